@@ -0,0 +1,254 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        alarms.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Central threshold/alarm evaluation engine.
+# @details     Compiles the low/high warning and critical thresholds of every parameter into NumPy
+#              arrays once, evaluates all parameters of an incoming block in one vectorized pass and
+#              publishes Nominal/Warning/Critical transitions with hysteresis and debounce.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Vectorized alarm engine with hysteresis and debounce
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+####################################################################################################
+
+ALARM_STATES = ('Nominal', 'Warning', 'Critical')   # Indexed by alarm level
+NOMINAL, WARNING, CRITICAL = range(3)
+THRESHOLD_KEYS = ('low_crit', 'low_warn', 'high_warn', 'high_crit')
+DEFAULT_HYSTERESIS = 0.01   # Fraction of the low_crit..high_crit span a value must clear to de-escalate
+DEFAULT_DEBOUNCE = 3        # Consecutive samples a new level must persist before it is published
+
+
+def compile_thresholds(thresholds):
+    """
+    @brief Validate a threshold dict and convert it to floats once.
+    @param thresholds Dict with low_crit, low_warn, high_warn and high_crit.
+    @return Tuple of four floats, or None if the dict is missing keys or holds non-numeric values.
+    """
+    if not isinstance(thresholds, dict) or not set(THRESHOLD_KEYS).issubset(thresholds.keys()):
+        return None
+    try:
+        return tuple(float(thresholds[key]) for key in THRESHOLD_KEYS)
+    except (TypeError, ValueError):
+        return None
+
+
+def alarm_levels(values, low_crit, low_warn, high_warn, high_crit):
+    """
+    @brief Classify values against thresholds without any state.
+    @details All arguments broadcast; NaN values are Nominal.
+    @return Integer array of NOMINAL/WARNING/CRITICAL levels.
+    """
+    values = np.asarray(values, dtype=float)
+    levels = np.where((values < low_warn) | (values > high_warn), WARNING, NOMINAL)
+    return np.where((values < low_crit) | (values > high_crit), CRITICAL, levels)
+
+
+def alarm_state(value, thresholds):
+    """
+    @brief Alarm state name of a single value, 'Nominal' when value or thresholds are unusable.
+    """
+    compiled = compile_thresholds(thresholds)
+    if compiled is None or value is None or not isinstance(value, (int, float)):
+        return ALARM_STATES[NOMINAL]
+    return ALARM_STATES[int(alarm_levels(value, *compiled))]
+
+
+class AlarmEngine(QObject):
+    """
+    @brief Evaluates the thresholds of all parameters per incoming block.
+    @details Escalation uses the configured thresholds. De-escalation uses thresholds moved inwards by
+             the hysteresis band, so a value hovering on a limit does not flap. A level change is only
+             published after it held for `debounce` consecutive samples. Cost depends on the number
+             of samples per block, not on the number of parameters or widgets.
+    """
+    stateChanged = Signal(str, str, float)   # param_id, new state name, value that triggered it
+
+    def __init__(self, parameters=None, debounce=DEFAULT_DEBOUNCE, hysteresis=DEFAULT_HYSTERESIS):
+        """
+        @param parameters Parameter definitions with 'id', 'array_index' and 'threshold'.
+        @param debounce Consecutive samples required before publishing a level change.
+        @param hysteresis Default hysteresis as a fraction of each parameter's critical span; a
+                          'hysteresis' key in a threshold dict overrides it in engineering units.
+        """
+        super().__init__()
+        self.debounce = max(1, int(debounce))
+        self.hysteresis = hysteresis
+        self.param_ids = []
+        self.levels = np.zeros(0, dtype=np.int8)
+        self.configure(parameters or [])
+
+    def configure(self, parameters):
+        """
+        @brief Compile the thresholds of all parameters; parameters without valid ones are skipped.
+        @details Current states are kept for parameters that remain configured.
+        """
+        previous = dict(zip(self.param_ids, self.levels))
+        ids, indices, limits, bands = [], [], [], []
+        for param in parameters:
+            compiled = compile_thresholds(param.get('threshold'))
+            array_index = param.get('array_index')
+            if compiled is None or array_index is None:
+                continue
+            try:
+                band = float(param['threshold']['hysteresis'])
+            except (KeyError, TypeError, ValueError):
+                band = self.hysteresis * abs(compiled[3] - compiled[0])
+            ids.append(param['id'])
+            indices.append(int(array_index))
+            limits.append(compiled)
+            bands.append(band)
+
+        self.param_ids = ids
+        self.indices = np.array(indices, dtype=np.intp)
+        limits = np.array(limits, dtype=float).reshape(-1, 4)
+        bands = np.array(bands, dtype=float)
+        self.low_crit, self.low_warn, self.high_warn, self.high_crit = limits.T
+        # Limits a value must clear to drop back a level
+        self.release = (self.low_crit + bands, self.low_warn + bands,
+                        self.high_warn - bands, self.high_crit - bands)
+        self.levels = np.array([previous.get(pid, NOMINAL) for pid in ids], dtype=np.int8)
+        self.pending = self.levels.copy()
+        self.pending_count = np.zeros(len(ids), dtype=np.int32)
+
+    def evaluate(self, block):
+        """
+        @brief Evaluate one packet or a block of packets and publish the resulting transitions.
+        @param block Packet (list of channel values, None for missing) or 2-D samples x channels array.
+        @return List of (param_id, old state, new state, value) transitions, in sample order.
+        """
+        if not self.param_ids:
+            return []
+        data = np.array(block, dtype=float, ndmin=2)   # None -> NaN
+        in_range = self.indices < data.shape[1]
+        values = np.full((data.shape[0], len(self.param_ids)), np.nan)
+        values[:, in_range] = data[:, self.indices[in_range]]
+
+        raw = alarm_levels(values, self.low_crit, self.low_warn, self.high_warn, self.high_crit)
+        missing = np.isnan(values)
+
+        # Fast path: every parameter stays where it is for the whole block
+        if not self.pending_count.any() and np.all((raw == self.levels) | missing):
+            return []
+
+        transitions = []
+        active = np.flatnonzero((self.pending_count > 0) | ((raw != self.levels) & ~missing).any(axis=0))
+        for column in active:
+            release = alarm_levels(values[:, column], *(limit[column] for limit in self.release))
+            transitions.extend(self._advance(column, values[:, column], raw[:, column], release,
+                                             missing[:, column]))
+        transitions.sort(key=lambda t: t[0])
+        transitions = [t[1:] for t in transitions]
+
+        for param_id, _old, new, value in transitions:
+            self.stateChanged.emit(param_id, new, value)
+        return transitions
+
+    def _advance(self, column, values, raw, release, missing):
+        """
+        @brief Run the hysteresis/debounce state machine of one parameter over a block.
+        @details The target level only depends on the current level, so targets are computed for the
+                 whole remaining block at once and recomputed only after each published transition.
+        @return List of (row, param_id, old state, new state, value) transitions.
+        """
+        transitions = []
+        start = 0
+        while start < len(values):
+            level = self.levels[column]
+            target = np.where(raw[start:] >= level, raw[start:], np.minimum(level, release[start:]))
+            target[missing[start:]] = level
+            changing = target != level
+
+            # Length of the run of identical changing targets ending at each sample
+            position = np.arange(len(target))
+            boundary = np.ones(len(target), dtype=bool)
+            boundary[1:] = (target[1:] != target[:-1]) | ~changing[:-1]
+            run_start = np.maximum.accumulate(np.where(boundary, position, 0))
+            count = position - run_start + 1
+            if changing[0] and target[0] == self.pending[column]:
+                count[run_start == 0] += self.pending_count[column]
+            count[~changing] = 0
+
+            fired = np.flatnonzero(count >= self.debounce)
+            if not len(fired):
+                self.pending[column] = target[-1] if changing[-1] else level
+                self.pending_count[column] = count[-1]
+                break
+            row = start + fired[0]
+            self.levels[column] = target[fired[0]]
+            self.pending[column] = self.levels[column]
+            self.pending_count[column] = 0
+            transitions.append((row, self.param_ids[column], ALARM_STATES[level],
+                                ALARM_STATES[self.levels[column]], float(values[row])))
+            start = row + 1
+        return transitions
+
+    def state(self, param_id):
+        """
+        @brief Published state name of a parameter ('Nominal' when it has no thresholds).
+        """
+        try:
+            return ALARM_STATES[self.levels[self.param_ids.index(param_id)]]
+        except ValueError:
+            return ALARM_STATES[NOMINAL]
+
+    def states(self):
+        """
+        @brief Published state names of all configured parameters.
+        """
+        return {pid: ALARM_STATES[level] for pid, level in zip(self.param_ids, self.levels)}
+
+    def reset(self):
+        """
+        @brief Return every parameter to Nominal and drop pending changes.
+        """
+        self.levels[:] = NOMINAL
+        self.pending[:] = NOMINAL
+        self.pending_count[:] = 0
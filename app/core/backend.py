@@ -52,6 +52,9 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # 003  MOD      26-09-2025  MuhammadRamzy        First commit with the ui/ux and flow changes
 # 004  MOD      01-10-2025  MuhammadRamzy        License Update
 # 005  MOD      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 006  MOD      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation
+# 007  MOD      19-10-2026  MuhammadRamzy        feat: Reader link statistics
+# 008  MOD      19-10-2026  MuhammadRamzy        fix: Time the blocking wait for data apart from the read stage
 ####################################################################################################
 
 ####################################################################################################
@@ -61,6 +64,7 @@ import json
 import re
 import socket
 import struct
+import time
 from typing import Optional, List, Union
 
 try:
@@ -104,6 +108,9 @@ class DataReader:
         self.little_endian = bool(little_endian)
         self.csv_separator = csv_separator or ","
         self.parameters = parameters or []
+        self.metrics = None  # Optional PipelineMetrics receiving read/decode timings
+        self._data_ready = None  # perf_counter() when the last blocking transport call returned
+        self.stats = None    # Optional LinkStats receiving bytes, frames and parse errors
         
         # Pre-calculate struct format if possible
         self._struct_fmt = ""
@@ -147,6 +154,7 @@ class DataReader:
         try:
             if self.mode == "serial" and self.ser:
                 data = self.ser.readline()
+                self._data_ready = time.perf_counter()
                 if data:
                     self.rx_bytes += len(data)
                 return data or None
@@ -154,6 +162,7 @@ class DataReader:
                 # Read chunks until we find a newline
                 if b"\n" not in self._buffer:
                     chunk = self.sock.recv(4096)
+                    self._data_ready = time.perf_counter()
                     if not chunk:
                         return None
                     self.rx_bytes += len(chunk)
@@ -164,6 +173,7 @@ class DataReader:
                 return None
             elif self.mode == "udp" and self.sock:
                 chunk, _ = self.sock.recvfrom(8192)
+                self._data_ready = time.perf_counter()
                 if not chunk:
                     return None
                 self.rx_bytes += len(chunk)
@@ -233,10 +243,12 @@ class DataReader:
         try:
             if self.mode == "serial" and self.ser:
                 chunk = self.ser.read(needed)
+                self._data_ready = time.perf_counter()
                 if chunk:
                     self._buffer += chunk
             elif self.mode in ("tcp", "udp") and self.sock:
                 chunk = self.sock.recv(4096)
+                self._data_ready = time.perf_counter()
                 if chunk:
                     self._buffer += chunk
         except Exception:
@@ -252,11 +264,18 @@ class DataReader:
         if self._struct_size == 0:
             return None
             
+        metrics = self.metrics if self.metrics is not None and self.metrics.enabled else None
+        if metrics:
+            start = time.perf_counter()
+            self._data_ready = None
         raw = self._read_exact(self._struct_size)
         if not raw:
             return None
             
         self.rx_bytes += len(raw)
+        if metrics:
+            read_done = time.perf_counter()
+            self._record_read(metrics, start, read_done)
         
         try:
             values = list(struct.unpack(self._struct_fmt, raw))
@@ -266,15 +285,47 @@ class DataReader:
             return [float(v) for v in values]
         except Exception as e:
             print(f"Struct unpack error: {e}")
-            return None
+            return "Parse"
+        finally:
+            if metrics:
+                metrics.record('decode', time.perf_counter() - read_done)
 
     def read_line(self) -> Union[None, List[float], str]:
+        """Read and decode one packet; returns the values, "Parse" on a decode error, or None."""
+        if self.stats is None:
+            return self._read_packet()
+        rx_before = self.rx_bytes
+        packet = self._read_packet()
+        self.stats.record(packet, self.rx_bytes - rx_before)
+        return packet
+
+    def _read_packet(self) -> Union[None, List[float], str]:
         if self.data_format == "binary_struct":
             return self._parse_binary_struct()
             
+        metrics = self.metrics if self.metrics is not None and self.metrics.enabled else None
+        if metrics:
+            start = time.perf_counter()
+            self._data_ready = None
         raw = self._read_bytes()
         if raw is None:
             return None
+        if metrics is None:
+            return self.decode(raw)
+        read_done = time.perf_counter()
+        packet = self.decode(raw)
+        self._record_read(metrics, start, read_done)
+        metrics.record('decode', time.perf_counter() - read_done)
+        return packet
+
+    def _record_read(self, metrics, start, read_done):
+        """Split a read into the idle wait for data and the work of framing it."""
+        ready = self._data_ready if self._data_ready is not None else start
+        metrics.record('wait', ready - start)
+        metrics.record('read', read_done - ready)
+
+    def decode(self, raw: bytes) -> Union[None, List[float], str]:
+        """Parse one received line or datagram in the configured data format."""
         try:
             if self.data_format == "json_array":
                 line = raw.decode("utf-8", errors="ignore").strip()
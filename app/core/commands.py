@@ -48,71 +48,101 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side
 #                                                layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        refactor: Widget commands address tabs by stable ID
+# 002  MOD      19-10-2026  MuhammadRamzy        feat: Parameter commands store the changed slice only
 ####################################################################################################
 
 ####################################################################################################
 # Imports
 
-from app.core.history import Command
+from app.core.history import Command, estimate_size
 import copy
 
 ####################################################################################################
 
 class AddWidgetCommand(Command):
-    def __init__(self, main_window, widget_config, tab_index):
+    def __init__(self, main_window, widget_config, tab_id):
         self.main_window = main_window
         self.widget_config = widget_config
-        self.tab_index = tab_index
+        self.tab_id = tab_id
         self.widget_id = None # Set after execution
 
     def execute(self):
         # Logic to add widget
         # We need to call the actual implementation in MainWindow
         # For now, we'll assume MainWindow has a method _add_widget_internal that returns the ID
-        self.widget_id = self.main_window._add_widget_internal(self.widget_config, self.tab_index)
+        self.widget_id = self.main_window._add_widget_internal(self.widget_config, self.tab_id)
         # Refresh UI after adding widget
         self.main_window.refresh_active_displays_list()
         self.main_window.mark_as_unsaved()
 
+    def size(self):
+        return estimate_size(self.widget_config)
+
     def undo(self):
         if self.widget_id:
-            self.main_window._remove_widget_internal(self.widget_id, self.tab_index)
+            self.main_window._remove_widget_internal(self.widget_id)
             # Refresh UI after removing widget
             self.main_window.refresh_active_displays_list()
             self.main_window.mark_as_unsaved()
 
 class RemoveWidgetCommand(Command):
-    def __init__(self, main_window, widget_id, tab_index):
+    def __init__(self, main_window, widget_id, tab_id):
         self.main_window = main_window
         self.widget_id = widget_id
-        self.tab_index = tab_index
+        self.tab_id = tab_id
         self.widget_config = None # Saved before removal
 
     def execute(self):
         # Save config before removing
-        self.widget_config = self.main_window._get_widget_config(self.widget_id, self.tab_index)
-        self.main_window._remove_widget_internal(self.widget_id, self.tab_index)
+        self.widget_config = self.main_window._get_widget_config(self.widget_id)
+        self.main_window._remove_widget_internal(self.widget_id)
         # Refresh UI after removing widget
         self.main_window.refresh_active_displays_list()
         self.main_window.mark_as_unsaved()
 
+    def size(self):
+        return estimate_size(self.widget_config)
+
     def undo(self):
         if self.widget_config:
-            self.main_window._add_widget_internal(self.widget_config, self.tab_index, restore_id=self.widget_id)
+            self.main_window._add_widget_internal(self.widget_config, self.tab_id, restore_id=self.widget_id)
             # Refresh UI after restoring widget
             self.main_window.refresh_active_displays_list()
             self.main_window.mark_as_unsaved()
 
 class UpdateParametersCommand(Command):
+    """
+    @brief Replace the parameter list, keeping only the part that changed for undo.
+    @details Parameter edits touch a few entries of a possibly long list (add, edit, remove, move),
+             so the command stores the differing slice between the common head and tail of the old
+             and new lists instead of two full copies.
+    """
     def __init__(self, main_window, old_params, new_params):
         self.main_window = main_window
-        self.old_params = copy.deepcopy(old_params)
-        self.new_params = copy.deepcopy(new_params)
+        start = 0
+        limit = min(len(old_params), len(new_params))
+        while start < limit and old_params[start] == new_params[start]:
+            start += 1
+        tail = 0
+        while tail < limit - start and old_params[-1 - tail] == new_params[-1 - tail]:
+            tail += 1
+        self.start = start
+        self.old_slice = copy.deepcopy(old_params[start:len(old_params) - tail])
+        self.new_slice = copy.deepcopy(new_params[start:len(new_params) - tail])
+        self._size = estimate_size(self.old_slice) + estimate_size(self.new_slice)
+
+    def _apply(self, remove, insert):
+        params = list(self.main_window.parameters)
+        params[self.start:self.start + len(remove)] = copy.deepcopy(insert)
+        self.main_window.parameters = params
+        self.main_window.restart_simulator() # Refresh simulator with new params
 
     def execute(self):
-        self.main_window.parameters = copy.deepcopy(self.new_params)
-        self.main_window.restart_simulator() # Refresh simulator with new params
+        self._apply(self.old_slice, self.new_slice)
 
     def undo(self):
-        self.main_window.parameters = copy.deepcopy(self.old_params)
-        self.main_window.restart_simulator()
+        self._apply(self.new_slice, self.old_slice)
+
+    def size(self):
+        return self._size
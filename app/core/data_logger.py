@@ -38,7 +38,8 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # Created On:  29-11-2025
 #
 # @brief       Data logging functionality.
-# @details     Handles logging of telemetry data to CSV and JSON formats with buffering.
+# @details     Handles logging of telemetry data to CSV and JSON formats with buffering, and writes a
+#              time index next to each log so logged sessions can be queried by time range.
 ####################################################################################################
 # HISTORY:
 #
@@ -48,6 +49,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side
 #                                                layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Sidecar time index and LogReader query API
 ####################################################################################################
 
 ####################################################################################################
@@ -57,10 +59,16 @@ import os
 import csv
 import json
 import time
+import struct
 from datetime import datetime
 
+from .log_parser import LogReader, log_index_path
+
 ####################################################################################################
 
+INDEX_PACK_FORMAT = '<dq'  # One index entry: elapsed time (float64), byte offset (int64)
+
+
 class DataLogger:
     """
     @brief Handles data logging to CSV and JSON formats.
@@ -72,6 +80,7 @@ class DataLogger:
         self.log_format = 'csv'  # 'csv' or 'json'
         self.log_file_path = None
         self.log_file = None
+        self.index_file = None
         self.csv_writer = None
         self.log_start_time = None
         self.parameters = []
@@ -115,6 +124,7 @@ class DataLogger:
             raise ValueError("No log file path configured")
         
         self.log_file = open(self.log_file_path, 'w', newline='', encoding='utf-8')
+        self.index_file = open(log_index_path(self.log_file_path), 'wb')
         self.log_start_time = time.time()
         
         if self.log_format == 'csv':
@@ -144,6 +154,9 @@ class DataLogger:
             if self.log_file:
                 self.log_file.close()
                 self.log_file = None
+            if self.index_file:
+                self.index_file.close()
+                self.index_file = None
             self.is_logging = False
     
     def log_data(self, packet_data, data_history):
@@ -188,6 +201,12 @@ class DataLogger:
         if not self.log_buffer or not self.log_file:
             return
         
+        # Index entry for this chunk: elapsed time of its first row (as written) and its byte offset
+        offset = self.log_file.tell()
+        first_elapsed = self.log_buffer[0]['elapsed_time']
+        if self.log_format == 'csv':
+            first_elapsed = round(first_elapsed, 3)
+        
         if self.log_format == 'csv':
             for entry in self.log_buffer:
                 row = [
@@ -208,4 +227,22 @@ class DataLogger:
                 self.log_file.write(json.dumps(json_entry) + '\n')
         
         self.log_file.flush()
+        if self.index_file:
+            # Written after the data is on disk so the index never points past the end of the log
+            self.index_file.write(struct.pack(INDEX_PACK_FORMAT, first_elapsed, offset))
+            self.index_file.flush()
         self.log_buffer = []
+    
+    def open_reader(self, parameters=None):
+        """
+        @brief Open the current log for time-range queries.
+        @details Buffered entries are flushed first so the reader sees everything logged so far.
+        @param parameters Parameter dictionaries to resolve columns with; defaults to the logged ones.
+        @return LogReader over the log file.
+        @throws ValueError If no log file has been configured.
+        """
+        if not self.log_file_path:
+            raise ValueError("No log file path configured")
+        if self.is_logging:
+            self.flush_buffer()
+        return LogReader(self.log_file_path, self.log_format, parameters or self.parameters)
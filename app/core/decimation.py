@@ -0,0 +1,201 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        decimation.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Min/max-preserving decimation of time series.
+# @details     Reduces long (x, y) series to a few points per output pixel while keeping every local
+#              minimum and maximum, so spikes stay visible in plots at any zoom level.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Parallel per-parameter plot rendering in reports
+#                                                with decimated inputs
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Viewport decimation for live TimeGraph curves
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+
+####################################################################################################
+
+def decimate_minmax(x, y, buckets):
+    """
+    @brief Decimate a series to at most two points (min and max) per x bucket.
+    @details The x range is split into `buckets` equal-width columns (typically the plot's pixel
+             width) and only the extremes of each column are kept, in x order, together with the
+             first and last points so the decimated series spans the same x range. Series that
+             already fit are returned unchanged.
+    @param x 1-D array of monotonically increasing x positions.
+    @param y 1-D array of values, same length as x.
+    @param buckets Number of columns to reduce to.
+    @return Tuple (x, y) of NumPy arrays.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    buckets = max(1, int(buckets))
+    if x.size <= 2 * buckets:
+        return x, y
+
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+        if x.size <= 2 * buckets:
+            return x, y
+
+    # x is sorted, so each column is a contiguous run starting at the first x past its left edge.
+    span = x[-1] - x[0]
+    edges = x[0] + span * (np.arange(1, buckets) / buckets)
+    starts = np.unique(np.r_[0, np.searchsorted(x, edges, 'left')])
+    starts = starts[starts < x.size]
+
+    # Index of the first minimum / maximum in each run: every run contains its own extreme, so the
+    # first matching position at or after the run start is it.
+    counts = np.diff(np.r_[starts, x.size])
+    at_low = np.flatnonzero(y == np.repeat(np.minimum.reduceat(y, starts), counts))
+    at_high = np.flatnonzero(y == np.repeat(np.maximum.reduceat(y, starts), counts))
+    lo = at_low[np.searchsorted(at_low, starts)]
+    hi = at_high[np.searchsorted(at_high, starts)]
+
+    # Keep each pair in x order and drop the duplicate when a column holds a single point.
+    first, second = np.minimum(lo, hi), np.maximum(lo, hi)
+    idx = np.column_stack((first, second)).ravel()
+    keep = np.r_[True, idx[1:] != idx[:-1]]
+    idx = idx[keep]
+    if idx[0] != 0:
+        idx = np.r_[0, idx]
+    if idx[-1] != x.size - 1:
+        idx = np.r_[idx, x.size - 1]
+    return x[idx], y[idx]
+
+
+def decimate_viewport(x, y, x_min, x_max, pixels):
+    """
+    @brief Decimate the part of a series that falls inside a plot's visible x range.
+    @details The series is sliced to [x_min, x_max] by binary search, widened by one point on each
+             side so lines run to the plot edges, then min/max decimated to one column per pixel
+             (at most two points per pixel).
+    @param x 1-D array of monotonically increasing x positions.
+    @param y 1-D array of values, same length as x.
+    @param x_min Left edge of the visible range.
+    @param x_max Right edge of the visible range.
+    @param pixels Width of the plot area in pixels.
+    @return Tuple (x, y) of NumPy arrays.
+    """
+    start = max(int(np.searchsorted(x, x_min, 'left')) - 1, 0)
+    stop = min(int(np.searchsorted(x, x_max, 'right')) + 1, len(x))
+    return decimate_minmax(x[start:stop], y[start:stop], pixels)
+
+
+class MinMaxEnvelope:
+    """
+    @brief Bounded, extrema-preserving decimation of an (x, y) stream.
+    @details Samples are grouped into buckets of `stride` points and only the minimum and maximum of
+             each bucket are kept. When the bucket count exceeds the capacity, neighbouring buckets
+             are merged and the stride doubles, so memory stays constant for any stream length while
+             spikes are never dropped.
+    """
+
+    def __init__(self, capacity=2048):
+        self.capacity = max(2, int(capacity))
+        self.stride = 1
+        empty = np.empty(0, dtype=np.float64)
+        self._lo_x, self._lo_y, self._hi_x, self._hi_y = empty, empty, empty, empty
+        self._pending_x, self._pending_y = empty, empty
+
+    def add(self, x, y):
+        """
+        @brief Append a block of samples (NaN values are skipped).
+        @param x 1-D array of x positions (monotonic).
+        @param y 1-D array of values, same length as x.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        valid = ~np.isnan(y)
+        x = np.concatenate((self._pending_x, x[valid]))
+        y = np.concatenate((self._pending_y, y[valid]))
+
+        full = (x.size // self.stride) * self.stride
+        if full:
+            bx = x[:full].reshape(-1, self.stride)
+            by = y[:full].reshape(-1, self.stride)
+            rows = np.arange(by.shape[0])
+            lo, hi = by.argmin(axis=1), by.argmax(axis=1)
+            self._lo_x = np.concatenate((self._lo_x, bx[rows, lo]))
+            self._lo_y = np.concatenate((self._lo_y, by[rows, lo]))
+            self._hi_x = np.concatenate((self._hi_x, bx[rows, hi]))
+            self._hi_y = np.concatenate((self._hi_y, by[rows, hi]))
+        self._pending_x, self._pending_y = x[full:], y[full:]
+
+        while self._lo_y.size > self.capacity:
+            self._merge_buckets()
+
+    def _merge_buckets(self):
+        pairs = (self._lo_y.size // 2) * 2
+        if pairs == 0:
+            return
+        lo_x, lo_y = self._lo_x[:pairs].reshape(-1, 2), self._lo_y[:pairs].reshape(-1, 2)
+        hi_x, hi_y = self._hi_x[:pairs].reshape(-1, 2), self._hi_y[:pairs].reshape(-1, 2)
+        rows = np.arange(lo_y.shape[0])
+        lo, hi = lo_y.argmin(axis=1), hi_y.argmax(axis=1)
+
+        # An odd trailing bucket is carried over unmerged.
+        self._lo_x = np.concatenate((lo_x[rows, lo], self._lo_x[pairs:]))
+        self._lo_y = np.concatenate((lo_y[rows, lo], self._lo_y[pairs:]))
+        self._hi_x = np.concatenate((hi_x[rows, hi], self._hi_x[pairs:]))
+        self._hi_y = np.concatenate((hi_y[rows, hi], self._hi_y[pairs:]))
+        self.stride *= 2
+
+    def points(self):
+        """
+        @brief Decimated series in x order.
+        @return Tuple (x, y) of NumPy arrays.
+        """
+        lo_first = self._lo_x <= self._hi_x
+        first_x = np.where(lo_first, self._lo_x, self._hi_x)
+        first_y = np.where(lo_first, self._lo_y, self._hi_y)
+        second_x = np.where(lo_first, self._hi_x, self._lo_x)
+        second_y = np.where(lo_first, self._hi_y, self._lo_y)
+        x = np.column_stack((first_x, second_x)).ravel()
+        y = np.column_stack((first_y, second_y)).ravel()
+        return np.concatenate((x, self._pending_x)), np.concatenate((y, self._pending_y))
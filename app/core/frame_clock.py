@@ -0,0 +1,194 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        frame_clock.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Shared frame clock for dashboard rendering.
+# @details     One timer drives every per-frame UI refresh in phase. Refreshes of widgets that are
+#              hidden (inactive tab, closed dock) or in a minimized window are skipped, and the
+#              frame rate steps down under load and back up when the load drops.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Single shared frame clock for widget refreshes
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import time
+from functools import partial
+from PySide6.QtCore import QObject, QTimer, Signal
+
+####################################################################################################
+
+FPS_LEVELS = (60, 30, 20, 15)     # Frame rates the clock steps between, fastest first
+DEFAULT_FPS = 30
+LOAD_HIGH = 0.8                    # Busy fraction of a frame that triggers a step down
+LOAD_LOW = 0.35                    # Busy fraction below which the clock steps back up
+LOAD_SMOOTHING = 0.2               # Weight of the newest frame in the load average
+ADAPT_HOLD_SECONDS = 2.0           # Minimum time between two rate changes
+
+
+class FrameClock(QObject):
+    """
+    @brief Central render scheduler ticking registered refresh callbacks.
+    @details Callbacks run in priority order (lower first) within one timer tick, so data
+             distribution runs before the widgets that draw it. The load of a frame is the time
+             spent in callbacks plus how late the tick fired (time the event loop spent painting
+             or processing input), as a fraction of the frame interval.
+    """
+    fpsChanged = Signal(int)
+
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """
+        @brief The application-wide clock, created on first use.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __init__(self, max_fps=DEFAULT_FPS, parent=None):
+        super().__init__(parent)
+        self._entries = []           # (priority, order, key, widget, callback)
+        self._order = 0
+        self._levels = [fps for fps in FPS_LEVELS if fps <= max_fps] or [FPS_LEVELS[-1]]
+        self._level = 0
+        self.load = 0.0
+        self._last_tick = None
+        self._last_change = time.perf_counter()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.tick)
+
+    @property
+    def fps(self):
+        return self._levels[self._level]
+
+    def set_max_fps(self, max_fps):
+        """
+        @brief Cap the frame rate; the clock adapts between the cap and the slowest level.
+        @param max_fps Highest frame rate allowed.
+        """
+        self._levels = [fps for fps in FPS_LEVELS if fps <= max_fps] or [FPS_LEVELS[-1]]
+        self._level = 0
+        self._apply_rate()
+
+    def register(self, widget, callback, priority=10):
+        """
+        @brief Run a refresh callback every frame while its widget is on screen.
+        @param widget Widget whose visibility gates the callback; unregistered when destroyed.
+        @param callback Callable taking no arguments.
+        @param priority Lower priorities run earlier in the frame.
+        """
+        key = id(widget)
+        self._entries.append((priority, self._order, key, widget, callback))
+        self._entries.sort(key=lambda entry: entry[:2])
+        self._order += 1
+        widget.destroyed.connect(partial(self._forget, key))
+        if not self.timer.isActive():
+            self._last_tick = None
+            self._apply_rate()
+
+    def unregister(self, widget):
+        self._forget(id(widget))
+
+    def _forget(self, key, *args):
+        self._entries = [entry for entry in self._entries if entry[2] != key]
+        if not self._entries:
+            try:
+                self.timer.stop()
+            except RuntimeError:
+                # Widget outlived this clock; its destroyed signal is still connected
+                pass
+
+    def _apply_rate(self):
+        self.timer.start(int(round(1000 / self.fps)))
+
+    @staticmethod
+    def is_on_screen(widget):
+        """
+        @brief Whether a widget can currently be seen.
+        @return False for widgets that are hidden, fully obscured, or in a minimized window.
+        """
+        return widget.isVisible() and not widget.window().isMinimized() and not widget.visibleRegion().isEmpty()
+
+    def tick(self):
+        """
+        @brief Run one frame: every on-screen callback, then adapt the rate to the measured load.
+        """
+        start = time.perf_counter()
+        for entry in list(self._entries):
+            widget, callback = entry[3], entry[4]
+            try:
+                if self.is_on_screen(widget):
+                    callback()
+            except RuntimeError:
+                # Underlying C++ widget already deleted
+                self._forget(entry[2])
+        end = time.perf_counter()
+
+        interval = 1.0 / self.fps
+        late = 0.0
+        if self._last_tick is not None:
+            late = max(0.0, (start - self._last_tick) - interval)
+        self._last_tick = start
+        frame_load = ((end - start) + late) / interval
+        self.load += LOAD_SMOOTHING * (frame_load - self.load)
+        self._adapt(end)
+
+    def _adapt(self, now):
+        if now - self._last_change < ADAPT_HOLD_SECONDS:
+            return
+        level = self._level
+        if self.load > LOAD_HIGH and level < len(self._levels) - 1:
+            level += 1
+        elif self.load < LOAD_LOW and level > 0:
+            level -= 1
+        if level != self._level:
+            self._level = level
+            self._last_change = now
+            self._last_tick = None
+            self.load = 0.0
+            self._apply_rate()
+            self.fpsChanged.emit(self.fps)
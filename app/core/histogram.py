@@ -0,0 +1,254 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        histogram.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Streaming histogram of live parameter values.
+# @details     Bin counts are updated incrementally as samples arrive and, for a sliding window, as
+#              they leave it. Bins are either fixed (explicit edges) or adaptive: a uniform grid
+#              that doubles its bin width to take in out-of-range samples, merging counts exactly.
+#              A windowed adaptive grid is re-fitted to the window contents once the window has
+#              turned over, or earlier when the samples crowd into a few bins.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Incremental histogram with fixed or adaptive bins
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Re-fit windowed adaptive bins, ignore non-finite values
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+
+####################################################################################################
+
+DEFAULT_BINS = 20
+DEFAULT_WINDOW = 500        # Samples counted by a sliding-window histogram (matches dashboard history)
+
+
+class StreamingHistogram:
+    """
+    @brief Histogram whose counts are maintained sample by sample.
+    @details With `window` set, only the most recent `window` samples are counted: their bin indices
+             are kept in a ring so evicted samples decrement exactly the bin they were counted in.
+             With `window=None` every sample since the last clear() is accumulated (long-horizon
+             mode) and nothing per sample is kept.
+             An adaptive grid only grows between fits; with a window it is re-fitted to the samples
+             still in the window, so a transient outlier stops dominating once it has left it.
+             Samples outside fixed edges are tallied in `underflow`/`overflow`; NaN and infinite
+             values are ignored.
+    """
+
+    def __init__(self, bins=DEFAULT_BINS, edges=None, window=DEFAULT_WINDOW):
+        """
+        @param bins Number of bins of an adaptive histogram (ignored when edges are given).
+        @param edges Optional increasing bin edges (bins + 1 values) for fixed binning.
+        @param window Number of recent samples to count, or None to accumulate all samples.
+        """
+        if edges is not None:
+            edges = np.asarray(edges, dtype=float)
+            if edges.ndim != 1 or len(edges) < 2 or np.any(np.diff(edges) <= 0):
+                raise ValueError("Histogram edges must be at least two strictly increasing values")
+            self.bins = len(edges) - 1
+        else:
+            self.bins = max(1, int(bins))
+        self.fixed_edges = edges
+        self.window = None if window is None else max(1, int(window))
+        self.clear()
+
+    def clear(self):
+        """
+        @brief Drop all counted samples (adaptive bins forget their range).
+        """
+        self.counts = np.zeros(self.bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.total = 0
+        self._origin = None     # Adaptive grid: left edge and bin width
+        self._width = None
+        if self.window is not None:
+            self._ring = np.empty(self.window, dtype=np.int64)   # Bin index of each windowed sample
+            self._values = np.empty(self.window)                  # Value of each windowed sample
+            self._head = 0
+            self._filled = 0
+            self._since_fit = 0     # Samples added since the adaptive grid was last fitted
+
+    @property
+    def edges(self):
+        """
+        @brief Current bin edges (empty before the first sample of an adaptive histogram).
+        """
+        if self.fixed_edges is not None:
+            return self.fixed_edges
+        if self._origin is None:
+            return np.zeros(0)
+        return self._origin + self._width * np.arange(self.bins + 1)
+
+    @property
+    def centers(self):
+        edges = self.edges
+        return (edges[:-1] + edges[1:]) / 2.0
+
+    def add(self, values):
+        """
+        @brief Count new samples, evicting the oldest ones from a sliding window.
+        @param values Iterable or array of new sample values, oldest first.
+        @return True if any bin count (or the binning) changed.
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[np.isfinite(values)]
+        if not values.size:
+            return False
+
+        before = self.counts.copy()
+        edges_before = None if self.fixed_edges is not None else (self._origin, self._width)
+        if self.window is not None and values.size >= self.window:
+            # The block replaces the whole window
+            self.counts[:] = 0
+            self.underflow = self.overflow = self.total = 0
+            self._filled = self._head = 0
+            values = values[-self.window:]
+        if self.fixed_edges is None:
+            self._fit_range(values)
+        index = self._bin_index(values)
+        if self.window is not None:
+            self._evict(max(0, self._filled + values.size - self.window))
+            positions = (self._head + np.arange(values.size)) % self.window
+            self._ring[positions] = index
+            self._values[positions] = values
+            self._head = (self._head + values.size) % self.window
+            self._filled = min(self.window, self._filled + values.size)
+        self._count(index, 1)
+        self.total += values.size
+        if self.fixed_edges is None and self.window is not None:
+            self._since_fit += values.size
+            if self._since_fit >= self.window or self._crowded():
+                self._refit()
+        if self.fixed_edges is None and (self._origin, self._width) != edges_before:
+            return True
+        return not np.array_equal(before, self.counts)
+
+    def _evict(self, count):
+        """
+        @brief Remove the `count` oldest samples of the window from the counts.
+        """
+        if count <= 0:
+            return
+        start = (self._head - self._filled) % self.window
+        positions = (start + np.arange(count)) % self.window
+        self._count(self._ring[positions], -1)
+        self.total -= count
+        self._filled -= count
+
+    def _bin_index(self, values):
+        """
+        @return Bin index per value; -1 below the first edge, self.bins above the last.
+        """
+        edges = self.edges
+        index = np.searchsorted(edges, values, side='right') - 1
+        # The last bin is closed on the right, as in np.histogram
+        index[values == edges[-1]] = self.bins - 1
+        return index
+
+    def _count(self, index, step):
+        if not index.size:
+            return
+        inside = (index >= 0) & (index < self.bins)
+        self.counts += step * np.bincount(index[inside], minlength=self.bins)
+        self.underflow += step * int(np.count_nonzero(index < 0))
+        self.overflow += step * int(np.count_nonzero(index >= self.bins))
+
+    def _grid_for(self, low, high):
+        """
+        @return (origin, width) of a fresh adaptive grid covering [low, high].
+        """
+        span = high - low
+        width = span / self.bins if span > 0 else max(abs(low) * 0.1, 1.0) / self.bins
+        origin = low if span > 0 else low - width * (self.bins // 2)
+        while origin + width * self.bins < high:     # Rounding must not leave the maximum outside
+            width = np.nextafter(width, np.inf)
+        return origin, width
+
+    def _crowded(self):
+        """
+        @return True if the counted samples occupy no more than a quarter of the bins.
+        """
+        return np.count_nonzero(self.counts) <= max(1, self.bins // 4)
+
+    def _refit(self):
+        """
+        @brief Fit the adaptive grid to the samples in the window and recount them.
+        @details O(window), and run at most once per window of samples unless the samples crowd into
+                 a few bins and a tighter grid exists.
+        """
+        self._since_fit = 0
+        start = (self._head - self._filled) % self.window
+        positions = (start + np.arange(self._filled)) % self.window
+        values = self._values[positions]
+        grid = self._grid_for(float(values.min()), float(values.max()))
+        if grid == (self._origin, self._width):
+            return
+        self._origin, self._width = grid
+        index = self._bin_index(values)
+        self._ring[positions] = index
+        self.counts[:] = 0
+        self.underflow = self.overflow = 0
+        self._count(index, 1)
+
+    def _fit_range(self, values):
+        """
+        @brief Grow the adaptive grid until it covers values, merging bin pairs on each doubling.
+        @details Doubling the width around an origin shifted by a whole number of old bins keeps every
+                 old bin inside exactly one new bin, so merged counts stay exact.
+        """
+        low, high = float(values.min()), float(values.max())
+        if self._origin is None:
+            self._origin, self._width = self._grid_for(low, high)
+        while low < self._origin or high > self.edges[-1]:
+            shift = self.bins if low < self._origin else 0
+            merged = np.zeros(self.bins, dtype=np.int64)
+            np.add.at(merged, (np.arange(self.bins) + shift) // 2, self.counts)
+            self.counts = merged
+            if self.window is not None and self._filled:
+                self._ring = (self._ring + shift) // 2
+            self._origin -= shift * self._width
+            self._width *= 2.0
@@ -48,15 +48,34 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side
 #                                                layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Deque-backed history capped by count and memory
 ####################################################################################################
 
 ####################################################################################################
 # Imports
 
-from typing import List, Any, Callable, Optional
+import sys
+from collections import deque
+from typing import Any, Optional
 
 ####################################################################################################
 
+DEFAULT_LIMIT = 50                      # Commands kept for undo
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024     # Approximate memory the undo state may hold
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    @brief Approximate memory held by a JSON-like value (dicts, lists, tuples, scalars), in bytes.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(estimate_size(item) for item in obj)
+    return size
+
+
 class Command:
     """
     @brief Abstract base class for all undoable commands.
@@ -67,23 +86,42 @@ class Command:
     def undo(self):
         raise NotImplementedError
 
+    def size(self) -> int:
+        """Approximate memory this command keeps for undo/redo, in bytes."""
+        return 0
+
 class CommandHistory:
     """
     @brief Manages the history of executed commands for Undo/Redo.
+    @details The oldest commands are dropped once more than `limit` are kept or, if `max_bytes` is
+             set, once the undo and redo stacks together hold more than `max_bytes` (the most recent
+             command is always kept).
     """
-    def __init__(self, limit: int = 50):
-        self._history: List[Command] = []
-        self._redo_stack: List[Command] = []
+    def __init__(self, limit: int = DEFAULT_LIMIT, max_bytes: Optional[int] = DEFAULT_MAX_BYTES):
+        self._history: deque = deque(maxlen=limit)
+        self._redo_stack: list = []
         self._limit = limit
+        self._max_bytes = max_bytes
 
     def push(self, command: Command):
         """Execute a command and add it to history."""
         command.execute()
         self._history.append(command)
         self._redo_stack.clear() # Clear redo stack on new action
-        
-        if len(self._history) > self._limit:
-            self._history.pop(0)
+        self._trim()
+
+    def _trim(self):
+        """Drop the oldest commands while the history is over its memory budget."""
+        if self._max_bytes is None:
+            return
+        used = self.memory_usage()
+        while used > self._max_bytes and len(self._history) > 1:
+            used -= self._history.popleft().size()
+
+    def memory_usage(self) -> int:
+        """Approximate memory held by the undo and redo stacks, in bytes."""
+        return sum(command.size() for command in self._history) + \
+            sum(command.size() for command in self._redo_stack)
 
     def undo(self):
         """Undo the last command."""
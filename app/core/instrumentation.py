@@ -0,0 +1,205 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        instrumentation.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Per-stage timing of the telemetry pipeline.
+# @details     Monotonic timers around read, decode, filter, history insert, log enqueue and widget
+#              render are aggregated into fixed log-spaced histograms, so recording costs a bisect and
+#              a few additions and memory stays constant. Snapshots give rates, percentiles and the
+#              busy fraction of each stage, and can be exported as JSON. Time the reader spends
+#              blocked waiting for data is kept apart as the idle 'wait' stage.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Separate idle wait stage for the reader
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import json
+import math
+import time
+from bisect import bisect_right
+from datetime import datetime
+
+####################################################################################################
+
+STAGES = ('read', 'decode', 'filter', 'history', 'log', 'render')
+IDLE_STAGES = ('wait',)    # Reader blocked on the transport: timed, but not load
+BUCKETS_PER_DECADE = 5
+MIN_DURATION = 1e-7        # Seconds; shorter durations fall in the first bucket
+MAX_DURATION = 10.0        # Seconds; longer durations fall in the last bucket
+BUCKET_EDGES = [MIN_DURATION * 10 ** (step / BUCKETS_PER_DECADE)
+                for step in range(int(round(math.log10(MAX_DURATION / MIN_DURATION) * BUCKETS_PER_DECADE)) + 1)]
+
+
+class StageStats:
+    """
+    @brief Duration histogram of one pipeline stage.
+    @details Bucket i counts durations in (BUCKET_EDGES[i-1], BUCKET_EDGES[i]]; percentiles are
+             reported as the upper edge of their bucket (about 58% resolution), capped at the
+             largest duration seen.
+    """
+    __slots__ = ('counts', 'count', 'total', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_EDGES) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.counts[bisect_right(BUCKET_EDGES, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent):
+        """
+        @return Duration in seconds below which `percent` of the samples fall (0.0 when empty).
+        """
+        if not self.count:
+            return 0.0
+        rank = percent / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                edge = BUCKET_EDGES[min(index, len(BUCKET_EDGES) - 1)]
+                return min(edge, self.max)
+        return self.max
+
+    def snapshot(self, elapsed, histogram=False):
+        """
+        @brief Summary of the stage.
+        @param elapsed Seconds the stats cover, for rates and busy fraction.
+        @param histogram Include the raw bucket counts.
+        """
+        summary = {
+            'count': self.count,
+            'rate': self.count / elapsed if elapsed > 0 else 0.0,
+            'mean_us': self.total / self.count * 1e6 if self.count else 0.0,
+            'p50_us': self.percentile(50) * 1e6,
+            'p90_us': self.percentile(90) * 1e6,
+            'p99_us': self.percentile(99) * 1e6,
+            'max_us': self.max * 1e6,
+            'total_s': self.total,
+            'busy': self.total / elapsed if elapsed > 0 else 0.0,
+        }
+        if histogram:
+            summary['bucket_edges_us'] = [edge * 1e6 for edge in BUCKET_EDGES]
+            summary['bucket_counts'] = list(self.counts)
+        return summary
+
+
+class PipelineMetrics:
+    """
+    @brief Stage timings and packet counters shared by the ingest thread and the GUI.
+    @details Each stage and counter is written by one thread only (read/decode/emitted by the
+             ingest thread, the rest by the GUI thread), so no locking is needed; a snapshot taken
+             while packets flow may be off by a packet. Callers check `enabled` before taking
+             timestamps, so a disabled instance costs one attribute read per stage.
+    """
+
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """
+        @brief The application-wide instance, created on first use.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __init__(self, enabled=True, clock=time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.stages = {stage: StageStats() for stage in STAGES + IDLE_STAGES}
+        self.started = self.clock()
+        self.emitted = 0      # Packets handed to the GUI by the ingest thread
+        self.handled = 0      # Packets processed by the GUI thread
+        self.rx_bytes = 0     # Bytes received from the transport
+
+    def record(self, stage, seconds):
+        """
+        @brief Add one duration to a stage.
+        """
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.add(seconds)
+
+    @property
+    def backlog(self):
+        """Packets emitted by the ingest thread and not yet processed by the GUI."""
+        return max(0, self.emitted - self.handled)
+
+    def snapshot(self, histogram=False):
+        """
+        @brief Current state of every stage and counter as a JSON-ready dictionary.
+        @param histogram Include the bucket counts of each stage.
+        """
+        elapsed = self.clock() - self.started
+        return {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'elapsed_s': elapsed,
+            'packets_emitted': self.emitted,
+            'packets_handled': self.handled,
+            'backlog': self.backlog,
+            'rx_bytes': self.rx_bytes,
+            'stages': {stage: stats.snapshot(elapsed, histogram) for stage, stats in self.stages.items()},
+        }
+
+    def export(self, path):
+        """
+        @brief Write a snapshot, including histograms, to a JSON file.
+        """
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(histogram=True), f, indent=2)
+        return path
@@ -0,0 +1,209 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        link_stats.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Sliding-window link statistics of a telemetry source.
+# @details     Bytes/s, frames/s, parse-error rate, checksum failures, reconnects and inter-arrival jitter
+#              of one data source, kept in ring-of-buckets counters so every update is O(1) and memory
+#              is constant. Written by the ingest thread, read once a second by the GUI.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Reader link statistics
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import math
+import time
+
+####################################################################################################
+
+WINDOW = 5.0          # Seconds covered by the sliding-window rates
+BUCKETS = 10          # Buckets per window; the window slides in WINDOW / BUCKETS steps
+
+
+def format_bytes(size):
+    """
+    @brief Human readable byte count ("512 B", "1.5 KB", ...).
+    """
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class WindowCounter:
+    """
+    @brief Sum of the values added during the last `window` seconds.
+    @details Values go into a ring of buckets tagged with their time slot; a bucket is cleared
+             when its slot comes round again, so add() is O(1) and never allocates. total() only
+             reads, so the GUI thread can call it while the ingest thread adds.
+    """
+    __slots__ = ('width', 'values', 'slots')
+
+    def __init__(self, window=WINDOW, buckets=BUCKETS):
+        self.width = window / buckets
+        self.values = [0.0] * buckets
+        self.slots = [-1] * buckets
+
+    def add(self, now, value=1.0):
+        slot = int(now / self.width)
+        index = slot % len(self.values)
+        if self.slots[index] != slot:
+            self.slots[index] = slot
+            self.values[index] = value
+        else:
+            self.values[index] += value
+
+    def total(self, now):
+        oldest = int(now / self.width) - len(self.values)
+        return sum(value for value, slot in zip(self.values, self.slots) if slot > oldest)
+
+    def span(self, now):
+        """Seconds covered by total(): the full buckets in the window plus the current one."""
+        return now - (int(now / self.width) - len(self.values) + 1) * self.width
+
+    def clear(self):
+        self.values = [0.0] * len(self.values)
+        self.slots = [-1] * len(self.slots)
+
+
+class LinkStats:
+    """
+    @brief Sliding-window traffic and error statistics of one data source.
+    @details Lifetime totals are kept next to the windowed counters. Jitter is the standard
+             deviation of the frame inter-arrival time over the window.
+    """
+
+    def __init__(self, window=WINDOW, clock=time.monotonic):
+        self.window = window
+        self.clock = clock
+        self._bytes = WindowCounter(window)
+        self._frames = WindowCounter(window)
+        self._errors = WindowCounter(window)
+        self._checksum = WindowCounter(window)
+        self._gaps = WindowCounter(window)
+        self._gaps_squared = WindowCounter(window)
+        self._gap_count = WindowCounter(window)
+        self.reset()
+
+    def reset(self):
+        for counter in (self._bytes, self._frames, self._errors, self._checksum,
+                        self._gaps, self._gaps_squared, self._gap_count):
+            counter.clear()
+        self.started = self.clock()
+        self.last_frame = None
+        self.total_bytes = 0
+        self.total_frames = 0
+        self.parse_errors = 0
+        self.checksum_failures = 0
+        self.reconnects = 0
+
+    def add_bytes(self, count, now=None):
+        if count:
+            self._bytes.add(self.clock() if now is None else now, count)
+            self.total_bytes += count
+
+    def add_frame(self, now=None):
+        now = self.clock() if now is None else now
+        self._frames.add(now)
+        self.total_frames += 1
+        if self.last_frame is not None:
+            gap = now - self.last_frame
+            self._gaps.add(now, gap)
+            self._gaps_squared.add(now, gap * gap)
+            self._gap_count.add(now)
+        self.last_frame = now
+
+    def add_parse_error(self, now=None):
+        self._errors.add(self.clock() if now is None else now)
+        self.parse_errors += 1
+
+    def add_checksum_failure(self, now=None):
+        self._checksum.add(self.clock() if now is None else now)
+        self.checksum_failures += 1
+
+    def add_reconnect(self):
+        self.reconnects += 1
+
+    def record(self, packet, rx_bytes):
+        """
+        @brief Account one DataReader.read_line() result.
+        @param packet The value list, "Parse" for a frame that failed to decode, or None.
+        @param rx_bytes Bytes the reader received while producing it.
+        """
+        now = self.clock()
+        self.add_bytes(rx_bytes, now)
+        if isinstance(packet, list):
+            self.add_frame(now)
+        elif packet == "Parse":
+            self.add_parse_error(now)
+
+    def snapshot(self, now=None):
+        """
+        @brief Windowed rates and lifetime totals as a dictionary.
+        """
+        now = self.clock() if now is None else now
+        span = max(min(self._frames.span(now), now - self.started), 1e-3)
+        frames = self._frames.total(now)
+        errors = self._errors.total(now)
+        gaps = self._gap_count.total(now)
+        jitter = 0.0
+        if gaps > 1:
+            mean = self._gaps.total(now) / gaps
+            jitter = math.sqrt(max(0.0, self._gaps_squared.total(now) / gaps - mean * mean))
+        return {
+            'bytes_per_s': self._bytes.total(now) / span,
+            'frames_per_s': frames / span,
+            'errors_per_s': errors / span,
+            'error_rate': errors / (frames + errors) if frames + errors else 0.0,
+            'checksum_per_s': self._checksum.total(now) / span,
+            'jitter_ms': jitter * 1e3,
+            'total_bytes': self.total_bytes,
+            'total_frames': self.total_frames,
+            'parse_errors': self.parse_errors,
+            'checksum_failures': self.checksum_failures,
+            'reconnects': self.reconnects,
+        }
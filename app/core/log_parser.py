@@ -0,0 +1,545 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        log_parser.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Streaming parser and statistics for DataLogger log files.
+# @details     Reads CSV and JSON Lines logs in fixed-size blocks into NumPy arrays and accumulates
+#              per-parameter statistics with one-pass algorithms, so logs larger than memory can be
+#              summarised for reports. LogReader answers time-range queries on a log by seeking
+#              through the sidecar time index DataLogger writes next to it.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Streaming, vectorized log parser for summary
+#                                                reports
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: LogReader time-range and column queries over
+#                                                a sidecar time index
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import io
+import os
+import csv
+import json
+import numpy as np
+
+from .filters import FilterManager
+from .decimation import MinMaxEnvelope
+
+####################################################################################################
+
+DEFAULT_BLOCK_BYTES = 4 * 1024 * 1024   # Bytes of log text parsed per block
+DEFAULT_RESERVOIR_SIZE = 65536          # Samples kept for percentile estimation
+DEFAULT_ENVELOPE_BUCKETS = 2048         # Min/max buckets kept per series for plotting
+REPORT_PERCENTILES = (5, 25, 50, 75, 95)
+INDEX_SUFFIX = '.idx'                   # Sidecar time index written next to each log
+INDEX_DTYPE = np.dtype([('elapsed', '<f8'), ('offset', '<i8')])
+INDEX_SCAN_BYTES = 64 * 1024            # Index granularity when rebuilding a missing index
+
+
+class RunningStats:
+    """
+    @brief One-pass statistics accumulator for a stream of float blocks.
+    @details Count, min, max, mean and variance are merged block by block (Chan et al.), so the
+             result is exact regardless of stream length. Percentiles come from a fixed-size uniform
+             reservoir sample and are exact until the stream exceeds the reservoir size.
+    """
+
+    def __init__(self, reservoir_size=DEFAULT_RESERVOIR_SIZE, seed=0):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self._reservoir = np.empty(reservoir_size, dtype=np.float64)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        @brief Merge a block of samples into the running statistics.
+        @param values 1-D array of samples; NaN entries are ignored.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        n = values.size
+        if n == 0:
+            return
+
+        block_mean = float(values.mean())
+        block_m2 = float(((values - block_mean) ** 2).sum())
+        total = self.count + n
+        delta = block_mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += block_m2 + delta * delta * self.count * n / total
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        self._update_reservoir(values)
+        self.count = total
+
+    def _update_reservoir(self, values):
+        # Vectorised Algorithm R: sample i (0-based, global) replaces slot randint(0, i]
+        # when that slot falls inside the reservoir.
+        capacity = self._reservoir.size
+        filled = min(self.count, capacity)
+        take = min(capacity - filled, values.size)
+        if take:
+            self._reservoir[filled:filled + take] = values[:take]
+        rest = values[take:]
+        if rest.size:
+            positions = np.arange(self.count + take, self.count + values.size)
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < capacity
+            self._reservoir[slots[keep]] = rest[keep]
+
+    @property
+    def std(self):
+        return float(np.sqrt(self._m2 / self.count)) if self.count else 0.0
+
+    def percentiles(self, q=REPORT_PERCENTILES):
+        """
+        @brief Percentiles of the stream (estimated once the reservoir has overflowed).
+        @param q Iterable of percentiles in the range 0-100.
+        @return Dictionary mapping each percentile to its value.
+        """
+        if not self.count:
+            return {p: None for p in q}
+        sample = self._reservoir[:min(self.count, self._reservoir.size)]
+        return dict(zip(q, (float(v) for v in np.percentile(sample, q))))
+
+
+def csv_column_name(param):
+    """Column header DataLogger writes for a parameter in CSV logs."""
+    return f"{param['id']}_{param['name']}"
+
+
+def _read_lines(f, block_bytes):
+    """Read about block_bytes of whole lines from a binary file; None at end of file."""
+    raw = f.readlines(block_bytes)
+    if not raw:
+        return None
+    return [line for line in b''.join(raw).decode('utf-8', errors='replace').splitlines() if line.strip()]
+
+
+def _read_csv_header(f):
+    header_line = f.readline().decode('utf-8', errors='replace')
+    return next(csv.reader([header_line]), [])
+
+
+def _resolve_csv_columns(header, parameters):
+    """Map parameter ids to CSV column indices (exact header match first, then id prefix)."""
+    columns = {}
+    for param in parameters:
+        name = csv_column_name(param)
+        if name in header:
+            columns[param['id']] = header.index(name)
+            continue
+        prefix = f"{param['id']}_"
+        for idx, col in enumerate(header):
+            if col.startswith(prefix):
+                columns[param['id']] = idx
+                break
+    return columns
+
+
+def _parse_csv_block(lines, usecols):
+    """Parse CSV data lines into a 2-D float array restricted to `usecols`."""
+    text = '\n'.join(lines) + '\n'
+    # DataLogger writes missing values as empty fields; make them explicit NaNs for loadtxt.
+    text = text.replace(',,', ',nan,').replace(',,', ',nan,').replace(',\n', ',nan\n')
+    try:
+        return np.loadtxt(io.StringIO(text), delimiter=',', usecols=usecols, ndmin=2, dtype=np.float64)
+    except ValueError:
+        # A torn or malformed row (e.g. a log still being written); drop the bad rows only.
+        return np.atleast_2d(np.genfromtxt(io.StringIO(text), delimiter=',', usecols=usecols,
+                                           dtype=np.float64, invalid_raise=False))
+
+
+def _iter_csv_blocks(f, parameters, block_bytes):
+    header = _read_csv_header(f)
+    columns = _resolve_csv_columns(header, parameters)
+    elapsed_col = header.index('elapsed_time') if 'elapsed_time' in header else 1
+    param_ids = list(columns)
+    usecols = [elapsed_col] + [columns[pid] for pid in param_ids]
+
+    while True:
+        lines = _read_lines(f, block_bytes)
+        if lines is None:
+            break
+        if not lines:
+            continue
+        block = _parse_csv_block(lines, usecols)
+        if block.size == 0:
+            continue
+        first_ts = lines[0].split(',', 1)[0]
+        last_ts = lines[-1].split(',', 1)[0]
+        data = {pid: block[:, i + 1] for i, pid in enumerate(param_ids)}
+        yield block[:, 0], data, first_ts, last_ts
+
+
+def _parse_json_block(lines):
+    try:
+        return json.loads('[' + ','.join(lines) + ']')
+    except json.JSONDecodeError:
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass
+        return entries
+
+
+def _iter_json_blocks(f, parameters, block_bytes):
+    param_ids = [p['id'] for p in parameters]
+    while True:
+        lines = _read_lines(f, block_bytes)
+        if lines is None:
+            break
+        lines = [line for line in lines if not line.lstrip().startswith('#')]
+        entries = _parse_json_block(lines)
+        if not entries:
+            continue
+        elapsed = np.array([e.get('elapsed_time') for e in entries], dtype=np.float64)
+        data = {}
+        for pid in param_ids:
+            data[pid] = np.array([e.get('parameters', {}).get(pid) for e in entries], dtype=np.float64)
+        yield elapsed, data, entries[0].get('timestamp', ''), entries[-1].get('timestamp', '')
+
+
+def iter_log_blocks(log_file, file_format, parameters, block_bytes=DEFAULT_BLOCK_BYTES, progress=None):
+    """
+    @brief Stream a DataLogger log file as blocks of NumPy arrays.
+    @param log_file Path to the CSV or JSON Lines log.
+    @param file_format 'csv' or 'json'.
+    @param parameters Parameter dictionaries the log was written with.
+    @param block_bytes Approximate number of bytes of text parsed per block.
+    @param progress Optional callable(bytes_read, total_bytes) invoked after each block.
+    @return Generator of (elapsed, {param_id: values}, first_timestamp, last_timestamp) tuples;
+            missing samples are NaN.
+    """
+    total_bytes = os.path.getsize(log_file)
+    with open(log_file, 'rb') as f:
+        if file_format == 'csv':
+            blocks = _iter_csv_blocks(f, parameters, block_bytes)
+        elif file_format == 'json':
+            blocks = _iter_json_blocks(f, parameters, block_bytes)
+        else:
+            raise ValueError(f"Unsupported log format '{file_format}'")
+        for block in blocks:
+            if progress:
+                progress(f.tell(), total_bytes)
+            yield block
+
+
+def _build_filter(filter_config):
+    filter_class = FilterManager.FILTER_CLASSES.get(filter_config.get('type')) if filter_config else None
+    if filter_class is None:
+        return None
+    return filter_class.from_dict(filter_config)
+
+
+def summarize_log(log_file, file_format, parameters, filters=None, block_bytes=DEFAULT_BLOCK_BYTES,
+                  envelope_buckets=DEFAULT_ENVELOPE_BUCKETS, progress=None):
+    """
+    @brief Compute report statistics for a log file in a single streaming pass.
+    @param log_file Path to the log file.
+    @param file_format 'csv' or 'json'.
+    @param parameters Parameter dictionaries the log was written with.
+    @param filters Optional mapping of parameter id to a filter dictionary (SignalFilter.to_dict());
+           the filtered series is produced alongside the raw one for plotting.
+    @param block_bytes Approximate number of bytes parsed per block.
+    @param envelope_buckets Number of min/max buckets kept per plotted series.
+    @param progress Optional callable(bytes_read, total_bytes) invoked after each block.
+    @return Summary dictionary with file metadata and per-parameter statistics keyed by name.
+    """
+    filters = filters or {}
+    data_summary = {
+        'file_path': log_file,
+        'file_size': os.path.getsize(log_file),
+        'format': file_format,
+        'parameters': {},
+        'start_time': None,
+        'end_time': None,
+        'duration': 0,
+        'total_samples': 0
+    }
+
+    stats = {p['id']: RunningStats() for p in parameters}
+    envelopes = {p['id']: MinMaxEnvelope(envelope_buckets) for p in parameters}
+    active_filters = {}
+    for p in parameters:
+        filter_obj = _build_filter(filters.get(p['id']))
+        if filter_obj is not None:
+            active_filters[p['id']] = (filter_obj, MinMaxEnvelope(envelope_buckets))
+
+    for elapsed, data, first_ts, last_ts in iter_log_blocks(log_file, file_format, parameters,
+                                                                block_bytes, progress):
+        if data_summary['start_time'] is None:
+            data_summary['start_time'] = first_ts
+        data_summary['end_time'] = last_ts
+        data_summary['total_samples'] += elapsed.size
+        if elapsed.size and not np.isnan(elapsed[-1]):
+            data_summary['duration'] = float(elapsed[-1])
+
+        for pid, values in data.items():
+            stats[pid].update(values)
+            envelopes[pid].add(elapsed, values)
+            if pid in active_filters:
+                filter_obj, filtered_env = active_filters[pid]
+                filtered = np.array([filter_obj.apply(v) if v == v else np.nan for v in values.tolist()],
+                                    dtype=np.float64)
+                filtered_env.add(elapsed, filtered)
+
+    for param in parameters:
+        pid = param['id']
+        param_stats = stats[pid]
+        if not param_stats.count:
+            continue
+        timestamps, values = envelopes[pid].points()
+        entry = {
+            'unit': param.get('unit', ''),
+            'count': param_stats.count,
+            'min': param_stats.min,
+            'max': param_stats.max,
+            'mean': param_stats.mean,
+            'std': param_stats.std,
+            'percentiles': param_stats.percentiles(),
+            'values': values,
+            'timestamps': timestamps
+        }
+        if pid in active_filters:
+            filter_obj, filtered_env = active_filters[pid]
+            entry['filter_name'] = filter_obj.__class__.__name__
+            entry['filtered_timestamps'], entry['filtered_values'] = filtered_env.points()
+        data_summary['parameters'][param['name']] = entry
+
+    return data_summary
+
+
+def log_index_path(log_file):
+    """Path of the sidecar time index for a log file."""
+    return log_file + INDEX_SUFFIX
+
+
+def _first_elapsed(lines, file_format, elapsed_col):
+    """Elapsed time of the first data line in `lines`, or None if there is none."""
+    for line in lines:
+        try:
+            if file_format == 'csv':
+                return float(line.split(',')[elapsed_col])
+            if not line.lstrip().startswith('#'):
+                return float(json.loads(line)['elapsed_time'])
+        except (ValueError, IndexError, KeyError, TypeError):
+            continue
+    return None
+
+
+class LogReader:
+    """
+    @brief Time-range and parameter queries over a DataLogger log file.
+    @details Each index entry holds the elapsed time of a row and the byte offset it starts at, in
+             file order. A query bisects the index for the byte range covering the requested window,
+             reads only that range and parses only the requested columns, so the cost depends on the
+             size of the window rather than the size of the log. Logs without an index (older logs,
+             or the index was deleted) are indexed by one scan on open. Elapsed time is assumed to
+             be non-decreasing, which holds for logs written by DataLogger.
+    """
+
+    def __init__(self, log_file, file_format=None, parameters=None):
+        """
+        @brief Open a log for querying.
+        @param log_file Path to the CSV or JSON Lines log.
+        @param file_format 'csv' or 'json'; inferred from the file extension when omitted.
+        @param parameters Parameter dictionaries the log was written with. When omitted, CSV
+               columns are taken from the header and JSON ids from the '# Parameters:' comment.
+        """
+        if file_format is None:
+            file_format = 'json' if log_file.lower().endswith('.json') else 'csv'
+        if file_format not in ('csv', 'json'):
+            raise ValueError(f"Unsupported log format '{file_format}'")
+        self.log_file = log_file
+        self.file_format = file_format
+        self._elapsed_col = 1
+        self._columns = {}
+
+        with open(log_file, 'rb') as f:
+            if file_format == 'csv':
+                header = _read_csv_header(f)
+                if 'elapsed_time' in header:
+                    self._elapsed_col = header.index('elapsed_time')
+                if parameters is None:
+                    self._columns = {col: idx for idx, col in enumerate(header)
+                                     if idx > self._elapsed_col}
+                else:
+                    self._columns = _resolve_csv_columns(header, parameters)
+            else:
+                if parameters is None:
+                    parameters = self._json_header_parameters(f)
+                self._columns = {p['id']: None for p in parameters}
+            self._data_start = f.tell()
+
+        self.index = self._load_index()
+
+    @property
+    def parameter_ids(self):
+        """Parameter ids (CSV column names when no parameters were given) that can be queried."""
+        return list(self._columns)
+
+    @staticmethod
+    def _json_header_parameters(f):
+        ids = []
+        while True:
+            line = f.readline()
+            if not line.startswith(b'#'):
+                break
+            text = line.decode('utf-8', errors='replace')
+            if text.startswith('# Parameters:'):
+                ids = [pid.strip() for pid in text.split(':', 1)[1].split(',') if pid.strip()]
+        f.seek(0)
+        return [{'id': pid} for pid in ids]
+
+    def _load_index(self):
+        path = log_index_path(self.log_file)
+        if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(self.log_file) - 1:
+            raw = np.fromfile(path, dtype=np.uint8)
+            # Drop a torn trailing entry from a crash mid-write
+            raw = raw[:raw.size - raw.size % INDEX_DTYPE.itemsize]
+            index = raw.view(INDEX_DTYPE)
+            if index.size:
+                return index
+        return self._scan_index()
+
+    def _scan_index(self):
+        entries = []
+        with open(self.log_file, 'rb') as f:
+            f.seek(self._data_start)
+            while True:
+                offset = f.tell()
+                lines = _read_lines(f, INDEX_SCAN_BYTES)
+                if lines is None:
+                    break
+                elapsed = _first_elapsed(lines, self.file_format, self._elapsed_col)
+                if elapsed is not None:
+                    entries.append((elapsed, offset))
+        return np.array(entries, dtype=INDEX_DTYPE)
+
+    def time_range(self):
+        """
+        @brief Elapsed time of the first indexed row and of the last row in the log.
+        @return (first, last) in seconds, or (None, None) for an empty log.
+        """
+        if not self.index.size:
+            return None, None
+        with open(self.log_file, 'rb') as f:
+            f.seek(int(self.index['offset'][-1]))
+            last = None
+            while True:
+                lines = _read_lines(f, DEFAULT_BLOCK_BYTES)
+                if lines is None:
+                    break
+                for line in reversed(lines):
+                    last = _first_elapsed([line], self.file_format, self._elapsed_col)
+                    if last is not None:
+                        break
+        return float(self.index['elapsed'][0]), last
+
+    def _byte_range(self, start, end):
+        elapsed = self.index['elapsed']
+        offsets = self.index['offset']
+        if start is None or not elapsed.size:
+            first = self._data_start
+        else:
+            # Last entry strictly before `start`: rows tied with `start` may precede the next entry
+            first = int(offsets[max(np.searchsorted(elapsed, start, 'left') - 1, 0)])
+        last = None
+        if end is not None:
+            stop = np.searchsorted(elapsed, end, 'right')
+            if stop < elapsed.size:
+                last = int(offsets[stop])
+        return first, last
+
+    def read(self, start=None, end=None, parameters=None):
+        """
+        @brief Read the samples of a time window as NumPy arrays.
+        @param start Window start in elapsed seconds (inclusive); None for the start of the log.
+        @param end Window end in elapsed seconds (inclusive); None for the end of the log.
+        @param parameters Parameter ids to read; None for all of them.
+        @return Dictionary with 'elapsed' and one float64 array per parameter id; missing samples
+                are NaN.
+        @throws KeyError If a requested parameter is not in the log.
+        """
+        param_ids = self.parameter_ids if parameters is None else list(parameters)
+        for pid in param_ids:
+            if pid not in self._columns:
+                raise KeyError(f"Parameter '{pid}' is not in {os.path.basename(self.log_file)}")
+
+        first, last = self._byte_range(start, end)
+        with open(self.log_file, 'rb') as f:
+            f.seek(first)
+            raw = f.read() if last is None else f.read(max(last - first, 0))
+        lines = [line for line in raw.decode('utf-8', errors='replace').splitlines() if line.strip()]
+
+        if self.file_format == 'csv':
+            usecols = [self._elapsed_col] + [self._columns[pid] for pid in param_ids]
+            block = _parse_csv_block(lines, usecols) if lines else np.empty((0, len(usecols)))
+            if block.size == 0:
+                block = np.empty((0, len(usecols)))
+            elapsed = block[:, 0]
+            data = {pid: block[:, i + 1] for i, pid in enumerate(param_ids)}
+        else:
+            entries = _parse_json_block([line for line in lines if not line.lstrip().startswith('#')])
+            elapsed = np.array([e.get('elapsed_time') for e in entries], dtype=np.float64)
+            data = {pid: np.array([e.get('parameters', {}).get(pid) for e in entries], dtype=np.float64)
+                    for pid in param_ids}
+
+        mask = np.ones(elapsed.size, dtype=bool)
+        if start is not None:
+            mask &= elapsed >= start
+        if end is not None:
+            mask &= elapsed <= end
+        result = {'elapsed': elapsed[mask]}
+        for pid in param_ids:
+            result[pid] = data[pid][mask]
+        return result
@@ -0,0 +1,151 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        packet_ring.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Bounded ring of raw telemetry packets.
+# @details     Stores the most recent packets in preallocated NumPy arrays (values padded with NaN,
+#              packet lengths, receive times) so a raw viewer keeps constant memory however long it
+#              runs, and can fetch any range of rows as arrays for vectorized formatting.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Bounded packet ring for the raw telemetry viewer
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+
+####################################################################################################
+
+DEFAULT_CAPACITY = 50000     # Packets kept (about 13 MB at 32 channels)
+DEFAULT_WIDTH = 32           # Initial values per row; widened up to max_width for longer packets
+DEFAULT_MAX_WIDTH = 1024
+NOTE_LENGTH = -1             # Row length marking a text note ([PAUSED], [SENT] ...) instead of a packet
+
+
+class PacketRing:
+    """
+    @brief Fixed-capacity ring of packets addressed by absolute sequence number.
+    @details Sequence numbers count every row ever appended; rows older than `first` have been
+             overwritten. Text notes share the ring so they keep their place among the packets.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, width=DEFAULT_WIDTH, max_width=DEFAULT_MAX_WIDTH):
+        self.capacity = max(1, int(capacity))
+        self.max_width = max_width
+        self.values = np.full((self.capacity, min(width, max_width)), np.nan)
+        self.lengths = np.zeros(self.capacity, dtype=np.int32)
+        self.timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self.numbers = np.zeros(self.capacity, dtype=np.int64)
+        self.notes = {}
+        self.total = 0
+        self.packets = 0
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def first(self):
+        """Sequence number of the oldest row still held."""
+        return self.total - len(self)
+
+    def clear(self):
+        self.total = 0
+        self.packets = 0
+        self.notes.clear()
+
+    def append(self, packet, timestamp):
+        """
+        @brief Store one packet.
+        @param packet Sequence of numeric values (None for missing), or a single number.
+        @param timestamp Receive time of the packet.
+        @return Number of values stored (longer packets are truncated to max_width).
+        """
+        values = np.array(packet, dtype=np.float64, ndmin=1).ravel()[:self.max_width]
+        if values.size > self.values.shape[1]:
+            self._widen(values.size)
+        row = self._claim(timestamp)
+        self.values[row, :values.size] = values
+        self.values[row, values.size:] = np.nan
+        self.lengths[row] = values.size
+        self.packets += 1
+        self.numbers[row] = self.packets
+        return values.size
+
+    def append_note(self, text, timestamp):
+        """
+        @brief Store a line of text between packets.
+        """
+        row = self._claim(timestamp)
+        self.lengths[row] = NOTE_LENGTH
+        self.numbers[row] = 0
+        self.notes[self.total - 1] = text
+
+    def _claim(self, timestamp):
+        if self.total >= self.capacity:
+            self.notes.pop(self.total - self.capacity, None)
+        row = self.total % self.capacity
+        self.timestamps[row] = timestamp
+        self.total += 1
+        return row
+
+    def _widen(self, width):
+        width = min(max(width, self.values.shape[1] * 2), self.max_width)
+        widened = np.full((self.capacity, width), np.nan)
+        widened[:, :self.values.shape[1]] = self.values
+        self.values = widened
+
+    def rows(self, start, stop):
+        """
+        @brief Fetch rows by sequence number.
+        @param start First sequence number (clamped to `first`).
+        @param stop One past the last sequence number (clamped to `total`).
+        @return (sequence numbers, values, lengths, timestamps, packet numbers) arrays, all copies.
+                Packet numbers count packets only and are 0 on note rows.
+        """
+        start, stop = max(start, self.first), min(stop, self.total)
+        sequence = np.arange(start, max(start, stop))
+        index = sequence % self.capacity
+        return (sequence, self.values[index], self.lengths[index], self.timestamps[index],
+                self.numbers[index])
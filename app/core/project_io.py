@@ -0,0 +1,119 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        project_io.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Atomic, compact project file I/O.
+# @details     Project files are written as compact JSON to a temporary file in the target directory,
+#              flushed to disk and renamed over the destination, so a crash or full disk mid-save never
+#              leaves a truncated project behind. Loading accepts both compact and indented files.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Atomic compact project save/load
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Keep the project file's permissions across saves
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import json
+import os
+import stat
+import tempfile
+
+####################################################################################################
+
+SEPARATORS = (',', ':')     # No whitespace: smaller files, faster to write and parse
+
+
+def dumps_project(project_data):
+    """
+    @brief Serialise a project dictionary to compact JSON text.
+    """
+    return json.dumps(project_data, separators=SEPARATORS)
+
+
+def save_project_file(path, project_data):
+    """
+    @brief Atomically write a project dictionary to `path`.
+    @details The data is serialised before the file is touched, written to a sibling temporary file,
+             fsync'ed and moved over `path` with os.replace(); on any error the old file is kept.
+             The file keeps the mode of the file it replaces, or gets the umask default if new.
+    @param path Destination project file.
+    @param project_data JSON-serialisable project dictionary.
+    """
+    text = dumps_project(project_data)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.project-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _target_mode(path):
+    """
+    @brief Permission bits for a saved project: those of the existing file, else 0666 minus the umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def load_project_file(path):
+    """
+    @brief Read a project dictionary written by save_project_file() or an older indented save.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
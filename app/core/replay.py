@@ -0,0 +1,222 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        replay.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Session replay of DataLogger logs.
+# @details     Turns a logged session back into telemetry packets on the original timeline, scaled
+#              by a playback speed, with pause and seek. DataSimulator's replay mode emits these
+#              packets through the same path as live data.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Session replay source at 0.1x-100x speed
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import time
+import threading
+import numpy as np
+
+from .log_parser import LogReader
+
+####################################################################################################
+
+REPLAY_MIN_SPEED = 0.1
+REPLAY_MAX_SPEED = 100.0
+REPLAY_CHUNK_SECONDS = 10.0  # Log time read from disk per chunk
+REPLAY_MAX_WAIT = 0.05       # Longest sleep between polls, keeps pause/seek/speed responsive
+
+
+class LogReplay:
+    """
+    @brief Plays a logged session back as packets on a scaled clock.
+    @details The play head is derived from a monotonic clock anchor (log time and wall time at the
+             last play/seek/speed change), so timing does not drift with the number of rows or the
+             time spent emitting them. Rows are read from the log in chunks through LogReader and
+             placed into packets at each parameter's array_index. Control methods are thread safe.
+    """
+
+    def __init__(self, log_file, parameters, num_channels=32, speed=1.0, file_format=None,
+                 clock=time.perf_counter):
+        """
+        @brief Open a log for replay.
+        @param log_file Path to a DataLogger CSV or JSON Lines log.
+        @param parameters Current parameter dictionaries; logged columns are matched by id and
+               emitted at the parameter's array_index. Parameters not in the log stay None.
+        @param num_channels Minimum packet length.
+        @param speed Initial playback speed, clamped to 0.1x-100x.
+        @param file_format 'csv' or 'json'; inferred from the extension when omitted.
+        @param clock Monotonic clock in seconds (injectable for tests).
+        """
+        mapped = [p for p in parameters if p.get('array_index') is not None]
+        self.reader = LogReader(log_file, file_format, mapped)
+        available = set(self.reader.parameter_ids)
+        self._slots = [(p['id'], int(p['array_index'])) for p in mapped if p['id'] in available]
+        self.packet_size = max([num_channels] + [idx + 1 for _, idx in self._slots])
+        self.start_time, self.end_time = self.reader.time_range()
+        if self.start_time is None:
+            self.start_time = self.end_time = 0.0
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._speed = self._clamp_speed(speed)
+        self._playing = False
+        self._anchor_pos = self.start_time
+        self._anchor_wall = clock()
+        self._chunk_elapsed = np.empty(0)
+        self._chunk_rows = []
+        self._cursor = 0
+        self._chunk_end = None
+        self._load_chunk(self.start_time, inclusive=True)
+
+    @staticmethod
+    def _clamp_speed(speed):
+        return min(max(float(speed), REPLAY_MIN_SPEED), REPLAY_MAX_SPEED)
+
+    @property
+    def duration(self):
+        return self.end_time - self.start_time
+
+    @property
+    def speed(self):
+        return self._speed
+
+    @property
+    def is_playing(self):
+        return self._playing
+
+    @property
+    def finished(self):
+        with self._lock:
+            return self._chunk_end is None and self._cursor >= len(self._chunk_rows)
+
+    def _position(self, now):
+        if not self._playing:
+            return self._anchor_pos
+        return self._anchor_pos + (now - self._anchor_wall) * self._speed
+
+    @property
+    def position(self):
+        """Current play head in log seconds, measured from the start of the session."""
+        with self._lock:
+            return min(self._position(self._clock()), self.end_time) - self.start_time
+
+    def _reanchor(self, position):
+        self._anchor_pos = position
+        self._anchor_wall = self._clock()
+
+    def play(self):
+        with self._lock:
+            if not self._playing:
+                self._reanchor(self._anchor_pos)
+                self._playing = True
+
+    def pause(self):
+        with self._lock:
+            if self._playing:
+                self._reanchor(min(self._position(self._clock()), self.end_time))
+                self._playing = False
+
+    def set_speed(self, speed):
+        """
+        @brief Change the playback speed without moving the play head.
+        @param speed Speed multiplier, clamped to 0.1x-100x.
+        @return The speed in effect.
+        """
+        with self._lock:
+            self._reanchor(self._position(self._clock()))
+            self._speed = self._clamp_speed(speed)
+            return self._speed
+
+    def seek(self, position):
+        """
+        @brief Move the play head.
+        @param position Seconds from the start of the session; clamped to the session.
+        """
+        target = min(max(self.start_time + float(position), self.start_time), self.end_time)
+        with self._lock:
+            self._reanchor(target)
+            self._load_chunk(target, inclusive=True)
+
+    def _load_chunk(self, start, inclusive):
+        end = start + REPLAY_CHUNK_SECONDS
+        data = self.reader.read(start, end, [pid for pid, _ in self._slots])
+        elapsed = data['elapsed']
+        keep = slice(None) if inclusive else elapsed > start
+        self._chunk_elapsed = elapsed[keep]
+        rows = [[None] * self.packet_size for _ in range(self._chunk_elapsed.size)]
+        for pid, idx in self._slots:
+            for row, value in zip(rows, data[pid][keep].tolist()):
+                if value == value:  # NaN marks a missing sample
+                    row[idx] = value
+        self._chunk_rows = rows
+        self._cursor = 0
+        self._chunk_end = end if end < self.end_time else None
+
+    def poll(self):
+        """
+        @brief Collect the packets that have come due since the last poll.
+        @return (packets, wait): packets in log order, and the seconds to wait before the next one
+                is due (capped at REPLAY_MAX_WAIT).
+        """
+        with self._lock:
+            head = self._position(self._clock())
+            packets = []
+            while True:
+                if self._cursor >= len(self._chunk_rows):
+                    if self._chunk_end is None or self._chunk_end > head:
+                        break
+                    self._load_chunk(self._chunk_end, inclusive=False)
+                    continue
+                stop = int(np.searchsorted(self._chunk_elapsed, head, 'right'))
+                if stop <= self._cursor:
+                    break
+                packets.extend(self._chunk_rows[self._cursor:stop])
+                self._cursor = stop
+
+            wait = REPLAY_MAX_WAIT
+            if self._playing and self._cursor < len(self._chunk_rows):
+                due = (self._chunk_elapsed[self._cursor] - head) / self._speed
+                wait = min(max(due, 0.0), REPLAY_MAX_WAIT)
+            return packets, wait
@@ -0,0 +1,573 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        report.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       PDF summary report generation.
+# @details     Builds the summary report from a DataLogger log file and runs the whole job in a
+#              separate process, so parsing and plotting never block the dashboard's GUI thread.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Run PDF summary report generation off the GUI
+#                                                thread
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Parallel per-parameter plot rendering with
+#                                                decimated inputs
+# 002  MOD      19-10-2026  MuhammadRamzy        fix: Stop plot workers on cancel and report plot errors
+#                                                as progress
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import io
+import os
+import queue
+import traceback
+import multiprocessing
+from datetime import datetime
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .log_parser import summarize_log
+from .decimation import decimate_minmax
+
+####################################################################################################
+
+PLOT_SIZE_INCHES = (8, 3)
+PLOT_DPI = 100
+PLOT_WIDTH_PX = PLOT_SIZE_INCHES[0] * PLOT_DPI
+PARALLEL_PLOT_THRESHOLD = 4     # Below this many plots a process pool costs more than it saves
+CANCEL_POLL_S = 0.2             # Progress is re-sent this often while pool plots run, to notice a cancel
+
+
+class ReportCancelled(Exception):
+    """Raised from a progress callback to abort report generation."""
+
+
+_plot_figure = None
+
+
+def _get_plot_figure():
+    """Figure reused by every plot rendered in this process (artists are cleared per plot)."""
+    global _plot_figure
+    if _plot_figure is None:
+        # Figure + Agg canvas directly: no pyplot global state, safe to run in any process.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        _plot_figure = Figure(figsize=PLOT_SIZE_INCHES, dpi=PLOT_DPI)
+        FigureCanvasAgg(_plot_figure)
+        # Fixed margins instead of tight_layout(), which costs an extra full draw per plot.
+        _plot_figure.subplots_adjust(left=0.08, right=0.98, top=0.9, bottom=0.15)
+        _plot_figure.add_subplot(111)
+    return _plot_figure
+
+
+def render_parameter_plot(param_name, plot_data):
+    """
+    @brief Render one parameter's history plot to PNG with the Agg backend.
+    @param param_name Parameter name used in the title.
+    @param plot_data Dictionary with 'unit', 'timestamps', 'values' and optionally 'filter_name',
+           'filtered_timestamps' and 'filtered_values'.
+    @return PNG image bytes.
+    """
+    fig = _get_plot_figure()
+    ax = fig.axes[0]
+    ax.clear()
+
+    ax.plot(plot_data['timestamps'], plot_data['values'], label='Raw Data', color='#a1a1a6', alpha=0.6, linewidth=1)
+    if 'filtered_values' in plot_data:
+        ax.plot(plot_data['filtered_timestamps'], plot_data['filtered_values'],
+                label=f"Filtered ({plot_data['filter_name']})", color='#007aff', linewidth=1.5)
+
+    ax.set_title(f"{param_name} History", fontsize=10, fontweight='bold', color='#333333')
+    ax.set_xlabel("Time (s)", fontsize=8)
+    ax.set_ylabel(plot_data['unit'], fontsize=8)
+    ax.tick_params(labelsize=8)
+    ax.grid(True, linestyle='--', alpha=0.3)
+    ax.legend(fontsize=8)
+
+    # ReportLab re-compresses embedded images, so a fast PNG compression level loses nothing.
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', pil_kwargs={'compress_level': 1})
+    return buf.getvalue()
+
+
+def _plot_data(stats):
+    """Decimate a parameter's series to the plot's pixel width (min/max per column)."""
+    plot_data = {'unit': stats['unit']}
+    plot_data['timestamps'], plot_data['values'] = decimate_minmax(stats['timestamps'], stats['values'], PLOT_WIDTH_PX)
+    if 'filtered_values' in stats:
+        plot_data['filter_name'] = stats['filter_name']
+        plot_data['filtered_timestamps'], plot_data['filtered_values'] = decimate_minmax(
+            stats['filtered_timestamps'], stats['filtered_values'], PLOT_WIDTH_PX)
+    return plot_data
+
+
+def _render_plot_job(job):
+    param_name, plot_data = job
+    try:
+        return param_name, render_parameter_plot(param_name, plot_data), None
+    except Exception as e:
+        return param_name, None, str(e)
+
+
+def render_parameter_plots(data_summary, progress=None, max_workers=None):
+    """
+    @brief Render every parameter plot of a summary, in parallel when worthwhile.
+    @param data_summary Summary dictionary produced by summarize_log().
+    @param progress Optional callable(percent, message); may raise ReportCancelled. It is also called
+           every CANCEL_POLL_S while pool plots run, and a cancel kills the pool's workers at once.
+    @param max_workers Upper bound on worker processes (defaults to the CPU count).
+    @return Dictionary mapping parameter name to (png_bytes, error_message).
+    """
+    jobs = [(name, _plot_data(stats)) for name, stats in data_summary['parameters'].items()
+            if len(stats['values']) > 1]
+    results = {}
+    if not jobs:
+        return results
+
+    def report(done):
+        if progress:
+            progress(60 + 35 * done // len(jobs), f"Rendering plots ({done}/{len(jobs)})...")
+
+    workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    if workers < 2 or len(jobs) < PARALLEL_PLOT_THRESHOLD:
+        for done, job in enumerate(jobs):
+            report(done)
+            name, png, error = _render_plot_job(job)
+            results[name] = (png, error)
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+    executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        report(0)
+        pending = {executor.submit(_render_plot_job, job) for job in jobs}
+        while pending:
+            done, pending = wait(pending, timeout=CANCEL_POLL_S, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, png, error = future.result()
+                results[name] = (png, error)
+            report(len(results))
+    except BaseException:
+        # Kill the workers here rather than leave them to a terminate() of this process, which
+        # would orphan them
+        processes = list(executor._processes.values())
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
+
+
+def build_summary_report(pdf_path, log_file, file_format, parameters, filters=None,
+                         report_title="Glance Report", progress=None):
+    """
+    @brief Parse a log file and write the PDF summary report.
+    @param pdf_path Output path of the PDF.
+    @param log_file Path of the DataLogger log to summarise.
+    @param file_format Log format ('csv' or 'json').
+    @param parameters Parameter dictionaries the log was written with.
+    @param filters Optional mapping of parameter id to filter dictionary for the filtered trace.
+    @param report_title Title printed on the first page.
+    @param progress Optional callable(percent, message); may raise ReportCancelled.
+    """
+    def parse_progress(bytes_read, total_bytes):
+        if progress:
+            progress(60 * bytes_read // max(total_bytes, 1), "Parsing logged data...")
+
+    if progress:
+        progress(0, "Parsing logged data...")
+    data_summary = summarize_log(log_file, file_format, parameters, filters=filters, progress=parse_progress)
+    create_pdf_report(pdf_path, data_summary, report_title, progress)
+    if progress:
+        progress(100, "Report complete")
+
+
+def create_pdf_report(pdf_path, data_summary, report_title, progress=None):
+    """
+    @brief Create a formatted PDF report with plots and professional styling.
+    @param pdf_path Output path of the PDF.
+    @param data_summary Summary dictionary produced by summarize_log().
+    @param report_title Title printed on the first page.
+    @param progress Optional callable(percent, message); may raise ReportCancelled.
+    """
+
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image as ReportLabImage
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+
+    # Create PDF document
+    doc = SimpleDocTemplate(pdf_path, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
+    story = []
+    styles = getSampleStyleSheet()
+
+    # --- Custom Styles ---
+    # Apple-like typography
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontName='Helvetica-Bold',
+        fontSize=24,
+        textColor=colors.HexColor('#1d1d1f'), # Apple dark gray
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontName='Helvetica-Bold',
+        fontSize=16,
+        textColor=colors.HexColor('#007aff'), # Apple Blue
+        spaceAfter=12,
+        spaceBefore=20
+    )
+
+    normal_style = ParagraphStyle(
+        'CustomNormal',
+        parent=styles['Normal'],
+        fontName='Helvetica',
+        fontSize=10,
+        textColor=colors.HexColor('#333333'),
+        leading=14
+    )
+
+    # --- Footer Function ---
+    def add_footer(canvas, doc):
+        canvas.saveState()
+        canvas.setFont('Helvetica', 9)
+        canvas.setFillColor(colors.HexColor('#86868b')) # Apple gray
+
+        # Draw Line
+        canvas.setStrokeColor(colors.HexColor('#d2d2d7'))
+        canvas.line(inch, 0.75*inch, letter[0]-inch, 0.75*inch)
+
+        # Left: Timestamp
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+        canvas.drawString(inch, 0.5*inch, f"Generated: {timestamp}")
+
+        # Center: Page Number
+        page_num = canvas.getPageNumber()
+        canvas.drawCentredString(letter[0]/2, 0.5*inch, f"Page {page_num}")
+
+        # Right: Logo & Branding
+        # Assuming logo exists at ./docs/public/Glance_nobg.png
+        logo_path = "./docs/public/Glance_nobg.png"
+        if os.path.exists(logo_path):
+            # Draw small logo
+            canvas.drawImage(logo_path, letter[0]-1.2*inch, 0.45*inch, width=0.2*inch, height=0.2*inch, mask='auto')
+            canvas.drawString(letter[0]-0.95*inch, 0.5*inch, "Glance")
+        else:
+            canvas.drawRightString(letter[0]-inch, 0.5*inch, "Glance Dashboard")
+
+        canvas.restoreState()
+
+    # --- Content ---
+
+    # 1. Title
+    story.append(Paragraph(report_title, title_style))
+    story.append(Spacer(1, 0.2*inch))
+
+    # 2. Metadata Table
+    story.append(Paragraph("Report Information", heading_style))
+
+    meta_data = [
+        ['Report Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
+        ['Data Source:', os.path.basename(data_summary['file_path'])],
+        ['File Size:', f"{data_summary['file_size'] / 1024:.2f} KB"],
+        ['Data Format:', data_summary['format'].upper()],
+        ['Total Samples:', str(data_summary['total_samples'])],
+    ]
+
+    if data_summary['start_time']:
+        meta_data.append(['Start Time:', str(data_summary['start_time'])])
+    if data_summary['end_time']:
+        meta_data.append(['End Time:', str(data_summary['end_time'])])
+    if data_summary['duration']:
+        hours = int(data_summary['duration'] // 3600)
+        minutes = int((data_summary['duration'] % 3600) // 60)
+        seconds = int(data_summary['duration'] % 60)
+        meta_data.append(['Duration:', f"{hours:02d}:{minutes:02d}:{seconds:02d}"])
+
+    meta_table = Table(meta_data, colWidths=[2*inch, 4*inch])
+    meta_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f5f5f7')), # Apple light gray
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1d1d1f')),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d2d2d7')),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ]))
+
+    story.append(meta_table)
+    story.append(Spacer(1, 0.3*inch))
+
+    # 3. Parameter Statistics Table
+    if data_summary['parameters']:
+        story.append(Paragraph("Parameter Statistics", heading_style))
+        story.append(Spacer(1, 0.1*inch))
+
+        stats_data = [['Parameter', 'Unit', 'Samples', 'Min', 'Max', 'Mean', 'Std Dev']]
+
+        for param_name, stats in data_summary['parameters'].items():
+            stats_data.append([
+                param_name,
+                stats['unit'],
+                str(stats['count']),
+                f"{stats['min']:.3f}",
+                f"{stats['max']:.3f}",
+                f"{stats['mean']:.3f}",
+                f"{stats['std']:.3f}"
+            ])
+
+        stats_table = Table(stats_data, colWidths=[1.4*inch, 0.7*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.8*inch])
+        stats_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#007aff')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d2d2d7')),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f7')]),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ]))
+
+        story.append(stats_table)
+        story.append(Spacer(1, 0.3*inch))
+
+        # 4. Detailed Analysis & Plots
+        story.append(PageBreak())
+        story.append(Paragraph("Detailed Parameter Analysis", heading_style))
+        story.append(Spacer(1, 0.2*inch))
+
+        plots = render_parameter_plots(data_summary, progress)
+
+        for param_name, stats in data_summary['parameters'].items():
+            # Parameter Header
+            param_title = ParagraphStyle(
+                'ParamTitle',
+                parent=styles['Heading3'],
+                fontSize=14,
+                textColor=colors.HexColor('#1d1d1f'),
+                spaceAfter=8,
+                fontName='Helvetica-Bold'
+            )
+            story.append(Paragraph(f"{param_name} ({stats['unit']})", param_title))
+
+            # Stats Table (Mini)
+            detail_data = [
+                ['Metric', 'Value', 'Metric', 'Value'],
+                ['Count', str(stats['count']), 'Min', f"{stats['min']:.4f}"],
+                ['Mean', f"{stats['mean']:.4f}", 'Max', f"{stats['max']:.4f}"],
+                ['Std Dev', f"{stats['std']:.4f}", 'Median', f"{stats['percentiles'][50]:.4f}"],
+                ['5th Pct', f"{stats['percentiles'][5]:.4f}", '95th Pct', f"{stats['percentiles'][95]:.4f}"],
+            ]
+
+            detail_table = Table(detail_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
+            detail_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f7')),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e5e5')),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ]))
+
+            story.append(detail_table)
+            story.append(Spacer(1, 0.2*inch))
+
+            # Plot (rendered up front by render_parameter_plots)
+            if param_name in plots:
+                png, error = plots[param_name]
+                if png:
+                    img = ReportLabImage(io.BytesIO(png), width=6*inch, height=2.25*inch)
+                    story.append(img)
+                    story.append(Spacer(1, 0.3*inch))
+                else:
+                    if progress:
+                        progress(95, f"Could not plot {param_name}: {error}")
+                    story.append(Paragraph(f"Could not generate plot: {error}", normal_style))
+
+            story.append(Spacer(1, 0.2*inch))
+
+    # Build PDF with Footer
+    if progress:
+        progress(95, "Writing PDF document...")
+    doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
+
+
+
+
+def _report_process_main(job, messages, cancel_event):
+    """Entry point of the report process; reports back through the `messages` queue."""
+    def progress(percent, message):
+        if cancel_event.is_set():
+            raise ReportCancelled()
+        messages.put(('progress', int(percent), message))
+
+    try:
+        build_summary_report(progress=progress, **job)
+        messages.put(('finished', job['pdf_path']))
+    except ReportCancelled:
+        if os.path.exists(job['pdf_path']):
+            os.remove(job['pdf_path'])
+        messages.put(('cancelled',))
+    except Exception as e:
+        traceback.print_exc()
+        messages.put(('failed', str(e)))
+
+
+class ReportJob(QObject):
+    """
+    @brief Runs build_summary_report() in a worker process.
+    @details The GUI keeps running while the report is produced; progress and the final result are
+             delivered as Qt signals by polling the worker's message queue from a QTimer.
+    """
+    progress = Signal(int, str)     # percent, status text
+    finished = Signal(str)          # PDF path
+    failed = Signal(str)            # error message
+    cancelled = Signal()
+
+    POLL_INTERVAL_MS = 100
+    CANCEL_GRACE_MS = 3000
+
+    def __init__(self, pdf_path, log_file, file_format, parameters, filters=None,
+                 report_title="Glance Report", parent=None):
+        super().__init__(parent)
+        self._job = {
+            'pdf_path': pdf_path,
+            'log_file': log_file,
+            'file_format': file_format,
+            'parameters': parameters,
+            'filters': filters or {},
+            'report_title': report_title,
+        }
+        # Spawn (not fork) so the worker never inherits the GUI's threads and locks.
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._messages = None
+        self._cancel_event = None
+        self._cancel_requested = False
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(self.POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+
+    @property
+    def pdf_path(self):
+        return self._job['pdf_path']
+
+    def start(self):
+        """Start the worker process."""
+        self._messages = self._context.Queue()
+        self._cancel_event = self._context.Event()
+        self._process = self._context.Process(
+            target=_report_process_main,
+            args=(self._job, self._messages, self._cancel_event),
+            name="GlanceReport"
+        )
+        self._process.start()
+        self._poll_timer.start()
+
+    def cancel(self):
+        """Ask the worker to stop; it is terminated if it does not exit within the grace period."""
+        if not self.is_running():
+            return
+        self._cancel_requested = True
+        self._cancel_event.set()
+        QTimer.singleShot(self.CANCEL_GRACE_MS, self._terminate_if_alive)
+
+    def is_running(self):
+        return self._process is not None and self._process.is_alive()
+
+    def _terminate_if_alive(self):
+        if self.is_running():
+            self._process.terminate()
+
+    def _poll(self):
+        # Sample liveness before draining so a result posted just before exit is never missed.
+        alive = self._process is not None and self._process.is_alive()
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            if kind == 'progress':
+                self.progress.emit(message[1], message[2])
+                continue
+            self._finish()
+            if kind == 'finished':
+                self.finished.emit(message[1])
+            elif kind == 'cancelled':
+                self.cancelled.emit()
+            else:
+                self.failed.emit(message[1])
+            return
+
+        if self._process is not None and not alive:
+            exit_code = self._process.exitcode
+            self._finish()
+            if self._cancel_requested:
+                self.cancelled.emit()
+            else:
+                self.failed.emit(f"Report process exited unexpectedly (exit code {exit_code})")
+
+    def _finish(self):
+        self._poll_timer.stop()
+        if self._process is not None:
+            self._process.join(timeout=1.0)
+            self._process = None
@@ -0,0 +1,146 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        series_buffer.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Append-only plot buffers for live time series.
+# @details     Keeps a plotted series in preallocated NumPy arrays that grow by doubling, together
+#              with an incrementally maintained min/max envelope, so appending new samples costs
+#              time proportional to the samples added rather than to the length of the history.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Incremental TimeGraph curve updates
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+
+from .decimation import MinMaxEnvelope
+
+####################################################################################################
+
+DEFAULT_INITIAL_CAPACITY = 4096
+DEFAULT_MAX_POINTS = 1000000
+DEFAULT_ENVELOPE_CAPACITY = 2048
+
+
+class SeriesBuffer:
+    """
+    @brief Growable (x, y) buffer with a running min/max envelope of its contents.
+    @details Storage doubles as needed up to max_points. Once full, the oldest quarter is dropped
+             in one move so trimming stays amortised O(1) per sample; the envelope is rebuilt only
+             then. x must be appended in non-decreasing order.
+    """
+
+    def __init__(self, max_points=DEFAULT_MAX_POINTS, envelope_capacity=DEFAULT_ENVELOPE_CAPACITY,
+                 initial_capacity=DEFAULT_INITIAL_CAPACITY):
+        self.max_points = max(4, int(max_points))
+        self.envelope_capacity = envelope_capacity
+        capacity = min(initial_capacity, self.max_points)
+        self._x = np.empty(capacity, dtype=np.float64)
+        self._y = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self.envelope = MinMaxEnvelope(envelope_capacity)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def x(self):
+        """View of the buffered x values (no copy)."""
+        return self._x[:self._size]
+
+    @property
+    def y(self):
+        """View of the buffered y values (no copy)."""
+        return self._y[:self._size]
+
+    def clear(self):
+        self._size = 0
+        self.envelope = MinMaxEnvelope(self.envelope_capacity)
+
+    def append(self, x, y):
+        """
+        @brief Append samples to the end of the series.
+        @param x 1-D array-like of x positions, not earlier than the last buffered one.
+        @param y 1-D array-like of values, same length as x.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.size > self.max_points:
+            x, y = x[-self.max_points:], y[-self.max_points:]
+        count = x.size
+        if not count:
+            return
+
+        needed = self._size + count
+        if needed > self.max_points:
+            self._drop_oldest(needed - self.max_points)
+            needed = self._size + count
+        if needed > self._x.size:
+            self._grow(needed)
+
+        self._x[self._size:needed] = x
+        self._y[self._size:needed] = y
+        self._size = needed
+        self.envelope.add(x, y)
+
+    def _grow(self, needed):
+        capacity = self._x.size
+        while capacity < needed:
+            capacity *= 2
+        capacity = min(capacity, self.max_points)
+        for name in ('_x', '_y'):
+            grown = np.empty(capacity, dtype=np.float64)
+            grown[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, grown)
+
+    def _drop_oldest(self, minimum):
+        drop = min(max(minimum, self.max_points // 4), self._size)
+        keep = self._size - drop
+        self._x[:keep] = self._x[drop:self._size]
+        self._y[:keep] = self._y[drop:self._size]
+        self._size = keep
+        self.envelope = MinMaxEnvelope(self.envelope_capacity)
+        self.envelope.add(self.x, self.y)
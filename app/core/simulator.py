@@ -38,7 +38,8 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # Created On:  29-11-2025
 #
 # @brief       Simulates telemetry data for the dashboard.
-# @details     Generates dummy data or reads from a backend source (Serial/TCP/UDP) and emits it via signals.
+# @details     Generates dummy data, reads from a backend source (Serial/TCP/UDP) or replays a logged
+#              session, and emits it via signals.
 ####################################################################################################
 # HISTORY:
 #
@@ -48,6 +49,9 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side
 #                                                layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Replay mode driven by a logged session
+# 002  MOD      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation
+# 003  MOD      19-10-2026  MuhammadRamzy        feat: Reader link statistics
 ####################################################################################################
 
 ####################################################################################################
@@ -58,6 +62,9 @@ import math
 import random
 from PySide6.QtCore import QThread, Signal
 from .backend import DataReader
+from .replay import LogReplay
+from .instrumentation import PipelineMetrics
+from .link_stats import LinkStats
 
 ####################################################################################################
 
@@ -67,6 +74,8 @@ class DataSimulator(QThread):
     @details Runs in a separate thread to prevent blocking the UI. Supports dummy data generation and backend connection.
     """
     newData = Signal(list) # Emits a list of values
+    replayProgress = Signal(float, float) # Replay position and duration in seconds
+    replayFinished = Signal()
 
     def __init__(self, num_channels=32, connection_settings=None, parameters=None):
         """
@@ -78,7 +87,7 @@ class DataSimulator(QThread):
         self.num_channels = num_channels
         self._is_running = True
         self._is_paused = False
-        self.mode = "dummy" # "dummy" or "backend"
+        self.mode = "dummy" # "dummy", "backend" or "replay"
         self.parameters = parameters or []
         self.connection_settings = connection_settings or {
             'mode': 'dummy',
@@ -96,7 +105,12 @@ class DataSimulator(QThread):
             'csv_separator': ',',
         }
         self.reader = None
+        self.replay = None
+        self.metrics = PipelineMetrics.shared()
+        self.link_stats = LinkStats()
+        self._connected_once = False
         self._connection_error_shown = False
+        self._replay_error_shown = False
 
     def _init_backend_connection(self):
         """
@@ -146,6 +160,8 @@ class DataSimulator(QThread):
                 csv_separator=cs.get('csv_separator',','),
                 parameters=self.parameters
             )
+            self.reader.metrics = self.metrics
+            self.reader.stats = self.link_stats
             
             # CRITICAL: Verify the connection actually works
             if mode == 'tcp' or mode == 'udp':
@@ -156,6 +172,9 @@ class DataSimulator(QThread):
                     raise ConnectionError("Serial port not opened")
             
             print(f"✓ {mode.upper()} connection established!")
+            if self._connected_once:
+                self.link_stats.add_reconnect()
+            self._connected_once = True
             self._connection_error_shown = False
             return True
             
@@ -174,6 +193,66 @@ class DataSimulator(QThread):
             
             return False
 
+    def _init_replay(self):
+        """
+        @brief Open the configured replay log if not already done.
+        @return True if a replay is ready, False otherwise.
+        """
+        if self.replay is not None:
+            return True
+        cs = self.connection_settings
+        try:
+            self.replay = LogReplay(cs.get('replay_file', ''), self.parameters,
+                                    num_channels=self.num_channels, speed=cs.get('replay_speed', 1.0))
+            self.replay.play()
+            self._replay_error_shown = False
+            return True
+        except (OSError, ValueError) as e:
+            if not self._replay_error_shown:
+                print(f"✗ Replay failed: {e}")
+                self._replay_error_shown = True
+            return False
+
+    def _run_replay_step(self):
+        """
+        @brief Emit the replayed packets that are due and wait for the next one.
+        """
+        if not self._init_replay():
+            time.sleep(1.0)
+            return
+        packets, wait = self.replay.poll()
+        for packet in packets:
+            self.newData.emit(packet)
+            self.link_stats.add_frame()
+        self.metrics.emitted += len(packets)
+        if packets:
+            self.replayProgress.emit(self.replay.position, self.replay.duration)
+        if self.replay.finished:
+            self.replay.pause()
+            self._is_paused = True
+            self.replayFinished.emit()
+            return
+        time.sleep(wait)
+
+    def set_replay_speed(self, speed):
+        """
+        @brief Change the replay speed.
+        @param speed Speed multiplier (0.1x-100x).
+        @return The speed in effect.
+        """
+        if self.replay:
+            speed = self.replay.set_speed(speed)
+        self.connection_settings['replay_speed'] = speed
+        return speed
+
+    def seek_replay(self, position):
+        """
+        @brief Move the replay to a position.
+        @param position Seconds from the start of the logged session.
+        """
+        if self.replay:
+            self.replay.seek(position)
+
     def run(self):
         """
         @brief Main thread loop.
@@ -196,6 +275,8 @@ class DataSimulator(QThread):
                             value = random.uniform(-10, 120)
                         packet[i] = value
                     self.newData.emit(packet)
+                    self.metrics.emitted += 1
+                    self.link_stats.add_frame()
                     time.sleep(0.1)
 
                 elif self.mode == "backend":
@@ -211,11 +292,14 @@ class DataSimulator(QThread):
                     retry_delay = 1.0
                     
                     try:
+                        rx_before = self.reader.rx_bytes
                         line = self.reader.read_line()
+                        self.metrics.rx_bytes += self.reader.rx_bytes - rx_before
                         
                         if isinstance(line, list):
                             packet = line
                             self.newData.emit(packet)
+                            self.metrics.emitted += 1
                         
                         time.sleep(0.01)  # Small delay to prevent CPU hogging
                         
@@ -231,6 +315,9 @@ class DataSimulator(QThread):
                         self._connection_error_shown = False
                         # Don't sleep here - let the retry logic handle it
                         
+                elif self.mode == "replay":
+                    self._run_replay_step()
+
             else:
                 # Paused - just sleep
                 time.sleep(0.1)
@@ -241,6 +328,14 @@ class DataSimulator(QThread):
         @return The new paused state (True if paused, False if running).
         """
         self._is_paused = not self._is_paused
+        if self.replay:
+            if self._is_paused:
+                self.replay.pause()
+            else:
+                if self.replay.finished:
+                    # Resuming a finished replay starts it over
+                    self.replay.seek(0.0)
+                self.replay.play()
         return self._is_paused
 
     def stop(self):
@@ -55,6 +55,9 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # 005  MOD      11-10-2025  oslowtech            Fixed Dialogs.py logging os and datetime import error
 # 006  MOD      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
 # 007  MOD      04-12-2025  MuhammadRamzy        feat: Professional widget-specific parameter selection
+# 008  MOD      19-10-2026  MuhammadRamzy        feat: Histogram range and accumulation options
+# 009  MOD      19-10-2026  MuhammadRamzy        feat: Live link statistics in the connection dialog
+# 010  MOD      19-10-2026  MuhammadRamzy        feat: Import pyserial's port listing on first use
 ####################################################################################################
 
 ####################################################################################################
@@ -68,24 +71,32 @@ from PySide6.QtWidgets import (
     QListWidget, QAbstractItemView, QPushButton, QVBoxLayout, QLabel,
     QTableWidget, QTableWidgetItem, QHeaderView, QHBoxLayout, QDoubleSpinBox,
     QMessageBox, QGroupBox, QFileDialog, QListWidgetItem, QToolBar, QGridLayout,
-    QWidget, QStackedWidget, QScrollArea
+    QWidget, QStackedWidget, QScrollArea, QCheckBox
 )
 from PySide6.QtGui import QIcon, QAction
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 from app.core.commands import UpdateParametersCommand
+from app.core.link_stats import format_bytes
 from app.core.history import CommandHistory
 
-try:
-    from serial.tools import list_ports as _serial_list_ports
-except ImportError:
-    _serial_list_ports = None
+
+def _serial_list_ports():
+    """
+    @brief pyserial's list_ports module, imported on first use; None when pyserial is missing.
+    """
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return None
+    return list_ports
 
 class ConnectionSettingsDialog(QDialog):
     """
     @brief Dialog for configuring data connection settings.
     @details Allows user to select connection mode (Dummy, Serial, TCP, UDP) and configure related parameters.
+             When the LinkStats of the running source are given, its live statistics are shown too.
     """
-    def __init__(self, settings, parent=None):
+    def __init__(self, settings, parent=None, link_stats=None):
         super().__init__(parent)
         self.setWindowTitle("Connection Settings")
         self._settings = dict(settings)
@@ -110,7 +121,8 @@ class ConnectionSettingsDialog(QDialog):
         self.serial_port_edit.setEditable(True)
         try:
             ports = []
-            if _serial_list_ports: ports = [p.device for p in _serial_list_ports.comports()]
+            list_ports = _serial_list_ports()
+            if list_ports: ports = [p.device for p in list_ports.comports()]
             if ports: self.serial_port_edit.addItems(ports)
         except Exception: pass
         self.serial_port_edit.setCurrentText(self._settings.get('serial_port', 'COM4'))
@@ -197,6 +209,23 @@ class ConnectionSettingsDialog(QDialog):
         
         main_layout.addWidget(format_group)
         
+        # --- Link Statistics (current connection) ---
+        self.link_stats = link_stats
+        if link_stats is not None:
+            stats_group = QGroupBox("Link Statistics")
+            stats_layout = QFormLayout(stats_group)
+            self.stats_labels = {}
+            for key, label in (('rate', "Throughput:"), ('errors', "Parse Errors:"),
+                               ('checksum', "Checksum Failures:"), ('reconnects', "Reconnects:"),
+                               ('jitter', "Jitter:"), ('total', "Received:")):
+                self.stats_labels[key] = QLabel()
+                stats_layout.addRow(label, self.stats_labels[key])
+            main_layout.addWidget(stats_group)
+            self.stats_timer = QTimer(self)
+            self.stats_timer.timeout.connect(self.refresh_link_stats)
+            self.stats_timer.start(1000)
+            self.refresh_link_stats()
+        
         # Buttons
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         buttons.accepted.connect(self.accept)
@@ -245,6 +274,20 @@ class ConnectionSettingsDialog(QDialog):
         self.csv_sep_combo.currentTextChanged.connect(_apply_csv_sep)
         _apply_csv_sep(self.csv_sep_combo.currentText())
 
+    def refresh_link_stats(self):
+        """Show the current statistics of the running connection"""
+        stats = self.link_stats.snapshot()
+        self.stats_labels['rate'].setText(
+            f"{stats['frames_per_s']:.1f} pkt/s, {format_bytes(stats['bytes_per_s'])}/s")
+        self.stats_labels['errors'].setText(
+            f"{stats['parse_errors']} ({stats['errors_per_s']:.1f}/s, {stats['error_rate']:.1%} of frames)")
+        self.stats_labels['checksum'].setText(
+            f"{stats['checksum_failures']} ({stats['checksum_per_s']:.1f}/s)")
+        self.stats_labels['reconnects'].setText(str(stats['reconnects']))
+        self.stats_labels['jitter'].setText(f"{stats['jitter_ms']:.2f} ms")
+        self.stats_labels['total'].setText(
+            f"{stats['total_frames']} packets, {format_bytes(stats['total_bytes'])}")
+
     def refresh_serial_ports(self):
         """Refresh the list of available serial ports"""
         current_text = self.serial_port_edit.currentText()
@@ -252,8 +295,9 @@ class ConnectionSettingsDialog(QDialog):
         
         try:
             ports = []
-            if _serial_list_ports:
-                ports = [p.device for p in _serial_list_ports.comports()]
+            list_ports = _serial_list_ports()
+            if list_ports:
+                ports = [p.device for p in list_ports.comports()]
             if ports:
                 self.serial_port_edit.addItems(ports)
             else:
@@ -602,6 +646,18 @@ class AddWidgetDialog(QDialog):
         hist_form.addRow("Data Source:", self.hist_source)
         self.hist_bins = QSpinBox(); self.hist_bins.setRange(5, 100); self.hist_bins.setValue(20)
         hist_form.addRow("Bins:", self.hist_bins)
+        # Fixed bin range; otherwise the range adapts to the data
+        self.hist_fixed_range = QCheckBox("Fixed range")
+        self.hist_min = QDoubleSpinBox(); self.hist_min.setRange(-1e6, 1e6); self.hist_min.setValue(0)
+        self.hist_max = QDoubleSpinBox(); self.hist_max.setRange(-1e6, 1e6); self.hist_max.setValue(100)
+        self.hist_min.setEnabled(False); self.hist_max.setEnabled(False)
+        self.hist_fixed_range.toggled.connect(self.hist_min.setEnabled)
+        self.hist_fixed_range.toggled.connect(self.hist_max.setEnabled)
+        hist_form.addRow(self.hist_fixed_range)
+        hist_form.addRow("Min:", self.hist_min)
+        hist_form.addRow("Max:", self.hist_max)
+        self.hist_accumulate = QCheckBox("Accumulate whole session (not just recent samples)")
+        hist_form.addRow(self.hist_accumulate)
         hist_layout.addWidget(hist_group)
         hist_layout.addStretch()
         self.pages["Histogram"] = hist_page; self.options_stack.addWidget(hist_page)
@@ -810,6 +866,9 @@ class AddWidgetDialog(QDialog):
         elif widget_type == "Histogram":
             param_ids.append(self.hist_source.currentData())
             options['bins'] = self.hist_bins.value()
+            if self.hist_fixed_range.isChecked() and self.hist_max.value() > self.hist_min.value():
+                options['range'] = [self.hist_min.value(), self.hist_max.value()]
+            options['accumulate'] = self.hist_accumulate.isChecked()
             
         elif widget_type == "Map (GPS)":
             param_ids = [self.map_lat.currentData(), self.map_lon.currentData()]
@@ -862,6 +921,12 @@ class AddWidgetDialog(QDialog):
         elif w_type == "Histogram" and p_ids:
             idx = self.hist_source.findData(p_ids[0])
             if idx >= 0: self.hist_source.setCurrentIndex(idx)
+            options = self.existing_config.get('options', {})
+            self.hist_bins.setValue(options.get('bins', 20))
+            if options.get('range'):
+                self.hist_fixed_range.setChecked(True)
+                self.hist_min.setValue(options['range'][0]); self.hist_max.setValue(options['range'][1])
+            self.hist_accumulate.setChecked(options.get('accumulate', False))
             
         elif w_type == "Map (GPS)" and len(p_ids) >= 2:
             idx1 = self.map_lat.findData(p_ids[0])
@@ -0,0 +1,254 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        headless.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Headless ingest-and-log mode.
+# @details     Loads a project file, connects its configured source and runs filters, alarms and logging
+#              with the same core modules as the dashboard, under a QCoreApplication. No Qt widget,
+#              WebEngine or pyqtgraph module is imported, so it runs on display-less recording boxes.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Headless ingest-and-log mode
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Read projects through project_io
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import argparse
+import os
+import signal
+import sys
+import time
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal
+from app.core.alarms import AlarmEngine
+from app.core.data_logger import DataLogger
+from app.core.filters import FilterManager
+from app.core.link_stats import format_bytes
+from app.core.project_io import load_project_file
+from app.core.simulator import DataSimulator
+
+####################################################################################################
+
+DEFAULT_STATUS_INTERVAL = 10.0   # Seconds between status lines
+
+
+class HeadlessRecorder(QObject):
+    """
+    @brief Records the configured source of a project to its data log without a GUI.
+    @details Packets are handled like MainWindow.update_data(): filters, alarms, then the logger.
+             Only the latest sample of each parameter is kept, which is all the logger reads.
+    """
+    finished = Signal()
+
+    def __init__(self, project, log_path=None, log_format=None, duration=None,
+                 status_interval=DEFAULT_STATUS_INTERVAL, output=print):
+        """
+        @param project Project dictionary as saved by the dashboard.
+        @param log_path Log file overriding the project's logging settings.
+        @param log_format 'csv' or 'json', overriding the project's logging settings.
+        @param duration Seconds to record before stopping; None records until stop().
+        @param status_interval Seconds between status lines; 0 disables them.
+        @param output Callable receiving each console line.
+        """
+        super().__init__()
+        self.parameters = project.get('parameters', [])
+        self.connection_settings = dict(project.get('connection_settings') or {'mode': 'dummy'})
+        self.duration = duration
+        self.output = output
+        self.data_history = {}
+        self.packets = 0
+        self.started = None
+        self.simulator = None
+
+        self.filter_manager = FilterManager()
+        self.filter_manager.from_dict(project.get('filters', {}))
+
+        self.alarm_engine = AlarmEngine(self.parameters)
+        self.alarm_engine.stateChanged.connect(self._on_alarm_changed)
+
+        settings = project.get('logging_settings') or {}
+        selected = settings.get('selected_params')
+        self.data_logger = DataLogger()
+        self.data_logger.configure(
+            format_type=log_format or settings.get('format', 'csv'),
+            file_path=log_path or settings.get('file_path'),
+            parameters=[p for p in self.parameters if selected is None or p['id'] in selected],
+            buffer_size=settings.get('buffer_size', 100)
+        )
+
+        self.status_timer = QTimer(self)
+        self.status_timer.timeout.connect(self.print_status)
+        if status_interval:
+            self.status_timer.setInterval(int(status_interval * 1000))
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """
+        @brief Create a recorder for a saved project file.
+        """
+        return cls(load_project_file(path), **kwargs)
+
+    def start(self):
+        """
+        @brief Open the log and connect the source.
+        """
+        self.data_logger.start_logging()
+        self.started = time.time()
+
+        self.simulator = DataSimulator(num_channels=32, connection_settings=self.connection_settings,
+                                       parameters=self.parameters)
+        mode = self.connection_settings.get('mode', 'dummy')
+        self.simulator.mode = mode if mode in ('dummy', 'replay') else 'backend'
+        self.simulator.newData.connect(self.handle_packet)
+        self.simulator.replayFinished.connect(self.stop)
+        self.simulator.start()
+
+        if self.status_timer.interval() > 0:
+            self.status_timer.start()
+        if self.duration:
+            QTimer.singleShot(int(self.duration * 1000), self.stop)
+        self.output(f"Recording {mode} source to {self.data_logger.log_file_path}")
+
+    def stop(self):
+        """
+        @brief Disconnect the source, flush and close the log, and emit finished.
+        """
+        if self.simulator is None:
+            return
+        simulator, self.simulator = self.simulator, None
+        simulator.stop()
+        simulator.wait()
+        self.status_timer.stop()
+        self.data_logger.stop_logging()
+        self.print_status(simulator)
+        self.output(f"Stopped; log written to {self.data_logger.log_file_path}")
+        self.finished.emit()
+
+    def handle_packet(self, packet):
+        if packet is None or not isinstance(packet, (list, tuple)):
+            return
+        timestamp = time.time()
+        self.packets += 1
+
+        for param_meta in self.parameters:
+            array_idx = param_meta.get('array_index')
+            if array_idx is not None and 0 <= array_idx < len(packet):
+                raw_value = packet[array_idx]
+                if raw_value is None:
+                    continue
+                param_id = param_meta['id']
+                filtered_value = self.filter_manager.apply_filters(param_id, raw_value, timestamp)
+                self.data_history[param_id] = [{
+                    'value': raw_value,
+                    'filtered_value': filtered_value,
+                    'timestamp': timestamp
+                }]
+
+        self.alarm_engine.evaluate(packet)
+        self.data_logger.log_data(packet, self.data_history)
+
+    def print_status(self, simulator=None):
+        simulator = simulator or self.simulator
+        if simulator is None or self.started is None:
+            return
+        stats = simulator.link_stats.snapshot()
+        log_size = 0
+        try:
+            log_size = os.path.getsize(self.data_logger.log_file_path)
+        except OSError:
+            pass
+        self.output(f"[{time.time() - self.started:8.1f} s] {self.packets} packets, "
+                    f"{stats['frames_per_s']:.1f} pkt/s, {format_bytes(stats['bytes_per_s'])}/s, "
+                    f"{stats['parse_errors']} parse errors, {stats['reconnects']} reconnects, "
+                    f"log {format_bytes(log_size)}")
+
+    def _on_alarm_changed(self, param_id, state, value):
+        name = next((p['name'] for p in self.parameters if p['id'] == param_id), param_id)
+        self.output(f"Alarm: {name} {state} ({value:.3f})")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Record a Glance project's data source without a GUI")
+    parser.add_argument("project", help="project file (.json) saved by the dashboard")
+    parser.add_argument("--duration", type=float, metavar="SECONDS",
+                        help="stop after SECONDS (default: run until interrupted)")
+    parser.add_argument("--log-file", metavar="PATH", help="log file, overriding the project's")
+    parser.add_argument("--log-format", choices=("csv", "json"), help="log format, overriding the project's")
+    parser.add_argument("--status-interval", type=float, default=DEFAULT_STATUS_INTERVAL, metavar="SECONDS",
+                        help="seconds between status lines, 0 to disable (default: %(default)s)")
+    return parser
+
+
+def main(argv=None):
+    """
+    @brief Run a headless recording until the duration elapses, a replay ends or SIGINT/SIGTERM.
+    @return Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    try:
+        recorder = HeadlessRecorder.from_file(args.project, log_path=args.log_file, log_format=args.log_format,
+                                              duration=args.duration, status_interval=args.status_interval)
+        recorder.start()
+    except (OSError, ValueError) as e:
+        print(f"Cannot start recording: {e}", file=sys.stderr)
+        return 1
+
+    recorder.finished.connect(app.quit)
+    previous = {signum: signal.signal(signum, lambda *_: recorder.stop())
+                for signum in (signal.SIGINT, signal.SIGTERM)}
+    # Python signal handlers only run between bytecodes; wake the interpreter regularly
+    wake_timer = QTimer()
+    wake_timer.timeout.connect(lambda: None)
+    wake_timer.start(200)
+    try:
+        return app.exec()
+    finally:
+        wake_timer.stop()
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
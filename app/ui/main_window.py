@@ -51,6 +51,27 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # 001  MOD      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side
 #                                                layout and QStackedWidget
 # 002  MOD      30-11-2025  MuhammadRamzy        feat: Enhance status bar UI/UX 
+# 003  MOD      19-10-2026  MuhammadRamzy        feat: Stream summary report statistics through
+#                                                log_parser instead of loading whole logs
+# 004  MOD      19-10-2026  MuhammadRamzy        feat: Generate summary reports in a worker process
+# 005  MOD      19-10-2026  MuhammadRamzy        feat: Replay logged sessions with speed and seek
+# 006  MOD      19-10-2026  MuhammadRamzy        feat: Feed TimeGraphs new samples only, by history
+#                                                sequence number
+# 007  MOD      19-10-2026  MuhammadRamzy        feat: Drive dashboard refreshes from the shared
+#                                                frame clock
+# 008  MOD      19-10-2026  MuhammadRamzy        feat: Redraw only widgets whose parameters changed
+# 009  MOD      19-10-2026  MuhammadRamzy        feat: Evaluate alarms through the central alarm engine
+# 010  MOD      19-10-2026  MuhammadRamzy        feat: Incremental histogram updates
+# 011  MOD      19-10-2026  MuhammadRamzy        feat: LogTable rows from history sequence numbers
+# 012  MOD      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation and overlay
+# 013  MOD      19-10-2026  MuhammadRamzy        feat: Built-in sampling profiler
+# 014  MOD      19-10-2026  MuhammadRamzy        feat: Reader link statistics in the status bar
+# 015  MOD      19-10-2026  MuhammadRamzy        feat: Lazy optional imports and on-demand phase pages
+# 016  MOD      19-10-2026  MuhammadRamzy        feat: Atomic compact project files and lazy tab restore
+# 017  MOD      19-10-2026  MuhammadRamzy        refactor: Stable tab IDs and widget/parameter reverse indexes
+# 018  MOD      19-10-2026  MuhammadRamzy        fix: Show replay position and keep pause button state in sync
+# 019  MOD      19-10-2026  MuhammadRamzy        fix: Pass widget options to TimeGraph
+# 020  MOD      19-10-2026  MuhammadRamzy        fix: Report saved profile paths in the status bar only
 ####################################################################################################
 
 ####################################################################################################
@@ -63,8 +84,8 @@ import json
 import base64
 import math
 import uuid
-import csv
 import random
+import importlib.util
 from datetime import datetime
 import numpy as np
 from PySide6.QtWidgets import (
@@ -77,38 +98,25 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QTimer, QThread, Signal, Slot, QByteArray, QPropertyAnimation, QEasingCurve, QPoint, QRect, QUrl, QSize, QSettings
 from PySide6.QtGui import QFont, QColor, QBrush, QAction, QPixmap, QIcon, QDesktopServices, QKeySequence, QShortcut
-import pyqtgraph as pg
-
-try:
-    from serial.tools import list_ports as _serial_list_ports
-except ImportError:
-    _serial_list_ports = None
 
 import webbrowser
 
-# ReportLab imports
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-
-# QWebEngineView import
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-except ImportError:
-    QWebEngineView = None
+# Heavy optional modules (pyserial's port scan, reportlab, QtWebEngine, pyqtgraph) are imported where
+# they are first used, so they do not add to start-up time.
 
 from app.core.data_logger import DataLogger
+from app.core.report import ReportJob
 from app.core.filters import FilterManager, MovingAverageFilter, LowPassFilter, KalmanFilter, MedianFilter
 from app.core.simulator import DataSimulator
+from app.core.frame_clock import FrameClock
+from app.core.instrumentation import PipelineMetrics
+from app.core.profiler import StackSampler, DEFAULT_DURATION
+from app.core.link_stats import format_bytes
+from app.core.project_io import save_project_file, load_project_file
+from app.core.alarms import AlarmEngine, alarm_state
 from app.widgets import ValueCard, TimeGraph, LogTable, GaugeWidget, HistogramWidget, LEDWidget, MapWidget, ClosableDock
 from app.widgets.telemetry import RawTelemetryMonitor, StandaloneTelemetryViewer
+from app.widgets.performance import PipelineOverlay
 from app.dialogs import ConnectionSettingsDialog, AddWidgetDialog, ParameterEntryDialog, ManageParametersDialog, DataLoggingDialog
 from app.core.history import CommandHistory
 from app.core.commands import AddWidgetCommand, RemoveWidgetCommand, UpdateParametersCommand
@@ -169,7 +177,12 @@ class MainWindow(QMainWindow):
         self.next_graph_color_index = 0
         self.parameters = []
         self.data_history = {}
-        self.tab_data = {}
+        self.history_seq = {}  # param_id -> total samples ever appended to data_history
+        self._dirty_params = set()  # params with samples appended since the last frame
+        self.param_subscribers = None  # param_id -> [(widget_id, widget, config)]; None = rebuild
+        self._stale_widgets = {}  # widget_id -> (widget, config) awaiting a render while off screen
+        self.tab_data = {}  # tab_id -> tab info; the id is also the 'tab_id' property of the tab's QMainWindow
+        self.widget_tabs = {}  # widget_id -> tab_id of the tab holding it
         self.graph_color_palette = ['#00BFFF', '#FF3131', '#39CCCC', '#F012BE', '#FFDC00', '#7FDBFF', '#01FF70', '#FF851B']
         self.next_graph_color_index = 0
         self.parameters = []; self.data_history = {}; self.tab_data = {}
@@ -196,12 +209,14 @@ class MainWindow(QMainWindow):
         # Metrics
         self.packet_count = 0
         self.total_packets = 0
-        self.total_rx_bytes = 0
         self.packet_timestamps = []
 
         # Raw telemetry monitor
         self.raw_tlm_monitor = None
         
+        # Summary report running in a worker process (if any)
+        self.report_job = None
+        
         # Track unsaved changes
         self.has_unsaved_changes = False
         self.current_project_path = None
@@ -235,20 +250,34 @@ class MainWindow(QMainWindow):
         
         # self.header_dock removed in favor of floating header in dashboard page
         
+        # Stage timings shared with the ingest thread, shown in the performance overlay
+        self.pipeline_metrics = PipelineMetrics.shared()
+
         # UI Update Timer (Throttling to ~30 FPS)
-        self.ui_update_timer = QTimer(self)
-        self.ui_update_timer.timeout.connect(self.update_dashboard_ui)
-        self.ui_update_timer.start(33) # 33ms = ~30 FPS
+        # Data distribution runs first in each frame, before the widgets that draw it
+        self.frame_clock = FrameClock.shared()
+        self.frame_clock.register(self, self.update_dashboard_ui, priority=0)
+
+        # Thresholds are compiled whenever the simulator restarts with new parameters
+        self.alarm_engine = AlarmEngine()
+        self.alarm_engine.stateChanged.connect(self._on_alarm_changed)
 
         self.health_timer = QTimer(self); self.health_timer.timeout.connect(self.check_data_stream); self.health_timer.start(1000)
         self.pause_button.clicked.connect(self.toggle_pause_stream); self.simulator = None
+        self.performance_overlay = PipelineOverlay(self.pipeline_metrics, self)
+        self.performance_overlay.closed.connect(lambda: self.performance_overlay_action.setChecked(False))
+        self.profiler = None
+        self.configured_widgets = []
         self._build_menu_bar()
         self._build_status_bar()
         self.apply_stylesheet()
         self._build_splash_screen()
-        self._build_welcome_page()
-        self._build_setup_page()
-        self._build_widgets_page()
+        # Wizard pages are built the first time their phase is shown
+        self._page_builders = {
+            'welcome': self._build_welcome_page,
+            'setup': self._build_setup_page,
+            'widgets': self._build_widgets_page,
+        }
         self._build_dashboard_page()
         self.show_phase("splash")
         self.restart_simulator()
@@ -413,8 +442,8 @@ class MainWindow(QMainWindow):
     def list_serial_ports(self):
         ports = []
         try:
-            if _serial_list_ports:
-                ports = [p.device for p in _serial_list_ports.comports()]
+            from serial.tools import list_ports
+            ports = [p.device for p in list_ports.comports()]
         except Exception:
             ports = []
         # Add common defaults if none found
@@ -445,14 +474,14 @@ class MainWindow(QMainWindow):
             if not self.simulator._is_paused: self.toggle_pause_stream()
         # self.update_status_bar()
 
-    def add_widget_to_dashboard(self, config, tab_index, widget_id=None):
+    def add_widget_to_dashboard(self, config, tab_id, widget_id=None):
         """
         @brief Add a widget to the dashboard.
         @param config Widget configuration dictionary.
-        @param tab_index Index of the tab to add the widget to.
+        @param tab_id ID of the tab to add the widget to.
         @param widget_id Optional unique ID for the widget.
         """
-        tab_info = self.tab_data.get(tab_index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info: return
         if widget_id is None: widget_id = str(uuid.uuid4())
         param_ids = config['param_ids']
@@ -464,7 +493,7 @@ class MainWindow(QMainWindow):
             for p_config in param_configs:
                 p_config['color'] = self.graph_color_palette[self.next_graph_color_index % len(self.graph_color_palette)]
                 self.next_graph_color_index += 1
-            widget = TimeGraph(param_configs)
+            widget = TimeGraph(param_configs, config.get('options'))
         elif config['displayType'] == 'Log Table':
             widget = LogTable(param_configs)
         elif config['displayType'] == 'Instant Value':
@@ -472,7 +501,7 @@ class MainWindow(QMainWindow):
         elif config['displayType'] == 'Gauge' and len(param_configs) == 1:
             widget = GaugeWidget(param_configs[0], config.get('options'))
         elif config['displayType'] == 'Histogram' and len(param_configs) == 1:
-            widget = HistogramWidget(param_configs[0])
+            widget = HistogramWidget(param_configs[0], config.get('options'))
         elif config['displayType'] == 'LED Indicator':
             widget = LEDWidget(param_configs, config.get('options'))
         elif config['displayType'] == 'Map (GPS)' and len(param_configs) == 2:
@@ -516,7 +545,7 @@ class MainWindow(QMainWindow):
                 orient = Qt.Orientation.Horizontal if last_orient == 'v' else Qt.Orientation.Vertical
                 tab_mainwindow.splitDockWidget(last_dock, dock, orient)
                 tab_info['last_orient'] = 'h' if orient == Qt.Orientation.Horizontal else 'v'
-            tab_info['widgets'][widget_id] = widget; tab_info['docks'][widget_id] = dock; tab_info['configs'][widget_id] = config
+            self._register_widget(tab_info, widget_id, widget, dock, config)
             # Maintain layout positions for move/tile operations
             positions = tab_info.setdefault('layout_positions', {})
             positions[widget_id] = self._next_grid_position(positions)
@@ -639,8 +668,8 @@ class MainWindow(QMainWindow):
         menu = QMenu(self)
         # Get widget info - store the dock reference directly
         self._context_dock = dock
-        current_index = self.tab_widget.currentIndex()
-        tinfo = self.tab_data.get(current_index, {})
+        tab_id = self._current_tab_id()
+        tinfo = self.tab_data.get(tab_id, {})
         widget_id = None
         for wid, d in tinfo.get('docks', {}).items():
             if d == dock:
@@ -657,7 +686,7 @@ class MainWindow(QMainWindow):
             close_action.triggered.connect(self._close_widget_direct)
             menu.addSeparator()
             tile_action = menu.addAction("Tile Evenly")
-            tile_action.triggered.connect(lambda: self._tile_evenly_safe(current_index))  # Pass current_index
+            tile_action.triggered.connect(lambda: self._tile_evenly_safe(tab_id))
         else:
             menu.addAction("No actions available")
         try:
@@ -676,9 +705,9 @@ class MainWindow(QMainWindow):
         col = n % cols
         return (row, col)
 
-    def _retile_positions(self, tab_index):
+    def _retile_positions(self, tab_id):
         """Retile docks based on saved positions (row, col) without changing assignments."""
-        tab_info = self.tab_data.get(tab_index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info: 
             return
         docks = tab_info['docks']
@@ -705,7 +734,7 @@ class MainWindow(QMainWindow):
         
         # If no positions saved, create a default grid layout
         if not non_floating_positions:
-            self._create_default_grid_positions(non_floating_docks, tab_index)
+            self._create_default_grid_positions(non_floating_docks, tab_id)
             non_floating_positions = tab_info.get('layout_positions', {})
         
         # Order docks by row-major order
@@ -782,9 +811,9 @@ class MainWindow(QMainWindow):
                     dock.setVisible(True)
                     dock.show()
 
-    def _create_default_grid_positions(self, docks_dict, tab_index):
+    def _create_default_grid_positions(self, docks_dict, tab_id):
         """Create default grid positions for docks that don't have saved positions."""
-        tab_info = self.tab_data.get(tab_index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info:
             return
             
@@ -806,7 +835,7 @@ class MainWindow(QMainWindow):
 
     def _rename_widget(self, widget_id):
         """Rename a widget"""
-        tab_info = self.tab_data.get(self.tab_widget.currentIndex())
+        tab_info = self.tab_data.get(self._current_tab_id())
         if not tab_info or widget_id not in tab_info['docks']: return
         dock = tab_info['docks'][widget_id]
         current_name = dock.windowTitle()
@@ -818,8 +847,7 @@ class MainWindow(QMainWindow):
         """Close the dock that was right-clicked"""
         if not hasattr(self, '_context_dock'): return
         dock = self._context_dock
-        current_index = self.tab_widget.currentIndex()
-        tab_info = self.tab_data.get(current_index)
+        tab_info = self.tab_data.get(self._current_tab_id())
         if not tab_info: return
         
         # Find the widget_id for this dock
@@ -830,14 +858,8 @@ class MainWindow(QMainWindow):
                 break
         
         if widget_id:
+            self._unregister_widget(widget_id)
             dock.deleteLater()
-            del tab_info['docks'][widget_id]
-            if widget_id in tab_info['widgets']: 
-                del tab_info['widgets'][widget_id]
-            if widget_id in tab_info['configs']: 
-                del tab_info['configs'][widget_id]
-            if 'layout_positions' in tab_info and widget_id in tab_info['layout_positions']:
-                del tab_info['layout_positions'][widget_id]
             self.refresh_active_displays_list()
 
     def _rename_widget_direct(self):
@@ -862,16 +884,16 @@ class MainWindow(QMainWindow):
             dock.show()
             
             # Trigger retiling to ensure proper positioning
-            self._retile_positions(self.tab_widget.currentIndex())
+            self._retile_positions(self._current_tab_id())
         else:
             # Floating the widget
             dock.setFloating(True)
             dock.raise_()
             dock.activateWindow()
 
-    def _tile_evenly_safe(self, tab_index):
+    def _tile_evenly_safe(self, tab_id):
         """Safely tile widgets in a grid pattern - handles any number of widgets dynamically"""
-        tab_info = self.tab_data.get(tab_index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info or not tab_info.get('docks'): 
             return
         
@@ -960,7 +982,7 @@ class MainWindow(QMainWindow):
 
     def _toggle_float_widget(self, widget_id):
         """Toggle float for a widget with improved snapping back behavior"""
-        tab_info = self.tab_data.get(self.tab_widget.currentIndex())
+        tab_info = self.tab_data.get(self._current_tab_id())
         if not tab_info or widget_id not in tab_info['docks']: 
             return
         dock = tab_info['docks'][widget_id]
@@ -972,7 +994,7 @@ class MainWindow(QMainWindow):
             dock.show()
             
             # Trigger retiling to ensure proper positioning
-            self._retile_positions(self.tab_widget.currentIndex())
+            self._retile_positions(self._current_tab_id())
         else:
             # Floating the widget
             dock.setFloating(True)
@@ -980,7 +1002,7 @@ class MainWindow(QMainWindow):
             dock.activateWindow()
 
     def _toggle_maximize_widget(self, widget_id):
-        tab_info = self.tab_data.get(self.tab_widget.currentIndex())
+        tab_info = self.tab_data.get(self._current_tab_id())
         if not tab_info or widget_id not in tab_info['docks']: return
         mw = tab_info['mainwindow']
         docks = tab_info['docks']
@@ -1002,8 +1024,8 @@ class MainWindow(QMainWindow):
                 d.setVisible(wid == widget_id)
             tab_info['maximized_widget_id'] = widget_id
 
-    def _tile_evenly(self, tab_index):
-        tab_info = self.tab_data.get(tab_index)
+    def _tile_evenly(self, tab_id):
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info: return
         # Reassign positions into an even grid
         positions = {}
@@ -1011,12 +1033,12 @@ class MainWindow(QMainWindow):
         for i, wid in enumerate(ids):
             positions[wid] = self._next_grid_position(positions)
         tab_info['layout_positions'] = positions
-        self._retile_positions(tab_index)
+        self._retile_positions(tab_id)
 
     def _move_widget(self, widget_id, direction):
         """Move widget in specified direction within the grid and retile."""
-        tab_index = self.tab_widget.currentIndex()
-        tab_info = self.tab_data.get(tab_index)
+        tab_id = self._current_tab_id()
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info: return
         positions = tab_info.setdefault('layout_positions', {})
         if widget_id not in positions: return
@@ -1045,7 +1067,7 @@ class MainWindow(QMainWindow):
             positions[swap_id] = (row, col)
         # Normalize positions to a compact grid
         self._normalize_positions(positions)
-        self._retile_positions(tab_index)
+        self._retile_positions(tab_id)
 
     def _handle_dock_snapping(self, dock):
         """Handle automatic snapping back when dock is dragged close to main window"""
@@ -1087,7 +1109,7 @@ class MainWindow(QMainWindow):
             dock.show()
             
             # Trigger retiling to ensure proper positioning
-            self._retile_positions(self.tab_widget.currentIndex())
+            self._retile_positions(self._current_tab_id())
 
     def _normalize_positions(self, positions):
         """Compress rows/cols to remove gaps after moves/closures with improved robustness."""
@@ -1134,12 +1156,16 @@ class MainWindow(QMainWindow):
 
         self.fps_tracker.tick()
 
-        # Track packets and bytes for status bar
         self.total_packets += 1
-        # Estimate bytes (each value as 4 bytes for simplicity)
-        self.total_rx_bytes += len(packet) * 4
 
-        # Iterate through the user-defined parameters, not the incoming data keys
+        metrics = self.pipeline_metrics
+        timed = metrics.enabled
+        if timed:
+            stage_start = time.perf_counter()
+
+        # Iterate through the user-defined parameters, not the incoming data keys.
+        # Filtering and history insertion run as two passes so each can be timed as one stage.
+        samples = []
         for param_meta in self.parameters:
             param_id = param_meta['id']
             array_idx = param_meta.get('array_index')
@@ -1152,115 +1178,151 @@ class MainWindow(QMainWindow):
 
                 # Apply filters to get filtered value
                 filtered_value = self.filter_manager.apply_filters(param_id, raw_value, timestamp)
+                samples.append((param_id, raw_value, filtered_value))
+
+        if timed:
+            filter_done = time.perf_counter()
+            metrics.record('filter', filter_done - stage_start)
+
+        for param_id, raw_value, filtered_value in samples:
+            # Store RAW value in history (for logging)
+            if param_id not in self.data_history: 
+                self.data_history[param_id] = []
+            param_history = self.data_history[param_id]
+            param_history.append({
+                'value': raw_value,  # Store raw value
+                'filtered_value': filtered_value,  # Also store filtered value
+                'timestamp': timestamp
+            })
+            if len(param_history) > 500:
+                del param_history[0]  # Limit history in place
+            self.history_seq[param_id] = self.history_seq.get(param_id, 0) + 1
+            self._dirty_params.add(param_id)
+
+        if timed:
+            metrics.record('history', time.perf_counter() - filter_done)
+        metrics.handled += 1
+
+        self.alarm_engine.evaluate(packet)
 
-                # Store RAW value in history (for logging)
-                if param_id not in self.data_history: 
-                    self.data_history[param_id] = []
-                self.data_history[param_id].append({
-                    'value': raw_value,  # Store raw value
-                    'filtered_value': filtered_value,  # Also store filtered value
-                    'timestamp': timestamp
-                })
-                self.data_history[param_id] = self.data_history[param_id][-500:]  # Limit history
-        
         # Log RAW data (not filtered) if logging is enabled
         if self.data_logger.is_logging:
+            if timed:
+                stage_start = time.perf_counter()
             self.data_logger.log_data(packet, self.data_history)
+            if timed:
+                metrics.record('log', time.perf_counter() - stage_start)
 
         # Send RAW data to raw telemetry monitor if open
         if self.raw_tlm_monitor and self.raw_tlm_monitor.isVisible():
             self.raw_tlm_monitor.append_packet(packet)
 
 
-    def update_dashboard_ui(self):
+    def _invalidate_subscriptions(self):
         """
-        @brief Update dashboard widgets at a fixed frame rate.
-        @details Called by QTimer to refresh UI elements using the latest data.
+        @brief Mark the parameter-to-widget index for rebuilding after widgets were added or removed.
         """
-        # Only update visible tab to save resources
-        current_tab_idx = self.tab_widget.currentIndex()
-        if current_tab_idx < 0:
-            return
-            
-        tab_info = self.tab_data.get(current_tab_idx)
-        if not tab_info:
-            return
+        self.param_subscribers = None
 
-        # Iterate through widgets in the current tab
-        for widget_id, widget in tab_info['widgets'].items():
-            config = tab_info['configs'].get(widget_id)
-            if not config:
-                continue
-                
-            # Check if widget is visible
-            if not widget.isVisible():
-                continue
+    def _build_subscriptions(self):
+        """
+        @brief Rebuild the parameter-to-widget index from tab_data.
+        @details Every widget is queued for one render, so new and reconfigured widgets show the
+                 current values even if their parameters are not changing.
+        """
+        self.param_subscribers = {}
+        self._stale_widgets = {}
+        for tab_info in self.tab_data.values():
+            for widget_id, widget in tab_info['widgets'].items():
+                config = tab_info['configs'].get(widget_id)
+                if not config:
+                    continue
+                for pid in config.get('param_ids', []):
+                    self.param_subscribers.setdefault(pid, []).append((widget_id, widget, config))
+                self._stale_widgets[widget_id] = (widget, config)
 
-            # Update based on widget type
-            if isinstance(widget, ValueCard):
-                # ValueCard now accepts a dict of values
-                values = {}
-                for pid in config['param_ids']:
-                    if pid in self.data_history and self.data_history[pid]:
-                        values[pid] = self.data_history[pid][-1]['filtered_value']
-                widget.update_values(values)
-            
-            elif isinstance(widget, GaugeWidget):
-                values = {}
-                for pid in config['param_ids']:
-                    if pid in self.data_history and self.data_history[pid]:
-                        values[pid] = self.data_history[pid][-1]['filtered_value']
-                widget.update_values(values)
-
-            elif isinstance(widget, LEDWidget):
-                # LEDWidget now accepts a dict of values
-                values = {}
-                for pid in config['param_ids']:
-                    if pid in self.data_history and self.data_history[pid]:
-                        values[pid] = self.data_history[pid][-1]['filtered_value']
-                widget.update_values(values)
-
-            elif isinstance(widget, TimeGraph):
-                    # Create filtered history for graphs
-                    filtered_history = {}
-                    has_data = False
-                    for pid in config['param_ids']:
-                        if pid in self.data_history:
-                            # Optimization: Only pass the last N points if history is huge?
-                            # For now, pass all, but TimeGraph should handle downsampling
-                            filtered_history[pid] = [
-                                {'value': dp['filtered_value'], 'timestamp': dp['timestamp']}
-                                for dp in self.data_history[pid]
-                            ]
-                            has_data = True
-                    if has_data:
-                        widget.update_data(filtered_history)
-
-            elif isinstance(widget, HistogramWidget):
-                if config['param_ids']:
-                    pid = config['param_ids'][0]
-                    if pid in self.data_history:
-                        hist_vals = [dp['filtered_value'] for dp in self.data_history[pid]]
-                        widget.update_histogram(hist_vals)
-
-            elif isinstance(widget, MapWidget):
-                # Map widget handles its own history extraction usually, or we pass full history
-                widget.update_position(self.data_history)
-            
-            elif isinstance(widget, LogTable):
-                # LogTable might need specific handling to not refresh too often
-                # It usually shows the latest value for a param
-                if config['param_ids']:
-                    pid = config['param_ids'][0]
-                    widget.update_data(pid, self.data_history)
-        
+    def update_dashboard_ui(self):
+        """
+        @brief Update dashboard widgets once per frame.
+        @details Called by the shared frame clock. Only widgets subscribed to a parameter that
+                 received samples since the previous frame are considered, and of those only the
+                 ones on screen are updated; off-screen ones are rendered once they become visible.
+        """
+        if self.param_subscribers is None:
+            self._build_subscriptions()
+
+        dirty, self._dirty_params = self._dirty_params, set()
+        for pid in dirty:
+            for widget_id, widget, config in self.param_subscribers.get(pid, ()):
+                self._stale_widgets[widget_id] = (widget, config)
+
+        timed = self.pipeline_metrics.enabled and self._stale_widgets
+        if timed:
+            render_start = time.perf_counter()
+        for widget_id, (widget, config) in list(self._stale_widgets.items()):
+            try:
+                if not FrameClock.is_on_screen(widget):
+                    continue
+            except RuntimeError:
+                # Widget deleted without going through the dashboard's removal paths
+                self._invalidate_subscriptions()
+                continue
+            del self._stale_widgets[widget_id]
+            self._render_widget(widget, config)
+        if timed:
+            self.pipeline_metrics.record('render', time.perf_counter() - render_start)
 
+    def _render_widget(self, widget, config):
+        """
+        @brief Push the latest data of a widget's parameters into it.
+        """
+        # Update based on widget type
+        if isinstance(widget, ValueCard):
+            # ValueCard now accepts a dict of values
+            values = {}
+            for pid in config['param_ids']:
+                if pid in self.data_history and self.data_history[pid]:
+                    values[pid] = self.data_history[pid][-1]['filtered_value']
+            widget.update_values(values)
+
+        elif isinstance(widget, GaugeWidget):
+            values = {}
+            for pid in config['param_ids']:
+                if pid in self.data_history and self.data_history[pid]:
+                    values[pid] = self.data_history[pid][-1]['filtered_value']
+            widget.update_values(values)
+
+        elif isinstance(widget, LEDWidget):
+            # LEDWidget now accepts a dict of values
+            values = {}
+            for pid in config['param_ids']:
+                if pid in self.data_history and self.data_history[pid]:
+                    values[pid] = self.data_history[pid][-1]['filtered_value']
+            widget.update_values(values)
+
+        elif isinstance(widget, TimeGraph):
+            # Graphs plot filtered values and pull only samples newer than their own cursor
+            widget.update_data(self.data_history, self.history_seq, 'filtered_value')
+
+        elif isinstance(widget, HistogramWidget):
+            # Counts only the samples newer than the histogram's own cursor
+            widget.update_data(self.data_history, self.history_seq, 'filtered_value')
+
+        elif isinstance(widget, MapWidget):
+            # Map widget handles its own history extraction usually, or we pass full history
+            widget.update_position(self.data_history)
+
+        elif isinstance(widget, LogTable):
+            # Rows are added for the samples newer than the table's own cursors
+            widget.update_data(self.data_history, self.history_seq, 'value')
 
     def restart_simulator(self):
         if self.simulator: 
             self.simulator.stop()
             self.simulator.wait()
         
+        self.alarm_engine.configure(self.parameters)
+
         # Create new simulator with connection settings and parameters
         self.simulator = DataSimulator(num_channels=32, connection_settings=self.connection_settings, parameters=self.parameters)
         
@@ -1268,12 +1330,18 @@ class MainWindow(QMainWindow):
         conn_mode = self.connection_settings.get('mode', 'dummy')
         if conn_mode == 'dummy':
             self.simulator.mode = "dummy"
+        elif conn_mode == 'replay':
+            self.simulator.mode = "replay"
         else:
             # For serial, tcp, udp - all use backend mode
             self.simulator.mode = "backend"
         
-        # Connect the signal for both modes
+        # Connect the signal for all modes
         self.simulator.newData.connect(self.update_data)
+        self.simulator.replayProgress.connect(self._on_replay_progress)
+        self.simulator.replayFinished.connect(self._on_replay_finished)
+        self.replay_label.setVisible(conn_mode == 'replay')
+        self._set_pause_button(False)
         self.simulator.start()
         
         # Give the connection a moment to establish
@@ -1283,45 +1351,33 @@ class MainWindow(QMainWindow):
 
     def _handle_dock_close(self, widget_id):
         #Called when the dock is closed using the title bar button
-        index = self.tab_widget.currentIndex()
-        if index < 0:
-            return
-
-        tab_info = self.tab_data.get(index)
+        tab_info, dock = self._unregister_widget(widget_id)
         if not tab_info:
             return
-
-        if widget_id in tab_info['docks']:
-            tab_info['docks'][widget_id].deleteLater()
-            del tab_info['docks'][widget_id]
-        if widget_id in tab_info['widgets']:
-            del tab_info['widgets'][widget_id]
-        if widget_id in tab_info['configs']:
-            del tab_info['configs'][widget_id]
-        if 'layout_positions' in tab_info and widget_id in tab_info['layout_positions']:
-            del tab_info['layout_positions'][widget_id]
+        if dock is not None:
+            dock.deleteLater()
 
         self.refresh_active_displays_list()
         self.mark_as_unsaved()
 
     def open_add_widget_dialog(self):
-        index = self.tab_widget.currentIndex()
-        if index < 0: QMessageBox.warning(self, "No Tab", "No active tab to add a widget to."); return
+        tab_id = self._current_tab_id()
+        if tab_id is None: QMessageBox.warning(self, "No Tab", "No active tab to add a widget to."); return
         dialog = AddWidgetDialog(self.parameters, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             widget_config = dialog.get_selection()
             # Use Command for Undo/Redo
-            command = AddWidgetCommand(self, widget_config, index)
+            command = AddWidgetCommand(self, widget_config, tab_id)
             self.dashboard_history.push(command)
             self.has_unsaved_changes = True
             self.update_window_title()
 
-    def _add_widget_internal(self, config, tab_idx, restore_id=None):
+    def _add_widget_internal(self, config, tab_id, restore_id=None):
         """Internal method to add a widget, used by Command"""
-        if tab_idx not in self.tab_data:
+        if tab_id not in self.tab_data:
             return None
             
-        tab_info = self.tab_data[tab_idx]
+        tab_info = self.tab_data[tab_id]
         widget_id = restore_id or str(uuid.uuid4())
         
         # Create widget instance
@@ -1335,7 +1391,7 @@ class MainWindow(QMainWindow):
             for p_config in param_configs:
                 p_config['color'] = self.graph_color_palette[self.next_graph_color_index % len(self.graph_color_palette)]
                 self.next_graph_color_index += 1
-            widget = TimeGraph(param_configs)
+            widget = TimeGraph(param_configs, config.get('options'))
         elif config['displayType'] == 'Log Table':
             widget = LogTable(param_configs)
         elif config['displayType'] == 'Instant Value':
@@ -1343,7 +1399,7 @@ class MainWindow(QMainWindow):
         elif config['displayType'] == 'Gauge' and len(param_configs) == 1:
             widget = GaugeWidget(param_configs[0], config.get('options'))
         elif config['displayType'] == 'Histogram' and len(param_configs) == 1:
-            widget = HistogramWidget(param_configs[0])
+            widget = HistogramWidget(param_configs[0], config.get('options'))
         elif config['displayType'] == 'LED Indicator':
             widget = LEDWidget(param_configs, config.get('options'))
         elif config['displayType'] == 'Map (GPS)' and len(param_configs) == 2:
@@ -1360,10 +1416,8 @@ class MainWindow(QMainWindow):
             # Connect edit signal with explicit lambda
             dock.edit_requested.connect(lambda wid: self.edit_widget(wid))
             
-            # Store in tab_data
-            tab_info['widgets'][widget_id] = widget
-            tab_info['configs'][widget_id] = config
-            tab_info['docks'][widget_id] = dock
+            # Store in tab_data and the widget/parameter indexes
+            self._register_widget(tab_info, widget_id, widget, dock, config)
             
             # Add to the tab's QMainWindow
             mainwindow.addDockWidget(Qt.DockWidgetArea.LeftDockWidgetArea, dock)
@@ -1373,7 +1427,7 @@ class MainWindow(QMainWindow):
             dock.raise_()
             
             # Arrange widgets
-            self._tile_evenly_safe(tab_idx)
+            self._tile_evenly_safe(tab_id)
             
             self.refresh_active_displays_list()
             
@@ -1384,71 +1438,60 @@ class MainWindow(QMainWindow):
     def edit_widget(self, widget_id):
         """Open edit dialog for existing widget"""
         # Find the widget configuration
-        for tab_idx, tab_info in self.tab_data.items():
-            if widget_id in tab_info['configs']:
-                config = tab_info['configs'][widget_id]
-                
-                # Open AddWidgetDialog in edit mode
-                dialog = AddWidgetDialog(self.parameters, self, edit_mode=True, existing_config=config)
-                if dialog.exec() == QDialog.DialogCode.Accepted:
-                    new_config = dialog.get_selection()
-                    
-                    # Remove old widget
-                    self._remove_widget_internal(widget_id, tab_idx)
-                    
-                    # Add new widget with same ID
-                    self._add_widget_internal(new_config, tab_idx, restore_id=widget_id)
-                    
-                    self.has_unsaved_changes = True
-                    self.update_window_title()
-                break
+        tab_id = self.widget_tabs.get(widget_id)
+        if tab_id is None:
+            return
+        config = self.tab_data[tab_id]['configs'][widget_id]
+        
+        # Open AddWidgetDialog in edit mode
+        dialog = AddWidgetDialog(self.parameters, self, edit_mode=True, existing_config=config)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            new_config = dialog.get_selection()
+            
+            # Remove old widget
+            self._remove_widget_internal(widget_id)
+            
+            # Add new widget with same ID
+            self._add_widget_internal(new_config, tab_id, restore_id=widget_id)
+            
+            self.has_unsaved_changes = True
+            self.update_window_title()
 
-    def _remove_widget_internal(self, widget_id, tab_idx):
+    def _remove_widget_internal(self, widget_id):
         """Internal method to remove a widget, used by Command"""
-        if tab_idx in self.tab_data:
-            tab_info = self.tab_data[tab_idx]
-            if widget_id in tab_info['widgets']:
-                dock = tab_info['docks'][widget_id]
-                # Hide immediately for instant visual feedback
-                dock.hide()
-                dock.deleteLater()
-                
-                del tab_info['widgets'][widget_id]
-                del tab_info['configs'][widget_id]
-                del tab_info['docks'][widget_id]
-                
-                # Clean up layout positions
-                if 'layout_positions' in tab_info and widget_id in tab_info['layout_positions']:
-                    del tab_info['layout_positions'][widget_id]
-                    # Normalize positions after removal
-                    self._normalize_positions(tab_info['layout_positions'])
+        tab_info, dock = self._unregister_widget(widget_id)
+        if dock is None:
+            return
+        # Hide immediately for instant visual feedback
+        dock.hide()
+        dock.deleteLater()
+        # Normalize positions after removal
+        self._normalize_positions(tab_info.get('layout_positions', {}))
 
-    def _get_widget_config(self, widget_id, tab_idx):
+    def _get_widget_config(self, widget_id):
         """Helper to get config for undo"""
-        if tab_idx in self.tab_data:
-            return self.tab_data[tab_idx]['configs'].get(widget_id)
-        return None
+        tab_info = self.tab_data.get(self.widget_tabs.get(widget_id))
+        return tab_info['configs'].get(widget_id) if tab_info else None
 
     def remove_widget_by_id(self, widget_id):
         # Find which tab has this widget
-        for tab_idx, info in self.tab_data.items():
-            if widget_id in info['widgets']:
-                # Use Command
-                command = RemoveWidgetCommand(self, widget_id, tab_idx)
-                self.dashboard_history.push(command)
-                self.has_unsaved_changes = True
-                self.update_window_title()
-                break
+        tab_id = self.widget_tabs.get(widget_id)
+        if tab_id is not None:
+            # Use Command
+            command = RemoveWidgetCommand(self, widget_id, tab_id)
+            self.dashboard_history.push(command)
+            self.has_unsaved_changes = True
+            self.update_window_title()
         self.refresh_active_displays_list() # Refresh list after command is pushed and executed
         
     def remove_selected_display(self):
         """Remove a widget via dialog selection"""
-        index = self.tab_widget.currentIndex()
-        if index < 0: 
+        tab_id = self._current_tab_id()
+        if tab_id is None: 
             QMessageBox.warning(self, "No Tab", "No active tab.")
             return
         
-        tab_info = self.tab_data.get(index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info or not tab_info['configs']:
             QMessageBox.information(self, "No Widgets", "No widgets to remove in current tab.")
             return
@@ -1477,23 +1520,17 @@ class MainWindow(QMainWindow):
             widget_id = widget_ids[selected_index]
             
             # Remove the widget
-            if widget_id in tab_info['docks']:
-                tab_info['docks'][widget_id].deleteLater()
-                del tab_info['docks'][widget_id]
-            if widget_id in tab_info['widgets']:
-                del tab_info['widgets'][widget_id]
-            if widget_id in tab_info['configs']:
-                del tab_info['configs'][widget_id]
-            if 'layout_positions' in tab_info and widget_id in tab_info['layout_positions']:
-                del tab_info['layout_positions'][widget_id]
+            _, dock = self._unregister_widget(widget_id)
+            if dock is not None:
+                dock.deleteLater()
             
             self.refresh_active_displays_list()
             self.mark_as_unsaved()
 
     def refresh_active_displays_list(self):
-        self.active_displays_list.clear(); index = self.tab_widget.currentIndex()
-        if index < 0 or index not in self.tab_data: return
-        tab_info = self.tab_data.get(index)
+        self.active_displays_list.clear()
+        tab_info = self.tab_data.get(self._current_tab_id())
+        if not tab_info: return
         for widget_id, config in tab_info['configs'].items():
             param_names = [p['name'] for p in self.parameters if p['id'] in config['param_ids']]
             display_name = f"{', '.join(param_names)} ({config['displayType']})"
@@ -1971,12 +2008,14 @@ class MainWindow(QMainWindow):
         if name is None:
             name, ok = QInputDialog.getText(self, "New Tab", "Enter tab name:")
             if not ok or not name: return
+        tab_id = str(uuid.uuid4())
         tab_main_window = QMainWindow()
+        tab_main_window.setProperty('tab_id', tab_id)
         tab_main_window.setDockNestingEnabled(True)
         # Ensure proper dock widget area setup
         tab_main_window.setCentralWidget(None)  # Clear any central widget
-        tab_index = self.tab_widget.addTab(tab_main_window, name)
-        self.tab_data[tab_index] = {
+        self.tab_data[tab_id] = {
+            'id': tab_id,
             'mainwindow': tab_main_window, 
             'widgets': {}, 
             'docks': {}, 
@@ -1985,10 +2024,64 @@ class MainWindow(QMainWindow):
             'floating_window': None,
             'layout_positions': {}  # Initialize layout positions
         }
+        position = self.tab_widget.addTab(tab_main_window, name)
         if not is_closable:
-            self.tab_widget.tabBar().setTabButton(tab_index, QTabBar.ButtonPosition.RightSide, None)
-        self.tab_widget.setCurrentIndex(tab_index)
-        return tab_index
+            self.tab_widget.tabBar().setTabButton(position, QTabBar.ButtonPosition.RightSide, None)
+        self.tab_widget.setCurrentIndex(position)
+        return tab_id
+
+    def _tab_id_at(self, position):
+        """
+        @brief ID of the tab shown at a QTabWidget position, or None.
+        """
+        widget = self.tab_widget.widget(position)
+        return widget.property('tab_id') if widget is not None else None
+
+    def _current_tab_id(self):
+        """
+        @brief ID of the tab currently shown in the main window, or None.
+        """
+        return self._tab_id_at(self.tab_widget.currentIndex())
+
+    def _tab_position(self, tab_id):
+        """
+        @brief QTabWidget position of a tab; -1 for floating or unknown tabs.
+        """
+        tab_info = self.tab_data.get(tab_id)
+        return self.tab_widget.indexOf(tab_info['mainwindow']) if tab_info else -1
+
+    def _register_widget(self, tab_info, widget_id, widget, dock, config):
+        """
+        @brief Record a widget in its tab and in the widget-to-tab and parameter-to-widget indexes.
+        """
+        tab_info['widgets'][widget_id] = widget
+        tab_info['docks'][widget_id] = dock
+        tab_info['configs'][widget_id] = config
+        self.widget_tabs[widget_id] = tab_info['id']
+        if self.param_subscribers is not None:
+            for pid in config.get('param_ids', []):
+                self.param_subscribers.setdefault(pid, []).append((widget_id, widget, config))
+            self._stale_widgets[widget_id] = (widget, config)
+
+    def _unregister_widget(self, widget_id):
+        """
+        @brief Drop a widget from its tab and from the indexes; the dock is left to the caller.
+        @return (tab_info, dock) of the widget, or (None, None) if it is not on the dashboard.
+        """
+        tab_info = self.tab_data.get(self.widget_tabs.pop(widget_id, None))
+        if not tab_info:
+            return None, None
+        tab_info['widgets'].pop(widget_id, None)
+        config = tab_info['configs'].pop(widget_id, None)
+        dock = tab_info['docks'].pop(widget_id, None)
+        tab_info.get('layout_positions', {}).pop(widget_id, None)
+        self._stale_widgets.pop(widget_id, None)
+        if self.param_subscribers is not None and config:
+            for pid in config.get('param_ids', []):
+                subscribers = self.param_subscribers.get(pid)
+                if subscribers:
+                    subscribers[:] = [entry for entry in subscribers if entry[0] != widget_id]
+        return tab_info, dock
 
     def _setup_tab_double_click(self):
         """Setup double-click handler for tab bar"""
@@ -2003,21 +2096,24 @@ class MainWindow(QMainWindow):
 
     def toggle_float_tab(self, tab_index):
         """Toggle tab between docked and floating state"""
-        if tab_index not in self.tab_data:
+        tab_id = self._tab_id_at(tab_index)
+        if tab_id not in self.tab_data:
             return
         
-        tab_info = self.tab_data[tab_index]
+        tab_info = self.tab_data[tab_id]
+        self._realize_tab(tab_id)
         
         if tab_info['is_floating']:
             # Dock the tab back
-            self._dock_tab(tab_index)
+            self._dock_tab(tab_id)
         else:
             # Float the tab
-            self._float_tab(tab_index)
+            self._float_tab(tab_id)
 
-    def _float_tab(self, tab_index):
+    def _float_tab(self, tab_id):
         """Detach tab into floating window"""
-        tab_info = self.tab_data[tab_index]
+        tab_info = self.tab_data[tab_id]
+        tab_index = self._tab_position(tab_id)
         tab_name = self.tab_widget.tabText(tab_index)
         
         # Create floating window
@@ -2043,7 +2139,7 @@ class MainWindow(QMainWindow):
         tab_info['floating_window'] = floating_window
         
         # Add menu bar to floating window
-        self._add_floating_window_menu(floating_window, tab_index, tab_name)
+        self._add_floating_window_menu(floating_window, tab_id, tab_name)
         
         # Show floating window
         floating_window.show()
@@ -2055,19 +2151,19 @@ class MainWindow(QMainWindow):
         def on_close(event):
             # Only dock if not being destroyed during app shutdown
             if not self.isHidden():
-                self._dock_tab(tab_index)
+                self._dock_tab(tab_id)
             if original_close:
                 original_close(event)
             event.accept()
         
         floating_window.closeEvent = on_close
 
-    def _dock_tab(self, tab_index):
+    def _dock_tab(self, tab_id):
         """Dock floating tab back to main window"""
-        if tab_index not in self.tab_data:
+        if tab_id not in self.tab_data:
             return
         
-        tab_info = self.tab_data[tab_index]
+        tab_info = self.tab_data[tab_id]
         
         if not tab_info.get('is_floating', False):
             return
@@ -2078,23 +2174,20 @@ class MainWindow(QMainWindow):
         if not floating_window:
             return
         
-        # Get the main window widget back
-        tab_main_window = floating_window.centralWidget()
+        # Get the main window widget back; takeCentralWidget() does not delete it
+        tab_main_window = floating_window.takeCentralWidget()
         
         if not tab_main_window:
             return
         
-        # Disconnect from floating window
-        floating_window.setCentralWidget(None)
-        
         # Get stored tab name
         tab_name = tab_info.get('stored_tab_name', 'Tab')
         
-        # Find a good position to insert (append to end)
-        insert_position = self.tab_widget.count()
+        # Put it back where it was floated from, or at the end if tabs were closed since
+        insert_position = min(tab_info.get('stored_tab_index', self.tab_widget.count()), self.tab_widget.count())
         
         # Add back to tab widget
-        new_index = self.tab_widget.addTab(tab_main_window, tab_name)
+        new_index = self.tab_widget.insertTab(insert_position, tab_main_window, tab_name)
         
         # Update tab info
         tab_info['is_floating'] = False
@@ -2102,63 +2195,13 @@ class MainWindow(QMainWindow):
         
         # Close floating window
         try:
-            floating_window.closeEvent = None  # Prevent recursion
+            floating_window.closeEvent = lambda event: event.accept()  # Prevent recursion
             floating_window.close()
             floating_window.deleteLater()
         except:
             pass
         # Switch to the docked tab
         self.tab_widget.setCurrentIndex(new_index)
-        
-        # If the index changed, update the mapping
-        if new_index != tab_index:
-            # We need to be careful here. tab_index is the OLD index.
-            # But wait, tab_index was removed from tab_widget earlier in _float_tab?
-            # No, _float_tab calls removeTab(tab_index).
-            # So when we call addTab, we get a NEW index.
-            # The tab_data still has the OLD index as key.
-            # We must move the data to the NEW index key.
-            
-            # Check if target index already exists (collision)
-            if new_index in self.tab_data:
-                # This shouldn't happen if indices are strictly managed, but let's be safe
-                # Shift existing data? Or just overwrite?
-                # Actually, QTabWidget indices shift when tabs are removed/added.
-                # We need to re-sync ALL tab_data keys with current QTabWidget indices.
-                pass
-
-            self.tab_data[new_index] = self.tab_data.pop(tab_index)
-            
-            # We should probably re-index everything to be safe
-            self._reindex_tabs()
-
-    def _reindex_tabs(self):
-        """Re-sync tab_data keys with current QTabWidget indices"""
-        new_tab_data = {}
-        
-        # Create a mapping of mainwindow -> tab_info
-        mw_to_info = {}
-        for idx, info in self.tab_data.items():
-            mw_to_info[info['mainwindow']] = info
-            
-        # Iterate through current tabs in QTabWidget
-        for i in range(self.tab_widget.count()):
-            widget = self.tab_widget.widget(i)
-            if widget in mw_to_info:
-                new_tab_data[i] = mw_to_info[widget]
-            else:
-                print(f"Warning: Tab at index {i} has no data")
-                
-        # Handle floating tabs
-        for idx, info in self.tab_data.items():
-            if info.get('is_floating', False):
-                # Find a free key for floating tabs
-                new_key = 1000
-                while new_key in new_tab_data:
-                    new_key += 1
-                new_tab_data[new_key] = info
-                    
-        self.tab_data = new_tab_data
 
     def _enable_dock_drag_drop(self):
         """Enable drag and drop for dock widgets across tabs"""
@@ -2174,7 +2217,8 @@ class MainWindow(QMainWindow):
         # Store the dock reference
         self._context_dock = dock
         current_index = self.tab_widget.currentIndex()
-        tinfo = self.tab_data.get(current_index, {})
+        tab_id = self._tab_id_at(current_index)
+        tinfo = self.tab_data.get(tab_id, {})
         widget_id = None
         
         for wid, d in tinfo.get('docks', {}).items():
@@ -2201,7 +2245,7 @@ class MainWindow(QMainWindow):
                         tab_name = self.tab_widget.tabText(i)
                         transfer_action = transfer_menu.addAction(tab_name)
                         transfer_action.triggered.connect(
-                            lambda checked, src=current_index, dst=i, wid=widget_id: 
+                            lambda checked, src=tab_id, dst=self._tab_id_at(i), wid=widget_id: 
                             self._transfer_widget_to_tab(src, dst, wid)
                         )
                 
@@ -2213,28 +2257,31 @@ class MainWindow(QMainWindow):
             menu.addSeparator()
             
             tile_action = menu.addAction("Tile Evenly")
-            tile_action.triggered.connect(lambda: self._tile_evenly_safe(current_index))
+            tile_action.triggered.connect(lambda: self._tile_evenly_safe(tab_id))
         else:
             menu.addAction("No actions available")
         
         menu.exec(dock.mapToGlobal(pos))
 
-    def _transfer_widget_to_tab(self, source_tab_index, dest_tab_index, widget_id):
+    def _transfer_widget_to_tab(self, source_tab_id, dest_tab_id, widget_id):
         """Transfer a widget from one tab to another"""
-        source_tab = self.tab_data.get(source_tab_index)
-        dest_tab = self.tab_data.get(dest_tab_index)
+        source_tab = self.tab_data.get(source_tab_id)
+        dest_tab = self.tab_data.get(dest_tab_id)
         
         if not source_tab or not dest_tab:
             return
         
         if widget_id not in source_tab['docks']:
             return
+        self._realize_tab(dest_tab_id)
         
         # Get widget information
-        dock = source_tab['docks'][widget_id]
         widget = source_tab['widgets'][widget_id]
         config = source_tab['configs'][widget_id]
         
+        # Remove from source tracking
+        _, dock = self._unregister_widget(widget_id)
+        
         # Get dock title for the new tab
         dock_title = dock.windowTitle()
         
@@ -2242,13 +2289,6 @@ class MainWindow(QMainWindow):
         source_main_window = source_tab['mainwindow']
         source_main_window.removeDockWidget(dock)
         
-        # Remove from source tracking
-        del source_tab['docks'][widget_id]
-        del source_tab['widgets'][widget_id]
-        del source_tab['configs'][widget_id]
-        if 'layout_positions' in source_tab and widget_id in source_tab['layout_positions']:
-            del source_tab['layout_positions'][widget_id]
-        
         # Create new dock in destination tab
         dest_main_window = dest_tab['mainwindow']
         
@@ -2273,9 +2313,7 @@ class MainWindow(QMainWindow):
             dest_main_window.splitDockWidget(dest_docks[-1], new_dock, Qt.Orientation.Horizontal)
         
         # Update destination tracking
-        dest_tab['docks'][widget_id] = new_dock
-        dest_tab['widgets'][widget_id] = widget
-        dest_tab['configs'][widget_id] = config
+        self._register_widget(dest_tab, widget_id, widget, new_dock, config)
         
         # Update layout positions
         positions = dest_tab.setdefault('layout_positions', {})
@@ -2289,7 +2327,9 @@ class MainWindow(QMainWindow):
         new_dock.raise_()
         
         # Switch to destination tab to show the result
-        self.tab_widget.setCurrentIndex(dest_tab_index)
+        dest_position = self._tab_position(dest_tab_id)
+        if dest_position >= 0:
+            self.tab_widget.setCurrentIndex(dest_position)
         
         # Refresh display list
         self.refresh_active_displays_list()
@@ -2297,7 +2337,7 @@ class MainWindow(QMainWindow):
         QMessageBox.information(
             self, 
             "Widget Moved", 
-            f"Widget moved to tab '{self.tab_widget.tabText(dest_tab_index)}'"
+            f"Widget moved to tab '{self.tab_widget.tabText(dest_position)}'"
         )
 
     def _setup_tab_drag_drop(self):
@@ -2339,7 +2379,7 @@ class MainWindow(QMainWindow):
         else:
             event.ignore()
     
-    def _add_floating_window_menu(self, floating_window, tab_index, tab_name):
+    def _add_floating_window_menu(self, floating_window, tab_id, tab_name):
         """Add menu bar to floating window"""
         menubar = floating_window.menuBar()
         
@@ -2348,7 +2388,7 @@ class MainWindow(QMainWindow):
         
         dock_action = QAction("Dock Tab", floating_window)
         dock_action.setShortcut("Ctrl+D")
-        dock_action.triggered.connect(lambda: self._dock_tab(tab_index))
+        dock_action.triggered.connect(lambda: self._dock_tab(tab_id))
         window_menu.addAction(dock_action)
         
         window_menu.addSeparator()
@@ -2380,7 +2420,7 @@ class MainWindow(QMainWindow):
         window_menu.addSeparator()
         
         rename_action = QAction("Rename Tab", floating_window)
-        rename_action.triggered.connect(lambda: self._rename_floating_tab(tab_index, floating_window))
+        rename_action.triggered.connect(lambda: self._rename_floating_tab(tab_id, floating_window))
         window_menu.addAction(rename_action)
         
         # View menu
@@ -2413,7 +2453,7 @@ class MainWindow(QMainWindow):
         
         floating_window.keyPressEvent = floating_key_press
 
-    def _rename_floating_tab(self, tab_index, floating_window):
+    def _rename_floating_tab(self, tab_id, floating_window):
         """Rename a floating tab"""
         current_name = floating_window.windowTitle().replace(" - Glance", "")
         new_name, ok = QInputDialog.getText(
@@ -2441,13 +2481,14 @@ class MainWindow(QMainWindow):
         menu = QMenu(self)
         
         # Float/Dock action
-        tab_info = self.tab_data.get(tab_index, {})
+        tab_id = self._tab_id_at(tab_index)
+        tab_info = self.tab_data.get(tab_id, {})
         if tab_info.get('is_floating', False):
             float_action = menu.addAction("Dock Tab")
-            float_action.triggered.connect(lambda: self._dock_tab(tab_index))
+            float_action.triggered.connect(lambda: self._dock_tab(tab_id))
         else:
             float_action = menu.addAction("Float Tab")
-            float_action.triggered.connect(lambda: self._float_tab(tab_index))
+            float_action.triggered.connect(lambda: self.toggle_float_tab(self._tab_position(tab_id)))
         
         menu.addSeparator()
         
@@ -2468,14 +2509,14 @@ class MainWindow(QMainWindow):
         if index < 0:
             return
         
-        tab_info = self.tab_data.get(index)
+        tab_info = self.tab_data.get(self._tab_id_at(index))
         if not tab_info:
             return
         
         if tab_info['is_floating']:
             # Rename floating window
             floating_window = tab_info['floating_window']
-            self._rename_floating_tab(index, floating_window)
+            self._rename_floating_tab(tab_info['id'], floating_window)
         else:
             # Rename docked tab
             current_name = self.tab_widget.tabText(index)
@@ -2491,36 +2532,26 @@ class MainWindow(QMainWindow):
     def close_tab(self, index):
         if index < 0: 
             return
-        
-        # Handle both floating and docked tabs
-        tab_info = None
-        
-        # First, try to find by direct index
-        if index in self.tab_data:
-            tab_info = self.tab_data[index]
-        else:
-            # If not found, might be because of reindexing, search by position
-            for idx, info in list(self.tab_data.items()):
-                if not info.get('is_floating', False):
-                    # Check if this is the tab at position 'index'
-                    tab_count = 0
-                    for i in sorted(self.tab_data.keys()):
-                        if not self.tab_data[i].get('is_floating', False):
-                            if tab_count == index:
-                                tab_info = self.tab_data[i]
-                                index = i
-                                break
-                            tab_count += 1
-                    if tab_info:
-                        break
-        
+        tab_id = self._tab_id_at(index)
+        if tab_id is not None:
+            self._discard_tab(tab_id)
+        self.refresh_active_displays_list()
+
+    def _discard_tab(self, tab_id):
+        """
+        @brief Delete a docked or floating tab with its widgets.
+        """
+        tab_info = self.tab_data.pop(tab_id, None)
         if not tab_info:
             return
+        for widget_id in tab_info['widgets']:
+            self.widget_tabs.pop(widget_id, None)
+        self._invalidate_subscriptions()
         
         # If floating, close the floating window first
         if tab_info.get('is_floating', False) and tab_info.get('floating_window'):
             try:
-                tab_info['floating_window'].closeEvent = None  # Prevent recursion
+                tab_info['floating_window'].closeEvent = lambda event: event.accept()  # Prevent recursion
                 tab_info['floating_window'].close()
                 tab_info['floating_window'].deleteLater()
             except:
@@ -2533,24 +2564,16 @@ class MainWindow(QMainWindow):
             except:
                 pass
         
+        # Remove from tab widget if not already removed
+        position = self.tab_widget.indexOf(tab_info['mainwindow'])
+        if position >= 0:
+            self.tab_widget.removeTab(position)
+        
         # Clean up main window
         try:
             tab_info['mainwindow'].deleteLater()
         except:
             pass
-        
-        # Remove from data
-        del self.tab_data[index]
-        
-        # Remove from tab widget if not already removed
-        if not tab_info.get('is_floating', False):
-            # Find actual position in tab widget
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.widget(i) == tab_info['mainwindow']:
-                    self.tab_widget.removeTab(i)
-                    break
-        
-        self.refresh_active_displays_list()
 
     def rename_current_tab(self):
         index = self.tab_widget.currentIndex()
@@ -2558,38 +2581,108 @@ class MainWindow(QMainWindow):
         current_name = self.tab_widget.tabText(index)
         new_name, ok = QInputDialog.getText(self, "Rename Tab", "Enter new tab name:", text=current_name)
         if ok and new_name: self.tab_widget.setTabText(index, new_name)
-    def on_tab_changed(self, index): self.refresh_active_displays_list()
+    def on_tab_changed(self, index):
+        self._realize_tab(self._tab_id_at(index))
+        self.refresh_active_displays_list()
+
+    def _realize_tab(self, tab_id):
+        """
+        @brief Build the widgets of a tab restored by load_project() that has not been shown yet.
+        @details The docks are created, then the saved dock state is applied straight away; the
+                 explicit grid layout is only used when the Qt state cannot be restored.
+        @param tab_id ID of the tab.
+        """
+        tab_info = self.tab_data.get(tab_id)
+        if not tab_info or 'pending' not in tab_info:
+            return
+        pending = tab_info.pop('pending')
+        try:
+            for widget_id, config in pending['configs'].items():
+                self.add_widget_to_dashboard(config, tab_id, widget_id)
+            restored = False
+            if pending['state']:
+                restored = tab_info['mainwindow'].restoreState(QByteArray(pending['state']))
+            if not restored and pending['explicit_layout']:
+                self._restore_tab_layout_explicit(tab_id, pending['explicit_layout'])
+            for dock in tab_info['docks'].values():
+                dock.show()
+        except Exception as e:
+            print(f"Error restoring tab {tab_id}: {e}")
     def get_alarm_state(self, value, thresholds):
-        # Handle None or non-numeric values gracefully
-        if value is None or not isinstance(value, (int, float)):
-            return 'Nominal'
+        # Handle None/non-numeric values and malformed thresholds gracefully ('Nominal')
+        return alarm_state(value, thresholds)
 
-        # Validate thresholds structure and values
-        required_keys = {'low_crit', 'low_warn', 'high_warn', 'high_crit'}
-        if not isinstance(thresholds, dict) or not required_keys.issubset(thresholds.keys()):
-            return 'Nominal'
+    def _on_alarm_changed(self, param_id, state, value):
+        name = next((p['name'] for p in self.parameters if p['id'] == param_id), param_id)
+        if state == 'Nominal':
+            self.statusBar().showMessage(f"{name} back to Nominal ({value:.3f})", 5000)
+        else:
+            self.statusBar().showMessage(f"{state}: {name} = {value:.3f}", 10000)
+
+    def _on_profile_action(self, checked):
+        if not checked:
+            self.finish_profiling()
+            return
+        seconds, ok = QInputDialog.getInt(self, "Record Profile", "Seconds to sample:",
+                                          int(DEFAULT_DURATION), 1, 600)
+        if ok:
+            self.start_profiling(seconds)
+        else:
+            self.profile_action.setChecked(False)
 
-        # Ensure all threshold values are numeric
+    def profile_output_dir(self):
+        """
+        @brief Folder profiles are written to: next to the current data log, else the logs folder.
+        """
+        if self.data_logger.log_file_path:
+            return os.path.dirname(os.path.abspath(self.data_logger.log_file_path))
+        return "logs"
+
+    def start_profiling(self, seconds=DEFAULT_DURATION):
+        """
+        @brief Sample the stacks of the GUI and ingest threads for a number of seconds.
+        @details The profile is written by finish_profiling() when the time is up, or earlier if
+                 the menu action is unchecked.
+        """
+        if self.profiler is not None:
+            return
+        profiler = self.profiler = StackSampler()
+        profiler.start(duration=seconds)
+        self.profile_action.setChecked(True)
+        # Only finish the run this timer belongs to, not one started after an early stop
+        QTimer.singleShot(int(seconds * 1000) + 100,
+                          lambda: self.profiler is profiler and self.finish_profiling())
+        self.statusBar().showMessage(f"Recording profile for {seconds:g} s...", int(seconds * 1000))
+
+    def finish_profiling(self):
+        """
+        @brief Stop the profiler if it is running and write its collapsed and speedscope files.
+        @return (collapsed path, speedscope path), or None if no profile was being recorded.
+        """
+        profiler, self.profiler = self.profiler, None
+        if profiler is None:
+            return None
+        profiler.stop()
+        self.profile_action.setChecked(False)
         try:
-            low_crit = float(thresholds['low_crit'])
-            low_warn = float(thresholds['low_warn'])
-            high_warn = float(thresholds['high_warn'])
-            high_crit = float(thresholds['high_crit'])
-        except (TypeError, ValueError):
-            # In case any threshold is None or non-numeric
-            return 'Nominal'
-
-        # Normal evaluation logic
-        if value < low_crit or value > high_crit:
-            return 'Critical'
-        if value < low_warn or value > high_warn:
-            return 'Warning'
-        return 'Nominal'
+            paths = profiler.write(self.profile_output_dir())
+        except OSError as e:
+            QMessageBox.warning(self, "Profile", f"Could not write the profile: {e}")
+            return None
+        self.statusBar().showMessage(f"Profile saved to {paths[0]} and {paths[1]}", 10000)
+        return paths
 
     def toggle_pause_stream(self):
         if self.simulator:
-            is_paused = self.simulator.toggle_pause()
-            self.pause_button.setText("Resume Stream" if is_paused else "Pause Stream")
+            self._set_pause_button(self.simulator.toggle_pause())
+
+    def _set_pause_button(self, paused):
+        """
+        @brief Keep the pause button's checked state and label in step with the stream.
+        @param paused True when the stream is paused.
+        """
+        self.pause_button.setChecked(paused)
+        self.pause_button.setText("Resume Stream" if paused else "Pause Stream")
     def check_data_stream(self):
         if not self.parameters:
             self.stream_status_label.setText("Awaiting Parameters")
@@ -2629,9 +2722,9 @@ class MainWindow(QMainWindow):
         
         self.setWindowTitle(title)
     
-    def _save_tab_layout_explicit(self, tab_index):
+    def _save_tab_layout_explicit(self, tab_id):
         """Save dock layout using grid positions"""
-        tab_info = self.tab_data.get(tab_index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info:
             return {}
         
@@ -2662,6 +2755,7 @@ class MainWindow(QMainWindow):
 
     def save_project(self, file_path=None):
         """Save project with improved functionality"""
+        interactive = not file_path
         if file_path:
             self.current_project_path = file_path
             
@@ -2672,21 +2766,32 @@ class MainWindow(QMainWindow):
             self.current_project_path = path
         
         try:
-            # Ensure tab indices are correct before saving
-            self._reindex_tabs()
+            # Docked tabs in their on-screen order, then floating ones
+            tab_ids = [self._tab_id_at(i) for i in range(self.tab_widget.count())]
+            tab_ids += [tab_id for tab_id, info in self.tab_data.items() if info.get('is_floating')]
             
             layout_data = {}
-            for index, tab_info in self.tab_data.items():
-                # Skip if index is not in tab widget (e.g. floating tabs might need special handling)
-                if index < self.tab_widget.count():
-                    tab_name = self.tab_widget.tabText(index)
-                elif tab_info.get('is_floating'):
-                    tab_name = tab_info.get('stored_tab_name', f"Floating Tab {index}")
+            for tab_id in tab_ids:
+                tab_info = self.tab_data.get(tab_id)
+                if not tab_info:
+                    continue
+                if tab_info.get('is_floating'):
+                    tab_name = tab_info.get('stored_tab_name', "Floating Tab")
                 else:
+                    tab_name = self.tab_widget.tabText(self._tab_position(tab_id))
+                
+                pending = tab_info.get('pending')
+                if pending:
+                    # Never shown since loading: write back what was loaded, untouched
+                    layout_data[tab_name] = {
+                        'state': base64.b64encode(pending['state']).decode('utf-8') if pending['state'] else None,
+                        'configs': {**pending['configs'], **tab_info['configs']},
+                        'explicit_layout': pending['explicit_layout']
+                    }
                     continue
                     
                 state = tab_info['mainwindow'].saveState()
-                explicit_layout = self._save_tab_layout_explicit(index)
+                explicit_layout = self._save_tab_layout_explicit(tab_id)
                 layout_data[tab_name] = {
                     'state': base64.b64encode(state.data()).decode('utf-8'),
                     'configs': tab_info['configs'],
@@ -2707,11 +2812,13 @@ class MainWindow(QMainWindow):
                 'created': datetime.now().isoformat()
             }
             
-            with open(self.current_project_path, 'w') as f:
-                json.dump(project_data, f, indent=4)
+            save_project_file(self.current_project_path, project_data)
             
             self.mark_as_saved()
-            QMessageBox.information(self, "Success", f"Project saved successfully to:\n{self.current_project_path}")
+            if interactive:
+                QMessageBox.information(self, "Success", f"Project saved successfully to:\n{self.current_project_path}")
+            else:
+                self.statusBar().showMessage(f"Project saved to {self.current_project_path}", 3000)
             self.update_status_bar_visibility("dashboard")
             return True
             
@@ -2724,12 +2831,12 @@ class MainWindow(QMainWindow):
         self.current_project_path = None
         self.save_project()
 
-    def _restore_tab_layout_explicit(self, tab_index, explicit_layout):
+    def _restore_tab_layout_explicit(self, tab_id, explicit_layout):
         """Restore dock layout from saved positions"""
         if not explicit_layout:
             return
         
-        tab_info = self.tab_data.get(tab_index)
+        tab_info = self.tab_data.get(tab_id)
         if not tab_info:
             return
         
@@ -2737,46 +2844,26 @@ class MainWindow(QMainWindow):
         if 'grid_positions' in explicit_layout:
             tab_info['layout_positions'] = explicit_layout['grid_positions']
             # Trigger retiling based on saved positions
-            self._retile_positions(tab_index)
+            self._retile_positions(tab_id)
         
-        # Restore individual dock states (floating, geometry)
-        if 'positions' in explicit_layout:
-            from PySide6.QtCore import QTimer
-            
-            def restore_dock_states():
-                try:
-                    for widget_id, pos_info in explicit_layout['positions'].items():
-                        if widget_id not in tab_info['docks']:
-                            continue
-                        
-                        dock = tab_info['docks'][widget_id]
-                        
-                        # Ensure dock is visible first
-                        dock.setVisible(True)
-                        
-                        # Restore floating and geometry
-                        if pos_info.get('floating', False):
-                            dock.setFloating(True)
-                            geom = pos_info.get('geometry', {})
-                            if geom:
-                                dock.setGeometry(
-                                    geom.get('x', 100), 
-                                    geom.get('y', 100), 
-                                    geom.get('width', 400), 
-                                    geom.get('height', 300)
-                                )
-                        else:
-                            dock.setFloating(False)
-                        
-                        # Ensure dock is raised and visible
-                        dock.show()
-                        dock.raise_()
-                        
-                except Exception as e:
-                    print(f"Error restoring dock states for tab {tab_index}: {e}")
-            
-            # Delay to let Qt finish initial layout and state restoration
-            QTimer.singleShot(300, restore_dock_states)
+        # Restore individual dock states (floating, geometry); the docks already exist
+        for widget_id, pos_info in explicit_layout.get('positions', {}).items():
+            dock = tab_info['docks'].get(widget_id)
+            if dock is None:
+                continue
+            if pos_info.get('floating', False):
+                dock.setFloating(True)
+                geom = pos_info.get('geometry', {})
+                if geom:
+                    dock.setGeometry(
+                        geom.get('x', 100), 
+                        geom.get('y', 100), 
+                        geom.get('width', 400), 
+                        geom.get('height', 300)
+                    )
+            else:
+                dock.setFloating(False)
+            dock.show()
 
     def load_project(self, file_path=None):
         """Load project with improved functionality"""
@@ -2799,8 +2886,7 @@ class MainWindow(QMainWindow):
             return False
         
         try:
-            with open(path, 'r') as f:
-                project_data = json.load(f)
+            project_data = load_project_file(path)
             
             # Load parameters
             self.parameters = project_data.get('parameters', [])
@@ -2841,52 +2927,26 @@ class MainWindow(QMainWindow):
             
             # Clear existing tabs and data
             self.data_history.clear()
-            while self.tab_widget.count() > 0:
-                self.close_tab(0)
-            
-            # Load layout data
+            # Load layout data. Tabs start as placeholders holding their saved configs and state;
+            # widgets are only built when a tab is first shown (see _realize_tab). currentChanged is
+            # blocked meanwhile so closing or adding tabs does not build anything.
             layout_data = project_data.get('layout', {})
-            for tab_name, tab_layout_data in layout_data.items():
-                index = self.add_new_tab(name=tab_name)
-                
-                # Add all widgets first
-                for widget_id, config in tab_layout_data.get('configs', {}).items():
-                    self.add_widget_to_dashboard(config, index, widget_id)
-                
-                # Use QTimer to ensure proper timing for state restoration
-                from PySide6.QtCore import QTimer
-                
-                def restore_tab_state(tab_idx, state_bytes, explicit_layout_data):
-                    def delayed_restore():
-                        try:
-                            restored = False
-                            # First restore Qt's built-in state
-                            if state_bytes:
-                                restored = self.tab_data[tab_idx]['mainwindow'].restoreState(QByteArray(state_bytes))
-                            
-                            # Only apply explicit layout restoration if restoreState failed or wasn't available
-                            # This prevents overwriting the correct layout with a stale grid layout
-                            if not restored and explicit_layout_data:
-                                self._restore_tab_layout_explicit(tab_idx, explicit_layout_data)
-                                
-                            # Ensure all docks are visible
-                            tab_info = self.tab_data.get(tab_idx)
-                            if tab_info:
-                                for dock in tab_info['docks'].values():
-                                    dock.show()
-                                    dock.raise_()
-                        except Exception as e:
-                            print(f"Error restoring tab {tab_idx}: {e}")
-                    
-                    # Delay restoration to let Qt finish widget creation
-                    QTimer.singleShot(100, delayed_restore)
-                
-                # Prepare state data
-                state_data = base64.b64decode(tab_layout_data['state']) if tab_layout_data.get('state') else None
-                explicit_layout = tab_layout_data.get('explicit_layout')
-                
-                # Schedule restoration
-                restore_tab_state(index, state_data, explicit_layout)
+            self.tab_widget.blockSignals(True)
+            try:
+                for tab_id in list(self.tab_data):
+                    self._discard_tab(tab_id)
+                for tab_name, tab_layout_data in layout_data.items():
+                    tab_id = self.add_new_tab(name=tab_name)
+                    self.tab_data[tab_id]['pending'] = {
+                        'configs': dict(tab_layout_data.get('configs', {})),
+                        'state': base64.b64decode(tab_layout_data['state']) if tab_layout_data.get('state') else None,
+                        'explicit_layout': tab_layout_data.get('explicit_layout')
+                    }
+                if self.tab_widget.count():
+                    self.tab_widget.setCurrentIndex(0)
+            finally:
+                self.tab_widget.blockSignals(False)
+            self.on_tab_changed(self.tab_widget.currentIndex())
             
             self.current_project_path = path
             self.mark_as_saved()
@@ -2896,7 +2956,10 @@ class MainWindow(QMainWindow):
             self.update_filter_menus()
             # self.update_status_bar()
             
-            QMessageBox.information(self, "Success", f"Project loaded successfully from:\n{path}")
+            if file_path:
+                self.statusBar().showMessage(f"Project loaded from {path}", 3000)
+            else:
+                QMessageBox.information(self, "Success", f"Project loaded successfully from:\n{path}")
             return True
             
         except Exception as e:
@@ -3025,6 +3088,21 @@ class MainWindow(QMainWindow):
         logging_menu.addAction(stop_logging_action)
         logging_menu.addAction(generate_summary_action)
 
+        replay_action = QAction("Replay Session Log...", self)
+        replay_action.setShortcut("Ctrl+Shift+P")
+        replay_action.triggered.connect(self.set_source_replay)
+
+        replay_speed_action = QAction("Replay Speed...", self)
+        replay_speed_action.triggered.connect(self.set_replay_speed)
+
+        seek_replay_action = QAction("Seek Replay...", self)
+        seek_replay_action.triggered.connect(self.seek_replay)
+
+        logging_menu.addSeparator()
+        logging_menu.addAction(replay_action)
+        logging_menu.addAction(replay_speed_action)
+        logging_menu.addAction(seek_replay_action)
+
         # View menu with shortcuts
         add_tab_action = QAction("Add Tab", self)
         add_tab_action.setShortcut("Ctrl+T")
@@ -3044,6 +3122,19 @@ class MainWindow(QMainWindow):
         raw_tlm_action.setShortcut("Ctrl+M")
         raw_tlm_action.triggered.connect(self.open_raw_telemetry_monitor)
 
+        # Live per-stage pipeline timings
+        self.performance_overlay_action = QAction("Performance Overlay", self)
+        self.performance_overlay_action.setShortcut("F12")
+        self.performance_overlay_action.setCheckable(True)
+        self.performance_overlay_action.setChecked(self.performance_overlay.isVisible())
+        self.performance_overlay_action.toggled.connect(self.performance_overlay.setVisible)
+
+        # Sampling profiler; the action stays checked while a profile is being recorded
+        self.profile_action = QAction("Record Profile...", self)
+        self.profile_action.setCheckable(True)
+        self.profile_action.setChecked(self.profiler is not None)
+        self.profile_action.triggered.connect(self._on_profile_action)
+
         # Add fullscreen action
         fullscreen_action = QAction("Toggle Fullscreen", self)
         fullscreen_action.setShortcut("F11")
@@ -3061,6 +3152,8 @@ class MainWindow(QMainWindow):
         view_menu.addSeparator()
         view_menu.addAction(fullscreen_action)
         view_menu.addAction(raw_tlm_action)
+        view_menu.addAction(self.performance_overlay_action)
+        view_menu.addAction(self.profile_action)
         view_menu.addSeparator()
         view_menu.addAction(pause_action)
 
@@ -3680,6 +3773,54 @@ class MainWindow(QMainWindow):
         self.restart_simulator()
         # self.update_status_bar()
 
+    def set_source_replay(self):
+        """
+        @brief Replay a logged session through the dashboard in place of live data.
+        """
+        log_path, _ = QFileDialog.getOpenFileName(
+            self, "Replay Session Log", "logs", "Data Logs (*.csv *.json);;All Files (*)")
+        if not log_path:
+            return
+        self.connection_settings['mode'] = 'replay'
+        self.connection_settings['replay_file'] = log_path
+        self.restart_simulator()
+
+    def _replay_active(self):
+        if self.connection_settings.get('mode') == 'replay' and self.simulator and self.simulator.replay:
+            return True
+        QMessageBox.information(self, "No Replay", "Start a session replay first (Data Logging > Replay Session Log...).")
+        return False
+
+    def set_replay_speed(self):
+        """
+        @brief Ask for a new replay speed.
+        """
+        if not self._replay_active():
+            return
+        speed, ok = QInputDialog.getDouble(self, "Replay Speed", "Speed multiplier (0.1x - 100x):",
+                                           self.simulator.replay.speed, 0.1, 100.0, 1)
+        if ok:
+            self.simulator.set_replay_speed(speed)
+
+    def seek_replay(self):
+        """
+        @brief Ask for a position to move the replay to.
+        """
+        if not self._replay_active():
+            return
+        replay = self.simulator.replay
+        position, ok = QInputDialog.getDouble(self, "Seek Replay", f"Position in seconds (0 - {replay.duration:.1f}):",
+                                              replay.position, 0.0, replay.duration, 1)
+        if ok:
+            self.simulator.seek_replay(position)
+
+    def _on_replay_progress(self, position, duration):
+        self.replay_label.setText(f"Replay {position:.1f} / {duration:.1f} s")
+
+    def _on_replay_finished(self):
+        self._set_pause_button(True)
+        self.statusBar().showMessage("Replay finished. Resume to play it again.", 5000)
+
     def _build_status_bar(self):
         sb = self.statusBar()
         sb.setSizeGripEnabled(False) # Cleaner look
@@ -3720,6 +3861,13 @@ class MainWindow(QMainWindow):
         self.session_time_label.setToolTip("Session Duration")
         sb.addPermanentWidget(self.session_time_label)
 
+        # Replay Position (only shown while replaying a log)
+        self.replay_label = QLabel("Replay 0.0 / 0.0 s")
+        self.replay_label.setObjectName("SBRight")
+        self.replay_label.setToolTip("Replay Position")
+        self.replay_label.setVisible(False)
+        sb.addPermanentWidget(self.replay_label)
+
         # Clock
         self.clock_label = QLabel()
         self.clock_label.setObjectName("SBRight")
@@ -3773,12 +3921,19 @@ class MainWindow(QMainWindow):
         else:
             self.log_size_label.setVisible(False)
             
-        # Packet Rate (Simplified estimation)
-        # Assuming total_packets is incremented elsewhere
-        # Ideally we'd track packets per second, but for now we can just show total or implement a rate counter
-        # Let's just show total packets for now if rate isn't tracked
-        if hasattr(self, 'total_packets'):
-             self.rate_label.setText(f"{self.total_packets} pkts")
+        # Link rates measured by the reader
+        if self.simulator:
+            stats = self.simulator.link_stats.snapshot()
+            self.rate_label.setText(f"{stats['frames_per_s']:.0f} pkt/s · {format_bytes(stats['bytes_per_s'])}/s")
+            self.rate_label.setToolTip(
+                f"Received: {stats['total_frames']} packets, {format_bytes(stats['total_bytes'])}\n"
+                f"Parse errors: {stats['parse_errors']} ({stats['error_rate']:.1%} of recent frames)\n"
+                f"Checksum failures: {stats['checksum_failures']}\n"
+                f"Reconnects: {stats['reconnects']}\n"
+                f"Inter-arrival jitter: {stats['jitter_ms']:.2f} ms")
+        else:
+            self.rate_label.setText("0 pkt/s")
+            self.rate_label.setToolTip("Incoming Data Rate")
 
     def update_connection_status(self):
         """Update connection status display (both header and status bar)"""
@@ -3800,6 +3955,11 @@ class MainWindow(QMainWindow):
             is_connected = True
             conn_text = "Connected (Dummy)"
             sb_text = "● Connected (Dummy)"
+        elif mode == 'replay':
+            is_connected = self.simulator.replay is not None
+            log_name = os.path.basename(self.connection_settings.get('replay_file', ''))
+            conn_text = f"Replaying ({log_name})"
+            sb_text = f"● Replay: {log_name}"
         else:
             # Check actual connection
             if mode == 'serial':
@@ -4418,8 +4578,8 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(nav_layout)
         self.stack.addWidget(self.widgets_page)
         
-        # Initialize empty widgets list
-        self.configured_widgets = []
+        # Show widgets configured (or loaded from a project) before the page was built
+        self.refresh_widgets_list()
         
         # Add default parameters if none exist
         # if not self.parameters:
@@ -4492,7 +4652,7 @@ class MainWindow(QMainWindow):
         # Add configured widgets to the main tab
         if self.configured_widgets:
             for widget_config in self.configured_widgets:
-                self.add_widget_to_dashboard(widget_config['config'], 0, widget_config['id'])
+                self.add_widget_to_dashboard(widget_config['config'], self._tab_id_at(0), widget_config['id'])
         
         # Show success message if widgets were added
         if self.configured_widgets:
@@ -4513,7 +4673,7 @@ class MainWindow(QMainWindow):
             file_path += '.glance'
 
         # Capture current layout positions
-        tab_info = self.tab_data.get(0) # Assuming single tab for now
+        tab_info = self.tab_data.get(self._tab_id_at(0)) # Assuming single tab for now
         current_positions = tab_info.get('layout_positions', {}) if tab_info else {}
         
         # Update configured_widgets with current positions
@@ -4560,7 +4720,7 @@ class MainWindow(QMainWindow):
             self.create_dashboard_with_widgets()
             
             # Restore layout positions
-            tab_info = self.tab_data.get(0)
+            tab_info = self.tab_data.get(self._tab_id_at(0))
             if tab_info:
                 positions = tab_info.setdefault('layout_positions', {})
                 has_positions = False
@@ -4570,7 +4730,7 @@ class MainWindow(QMainWindow):
                         has_positions = True
                 
                 if has_positions:
-                    self._retile_positions(0)
+                    self._retile_positions(tab_info['id'])
             
             QMessageBox.information(self, "Success", "Dashboard loaded successfully!")
         except Exception as e:
@@ -4728,8 +4888,8 @@ class MainWindow(QMainWindow):
     def generate_summary_report(self):
         """Generate a PDF summary report from logged data"""
         
-        # Check if ReportLab is available
-        if not REPORTLAB_AVAILABLE:
+        # Check if ReportLab is available (it is only imported by the report worker)
+        if importlib.util.find_spec("reportlab") is None:
             reply = QMessageBox.question(
                 self, 
                 "Library Required", 
@@ -4745,6 +4905,10 @@ class MainWindow(QMainWindow):
                                     "Then restart Glance.")
             return
         
+        if self.report_job and self.report_job.is_running():
+            QMessageBox.information(self, "Report In Progress", "A summary report is already being generated.")
+            return
+        
         # Check if there's any logged data
         if not self.data_logger.log_file_path or not os.path.exists(self.data_logger.log_file_path):
             QMessageBox.warning(self, "No Data Logged", 
@@ -4763,467 +4927,70 @@ class MainWindow(QMainWindow):
         if not pdf_path:
             return
         
-        # Create a progress dialog that allows the UI to remain responsive
-        from PySide6.QtWidgets import QProgressDialog
-        from PySide6.QtCore import Qt
+        # Make sure everything buffered so far is on disk before the worker reads the file
+        if self.data_logger.is_logging:
+            self.data_logger.flush_buffer()
+        
+        # Report is built in a worker process; the dashboard keeps ingesting meanwhile
+        self.report_job = ReportJob(
+            pdf_path,
+            self.data_logger.log_file_path,
+            self.data_logger.log_format,
+            self.data_logger.parameters,
+            filters=self._report_filters(),
+            report_title=self.windowTitle().replace(" - Telemetry Dashboard", "") + " Report",
+            parent=self
+        )
         
-        progress = QProgressDialog("Analyzing logged data and generating PDF report...", None, 0, 0, self)
+        from PySide6.QtWidgets import QProgressDialog
+        progress = QProgressDialog("Analyzing logged data and generating PDF report...", "Cancel", 0, 100, self)
         progress.setWindowTitle("Generating Report")
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setWindowModality(Qt.WindowModality.NonModal)
         progress.setMinimumDuration(0)
-        progress.setCancelButton(None)  # No cancel button
-        progress.setAutoClose(True)
-        progress.setAutoReset(True)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        progress.canceled.connect(self.report_job.cancel)
+        self.report_job.progress.connect(lambda pct, text: (progress.setValue(pct), progress.setLabelText(text)))
+        self.report_job.finished.connect(lambda path: self._on_report_finished(progress, path))
+        self.report_job.failed.connect(lambda error: self._on_report_failed(progress, error))
+        self.report_job.cancelled.connect(lambda: self._on_report_cancelled(progress))
         progress.show()
         
-        # Force the progress dialog to appear
-        QApplication.processEvents()
-        
-        try:
-            # Parse the logged data
-            progress.setLabelText("Step 1/2: Parsing logged data...")
-            QApplication.processEvents()
-            
-            data_summary = self._parse_logged_data()
-            
-            # Generate the PDF
-            progress.setLabelText("Step 2/2: Creating PDF document...")
-            QApplication.processEvents()
-            
-            self._create_pdf_report(pdf_path, data_summary)
-            
-            # Close progress dialog
-            progress.close()
-            QApplication.processEvents()
-            
-            # Ask if user wants to open the PDF
-            reply = QMessageBox.question(
-                self, 
-                "Report Generated", 
-                f"Summary report generated successfully!\n\n{pdf_path}\n\nWould you like to open it now?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                import webbrowser
-                webbrowser.open(pdf_path)
-                
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, "Error", f"Failed to generate report:\n{str(e)}")
-            import traceback
-            traceback.print_exc()
-
-    def _parse_logged_data(self):
-        """Parse logged data file and compute statistics"""
-        
-        log_file = self.data_logger.log_file_path
-        file_format = self.data_logger.log_format
-        
-        data_summary = {
-            'file_path': log_file,
-            'file_size': os.path.getsize(log_file),
-            'format': file_format,
-            'parameters': {},
-            'start_time': None,
-            'end_time': None,
-            'duration': 0,
-            'total_samples': 0
-        }
-        
-        try:
-            if file_format == 'csv':
-                # Parse CSV file
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    rows = list(reader)
-                    
-                    if not rows:
-                        return data_summary
-                    
-                    data_summary['total_samples'] = len(rows)
-                    
-                    # Get time range
-                    if 'timestamp' in rows[0]:
-                        data_summary['start_time'] = rows[0]['timestamp']
-                        data_summary['end_time'] = rows[-1]['timestamp']
-                    
-                    if 'elapsed_time' in rows[0] and rows[-1]['elapsed_time']:
-                        try:
-                            data_summary['duration'] = float(rows[-1]['elapsed_time'])
-                        except:
-                            pass
-                    
-                    # Compute statistics for each parameter
-                    for param in self.data_logger.parameters:
-                        param_id = param['id']
-                        param_name = param['name']
-                        
-                        # Find the column
-                        col_name = None
-                        for key in rows[0].keys():
-                            if param_id in key:
-                                col_name = key
-                                break
-                        
-                        if col_name:
-                            values = []
-                            for row in rows:
-                                try:
-                                    val = float(row[col_name])
-                                    values.append(val)
-                                except:
-                                    pass
-                            
-                            if values:
-                                data_summary['parameters'][param_name] = {
-                                    'unit': param['unit'],
-                                    'count': len(values),
-                                    'min': min(values),
-                                    'max': max(values),
-                                    'mean': sum(values) / len(values),
-                                    'values': values  # Store for plotting
-                                }
-            
-            elif file_format == 'json':
-                # Parse JSON Lines file
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    
-                    # Skip comment lines
-                    json_lines = [line for line in lines if not line.strip().startswith('#')]
-                    
-                    if not json_lines:
-                        return data_summary
-                    
-                    data_summary['total_samples'] = len(json_lines)
-                    
-                    # Parse first and last entries
-                    first_entry = json.loads(json_lines[0])
-                    last_entry = json.loads(json_lines[-1])
-                    
-                    data_summary['start_time'] = first_entry.get('timestamp', '')
-                    data_summary['end_time'] = last_entry.get('timestamp', '')
-                    data_summary['duration'] = last_entry.get('elapsed_time', 0)
-                    
-                    # Collect all values
-                    param_values = {}
-                    for line in json_lines:
-                        entry = json.loads(line)
-                        ts = entry.get('timestamp', 0)
-                        params = entry.get('parameters', {})
-                        
-                        for param_id, value in params.items():
-                            if value is not None:
-                                if param_id not in param_values:
-                                    param_values[param_id] = {'timestamps': [], 'values': []}
-                                param_values[param_id]['timestamps'].append(ts)
-                                param_values[param_id]['values'].append(value)
-                    
-                    # Compute statistics
-                    for param in self.data_logger.parameters:
-                        param_id = param['id']
-                        param_name = param['name']
-                        
-                        if param_id in param_values:
-                            values = param_values[param_id]['values']
-                            timestamps = param_values[param_id]['timestamps']
-                            data_summary['parameters'][param_name] = {
-                                'unit': param['unit'],
-                                'count': len(values),
-                                'min': min(values),
-                                'max': max(values),
-                                'mean': sum(values) / len(values),
-                                'values': values,
-                                'timestamps': timestamps
-                            }
-        
-        except Exception as e:
-            print(f"Error parsing log file: {e}")
-            import traceback
-            traceback.print_exc()
-        
-        return data_summary
+        self.report_job.start()
     
-    def _create_pdf_report(self, pdf_path, data_summary):
-        """Create a formatted PDF report with plots and professional styling"""
-        
-        from reportlab.lib.pagesizes import letter
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image as ReportLabImage
-        from reportlab.lib import colors
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-        import matplotlib.pyplot as plt
-        import io
-        from PIL import Image
-        
-        # Create PDF document
-        doc = SimpleDocTemplate(pdf_path, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
-        story = []
-        styles = getSampleStyleSheet()
-        
-        # --- Custom Styles ---
-        # Apple-like typography
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontName='Helvetica-Bold',
-            fontSize=24,
-            textColor=colors.HexColor('#1d1d1f'), # Apple dark gray
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontName='Helvetica-Bold',
-            fontSize=16,
-            textColor=colors.HexColor('#007aff'), # Apple Blue
-            spaceAfter=12,
-            spaceBefore=20
-        )
+    def _report_filters(self):
+        """Filter configuration for the report's filtered trace (first enabled filter per parameter)"""
+        report_filters = {}
+        for param in self.data_logger.parameters:
+            active_filter = next((f for f in self.filter_manager.get_filters(param['id']) if f.enabled), None)
+            if active_filter:
+                report_filters[param['id']] = active_filter.to_dict()
+        return report_filters
+    
+    def _on_report_finished(self, progress, pdf_path):
+        progress.close()
+        self.report_job = None
         
-        normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=styles['Normal'],
-            fontName='Helvetica',
-            fontSize=10,
-            textColor=colors.HexColor('#333333'),
-            leading=14
+        # Ask if user wants to open the PDF
+        reply = QMessageBox.question(
+            self, 
+            "Report Generated", 
+            f"Summary report generated successfully!\n\n{pdf_path}\n\nWould you like to open it now?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
-
-        # --- Footer Function ---
-        def add_footer(canvas, doc):
-            canvas.saveState()
-            canvas.setFont('Helvetica', 9)
-            canvas.setFillColor(colors.HexColor('#86868b')) # Apple gray
-            
-            # Draw Line
-            canvas.setStrokeColor(colors.HexColor('#d2d2d7'))
-            canvas.line(inch, 0.75*inch, letter[0]-inch, 0.75*inch)
-            
-            # Left: Timestamp
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
-            canvas.drawString(inch, 0.5*inch, f"Generated: {timestamp}")
-            
-            # Center: Page Number
-            page_num = canvas.getPageNumber()
-            canvas.drawCentredString(letter[0]/2, 0.5*inch, f"Page {page_num}")
-            
-            # Right: Logo & Branding
-            # Assuming logo exists at ./docs/public/Glance_nobg.png
-            logo_path = "./docs/public/Glance_nobg.png"
-            if os.path.exists(logo_path):
-                # Draw small logo
-                canvas.drawImage(logo_path, letter[0]-1.2*inch, 0.45*inch, width=0.2*inch, height=0.2*inch, mask='auto')
-                canvas.drawString(letter[0]-0.95*inch, 0.5*inch, "Glance")
-            else:
-                canvas.drawRightString(letter[0]-inch, 0.5*inch, "Glance Dashboard")
-                
-            canvas.restoreState()
-
-        # --- Content ---
-        
-        # 1. Title
-        # Use window title or default
-        report_title = self.windowTitle().replace(" - Telemetry Dashboard", "") + " Report"
-        story.append(Paragraph(report_title, title_style))
-        story.append(Spacer(1, 0.2*inch))
         
-        # 2. Metadata Table
-        story.append(Paragraph("Report Information", heading_style))
-        
-        meta_data = [
-            ['Report Generated:', datetime.now().strftime('%Y-%m-%d %H:%M:%S')],
-            ['Data Source:', os.path.basename(data_summary['file_path'])],
-            ['File Size:', f"{data_summary['file_size'] / 1024:.2f} KB"],
-            ['Data Format:', data_summary['format'].upper()],
-            ['Total Samples:', str(data_summary['total_samples'])],
-        ]
-        
-        if data_summary['start_time']:
-            meta_data.append(['Start Time:', str(data_summary['start_time'])])
-        if data_summary['end_time']:
-            meta_data.append(['End Time:', str(data_summary['end_time'])])
-        if data_summary['duration']:
-            hours = int(data_summary['duration'] // 3600)
-            minutes = int((data_summary['duration'] % 3600) // 60)
-            seconds = int(data_summary['duration'] % 60)
-            meta_data.append(['Duration:', f"{hours:02d}:{minutes:02d}:{seconds:02d}"])
-        
-        meta_table = Table(meta_data, colWidths=[2*inch, 4*inch])
-        meta_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f5f5f7')), # Apple light gray
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#1d1d1f')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d2d2d7')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        
-        story.append(meta_table)
-        story.append(Spacer(1, 0.3*inch))
-        
-        # 3. Parameter Statistics Table
-        if data_summary['parameters']:
-            story.append(Paragraph("Parameter Statistics", heading_style))
-            story.append(Spacer(1, 0.1*inch))
-            
-            stats_data = [['Parameter', 'Unit', 'Samples', 'Min', 'Max', 'Mean']]
-            
-            for param_name, stats in data_summary['parameters'].items():
-                stats_data.append([
-                    param_name,
-                    stats['unit'],
-                    str(stats['count']),
-                    f"{stats['min']:.3f}",
-                    f"{stats['max']:.3f}",
-                    f"{stats['mean']:.3f}"
-                ])
-            
-            stats_table = Table(stats_data, colWidths=[1.5*inch, 0.8*inch, 0.8*inch, 0.9*inch, 0.9*inch, 0.9*inch])
-            stats_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#007aff')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#d2d2d7')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f5f5f7')]),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
-            
-            story.append(stats_table)
-            story.append(Spacer(1, 0.3*inch))
-            
-            # 4. Detailed Analysis & Plots
-            story.append(PageBreak())
-            story.append(Paragraph("Detailed Parameter Analysis", heading_style))
-            story.append(Spacer(1, 0.2*inch))
-            
-            for param_name, stats in data_summary['parameters'].items():
-                # Find param ID to check filters
-                param_id = None
-                for p in self.data_logger.parameters:
-                    if p['name'] == param_name:
-                        param_id = p['id']
-                        break
-                
-                # Parameter Header
-                param_title = ParagraphStyle(
-                    'ParamTitle',
-                    parent=styles['Heading3'],
-                    fontSize=14,
-                    textColor=colors.HexColor('#1d1d1f'),
-                    spaceAfter=8,
-                    fontName='Helvetica-Bold'
-                )
-                story.append(Paragraph(f"{param_name} ({stats['unit']})", param_title))
-                
-                # Stats Table (Mini)
-                detail_data = [
-                    ['Metric', 'Value', 'Metric', 'Value'],
-                    ['Count', str(stats['count']), 'Min', f"{stats['min']:.4f}"],
-                    ['Mean', f"{stats['mean']:.4f}", 'Max', f"{stats['max']:.4f}"],
-                ]
-                
-                detail_table = Table(detail_data, colWidths=[1.5*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-                detail_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f5f5f7')),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e5e5')),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                
-                story.append(detail_table)
-                story.append(Spacer(1, 0.2*inch))
-                
-                # Plotting
-                if len(stats['values']) > 1:
-                    try:
-                        plt.figure(figsize=(8, 3), dpi=100)
-                        
-                        # Time axis
-                        timestamps = stats.get('timestamps', [])
-                        if not timestamps:
-                            timestamps = list(range(len(stats['values'])))
-                            xlabel = "Sample Index"
-                        else:
-                            start_ts = timestamps[0]
-                            timestamps = [t - start_ts for t in timestamps]
-                            xlabel = "Time (s)"
-                            
-                        values = stats['values']
-                        
-                        # Plot Raw Data
-                        plt.plot(timestamps, values, label='Raw Data', color='#a1a1a6', alpha=0.6, linewidth=1)
-                        
-                        # Apply Filter if exists
-                        if param_id:
-                            active_filters = self.filter_manager.get_filters(param_id)
-                            # Use the first enabled filter for the report
-                            active_filter = next((f for f in active_filters if f.enabled), None)
-                            
-                            if active_filter:
-                                filtered_values = []
-                                # Create a temporary filter instance
-                                if hasattr(active_filter, 'window_size'):
-                                     from app.core.filters import MovingAverageFilter, MedianFilter
-                                     if isinstance(active_filter, MovingAverageFilter):
-                                         temp_filter = MovingAverageFilter(active_filter.window_size)
-                                     elif isinstance(active_filter, MedianFilter):
-                                         temp_filter = MedianFilter(active_filter.window_size)
-                                elif hasattr(active_filter, 'alpha'):
-                                     from app.core.filters import LowPassFilter
-                                     temp_filter = LowPassFilter(active_filter.alpha)
-                                else:
-                                    temp_filter = None
-
-                                if temp_filter:
-                                    for v in values:
-                                        filtered_values.append(temp_filter.apply(v))
-                                    
-                                    plt.plot(timestamps, filtered_values, label=f'Filtered ({active_filter.__class__.__name__})', color='#007aff', linewidth=1.5)
-                        
-                        plt.title(f"{param_name} History", fontsize=10, fontweight='bold', color='#333333')
-                        plt.xlabel(xlabel, fontsize=8)
-                        plt.ylabel(stats['unit'], fontsize=8)
-                        plt.grid(True, linestyle='--', alpha=0.3)
-                        plt.legend(fontsize=8)
-                        plt.tight_layout()
-                        
-                        # Save to buffer
-                        buf = io.BytesIO()
-                        plt.savefig(buf, format='png')
-                        buf.seek(0)
-                        plt.close()
-                        
-                        # Add to PDF
-                        img = ReportLabImage(buf, width=6*inch, height=2.25*inch)
-                        story.append(img)
-                        story.append(Spacer(1, 0.3*inch))
-                        
-                    except Exception as e:
-                        print(f"Error plotting {param_name}: {e}")
-                        story.append(Paragraph(f"Could not generate plot: {str(e)}", normal_style))
-                
-                story.append(Spacer(1, 0.2*inch))
-
-        # Build PDF with Footer
-        doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
-
+        if reply == QMessageBox.StandardButton.Yes:
+            webbrowser.open(pdf_path)
+    
+    def _on_report_failed(self, progress, error):
+        progress.close()
+        self.report_job = None
+        QMessageBox.critical(self, "Error", f"Failed to generate report:\n{error}")
+    
+    def _on_report_cancelled(self, progress):
+        progress.close()
+        self.report_job = None
+        self.statusBar().showMessage("Report generation cancelled", 3000)
             
     # Duplicate update_connection_status removed
 
@@ -5318,6 +5085,10 @@ class MainWindow(QMainWindow):
         # Update status bar visibility
         self.update_status_bar_visibility(which)
         
+        builder = self._page_builders.pop(which, None)
+        if builder:
+            builder()
+        
         # Handle splash screen
         if which == "splash":
             self.stack.setCurrentWidget(self.splash_page)
@@ -5357,7 +5128,8 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(3000, hint.deleteLater)
 
     def open_connection_settings(self):
-        dialog = ConnectionSettingsDialog(self.connection_settings, self)
+        link_stats = self.simulator.link_stats if self.simulator else None
+        dialog = ConnectionSettingsDialog(self.connection_settings, self, link_stats=link_stats)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.connection_settings = dialog.get_settings()
             self.mark_as_unsaved()
@@ -5690,6 +5462,10 @@ class MainWindow(QMainWindow):
         if self.data_logger.is_logging:
             self.data_logger.stop_logging()
         
+        # Abandon any report still being generated
+        if self.report_job and self.report_job.is_running():
+            self.report_job.cancel()
+        
         # Stop raw telemetry monitor if active
         if self.raw_tlm_monitor:
             try:
@@ -5807,6 +5583,7 @@ class MainWindow(QMainWindow):
             ("General", [
                 (["F1"], "Show Shortcuts"),
                 (["F11"], "Toggle Fullscreen"),
+                (["F12"], "Performance Overlay"),
                 (["Esc"], "Exit Fullscreen"),
                 (["Space"], "Pause/Resume Stream"),
                 (["Ctrl", "Q"], "Exit Application"),
@@ -47,6 +47,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # No#   |       when       who                  what
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation
 ####################################################################################################
 
 ####################################################################################################
@@ -54,3 +55,4 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 from .general import ClosableDock, ValueCard, GaugeWidget, TimeGraph, HistogramWidget, LEDWidget, MapWidget, LogTable
 from .telemetry import RawTelemetryMonitor, StandaloneTelemetryViewer
+from .performance import PipelineOverlay
@@ -60,14 +60,22 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # 008  MOD      03-12-2025  NeilBaranwal9        feat: Fixed TimeGraph crash on high-frequency data
 # 009  MOD      07-12-2025  NeilBaranwal9        feat: Fix unresponsive TimeGraph buttons using QGraphicsProxyWidget
 # 010  MOD      07-12-2025  NeilBaranwal9        feat: Removed invisible hover-close button from TimeGraph and from CustomTitleBar in remaining widgets
+# 011  MOD      19-10-2026  MuhammadRamzy        feat: Viewport min/max decimation in TimeGraph
+# 012  MOD      19-10-2026  MuhammadRamzy        feat: Incremental TimeGraph curve updates
+# 013  MOD      19-10-2026  MuhammadRamzy        feat: TimeGraph refreshes on the shared frame clock
+# 014  MOD      19-10-2026  MuhammadRamzy        feat: Painted LEDs and value text with cached state
+# 015  MOD      19-10-2026  MuhammadRamzy        feat: Incremental histogram with fixed or adaptive bins
+# 016  MOD      19-10-2026  MuhammadRamzy        feat: Model/view LogTable over columnar sample storage
+# 017  MOD      19-10-2026  MuhammadRamzy        feat: Import pyqtgraph and QtWebEngine on first use
+# 018  MOD      19-10-2026  MuhammadRamzy        fix: Bound TimeGraph buffers and follow the last 500 samples
 ####################################################################################################
 
 
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel, QTableWidget, QHeaderView, QAbstractItemView, QGroupBox, QHBoxLayout, QTableWidgetItem, QComboBox, QPushButton, QApplication, QMessageBox, QDoubleSpinBox, QDockWidget, QGridLayout, QGraphicsDropShadowEffect, QLayout, QSizePolicy, QStyle, QGraphicsProxyWidget
-from PySide6.QtGui import QFont, QColor, QBrush, QLinearGradient, QConicalGradient, QPainter, QPen, QPainterPath, QIcon
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QFrame, QLabel, QTableWidget, QHeaderView, QAbstractItemView, QGroupBox, QHBoxLayout, QTableWidgetItem, QComboBox, QPushButton, QApplication, QMessageBox, QDoubleSpinBox, QDockWidget, QGridLayout, QLayout, QSizePolicy, QStyle, QGraphicsProxyWidget, QTableView
+from PySide6.QtGui import QFont, QColor, QBrush, QLinearGradient, QConicalGradient, QRadialGradient, QPainter, QPen, QPainterPath, QIcon
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-from PySide6.QtCore import Qt, Signal, QUrl, QTimer, QRectF, QPoint, QSize, QRect
+from PySide6.QtCore import Qt, Signal, QUrl, QTimer, QRectF, QPoint, QPointF, QSize, QRect, QAbstractTableModel, QModelIndex
 
 class FlowLayout(QLayout):
     def __init__(self, parent=None, margin=0, hSpacing=-1, vSpacing=-1):
@@ -203,14 +211,8 @@ class FlowLayout(QLayout):
             return parent.spacing()
 import time
 import math
+import operator
 import numpy as np
-import pyqtgraph as pg
-
-# Optional: Map widget using QWebEngineView if available
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView  # type: ignore
-except Exception:
-    QWebEngineView = None
 
 class CustomTitleBar(QWidget):
     """
@@ -314,11 +316,43 @@ class ClosableDock(QDockWidget):
             event.accept()
 
 
+class ValueText(QLabel):
+    """
+    @brief Label that paints its text in a cached colour instead of through a stylesheet.
+    @details Keeps the QLabel text API; set_state() repaints only when text or colour changed.
+    """
+    def __init__(self, text, color, parent=None):
+        super().__init__(text, parent)
+        self._color = QColor(color)
+
+    def set_state(self, text, color):
+        """
+        @brief Update the displayed text and colour.
+        @param text New text.
+        @param color QColor to paint the text with.
+        @return True if anything changed.
+        """
+        if text == self.text() and color == self._color:
+            return False
+        self._color = color
+        self.setText(text)
+        self.update()
+        return True
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setFont(self.font())
+        painter.setPen(self._color)
+        painter.drawText(self.contentsRect(), self.alignment(), self.text())
+
 class ValueCard(QFrame):
     """
     @brief Widget for displaying multiple scalar values in a grid (Value Panel).
     @details Shows parameter names, values, and units for a list of parameters.
     """
+    VALUE_COLOR = QColor("#ffffff")
+    EMPTY_COLOR = QColor(255, 255, 255, 77)
+
     def __init__(self, param_configs, priority=None):
         super().__init__()
         self.param_configs = param_configs
@@ -352,9 +386,8 @@ class ValueCard(QFrame):
             name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
             # Center: Value (Large, Bold)
-            value_label = QLabel("--")
+            value_label = ValueText("--", self.EMPTY_COLOR)
             value_label.setFont(QFont("SF Pro Display", 56, QFont.Weight.Bold)) 
-            value_label.setStyleSheet("color: #ffffff;")
             value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             self.value_labels[p_config['id']] = value_label
             
@@ -393,12 +426,10 @@ class ValueCard(QFrame):
                         display_value = f"{val:.2f}"
                     else:
                         display_value = f"{val:.3f}"
-                    lbl.setText(display_value)
                     # Dynamic color based on value? For now keep white.
-                    lbl.setStyleSheet("color: #ffffff; border: none; background: transparent;")
+                    lbl.set_state(display_value, self.VALUE_COLOR)
                 else:
-                    lbl.setText("--")
-                    lbl.setStyleSheet("color: rgba(255, 255, 255, 0.3); border: none; background: transparent;")
+                    lbl.set_state("--", self.EMPTY_COLOR)
 
 class CircularGauge(QWidget):
     def __init__(self, min_val, max_val, safe_limit=None, warning_limit=None, parent=None):
@@ -527,105 +558,6 @@ class LinearGauge(QWidget):
                 painter.fillPath(active_path, QBrush(grad))
 
 
-class LEDWidget(QFrame):
-    def __init__(self, param_configs, options=None):
-        super().__init__()
-        self.param_configs = param_configs
-        self.options = options or {}
-        self.led_configs = self.options.get('led_configs', {})
-        
-        # Main layout - Responsive Flow
-        # Reduced margins and spacing for tighter packing
-        self.main_layout = FlowLayout(self, margin=8, hSpacing=8, vSpacing=8)
-        
-        self.leds = {}
-        self.value_labels = {}
-        
-        for p_config in param_configs:
-            # Container
-            container = QFrame()
-            # Reduced fixed size to allow narrower width
-            container.setFixedSize(80, 90) 
-            # Remove border/background
-            container.setStyleSheet("background: transparent; border: none;")
-            
-            v_layout = QVBoxLayout(container)
-            v_layout.setContentsMargins(0, 0, 0, 0)
-            v_layout.setSpacing(2)
-            v_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # Clean parameter name
-            clean_name = p_config['name'].replace('GPS(', '').replace(')', '') if p_config['name'].startswith('GPS(') else p_config['name']
-            
-            # Title
-            title = QLabel(f"{clean_name}")
-            title.setFont(QFont("SF Pro Text", 9, QFont.Weight.Medium))
-            title.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
-            title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            # LED indicator (now contains value)
-            led = QLabel("--")
-            led.setFixedSize(40, 40) # Smaller LED
-            led.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            led.setFont(QFont("SF Pro Display", 10, QFont.Weight.Bold))
-            
-            # Default inactive style
-            led.setStyleSheet("""
-                border-radius: 20px; 
-                background: #2a2a2a; 
-                border: 2px solid #444;
-                color: #666;
-            """)
-            
-            self.leds[p_config['id']] = led
-            
-            v_layout.addWidget(title)
-            v_layout.addWidget(led, alignment=Qt.AlignmentFlag.AlignCenter)
-            
-            self.main_layout.addWidget(container)
-        
-        # Set frame style
-        self.setStyleSheet("background: transparent;")
-        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
-            
-    def update_values(self, values_dict):
-        for pid, val in values_dict.items():
-            if pid in self.leds:
-                led = self.leds[pid]
-                led_conf = self.led_configs.get(pid, {})
-                
-                # Default colors
-                active_color = led_conf.get('active_color', '#30d158') # Green
-                inactive_color = led_conf.get('inactive_color', '#ff453a') # Red
-                
-                # Thresholds
-                threshold = led_conf.get('threshold', 0.5)
-                
-                if val is not None:
-                    led.setText(str(val)) # Display the actual value
-                    if val >= threshold:
-                        led.setStyleSheet(f"""
-                            border-radius: 20px; 
-                            background: {active_color}; 
-                            border: 2px solid {QColor(active_color).lighter(150).name()};
-                            color: #fff;
-                        """)
-                    else:
-                        led.setStyleSheet(f"""
-                            border-radius: 20px; 
-                            background: {inactive_color}; 
-                            border: 2px solid {QColor(inactive_color).lighter(150).name()};
-                            color: #fff;
-                        """)
-                else:
-                    led.setText("--")
-                    led.setStyleSheet("""
-                        border-radius: 20px; 
-                        background: #2a2a2a; 
-                        border: 2px solid #444;
-                        color: #666;
-                    """)
-
 class GaugeWidget(QFrame):
     """
     @brief Gauge widget (Linear or Circular) with Cluster Support.
@@ -725,7 +657,6 @@ class GaugeWidget(QFrame):
 import sys
 import time
 import numpy as np
-import pyqtgraph as pg
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QApplication, QMessageBox, 
@@ -734,24 +665,47 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import QTimer, Qt
 from PySide6.QtGui import QColor, QLinearGradient, QBrush, QIcon
 
+from app.core.decimation import decimate_minmax, decimate_viewport
+from app.core.series_buffer import SeriesBuffer
+from app.core.frame_clock import FrameClock
+from app.core.histogram import StreamingHistogram, DEFAULT_BINS
+
+TIME_GRAPH_WINDOW = 500  # Samples per parameter shown while the graph follows live data
+
 class TimeGraph(QWidget):
     """
     @brief Widget for plotting parameter values over time.
     @details Includes 'Guaranteed' Reset Button.
              (Close button removed to rely on external/parent control).
+             Full-resolution series are kept in append-only NumPy buffers fed through a
+             per-parameter write cursor; curves only receive the visible x range min/max
+             decimated to the plot's pixel width, recomputed when data arrives or the view is
+             zoomed or panned. While following, the last 'window' samples of each parameter are
+             shown and only twice that many are kept; options 'accumulate' keeps and shows the
+             whole session instead.
     """
-    def __init__(self, param_configs):
+    def __init__(self, param_configs, options=None):
+        import pyqtgraph as pg  # Imported with the first graph rather than at start-up
         super().__init__()
         self.param_configs = param_configs
+        self.options = options or {}
         self.curves = {}
+        if self.options.get('accumulate'):
+            self.window = None
+            self.buffers = {p['id']: SeriesBuffer() for p in param_configs}
+        else:
+            # Room for the window plus scrollback, so trimming a quarter never cuts into the window
+            self.window = int(self.options.get('window', TIME_GRAPH_WINDOW))
+            self.buffers = {p['id']: SeriesBuffer(max_points=2 * self.window) for p in param_configs}
+        self._cursors = {}  # param_id -> history sequence number already buffered
         self.last_known_values = {}
         
         # --- Buffer and Threshold Control ---
-        self.latest_history = None  
+        self._data_changed = False
+        self._changed_from = float('inf')  # Earliest x whose rendering changed since the last redraw
+        self._view_changed = False
         self.current_y_max = 1.0    
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._refresh_plot)
-        self.update_timer.start(50) 
+        FrameClock.shared().register(self, self._refresh_plot)
         # -----------------------------------------
 
         # Main Layout
@@ -763,8 +717,6 @@ class TimeGraph(QWidget):
         self.plot_widget.setBackground(None) 
         self.plot_widget.showGrid(x=True, y=True, alpha=0.1)
         self.plot_widget.setAntialiasing(True)
-        self.plot_widget.setDownsampling(mode='peak')
-        self.plot_widget.setClipToView(True)
         
         # Axis styling
         axis_pen = pg.mkPen(color=QColor(255, 255, 255, 80), width=1)
@@ -834,9 +786,10 @@ class TimeGraph(QWidget):
             
             curve.setFillLevel(0)
             curve.setBrush(brush)
-            curve.setDownsampling(auto=True, method='peak', ds=5)
             self.curves[p_config['id']] = curve
 
+        self.plot_widget.getPlotItem().vb.sigXRangeChanged.connect(self._on_view_changed)
+
         container.addWidget(self.plot_widget)
         
         self.setStyleSheet("""
@@ -869,36 +822,94 @@ class TimeGraph(QWidget):
             y_reset = 10
             self.proxy_reset.setPos(x_reset, y_reset)
 
-    def update_data(self, history):
-        self.latest_history = history
+    def update_data(self, history, seq=None, value_key='value'):
+        """
+        @brief Append the samples that arrived since the last call.
+        @param history Dictionary of parameter id to a list of {'timestamp', value_key} samples,
+               newest last.
+        @param seq Optional dictionary of parameter id to the total number of samples ever appended
+               to that history. Without it, each call replaces the buffered series.
+        @param value_key Sample key holding the value to plot.
+        """
+        for param_id, buffer in self.buffers.items():
+            samples = history.get(param_id)
+            if not samples:
+                continue
+            if seq is None:
+                buffer.clear()
+                self._changed_from = -float('inf')
+                new_samples = samples
+            else:
+                total = seq.get(param_id, 0)
+                fresh = total - self._cursors.get(param_id, 0)
+                if fresh <= 0:
+                    continue
+                self._cursors[param_id] = total
+                # History is capped, so at most its length is still available
+                new_samples = samples[-fresh:] if fresh < len(samples) else samples
+
+            count = len(new_samples)
+            timestamps = np.fromiter((dp['timestamp'] for dp in new_samples), dtype=np.float64, count=count)
+            values = np.fromiter((dp[value_key] for dp in new_samples), dtype=np.float64, count=count)
+            timestamps -= self.start_time
+            # The curve changes from the previous last point on: it gains a segment to the new data
+            changed_from = buffer.x[-1] if len(buffer) else timestamps[0]
+            buffer.append(timestamps, values)
+            self.last_known_values[param_id] = samples[-1]
+            self._changed_from = min(self._changed_from, float(changed_from))
+            self._data_changed = True
 
     def reset_view(self):
         self.current_y_max = 0.0 
-        self.plot_widget.enableAutoRange(axis=pg.ViewBox.XAxis)
-        self.plot_widget.enableAutoRange(axis=pg.ViewBox.YAxis)
+        self.plot_widget.enableAutoRange(x=True, y=True)
+
+    def _on_view_changed(self, *args):
+        self._view_changed = True
+
+    def _visible_x_range(self):
+        vb = self.plot_widget.getPlotItem().vb
+        if vb.autoRangeEnabled()[0]:
+            # Auto-ranging follows the data, so the whole series is visible
+            return -np.inf, np.inf
+        return vb.viewRange()[0]
 
     def _refresh_plot(self):
-        if not self.latest_history:
+        if not (self._data_changed or self._view_changed):
+            return
+        x_min, x_max = self._visible_x_range()
+        visible_change = self._view_changed or self._changed_from <= x_max
+        self._data_changed = False
+        self._view_changed = False
+        self._changed_from = float('inf')
+        if not visible_change:
+            # Only samples to the right of a zoomed/panned view arrived; nothing visible changed
             return
 
         global_max_val = -float('inf')
         has_data = False
 
-        # 1. Update Curves
+        # 1. Update Curves with the decimated visible range
+        pixels = max(int(self.plot_widget.getPlotItem().vb.width()), 100)
         for param_id, curve in self.curves.items():
-            if param_id in self.latest_history and self.latest_history[param_id]:
-                param_history = self.latest_history[param_id]
-                self.last_known_values[param_id] = param_history[-1]
-                
-                timestamps = [dp['timestamp'] - self.start_time for dp in param_history]
-                values = [dp['value'] for dp in param_history]
-                curve.setData(x=timestamps, y=values)
-                
-                if values:
-                    current_max = max(values)
-                    if current_max > global_max_val:
-                        global_max_val = current_max
-                    has_data = True
+            buffer = self.buffers[param_id]
+            if not len(buffer):
+                continue
+            if x_min == -np.inf and x_max == np.inf and self.window:
+                # Following: only the most recent window of samples
+                x, y = decimate_minmax(buffer.x[-self.window:], buffer.y[-self.window:], pixels)
+            elif x_min == -np.inf and x_max == np.inf:
+                # Whole series: decimate the incrementally maintained envelope, not the history
+                x, y = decimate_minmax(*buffer.envelope.points(), pixels)
+            else:
+                x, y = decimate_viewport(buffer.x, buffer.y, x_min, x_max, pixels)
+            # Copy views of the live buffer: it is shifted in place when it trims old samples
+            curve.setData(x=np.array(x), y=np.array(y))
+
+            if y.size:
+                current_max = float(np.nanmax(y))
+                if current_max > global_max_val:
+                    global_max_val = current_max
+                has_data = True
 
         # 2. Threshold Window Logic
         if has_data:
@@ -937,9 +948,9 @@ class TimeGraph(QWidget):
             self.vLine.setPos(mousePoint.x())
             self.hLine.setPos(mousePoint.y())
             text = f"Time: {mousePoint.x():.2f}s\n"
-            for pid, curve in self.curves.items():
-                x_data, y_data = curve.getData()
-                if x_data is not None and len(x_data) > 0:
+            for pid, buffer in self.buffers.items():
+                x_data, y_data = buffer.x, buffer.y
+                if len(x_data) > 0:
                     idx = np.searchsorted(x_data, mousePoint.x())
                     if 0 < idx < len(x_data):
                         val_left = y_data[idx-1]
@@ -974,12 +985,14 @@ class TimeGraph(QWidget):
             x_data, y_data = curve.getData()
             if x_data is None or len(x_data) == 0:
                 continue
-            for i, (x, y) in enumerate(zip(x_data, y_data)):
-                dist = (x - pos.x())**2 + (y - pos.y())**2
-                if dist < min_dist:
-                    min_dist = dist
-                    p_name = next(p['name'] for p in self.param_configs if p['id'] == pid)
-                    nearest_point = (p_name, self.start_time + x, y)
+            dist = (x_data - pos.x())**2 + (y_data - pos.y())**2
+            if np.isnan(dist).all():
+                continue
+            i = int(np.nanargmin(dist))
+            if dist[i] < min_dist:
+                min_dist = dist[i]
+                p_name = next(p['name'] for p in self.param_configs if p['id'] == pid)
+                nearest_point = (p_name, self.start_time + x_data[i], y_data[i])
         if nearest_point:
             name, ts, val = nearest_point
             time_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(ts))
@@ -994,10 +1007,24 @@ class TimeGraph(QWidget):
 class HistogramWidget(QWidget):
     """
     @brief Widget for displaying the distribution of parameter values.
-    @details Uses a bar graph to show a histogram of the data.
+    @details Uses a bar graph to show a histogram of the data. Counts are maintained incrementally by a
+             StreamingHistogram; options select the bin count, a fixed 'range' or explicit 'edges', and
+             'accumulate' to count the whole session instead of the recent samples.
     """
-    def __init__(self, param_config):
+    def __init__(self, param_config, options=None):
+        import pyqtgraph as pg  # Imported with the first histogram rather than at start-up
         super().__init__(); self.param = param_config
+        self.options = options or {}
+        edges = self.options.get('edges')
+        bins = self.options.get('bins', DEFAULT_BINS)
+        if edges is None and self.options.get('range'):
+            low, high = self.options['range']
+            edges = np.linspace(low, high, bins + 1)
+        if self.options.get('accumulate'):
+            self.histogram = StreamingHistogram(bins, edges, window=None)
+        else:
+            self.histogram = StreamingHistogram(bins, edges)
+        self._cursor = 0
         layout = QVBoxLayout(self); layout.setContentsMargins(16,16,16,16)
         
         # Title
@@ -1022,26 +1049,170 @@ class HistogramWidget(QWidget):
                 border: 1px solid rgba(255, 255, 255, 0.05);
             }
         """)
+    def update_data(self, history, seq=None, value_key='value'):
+        """
+        @brief Count the samples that arrived since the last call.
+        @param history Dictionary of parameter id to a list of {value_key} samples, newest last.
+        @param seq Optional dictionary of parameter id to the total number of samples ever appended
+               to that history. Without it, the histogram is rebuilt from the history.
+        @param value_key Sample key holding the value to count.
+        """
+        samples = history.get(self.param['id'])
+        if not samples:
+            return
+        if seq is None:
+            self.histogram.clear()
+            new_samples = samples
+        else:
+            total = seq.get(self.param['id'], 0)
+            fresh = total - self._cursor
+            if fresh <= 0:
+                return
+            self._cursor = total
+            new_samples = samples[-fresh:] if fresh < len(samples) else samples
+        values = np.fromiter((dp[value_key] for dp in new_samples), dtype=np.float64, count=len(new_samples))
+        if self.histogram.add(values) or seq is None:
+            self._redraw()
+
     def update_histogram(self, values):
+        """
+        @brief Replace the histogram contents with values.
+        """
         if not values: return
-        try:
-            arr = np.array(values, dtype=float)
-            counts, edges = np.histogram(arr, bins=20)
-            centers = (edges[:-1] + edges[1:]) / 2.0
-            self.bar_item.setOpts(x=centers, height=counts, width=(edges[1]-edges[0])*0.9)
-        except Exception:
-            pass
+        self.histogram.clear()
+        self.histogram.add(np.asarray(values, dtype=float))
+        self._redraw()
+
+    def _redraw(self):
+        edges = self.histogram.edges
+        if not len(edges):
+            return
+        self.bar_item.setOpts(x=self.histogram.centers, height=self.histogram.counts, width=np.diff(edges) * 0.9)
+
+def _approx_equal(value, threshold):
+    return abs(value - threshold) < 0.0001
+
+# Threshold condition symbols (dialog and legacy spellings) -> comparison
+LED_CONDITIONS = {
+    '≥': operator.ge, '>=': operator.ge,
+    '≤': operator.le, '<=': operator.le,
+    '>': operator.gt, '<': operator.lt,
+    '==': _approx_equal,
+}
+
+def compile_led_rules(config):
+    """
+    @brief Precompile an LED threshold configuration into an ordered rule table.
+    @details Supports the multi-threshold format ({'thresholds': [{value, condition, color}]}) sorted by
+             value, and the old single-threshold format ({'threshold', 'condition'}) lit in green.
+    @param config LED configuration of one parameter.
+    @return List of (compare, threshold, color) tuples; the first matching rule wins.
+    """
+    if config.get('thresholds'):
+        rules = []
+        for threshold in sorted(config['thresholds'], key=lambda x: float(x['value'])):
+            compare = LED_CONDITIONS.get(threshold.get('condition', '≥'))
+            if compare:
+                rules.append((compare, float(threshold['value']), threshold.get('color', '#00ff00')))
+        return rules
+    if 'threshold' in config:
+        compare = LED_CONDITIONS.get(config.get('condition', '>'))
+        return [(compare, float(config.get('threshold', 0)), '#21b35a')] if compare else []
+    return []
+
+def match_led_rules(rules, value):
+    """
+    @brief Return the colour of the first rule matched by value, or None.
+    """
+    for compare, threshold, color in rules:
+        if compare(value, threshold):
+            return color
+    return None
+
+class LEDLamp(QWidget):
+    """
+    @brief Round LED painted directly with QPainter, including its glow halo.
+    @details State is a (fill, border, text colour, glow) tuple of QColors; set_state() repaints only when
+             the text or state actually changed, so no stylesheet is parsed per frame.
+    """
+    OFF_STATE = (QColor("#2a2a2a"), QColor("#444444"), QColor("#666666"), False)
+    MISSING_STATE = (QColor("#3a3a3a"), QColor("#555555"), QColor("#666666"), False)
+
+    def __init__(self, diameter=48, glow=10, parent=None):
+        super().__init__(parent)
+        self.diameter = diameter
+        self.glow = glow
+        self.setFixedSize(diameter + 2 * glow, diameter + 2 * glow)
+        self._text = "--"
+        self._state = self.OFF_STATE
+
+    @staticmethod
+    def active_state(color_hex):
+        """
+        @brief Build the lit state for a colour, with text contrasting against it.
+        """
+        c = QColor(color_hex)
+        brightness = (c.red() * 299 + c.green() * 587 + c.blue() * 114) / 1000
+        text_color = QColor("#000000") if brightness > 128 else QColor("#ffffff")
+        return (c, c, text_color, True)
+
+    def text(self):
+        return self._text
+
+    def state(self):
+        return self._state
+
+    def set_state(self, text, state):
+        """
+        @brief Update the LED text and colours.
+        @param text Text drawn inside the LED.
+        @param state (fill, border, text colour, glow) tuple.
+        @return True if a repaint was scheduled.
+        """
+        if text == self._text and state is self._state:
+            return False
+        self._text = text
+        self._state = state
+        self.update()
+        return True
+
+    def paintEvent(self, event):
+        fill, border, text_color, glow = self._state
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        center = QPointF(self.width() / 2, self.height() / 2)
+        radius = self.diameter / 2
+        if glow:
+            halo = QRadialGradient(center, radius + self.glow)
+            inner = QColor(fill)
+            inner.setAlpha(160)
+            outer = QColor(fill)
+            outer.setAlpha(0)
+            halo.setColorAt(radius / (radius + self.glow), inner)
+            halo.setColorAt(1.0, outer)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(halo))
+            painter.drawEllipse(center, radius + self.glow, radius + self.glow)
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(fill)
+        painter.drawEllipse(center, radius - 1, radius - 1)
+        painter.setPen(text_color)
+        painter.setFont(self.font())
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._text)
 
 class LEDWidget(QFrame):
     """
     @brief Widget for displaying multiple status LEDs (LED Panel).
-    @details Changes color (Green/Gray) based on value thresholds/conditions.
+    @details Changes color (Green/Gray) based on value thresholds/conditions. Threshold tables are
+             compiled once and lit states cached per colour.
     """
     def __init__(self, param_configs, options=None):
         super().__init__()
         self.param_configs = param_configs
         self.options = options or {}
         self.led_configs = self.options.get('led_configs', {})
+        self.led_rules = {pid: compile_led_rules(config) for pid, config in self.led_configs.items()}
+        self._lit_states = {}
         
         # Main layout - Responsive Flow
         self.main_layout = FlowLayout(self, margin=16, hSpacing=16, vSpacing=16)
@@ -1058,7 +1229,7 @@ class LEDWidget(QFrame):
             
             v_layout = QVBoxLayout(container)
             v_layout.setContentsMargins(0, 0, 0, 0)
-            v_layout.setSpacing(4)
+            v_layout.setSpacing(0)
             v_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
             # Clean parameter name
@@ -1070,20 +1241,10 @@ class LEDWidget(QFrame):
             title.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
             title.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
-            # LED indicator (now contains value)
-            led = QLabel("--")
-            led.setFixedSize(48, 48) # Compact size
-            led.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            # LED indicator (now contains value), glow drawn inside its own margin
+            led = LEDLamp(48, 10)
             led.setFont(QFont("SF Pro Display", 12, QFont.Weight.Bold))
             
-            # Default inactive style
-            led.setStyleSheet("""
-                border-radius: 24px; 
-                background: #2a2a2a; 
-                border: 2px solid #444;
-                color: #666;
-            """)
-            
             self.leds[p_config['id']] = led
             
             v_layout.addWidget(title)
@@ -1097,100 +1258,25 @@ class LEDWidget(QFrame):
     
     def update_values(self, data):
         for pid, led in self.leds.items():
-            if pid in data:
-                val = data[pid]
-                
-                # Handle None values
-                if val is None:
-                    led.setText("--")
-                    led.setStyleSheet("""
-                        border-radius: 24px; 
-                        background: #2a2a2a; 
-                        border: 2px solid #444;
-                        color: #666;
-                    """)
-                    led.setGraphicsEffect(None)
-                    continue
+            if pid not in data:
+                # If parameter ID is not in current data, set to inactive/default
+                led.set_state("--", LEDLamp.MISSING_STATE)
+                continue
 
-                led.setText(f"{val:.1f}") # Show value inside
-                
-                # Check thresholds
-                active_color = None
-                if pid in self.led_configs:
-                    config = self.led_configs[pid]
-                    # New format: multi-threshold with colors
-                    if 'thresholds' in config and config['thresholds']:
-                        thresholds = sorted(config['thresholds'], key=lambda x: x['value']) # Sort for priority
-                        for threshold in thresholds:
-                            t_val = float(threshold['value'])
-                            cond = threshold.get('condition', '≥')
-                            color = threshold['color']
-                            
-                            match = False
-                            if cond in ['≥', '>='] and val >= t_val: match = True
-                            elif cond in ['≤', '<='] and val <= t_val: match = True
-                            elif cond == '>' and val > t_val: match = True
-                            elif cond == '<' and val < t_val: match = True
-                            elif cond == '==' and abs(val - t_val) < 0.0001: match = True
-                            
-                            if match:
-                                active_color = color
-                                break # Priority to first match (after sorting)
-                    # Old format: single threshold (backward compatibility)
-                    elif 'threshold' in config:
-                        threshold = float(config.get('threshold', 0))
-                        condition = config.get('condition', '>')
-                        
-                        is_active = False
-                        if condition == '>': is_active = val > threshold
-                        elif condition == '<': is_active = val < threshold
-                        elif condition == '>=': is_active = val >= threshold
-                        elif condition == '<=': is_active = val <= threshold
-                        elif condition == '==': is_active = abs(val - threshold) < 0.0001
-                        
-                        if is_active:
-                            active_color = '#21b35a' # Default green for old format
-                
-                if active_color:
-                    # Active State with Glow
-                    # Determine text color based on brightness
-                    c = QColor(active_color)
-                    brightness = (c.red() * 299 + c.green() * 587 + c.blue() * 114) / 1000
-                    text_color = "#000000" if brightness > 128 else "#ffffff"
-                    
-                    led.setStyleSheet(f"""
-                        border-radius: 24px; 
-                        background-color: {active_color};
-                        border: 2px solid {active_color};
-                        color: {text_color};
-                    """)
-                    
-                    # Add glow effect if not present
-                    if not led.graphicsEffect():
-                        glow = QGraphicsDropShadowEffect()
-                        glow.setBlurRadius(20)
-                        glow.setColor(QColor(active_color))
-                        glow.setOffset(0, 0)
-                        led.setGraphicsEffect(glow)
-                    else:
-                        # Update existing glow color
-                        led.graphicsEffect().setColor(QColor(active_color))
-                else:
-                    # Inactive State
-                    led.setStyleSheet("""
-                        border-radius: 24px; 
-                        background: #2a2a2a; 
-                        border: 2px solid #444;
-                        color: #666;
-                    """)
-                    led.setGraphicsEffect(None) # Remove glow
+            val = data[pid]
+            # Handle None values
+            if val is None:
+                led.set_state("--", LEDLamp.OFF_STATE)
+                continue
+
+            active_color = match_led_rules(self.led_rules.get(pid, ()), val)
+            if active_color:
+                state = self._lit_states.get(active_color)
+                if state is None:
+                    state = self._lit_states[active_color] = LEDLamp.active_state(active_color)
             else:
-                # If parameter ID is not in current data, set to inactive/default
-                led.setText("--")
-                led.setStyleSheet("""
-                    background: #3a3a3a; 
-                    border: 1px solid #555;
-                """)
+                state = LEDLamp.OFF_STATE
+            led.set_state(f"{val:.1f}", state) # Show value inside
     
     def _get_led_color(self, value, config):
         """
@@ -1199,54 +1285,7 @@ class LEDWidget(QFrame):
         """
         if value is None:
             return None
-        
-        # New format: multi-threshold with colors
-        if 'thresholds' in config and config['thresholds']:
-            thresholds = config['thresholds']
-            
-            # Sort thresholds by value
-            sorted_thresholds = sorted(thresholds, key=lambda x: x['value'])
-            
-            # Find applicable threshold
-            for threshold in sorted_thresholds:
-                condition = threshold.get('condition', '≥')
-                threshold_val = threshold['value']
-                
-                # Check if condition is met
-                is_met = False
-                if condition in ['≥', '>=']:
-                    is_met = value >= threshold_val
-                elif condition in ['≤', '<=']:
-                    is_met = value <= threshold_val
-                elif condition == '>':
-                    is_met = value > threshold_val
-                elif condition == '<':
-                    is_met = value < threshold_val
-                elif condition == '==':
-                    is_met = abs(value - threshold_val) < 0.0001
-                
-                if is_met:
-                    return threshold.get('color', '#00ff00')
-            
-            # No threshold met - return None (gray)
-            return None
-        
-        # Old format: single threshold (backward compatibility)
-        elif 'threshold' in config:
-            threshold = float(config.get('threshold', 0))
-            condition = config.get('condition', '>')
-            
-            is_active = False
-            if condition == '>': is_active = value > threshold
-            elif condition == '<': is_active = value < threshold
-            elif condition == '>=': is_active = value >= threshold
-            elif condition == '<=': is_active = value <= threshold
-            elif condition == '==': is_active = abs(value - threshold) < 0.0001
-            
-            return '#21b35a' if is_active else None
-        
-        # No configuration - default to gray
-        return None
+        return match_led_rules(compile_led_rules(config), value)
     
     def _adjust_brightness(self, color_hex, factor):
         """Adjust color brightness for border effect"""
@@ -1259,12 +1298,6 @@ class LEDWidget(QFrame):
             return color.name()
         except:
             return color_hex
-            
-# Optional: Map widget using QWebEngineView if available
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView  # type: ignore
-except Exception:
-    QWebEngineView = None
 
 
 class MapWidget(QWidget):
@@ -1322,6 +1355,11 @@ class MapWidget(QWidget):
         self._nam = QNetworkAccessManager(self)
         self._net_reply = None
 
+        # QtWebEngine is the largest optional module; only import it once a map is created
+        try:
+            from PySide6.QtWebEngineWidgets import QWebEngineView  # type: ignore
+        except Exception:
+            QWebEngineView = None
         if QWebEngineView:
             self.web = QWebEngineView()
             self.web.setMinimumHeight(200)
@@ -1587,23 +1625,179 @@ class MapWidget(QWidget):
             except Exception:
                 # If this fails (e.g., page not ready), force a re-verify soon
                 QTimer.singleShot(1500, self._verify_leaflet_loaded)
+LOG_TABLE_MAX_ROWS = 1000000
+LOG_TABLE_INITIAL_ROWS = 4096
+
+# Search conditions of the LogTable search bar
+SEARCH_CONDITIONS = {
+    "=": lambda column, target: np.isclose(column, target),
+    ">": np.greater, "<": np.less, ">=": np.greater_equal, "<=": np.less_equal,
+}
+
+class LogTableModel(QAbstractTableModel):
+    """
+    @brief Virtual table of logged samples, newest row first.
+    @details Rows live in preallocated NumPy columns (timestamp plus one value column per parameter)
+             that grow by doubling up to max_rows, after which the oldest quarter is dropped in one
+             move. Cells are formatted only when the view asks for them, so the view can scroll over
+             millions of rows while only the visible ones cost anything.
+    """
+    def __init__(self, param_configs, max_rows=LOG_TABLE_MAX_ROWS, initial_rows=LOG_TABLE_INITIAL_ROWS):
+        super().__init__()
+        self.param_ids = [p['id'] for p in param_configs]
+        self.headers = ["Timestamp"] + [f"{p['name']} ({p.get('unit', '')})" for p in param_configs]
+        self.max_rows = max(4, int(max_rows))
+        capacity = min(initial_rows, self.max_rows)
+        self._time = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty((capacity, len(self.param_ids)), dtype=np.float64)
+        self._size = 0
+        self.dropped = 0              # Rows trimmed from the oldest end since the model was created
+        self.highlighted = None       # Absolute sample number of the highlighted row
+        self.highlight_brush = QBrush(QColor("#0078FF").lighter(150))
+
+    @property
+    def timestamps(self):
+        """View of the stored timestamps, oldest first (no copy)."""
+        return self._time[:self._size]
+
+    @property
+    def values(self):
+        """View of the stored values, one column per parameter, oldest first (no copy)."""
+        return self._values[:self._size]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._size
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        sample = self._size - 1 - index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == 0:
+                timestamp = self._time[sample]
+                return time.strftime('%H:%M:%S', time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+            value = self._values[sample, index.column() - 1]
+            return "---" if np.isnan(value) else f"{value:.3f}"
+        if role == Qt.ItemDataRole.BackgroundRole and self.highlighted == self.dropped + sample:
+            return self.highlight_brush
+        return None
+
+    def row_of(self, sample):
+        """
+        @brief View row of a stored sample index (oldest = 0).
+        """
+        return self._size - 1 - sample
+
+    def clear(self):
+        self.beginResetModel()
+        self._size = 0
+        self.dropped = 0
+        self.highlighted = None
+        self.endResetModel()
+
+    def append(self, timestamps, values):
+        """
+        @brief Add rows; they appear at the top of the table.
+        @param timestamps 1-D array of row timestamps, oldest first.
+        @param values 2-D array of row values (rows x parameters), NaN where unknown.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64).reshape(len(timestamps), len(self.param_ids))
+        if timestamps.size > self.max_rows:
+            timestamps, values = timestamps[-self.max_rows:], values[-self.max_rows:]
+        count = timestamps.size
+        if not count:
+            return
+        needed = self._size + count
+        if needed > self.max_rows:
+            self._drop_oldest(needed - self.max_rows)
+            needed = self._size + count
+        if needed > self._time.size:
+            self._grow(needed)
+
+        self.beginInsertRows(QModelIndex(), 0, count - 1)
+        self._time[self._size:needed] = timestamps
+        self._values[self._size:needed] = values
+        self._size = needed
+        self.endInsertRows()
+
+    def _grow(self, needed):
+        capacity = self._time.size
+        while capacity < needed:
+            capacity *= 2
+        capacity = min(capacity, self.max_rows)
+        grown_time = np.empty(capacity, dtype=np.float64)
+        grown_time[:self._size] = self._time[:self._size]
+        grown_values = np.empty((capacity, self._values.shape[1]), dtype=np.float64)
+        grown_values[:self._size] = self._values[:self._size]
+        self._time, self._values = grown_time, grown_values
+
+    def _drop_oldest(self, minimum):
+        drop = min(max(minimum, self.max_rows // 4), self._size)
+        # The oldest samples are the bottom rows of the view
+        self.beginRemoveRows(QModelIndex(), self._size - drop, self._size - 1)
+        keep = self._size - drop
+        self._time[:keep] = self._time[drop:self._size]
+        self._values[:keep] = self._values[drop:self._size]
+        self._size = keep
+        self.dropped += drop
+        self.endRemoveRows()
+
+    def find_last(self, column, condition, target):
+        """
+        @brief Find the newest sample whose value in a parameter column satisfies a condition.
+        @param column Parameter column (0 = first parameter).
+        @param condition Key of SEARCH_CONDITIONS.
+        @param target Value to compare against.
+        @return Stored sample index, or None.
+        """
+        with np.errstate(invalid='ignore'):
+            matches = np.flatnonzero(SEARCH_CONDITIONS[condition](self.values[:, column], target))
+        return int(matches[-1]) if matches.size else None
+
+    def set_highlight(self, sample):
+        """
+        @brief Highlight one stored sample (None clears the highlight).
+        """
+        rows = [self.row_of(self.highlighted - self.dropped)] if self.highlighted is not None else []
+        self.highlighted = None if sample is None else self.dropped + sample
+        if sample is not None:
+            rows.append(self.row_of(sample))
+        last_column = len(self.headers) - 1
+        for row in rows:
+            if 0 <= row < self._size:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column),
+                                      [Qt.ItemDataRole.BackgroundRole])
+
 class LogTable(QWidget):
     """
     @brief Widget for displaying a tabular log of telemetry data.
-    @details Shows timestamped values and supports searching/highlighting specific conditions.
+    @details Shows timestamped values and supports searching/highlighting specific conditions. One row
+             is added per sample time of any of its parameters, with the last known value of the
+             others; rows are served by a LogTableModel rather than per-cell items.
     """
     def __init__(self, param_configs):
         super().__init__()
         self.param_configs = param_configs
         self.param_map = {p['id']: {'name': p['name'], 'col': i + 1} for i, p in enumerate(self.param_configs)}
-        self.last_known_values = {}
-        self.highlight_brush = QBrush(QColor("#0078FF").lighter(150))
+        self.last_known_values = {}   # param_id -> (timestamp, value) of its newest sample
+        self._cursors = {}
         layout = QVBoxLayout(self); layout.setContentsMargins(0, 0, 0, 0)
-        self.table = QTableWidget()
-        headers = ["Timestamp"] + [f"{p['name']} ({p['unit']})" for p in self.param_configs]
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Timestamp", "Parameter", "Value"])
+        self.model = LogTableModel(param_configs)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Uniform row heights let the view skip measuring rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(28)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -1611,7 +1805,7 @@ class LogTable(QWidget):
         
         # Apple-like Table Styling
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: transparent;
                 gridline-color: transparent;
                 border: none;
@@ -1619,11 +1813,11 @@ class LogTable(QWidget):
                 font-family: "SF Pro Text";
                 font-size: 13px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
                 border-bottom: 1px solid rgba(255, 255, 255, 0.05);
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: rgba(10, 132, 255, 0.3);
             }
             QHeaderView::section {
@@ -1697,53 +1891,76 @@ class LogTable(QWidget):
             self.search_container.show()
         else:
             self.search_container.hide()
-    def update_data(self, updated_param_id, history):
-        # Optimization: Limit rows to 100
-        if self.table.rowCount() > 100: self.table.removeRow(100)
-        self.table.insertRow(0)
-        for pid in self.param_map.keys():
-            if pid in history and history[pid]: self.last_known_values[pid] = history[pid][-1]
-        ts_str = time.strftime('%H:%M:%S', time.localtime(self.last_known_values[updated_param_id]['timestamp']))
-        self.table.setItem(0, 0, QTableWidgetItem(ts_str))
-        for pid, pdata in self.param_map.items():
-            value_str = "---"
-            if pid in self.last_known_values: value_str = f"{self.last_known_values[pid]['value']:.3f}"
-            self.table.setItem(0, pdata['col'], QTableWidgetItem(value_str))
+    def update_data(self, history, seq=None, value_key='value'):
+        """
+        @brief Add rows for the samples that arrived since the last call.
+        @param history Dictionary of parameter id to a list of {'timestamp', value_key} samples,
+               newest last.
+        @param seq Optional dictionary of parameter id to the total number of samples ever appended
+               to that history. Without it, the table is rebuilt from the history.
+        @param value_key Sample key holding the value to show.
+        """
+        if seq is None:
+            self.model.clear()
+            self.last_known_values = {}
+        fresh_samples = {}
+        for pid in self.param_map:
+            samples = history.get(pid)
+            if not samples:
+                continue
+            if seq is None:
+                new_samples = samples
+            else:
+                total = seq.get(pid, 0)
+                fresh = total - self._cursors.get(pid, 0)
+                if fresh <= 0:
+                    continue
+                self._cursors[pid] = total
+                new_samples = samples[-fresh:] if fresh < len(samples) else samples
+            count = len(new_samples)
+            fresh_samples[pid] = (np.fromiter((dp['timestamp'] for dp in new_samples), dtype=np.float64, count=count),
+                                  np.fromiter((dp[value_key] if dp[value_key] is not None else np.nan
+                                               for dp in new_samples), dtype=np.float64, count=count))
+        if not fresh_samples:
+            return
+
+        # One row per distinct sample time; every column shows its value at or before that time
+        row_times = np.unique(np.concatenate([times for times, _ in fresh_samples.values()]))
+        rows = np.full((row_times.size, len(self.param_map)), np.nan)
+        for column, pid in enumerate(self.param_map):
+            times, values = fresh_samples.get(pid, (np.zeros(0), np.zeros(0)))
+            if pid in self.last_known_values:
+                last_time, last_value = self.last_known_values[pid]
+                times, values = np.append(last_time, times), np.append(last_value, values)
+            if not times.size:
+                continue
+            index = np.searchsorted(times, row_times, side='right') - 1
+            known = index >= 0
+            rows[known, column] = values[index[known]]
+            self.last_known_values[pid] = (times[-1], values[-1])
+        self.model.append(row_times, rows)
+
     def clear_highlights(self):
-        for r in range(self.table.rowCount()):
-            for c in range(self.table.columnCount()):
-                item = self.table.item(r, c)
-                if item: item.setBackground(QBrush(QColor("transparent")))
+        self.model.set_highlight(None)
+        self.table.clearSelection()
+
     def search_and_highlight(self):
         self.clear_highlights()
         try:
             target_p_name = self.search_param_combo.currentText()
-            target_col = self.search_param_combo.currentIndex() + 1
+            target_column = self.search_param_combo.currentIndex()
             target_val = self.search_value_spinbox.value()
             condition = self.search_cond_combo.currentText()
         except Exception as e:
             QMessageBox.warning(self, "Search Error", f"Invalid search criteria: {e}")
             return
-        found_item = None
-        for r in range(self.table.rowCount()):
-            item = self.table.item(r, target_col)
-            if not item or not item.text(): continue
-            try:
-                cell_val = float(item.text())
-                match = False
-                if condition == "=" and math.isclose(cell_val, target_val): match = True
-                elif condition == ">" and cell_val > target_val: match = True
-                elif condition == "<" and cell_val < target_val: match = True
-                elif condition == ">=" and cell_val >= target_val: match = True
-                elif condition == "<=" and cell_val <= target_val: match = True
-                if match:
-                    item.setBackground(self.highlight_brush)
-                    found_item = item
-                    break
-            except ValueError:
-                continue
-        if found_item:
-            self.table.scrollToItem(found_item, QAbstractItemView.ScrollHint.PositionAtCenter)
+        # Vectorized over every stored sample, not just the rows on screen
+        sample = self.model.find_last(target_column, condition, target_val) if target_column >= 0 else None
+        if sample is not None:
+            self.model.set_highlight(sample)
+            row = self.model.row_of(sample)
+            # Select too: the item stylesheet hides model background brushes on some styles
+            self.table.selectRow(row)
+            self.table.scrollTo(self.model.index(row, target_column + 1), QAbstractItemView.ScrollHint.PositionAtCenter)
         else:
             QMessageBox.information(self, "Search", f"No value matching '{condition} {target_val}' found for '{target_p_name}'.")
-
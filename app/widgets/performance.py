@@ -0,0 +1,235 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        performance.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Live performance overlay for the telemetry pipeline.
+# @details     A floating panel over the main window showing, per pipeline stage, the rate, mean, p99 and
+#              max duration and busy fraction from PipelineMetrics, with the GUI backlog and received
+#              bytes. Stages that fall behind are highlighted; snapshots can be exported as JSON.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation
+# 001  MOD      19-10-2026  MuhammadRamzy        refactor: Use the shared format_bytes from link_stats
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+from datetime import datetime
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QFileDialog
+from PySide6.QtCore import Qt, QTimer, QEvent, Signal
+
+from app.core.instrumentation import STAGES
+from app.core.link_stats import format_bytes
+
+####################################################################################################
+
+REFRESH_MS = 500
+LOAD_WARN = 0.5        # Busy fraction of one stage shown as falling behind
+BACKLOG_WARN = 100     # Packets waiting for the GUI thread shown as falling behind
+STAGE_LABELS = {
+    'read': 'Read', 'decode': 'Decode', 'filter': 'Filter', 'history': 'History',
+    'log': 'Log enqueue', 'render': 'Render',
+}
+OK_STYLE = "color: #f5f5f7;"
+WARN_STYLE = "color: #ff9f0a; font-weight: 600;"
+
+
+class PipelineOverlay(QFrame):
+    """
+    @brief Toggleable panel with live per-stage pipeline timings.
+    @details Anchored to the top-right corner of its parent window and refreshed twice a second
+             while visible; hidden, it costs nothing. Rates and busy fractions cover the last
+             refresh interval, so a stage falling behind shows up at once; durations are
+             percentiles since the last reset.
+    """
+    closed = Signal()
+
+    def __init__(self, metrics, parent=None):
+        super().__init__(parent)
+        self.metrics = metrics
+        self.setObjectName("PipelineOverlay")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet("""
+            #PipelineOverlay {
+                background-color: rgba(28, 28, 30, 0.92);
+                border: 1px solid rgba(255, 255, 255, 0.12);
+                border-radius: 10px;
+            }
+            QLabel { color: #f5f5f7; font-family: "SF Mono", "Menlo", "Consolas", monospace; font-size: 11px; background: transparent; }
+            QPushButton {
+                background-color: rgba(255, 255, 255, 0.1); border: none; border-radius: 5px;
+                padding: 3px 8px; color: #f5f5f7; font-size: 11px;
+            }
+            QPushButton:hover { background-color: rgba(255, 255, 255, 0.2); }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 10, 12, 10)
+        layout.setSpacing(6)
+
+        header = QHBoxLayout()
+        title = QLabel("PIPELINE")
+        title.setStyleSheet("color: #86868b; font-weight: 600; letter-spacing: 1px;")
+        header.addWidget(title)
+        header.addStretch()
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        export_btn = QPushButton("Export...")
+        export_btn.clicked.connect(lambda: self.export_snapshot())
+        close_btn = QPushButton("✕")
+        close_btn.clicked.connect(self.close_overlay)
+        for button in (reset_btn, export_btn, close_btn):
+            header.addWidget(button)
+        layout.addLayout(header)
+
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(14)
+        grid.setVerticalSpacing(2)
+        for column, text in enumerate(["Stage", "/s", "mean µs", "p99 µs", "max µs", "busy"]):
+            label = QLabel(text)
+            label.setStyleSheet("color: #86868b;")
+            grid.addWidget(label, 0, column, alignment=Qt.AlignmentFlag.AlignRight if column else Qt.AlignmentFlag.AlignLeft)
+        self.rows = {}
+        for row, stage in enumerate(STAGES, start=1):
+            labels = [QLabel(STAGE_LABELS.get(stage, stage))] + [QLabel("-") for _ in range(5)]
+            for column, label in enumerate(labels):
+                grid.addWidget(label, row, column, alignment=Qt.AlignmentFlag.AlignRight if column else Qt.AlignmentFlag.AlignLeft)
+            self.rows[stage] = labels
+        layout.addLayout(grid)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self._previous = None   # Snapshot of the last refresh, for per-interval rates
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        if parent is not None:
+            parent.installEventFilter(self)
+        self.hide()
+
+    def refresh(self):
+        """
+        @brief Update the table from a fresh metrics snapshot.
+        """
+        snapshot = self.metrics.snapshot()
+        previous = self._previous if self._previous and self._previous['elapsed_s'] < snapshot['elapsed_s'] else None
+        self._previous = snapshot
+        interval = snapshot['elapsed_s'] - (previous['elapsed_s'] if previous else 0.0)
+
+        for stage, labels in self.rows.items():
+            stats = snapshot['stages'].get(stage)
+            if not stats or not stats['count']:
+                for label in labels[1:]:
+                    label.setText("-")
+                style = OK_STYLE
+            else:
+                # Rate and busy cover the last refresh interval; percentiles everything since reset
+                before = previous['stages'].get(stage) if previous else None
+                count = stats['count'] - (before['count'] if before else 0)
+                total = stats['total_s'] - (before['total_s'] if before else 0.0)
+                busy = total / interval if interval > 0 else 0.0
+                labels[1].setText(f"{count / interval:.0f}" if interval > 0 else "-")
+                labels[2].setText(f"{stats['mean_us']:.1f}")
+                labels[3].setText(f"{stats['p99_us']:.0f}")
+                labels[4].setText(f"{stats['max_us']:.0f}")
+                labels[5].setText(f"{busy:.1%}")
+                style = WARN_STYLE if busy >= LOAD_WARN else OK_STYLE
+            for label in labels:
+                label.setStyleSheet(style)
+
+        handled = snapshot['packets_handled'] - (previous['packets_handled'] if previous else 0)
+        handled_rate = handled / interval if interval > 0 else 0.0
+        self.summary_label.setText(
+            f"Packets: {handled_rate:.0f}/s   Backlog: {snapshot['backlog']}   "
+            f"RX: {format_bytes(snapshot['rx_bytes'])}")
+        self.summary_label.setStyleSheet(WARN_STYLE if snapshot['backlog'] >= BACKLOG_WARN else OK_STYLE)
+        self.adjustSize()
+        self._reposition()
+
+    def reset(self):
+        self.metrics.reset()
+        self._previous = None
+        self.refresh()
+
+    def export_snapshot(self, path=None):
+        """
+        @brief Save a metrics snapshot with histograms as JSON.
+        @param path Output file; asked for when not given.
+        @return The path written, or None if cancelled.
+        """
+        if path is None:
+            default = f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            path, _ = QFileDialog.getSaveFileName(self, "Export Pipeline Snapshot", default, "JSON Files (*.json)")
+            if not path:
+                return None
+        return self.metrics.export(path)
+
+    def close_overlay(self):
+        self.hide()
+        self.closed.emit()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.raise_()
+        self.timer.start(REFRESH_MS)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def eventFilter(self, obj, event):
+        if obj is self.parent() and event.type() == QEvent.Type.Resize and self.isVisible():
+            self._reposition()
+        return False
+
+    def _reposition(self):
+        parent = self.parentWidget()
+        if parent is None:
+            return
+        top = 16
+        menu_bar = getattr(parent, 'menuBar', None)
+        if callable(menu_bar) and menu_bar().isVisible():
+            top += menu_bar().height()
+        self.move(max(0, parent.width() - self.width() - 16), top)
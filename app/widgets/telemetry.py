@@ -48,26 +48,245 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side
 #                                                layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Batched plain-text RawTelemetryMonitor
+# 002  MOD      19-10-2026  MuhammadRamzy        feat: Virtualized packet view for StandaloneTelemetryViewer
+# 003  MOD      19-10-2026  MuhammadRamzy        feat: Live link statistics in the connection dialog
 ####################################################################################################
 
 ####################################################################################################
 # Imports
 
 import time
+from collections import deque
 from datetime import datetime
+import numpy as np
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, 
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QPlainTextEdit,
     QFileDialog, QMessageBox, QWidget, QComboBox, QLineEdit, QCheckBox, 
-    QGroupBox, QMainWindow
+    QGroupBox, QMainWindow, QListView, QAbstractItemView, QApplication
 )
-from PySide6.QtGui import QFont
-from PySide6.QtCore import QTimer, Qt
+from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import QTimer, Qt, QAbstractListModel, QModelIndex
 
 from app.core.simulator import DataSimulator
+from app.core.frame_clock import FrameClock
+from app.core.packet_ring import PacketRing, NOTE_LENGTH, DEFAULT_CAPACITY
 from app.dialogs import ConnectionSettingsDialog
 
 ####################################################################################################
 
+BURST_REDRAW_INTERVAL = 0.2   # Seconds between text refreshes while packets arrive faster than shown
+INT64_LIMIT = 2.0 ** 62       # Values are clipped to this before integer formatting
+
+
+def _binary_cells(integers):
+    """
+    @brief Binary strings for an integer array, all padded to the widest value (at least 8 bits).
+    """
+    magnitude = np.abs(integers).astype(np.uint64)
+    width = max(8, int(magnitude.max(initial=0)).bit_length())
+    shifts = np.arange(width - 1, -1, -1, dtype=np.uint64)
+    bits = ((magnitude[..., None] >> shifts) & np.uint64(1)).astype(np.uint8) + ord('0')
+    cells = np.ascontiguousarray(bits).view(f'S{width}')[..., 0].astype(f'U{width + 1}')
+    return np.where(integers < 0, np.char.add('-', cells), cells)
+
+
+def format_packets(values, lengths, mode):
+    """
+    @brief Format a block of packets in one vectorized pass per display mode.
+    @param values 2-D array of packet values, NaN where a value is missing or past the packet end.
+    @param lengths Number of values in each row.
+    @param mode 'decimal', 'hex', 'ascii', 'binary' or 'mixed' (decimal followed by hex).
+    @return One string per row.
+    """
+    missing = np.isnan(values)
+    integers = np.clip(np.where(missing, 0.0, values), -INT64_LIMIT, INT64_LIMIT).astype(np.int64)
+    if mode == 'ascii':
+        printable = ~missing & (integers >= 32) & (integers <= 126)
+        codes = np.where(printable, integers, ord('.')).astype(np.uint8)
+        return [row[:length].tobytes().decode('ascii') for row, length in zip(codes, lengths)]
+    
+    if mode in ('hex', 'binary', 'mixed'):
+        if mode == 'binary':
+            cells = _binary_cells(integers)
+            cells[missing] = 'X' * 8
+        else:
+            cells = np.char.mod('%02X', integers)
+            cells[missing] = 'XX'
+        coded = [' '.join(row[:length]) for row, length in zip(cells.tolist(), lengths)]
+        if mode != 'mixed':
+            return coded
+    
+    decimals = np.where(missing, 'NULL', np.char.mod('%.6g', values)).tolist()
+    lines = [f"[{', '.join(row[:length])}]" for row, length in zip(decimals, lengths)]
+    if mode == 'mixed':
+        return [f"{line} | {hex_line}" for line, hex_line in zip(lines, coded)]
+    return lines
+
+
+class PacketLogModel(QAbstractListModel):
+    """
+    @brief List model over a PacketRing that formats rows only when a view asks for them.
+    @details Rows are formatted in chunks of CHUNK_ROWS with format_packets() and cached, so
+             scrolling costs a vectorized pass per chunk. New ring rows are published to views in one
+             insert/remove pair per sync() call rather than per packet.
+    """
+    CHUNK_ROWS = 64
+    MAX_CHUNKS = 64
+    NOTE_COLOR = QColor('#ffbf00')
+
+    def __init__(self, ring, parent=None):
+        super().__init__(parent)
+        self.ring = ring
+        self.mode = 'decimal'
+        self.show_timestamp = True
+        self.show_number = True
+        self._first = 0     # Sequence number of row 0
+        self._count = 0     # Rows published to views
+        self._chunks = {}   # Chunk number -> (first sequence, formatted lines)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        sequence = self._first + index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.line(sequence)
+        if role == Qt.ItemDataRole.ForegroundRole and sequence in self.ring.notes:
+            return self.NOTE_COLOR
+        return None
+
+    def line(self, sequence):
+        """
+        @brief Formatted text of one row, from the chunk cache when possible.
+        """
+        chunk = sequence // self.CHUNK_ROWS
+        start, lines = self._chunks.get(chunk, (0, ()))
+        if not start <= sequence < start + len(lines):
+            if len(self._chunks) >= self.MAX_CHUNKS:
+                self._chunks.clear()
+            start = max(chunk * self.CHUNK_ROWS, self.ring.first)
+            lines = self.format_rows(start, (chunk + 1) * self.CHUNK_ROWS)
+            self._chunks[chunk] = (start, lines)
+        offset = sequence - start
+        return lines[offset] if 0 <= offset < len(lines) else ""
+
+    def format_rows(self, start, stop):
+        """
+        @brief Format the ring rows in [start, stop) with the current mode and prefixes.
+        """
+        sequence, values, lengths, timestamps, numbers = self.ring.rows(start, stop)
+        bodies = format_packets(values, np.maximum(lengths, 0), self.mode)
+        lines = []
+        for seq, length, timestamp, number, body in zip(sequence.tolist(), lengths.tolist(),
+                                                        timestamps.tolist(), numbers.tolist(), bodies):
+            prefix = ""
+            if self.show_timestamp:
+                prefix += datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3] + " "
+            if length == NOTE_LENGTH:
+                body = self.ring.notes.get(seq, "")
+            elif self.show_number:
+                prefix += f"[{number}] "
+            lines.append(prefix + body)
+        return lines
+
+    def lines(self, block=4096):
+        """
+        @brief Yield every row held by the ring as text, formatting a block at a time.
+        """
+        for start in range(self.ring.first, self.ring.total, block):
+            yield from self.format_rows(start, start + block)
+
+    def sync(self):
+        """
+        @brief Publish rows appended to (and dropped from) the ring since the last call.
+        @return True if the row set changed.
+        """
+        first, total = self.ring.first, self.ring.total
+        dropped = min(first - self._first, self._count)
+        if dropped > 0:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            self._first += dropped
+            self._count -= dropped
+            self.endRemoveRows()
+        if self._count == 0:
+            self._first = first
+        added = total - (self._first + self._count)
+        if added > 0:
+            self.beginInsertRows(QModelIndex(), self._count, self._count + added - 1)
+            self._count += added
+            self.endInsertRows()
+        return dropped > 0 or added > 0
+
+    def reset(self):
+        """
+        @brief Drop all published rows, e.g. after the ring was cleared.
+        """
+        self.beginResetModel()
+        self._chunks.clear()
+        self._first = self.ring.first
+        self._count = 0
+        self.endResetModel()
+
+    def set_options(self, mode=None, show_timestamp=None, show_number=None):
+        """
+        @brief Change how rows are formatted and re-render the visible ones.
+        """
+        if mode is not None:
+            self.mode = mode
+        if show_timestamp is not None:
+            self.show_timestamp = show_timestamp
+        if show_number is not None:
+            self.show_number = show_number
+        self._chunks.clear()
+        if self._count:
+            self.dataChanged.emit(self.index(0), self.index(self._count - 1),
+                                  [Qt.ItemDataRole.DisplayRole])
+
+class RateCounter:
+    """
+    @brief Rolling event rate over a time window, kept in a fixed ring of time buckets.
+    @details Adding events and reading the rate cost O(buckets) at most, independent of the event
+             rate; nothing per event is stored.
+    """
+    def __init__(self, window=5.0, buckets=50, clock=time.monotonic):
+        self.window = window
+        self.buckets = buckets
+        self.bucket_width = window / buckets
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self._counts = [0] * self.buckets
+        self._slots = [-1] * self.buckets   # Absolute bucket number held by each ring entry
+        self._start = None
+
+    def add(self, count=1):
+        now = self.clock()
+        if self._start is None:
+            self._start = now
+        slot = int(now / self.bucket_width)
+        index = slot % self.buckets
+        if self._slots[index] != slot:
+            self._slots[index] = slot
+            self._counts[index] = 0
+        self._counts[index] += count
+
+    def rate(self):
+        """
+        @return Events per second over the window (or since the first event, if more recent).
+        """
+        if self._start is None:
+            return 0.0
+        now = self.clock()
+        oldest = int(now / self.bucket_width) - self.buckets
+        total = sum(count for count, slot in zip(self._counts, self._slots) if slot > oldest)
+        span = min(self.window, now - self._start)
+        return total / span if span > 0 else 0.0
+
+
 class RawTelemetryMonitor(QDialog):
     """
     @brief Serial monitor-style window for viewing raw incoming data packets.
@@ -106,12 +325,25 @@ class RawTelemetryMonitor(QDialog):
         layout.addWidget(header)
 
 
-        # Text display area
-        self.text_display = QTextEdit()
+        # Statistics
+        self.packet_count = 0
+        self.byte_count = 0
+        self.rate_counter = RateCounter()
+        self.is_paused = False
+        self.max_lines = 1000
+        # Packets received since the last flush; older ones would be trimmed from the view anyway
+        self.pending = deque(maxlen=self.max_lines)
+        self.lines = deque(maxlen=self.max_lines)   # Mirror of the displayed lines
+        self._last_burst_redraw = 0.0
+
+        # Text display area: plain text, trimmed by the document itself
+        self.text_display = QPlainTextEdit()
         self.text_display.setReadOnly(True)
+        self.text_display.setUndoRedoEnabled(False)
+        self.text_display.setMaximumBlockCount(self.max_lines)
         self.text_display.setFont(QFont("Consolas", 10))
         self.text_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #0c0c0c;
                 color: #00ff88;
                 border: 1px solid #333;
@@ -119,7 +351,7 @@ class RawTelemetryMonitor(QDialog):
                 padding: 8px;
             }
         """)
-        self.text_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.text_display.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         layout.addWidget(self.text_display)
 
 
@@ -162,13 +394,8 @@ class RawTelemetryMonitor(QDialog):
         
         layout.addLayout(btn_layout)
 
-
-        # Statistics
-        self.packet_count = 0
-        self.byte_count = 0
-        self.packet_timestamps = []
-        self.is_paused = False
-        self.max_lines = 1000
+        # Buffered lines are written once per frame
+        FrameClock.shared().register(self, self.flush)
         
         # Apply styling - Apple-like Dark Theme
         self.setStyleSheet("""
@@ -198,7 +425,7 @@ class RawTelemetryMonitor(QDialog):
             QPushButton:pressed {
                 background-color: rgba(255, 255, 255, 0.05);
             }
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #000000;
                 color: #00ff88;
                 border: 1px solid #333;
@@ -211,7 +438,9 @@ class RawTelemetryMonitor(QDialog):
 
     def append_packet(self, packet_data):
         """
-        @brief Append a new packet to the display.
+        @brief Queue a new packet for display.
+        @details Only counters are updated here; formatting and drawing happen once per frame in
+                 flush(), for at most max_lines packets.
         @param packet_data The data packet to display (list or raw value).
         """
         if self.is_paused:
@@ -219,59 +448,58 @@ class RawTelemetryMonitor(QDialog):
         
         # Update statistics
         self.packet_count += 1
-        current_time = time.time()
-        self.packet_timestamps.append(current_time)
-        
-        # Calculate rolling rate (last 5 seconds)
-        self.packet_timestamps = [ts for ts in self.packet_timestamps if current_time - ts < 5.0]
-        if len(self.packet_timestamps) > 1:
-            time_span = current_time - self.packet_timestamps[0]
-            rate = len(self.packet_timestamps) / time_span if time_span > 0 else 0.0
+        self.rate_counter.add()
+        hex_mode = self.hex_btn.isChecked()
+        if isinstance(packet_data, list):
+            self.byte_count += len(packet_data) if hex_mode else len(packet_data) * 4
         else:
-            rate = 0.0
-        
-        # Format packet data
-        timestamp_str = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        
-        if self.hex_btn.isChecked():
+            self.byte_count += len(str(packet_data))
+        self.pending.append((time.time(), self.packet_count, packet_data, hex_mode))
+
+    @staticmethod
+    def format_line(timestamp, number, packet_data, hex_mode):
+        """
+        @brief Format one queued packet as a plain-text line.
+        """
+        timestamp_str = datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]
+        if hex_mode:
             # Show as hex
             if isinstance(packet_data, list):
-                hex_data = ' '.join([f'{int(v):02X}' if v is not None else 'XX' for v in packet_data])
-                data_str = f"[HEX] {hex_data}"
-                self.byte_count += len(packet_data)
+                data_str = "[HEX] " + ' '.join([f'{int(v):02X}' if v is not None else 'XX' for v in packet_data])
             else:
                 data_str = f"[HEX] {str(packet_data)}"
-                self.byte_count += len(str(packet_data))
         else:
             # Show as decimal/json
             if isinstance(packet_data, list):
                 data_str = f"[{', '.join([f'{v:.2f}' if v is not None else 'NULL' for v in packet_data])}]"
-                self.byte_count += len(packet_data) * 4
             else:
                 data_str = str(packet_data)
-                self.byte_count += len(str(packet_data))
-        
-        # Create formatted line
-        line = f"<span style='color: #888888;'>{timestamp_str}</span> " \
-               f"<span style='color: #00bfff;'>[PKT {self.packet_count:06d}]</span> " \
-               f"<span style='color: #00ff88;'>{data_str}</span>"
-        
-        # Append to display
-        self.text_display.append(line)
-        
-        # Limit number of lines
-        doc = self.text_display.document()
-        if doc.blockCount() > self.max_lines:
-            cursor = self.text_display.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)
-            cursor.select(cursor.SelectionType.LineUnderCursor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
-        
-        # Auto-scroll to bottom
-        if self.autoscroll_btn.isChecked():
-            scrollbar = self.text_display.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
+        return f"{timestamp_str} [PKT {number:06d}] {data_str}"
+
+    def flush(self):
+        """
+        @brief Write queued packets to the display in one chunk and refresh the statistics.
+        @details Small batches are appended. A burst of a quarter of the display or more is cheaper
+                 to show by replacing the whole text from the mirrored lines than by appending and
+                 trimming block by block; bursts are redrawn at most every BURST_REDRAW_INTERVAL.
+        """
+        burst = len(self.pending) >= self.max_lines // 4
+        now = time.monotonic()
+        if self.pending and (not burst or now - self._last_burst_redraw >= BURST_REDRAW_INTERVAL):
+            lines = [self.format_line(*entry) for entry in self.pending]
+            self.pending.clear()
+            self.lines.extend(lines)
+            if burst:
+                self._last_burst_redraw = now
+            if burst and self.autoscroll_btn.isChecked():
+                self.text_display.setPlainText("\n".join(self.lines))
+            else:
+                self.text_display.appendPlainText("\n".join(lines))
+        
+            # Auto-scroll to bottom
+            if self.autoscroll_btn.isChecked():
+                scrollbar = self.text_display.verticalScrollBar()
+                scrollbar.setValue(scrollbar.maximum())
         
         # Update labels
         self.packet_count_label.setText(f"Packets: {self.packet_count}")
@@ -284,30 +512,38 @@ class RawTelemetryMonitor(QDialog):
             byte_str = f"{self.byte_count/(1024*1024):.1f} MB"
         self.byte_count_label.setText(f"Bytes: {byte_str}")
         
-        self.rate_label.setText(f"Rate: {rate:.1f}/s")
+        self.rate_label.setText(f"Rate: {self.rate_counter.rate():.1f}/s")
 
     def toggle_pause(self):
         """
         @brief Toggle pause state.
         @details Pauses or resumes the display updates.
         """
+        self._last_burst_redraw = 0.0
+        self.flush()
         self.is_paused = self.pause_btn.isChecked()
         if self.is_paused:
             self.pause_btn.setText("Resume")
-            self.text_display.append("<span style='color: #ffbf00;'>[PAUSED]</span>")
+            self._append_marker("[PAUSED]")
         else:
             self.pause_btn.setText("Pause")
-            self.text_display.append("<span style='color: #00ff88;'>[RESUMED]</span>")
+            self._append_marker("[RESUMED]")
+
+    def _append_marker(self, text):
+        self.lines.append(text)
+        self.text_display.appendPlainText(text)
     
     def clear_display(self):
         """
         @brief Clear the display.
         @details Resets the text area and statistics.
         """
+        self.pending.clear()
+        self.lines.clear()
         self.text_display.clear()
         self.packet_count = 0
         self.byte_count = 0
-        self.packet_timestamps.clear()
+        self.rate_counter.reset()
         self.packet_count_label.setText("Packets: 0")
         self.byte_count_label.setText("Bytes: 0")
         self.rate_label.setText("Rate: 0.0/s")
@@ -325,6 +561,8 @@ class RawTelemetryMonitor(QDialog):
         )
         if path:
             try:
+                self._last_burst_redraw = 0.0
+                self.flush()
                 with open(path, 'w', encoding='utf-8') as f:
                     f.write(self.text_display.toPlainText())
                 QMessageBox.information(self, "Saved", f"Raw telemetry saved to:\n{path}")
@@ -338,7 +576,7 @@ class StandaloneTelemetryViewer(QDialog):
     @details Provides advanced controls for connection, display formatting (hex, ascii, etc.), and data sending.
     """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, ring_capacity=DEFAULT_CAPACITY):
         super().__init__(parent)
         self.setWindowTitle("Advanced Raw Telemetry Monitor")
         self.setMinimumSize(1200, 800)
@@ -371,10 +609,14 @@ class StandaloneTelemetryViewer(QDialog):
         # Statistics
         self.packet_count = 0
         self.byte_count = 0
-        self.packet_timestamps = []
+        self.rate_counter = RateCounter()
         self.start_time = time.time()
         self.error_count = 0
         
+        # Raw packets are kept in a bounded ring; the view formats only the rows it shows
+        self.packet_ring = PacketRing(capacity=ring_capacity)
+        self.packet_model = PacketLogModel(self.packet_ring, self)
+        
         # Main layout
         main_layout = QHBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -394,13 +636,14 @@ class StandaloneTelemetryViewer(QDialog):
         toolbar = self._build_top_toolbar()
         content_layout.addWidget(toolbar)
         
-        # Text Display
-        self.text_display = QTextEdit()
-        self.text_display.setReadOnly(True)
-        self.text_display.setFont(QFont("Consolas", 10))
-        self.text_display.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        self.text_display.setStyleSheet("""
-            QTextEdit {
+        # Packet Display
+        self.packet_view = QListView()
+        self.packet_view.setModel(self.packet_model)
+        self.packet_view.setUniformItemSizes(True)
+        self.packet_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.packet_view.setFont(QFont("Consolas", 10))
+        self.packet_view.setStyleSheet("""
+            QListView {
                 background-color: #0c0c0c;
                 border: none;
                 color: #00ff88;
@@ -408,7 +651,7 @@ class StandaloneTelemetryViewer(QDialog):
                 selection-background-color: #0a84ff;
             }
         """)
-        content_layout.addWidget(self.text_display)
+        content_layout.addWidget(self.packet_view)
         
         # Send Panel
         send_panel = self._build_send_panel()
@@ -476,6 +719,7 @@ class StandaloneTelemetryViewer(QDialog):
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_statistics)
         self.update_timer.start(1000)
+        FrameClock.shared().register(self, self.refresh_view)
 
     def _build_sidebar(self):
         sidebar = QWidget()
@@ -516,8 +760,10 @@ class StandaloneTelemetryViewer(QDialog):
         
         self.show_timestamp = QCheckBox("Show Timestamps")
         self.show_timestamp.setChecked(True)
+        self.show_timestamp.toggled.connect(lambda c: self.packet_model.set_options(show_timestamp=c))
         self.show_packet_num = QCheckBox("Show Packet #")
         self.show_packet_num.setChecked(True)
+        self.show_packet_num.toggled.connect(lambda c: self.packet_model.set_options(show_number=c))
         self.autoscroll_check = QCheckBox("Auto-scroll")
         self.autoscroll_check.setChecked(True)
         self.autoscroll_check.toggled.connect(lambda c: setattr(self, 'autoscroll_enabled', c))
@@ -639,9 +885,11 @@ class StandaloneTelemetryViewer(QDialog):
         self.mode_ascii.setChecked(mode == 'ascii')
         self.mode_binary.setChecked(mode == 'binary')
         self.mode_mixed.setChecked(mode == 'mixed')
+        self.packet_model.set_options(mode=mode)
 
     def open_connection_settings(self):
-        dialog = ConnectionSettingsDialog(self.connection_settings, self)
+        link_stats = self.simulator.link_stats if self.simulator else None
+        dialog = ConnectionSettingsDialog(self.connection_settings, self, link_stats=link_stats)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.connection_settings = dialog.get_settings()
 
@@ -698,7 +946,7 @@ class StandaloneTelemetryViewer(QDialog):
         # Reset statistics
         self.packet_count = 0
         self.byte_count = 0
-        self.packet_timestamps = []
+        self.rate_counter.reset()
         
         # Update UI
         self.connect_btn.setText("Connect")
@@ -710,10 +958,11 @@ class StandaloneTelemetryViewer(QDialog):
     def toggle_pause(self):
         self.is_paused = self.pause_btn.isChecked()
         self.pause_btn.setText("Resume" if self.is_paused else "Pause")
-        self.text_display.append(f"<span style='color: #ffbf00;'>[{'PAUSED' if self.is_paused else 'RESUMED'}]</span>")
+        self.packet_ring.append_note(f"[{'PAUSED' if self.is_paused else 'RESUMED'}]", time.time())
 
     def clear_display(self):
-        self.text_display.clear()
+        self.packet_ring.clear()
+        self.packet_model.reset()
         self.packet_count = 0
         self.byte_count = 0
 
@@ -721,62 +970,48 @@ class StandaloneTelemetryViewer(QDialog):
         self.on_data_received(packet_data)
 
     def on_data_received(self, packet_data):
+        """
+        @brief Store a received packet in the ring; it is shown on the next frame.
+        """
         # Only process data if simulator is connected
         if not self.simulator or self.is_paused:
             return
         
         self.packet_count += 1
-        
-        # Formatting
-        if self.display_mode == 'hex':
-            data_str = " ".join([f"{int(x):02X}" for x in packet_data]) if isinstance(packet_data, list) else f"{packet_data}"
-        elif self.display_mode == 'ascii':
-            data_str = "".join([chr(int(x)) if 32 <= int(x) <= 126 else "." for x in packet_data]) if isinstance(packet_data, list) else str(packet_data)
-        elif self.display_mode == 'binary':
-            data_str = " ".join([f"{int(x):08b}" for x in packet_data]) if isinstance(packet_data, list) else str(packet_data)
-        elif self.display_mode == 'mixed':
-             data_str = f"{packet_data}" # Simplified for brevity
-        else: # decimal
-            data_str = str(packet_data)
-            
-        # Build line
-        ts = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        line = ""
-        if self.show_timestamp.isChecked(): line += f"<span style='color:#666;'>{ts}</span> "
-        if self.show_packet_num.isChecked(): line += f"<span style='color:#00bfff;'>[{self.packet_count}]</span> "
-        line += f"<span style='color:#00ff88;'>{data_str}</span>"
-        
-        self.text_display.append(line)
-        
-        if self.autoscroll_enabled:
-            sb = self.text_display.verticalScrollBar()
-            sb.setValue(sb.maximum())
-            
-        # Update byte count approximation
-        self.byte_count += len(str(packet_data))
+        self.rate_counter.add()
+        try:
+            values = self.packet_ring.append(packet_data, time.time())
+            self.byte_count += values * int(self.connection_settings.get('sample_width_bytes', 2))
+        except (TypeError, ValueError):
+            # Not numeric - keep it as a text line
+            self.error_count += 1
+            self.packet_ring.append_note(str(packet_data), time.time())
+            self.byte_count += len(str(packet_data))
+
+    def refresh_view(self):
+        """
+        @brief Publish new ring rows to the view once per frame and keep it scrolled to the end.
+        """
+        if self.packet_model.sync() and self.autoscroll_enabled:
+            self.packet_view.scrollToBottom()
 
     def update_statistics(self):
         self.packets_stat.setText(f"Pkts: {self.packet_count}")
         self.bytes_stat.setText(f"Bytes: {self.byte_count}")
+        self.rate_stat.setText(f"Rate: {self.rate_counter.rate():.1f}/s")
         
-        # Rate calc
-        current_time = time.time()
-        self.packet_timestamps.append(current_time)
-        self.packet_timestamps = [t for t in self.packet_timestamps if current_time - t < 1.0]
-        self.rate_stat.setText(f"Rate: {len(self.packet_timestamps)}/s")
-        
-        elapsed = int(current_time - self.start_time)
+        elapsed = int(time.time() - self.start_time)
         self.uptime_stat.setText(f"Time: {elapsed//60:02d}:{elapsed%60:02d}")
 
     def copy_to_clipboard(self):
-        self.text_display.selectAll()
-        self.text_display.copy()
-        self.text_display.moveCursor(self.text_display.textCursor().End)
+        QApplication.clipboard().setText("\n".join(self.packet_model.lines()))
 
     def save_to_file(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save Log", f"log_{int(time.time())}.txt")
         if path:
-            with open(path, 'w') as f: f.write(self.text_display.toPlainText())
+            with open(path, 'w') as f:
+                for line in self.packet_model.lines():
+                    f.write(line + "\n")
 
     def send_data(self):
         if not self.simulator: return
@@ -785,7 +1020,7 @@ class StandaloneTelemetryViewer(QDialog):
         if end == "LF": text += "\n"
         elif end == "CR": text += "\r"
         elif end == "CRLF": text += "\r\n"
-        self.text_display.append(f"<span style='color:#ffbf00;'>[SENT] {text.strip()}</span>")
+        self.packet_ring.append_note(f"[SENT] {text.strip()}", time.time())
         self.send_input.clear()
 
     def closeEvent(self, event):
@@ -0,0 +1,184 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        common.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Shared helpers for the benchmark suites.
+# @details     Percentiles, environment capture, JSON result files and comparison of a run against a
+#              saved baseline.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Benchmark suites for the ingest pipeline
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+import numpy as np
+
+####################################################################################################
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+DEFAULT_TOLERANCE = 0.10   # Relative worsening against the baseline that counts as a regression
+
+
+def percentiles(samples, points=(50, 90, 99)):
+    """
+    @brief Summarize samples as {'p50': ..., 'p90': ..., 'p99': ..., 'max': ...}.
+    @return None values when there are no samples.
+    """
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.size == 0:
+        return {**{f'p{point}': None for point in points}, 'max': None}
+    summary = {f'p{point}': float(value) for point, value in zip(points, np.percentile(samples, points))}
+    summary['max'] = float(samples.max())
+    return summary
+
+
+def environment_info():
+    """
+    @brief Describe the machine and code version a run was made with.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'commit': commit,
+    }
+
+
+def save_results(suite, results, path=None, settings=None):
+    """
+    @brief Write a run to a JSON file.
+    @param suite Suite name, used in the default file name.
+    @param results List of case dictionaries, each with a unique 'case' key.
+    @param path Output path; defaults to benchmarks/results/<suite>-<timestamp>.json.
+    @param settings Run settings recorded alongside the results.
+    @return Path written.
+    """
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{suite}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    document = {
+        'suite': suite,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment_info(),
+        'settings': settings or {},
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(current, baseline, metrics, tolerance=DEFAULT_TOLERANCE):
+    """
+    @brief Find metrics that got worse than the baseline by more than the tolerance.
+    @param current List of case dictionaries of this run.
+    @param baseline List of case dictionaries of the reference run (cases missing from either side
+           are ignored).
+    @param metrics Mapping of metric name -> 'higher' or 'lower' (the better direction).
+    @param tolerance Allowed relative change; absolute when the baseline value is 0.
+    @return List of (case, metric, baseline value, current value).
+    """
+    reference = {entry['case']: entry for entry in baseline}
+    regressions = []
+    for entry in current:
+        base = reference.get(entry['case'])
+        if base is None:
+            continue
+        for metric, better in metrics.items():
+            new, old = entry.get(metric), base.get(metric)
+            if new is None or old is None:
+                continue
+            worse = old - new if better == 'higher' else new - old
+            if worse > (tolerance * abs(old) if old else tolerance):
+                regressions.append((entry['case'], metric, old, new))
+    return regressions
+
+
+def add_output_arguments(parser):
+    """
+    @brief Add the --output, --baseline and --tolerance options shared by all suites.
+    """
+    parser.add_argument('--output', help="Result file (default: benchmarks/results/<suite>-<time>.json)")
+    parser.add_argument('--baseline', help="Earlier result file to compare against")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Relative worsening reported as a regression (default: %(default)s)")
+
+
+def finish(suite, results, args, metrics, settings=None):
+    """
+    @brief Save a run, compare it with the baseline if one was given, and print the outcome.
+    @return Process exit code: 1 if any regression was found, else 0.
+    """
+    path = save_results(suite, results, args.output, settings)
+    print(f"\nResults written to {path}")
+    if not args.baseline:
+        return 0
+    regressions = compare_results(results, load_results(args.baseline)['results'], metrics, args.tolerance)
+    for case, metric, old, new in regressions:
+        print(f"REGRESSION {case}: {metric} {old:.6g} -> {new:.6g}")
+    if not regressions:
+        print(f"No regressions against {args.baseline}")
+    return 1 if regressions else 0
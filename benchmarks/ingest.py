@@ -0,0 +1,361 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        ingest.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       End-to-end throughput and latency benchmark for the ingest pipeline.
+# @details     Drives DataReader from local TCP and UDP servers and pseudo-terminal (pty) serial
+#              loopbacks at controlled packet rates in each wire format. Every packet carries its
+#              sequence number in channel 0, so latency and drops are measured per packet.
+#
+#              Usage: python -m benchmarks.ingest [--transports tcp udp serial]
+#                     [--formats json_array csv raw_bytes binary_struct] [--rates 1000 10000]
+#                     [--duration 2] [--channels 32] [--output FILE] [--baseline FILE]
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Benchmark suites for the ingest pipeline
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Explicit argparse description
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import argparse
+import math
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+from app.core.backend import DataReader
+from benchmarks.common import add_output_arguments, finish, percentiles
+
+####################################################################################################
+
+TRANSPORTS = ('tcp', 'udp', 'serial')
+FORMATS = ('json_array', 'csv', 'raw_bytes', 'binary_struct')
+STREAM_TRANSPORTS = ('tcp', 'serial')   # Newline framed: cannot carry arbitrary raw bytes
+READ_TIMEOUT = 0.1                      # DataReader timeout, bounds how long an idle read blocks
+DRAIN_TIMEOUT = 0.5                     # Quiet time after the last send before packets count as dropped
+PARSE_PACKETS = 20000                   # Packets parsed from memory for the parse cost figure
+METRICS = {
+    'packets_per_s': 'higher',
+    'parse_ns_per_sample': 'lower',
+    'latency_p99_us': 'lower',
+    'drop_rate': 'lower',
+}
+
+
+class PacketEncoder:
+    """
+    @brief Encode benchmark packets in a DataReader wire format.
+    @details Channel 0 holds the sequence number; the other channels are fixed values, encoded
+             once so the sender spends its time on sending.
+    """
+
+    def __init__(self, data_format, channels):
+        self.data_format = data_format
+        self.channels = max(1, channels)
+        tail = [round(1000.0 * math.sin(channel), 3) for channel in range(1, self.channels)]
+        if data_format == 'json_array':
+            self._text = '[{}' + ''.join(f', {value}' for value in tail) + ']\n'
+        elif data_format == 'csv':
+            self._text = '{}' + ''.join(f',{value}' for value in tail) + '\n'
+        elif data_format == 'raw_bytes':
+            self._struct = struct.Struct(f'<{self.channels}I')
+            self._tail = [int(abs(value)) for value in tail]
+        elif data_format == 'binary_struct':
+            self._struct = struct.Struct('<I' + 'f' * len(tail))
+            self._tail = tail
+        else:
+            raise ValueError(f"Unknown data format '{data_format}'")
+
+    def reader_settings(self):
+        """DataReader keyword arguments needed to decode this encoding."""
+        settings = {'data_format': self.data_format, 'channel_count': self.channels}
+        if self.data_format == 'raw_bytes':
+            settings['sample_width_bytes'] = 4
+        elif self.data_format == 'binary_struct':
+            settings['parameters'] = [{'id': 'sequence', 'type': 'uint32'}] + [
+                {'id': f'ch{channel}', 'type': 'float32'} for channel in range(1, self.channels)]
+        return settings
+
+    def encode(self, sequence):
+        if self.data_format in ('json_array', 'csv'):
+            return self._text.format(sequence).encode()
+        return self._struct.pack(sequence, *self._tail)
+
+
+class TcpLink:
+    """DataReader connects as a client to a local listening socket."""
+
+    def __init__(self):
+        self.server = socket.create_server(('127.0.0.1', 0))
+        self.connection = None
+
+    def reader_settings(self):
+        return {'mode': 'tcp', 'tcp_host': '127.0.0.1', 'tcp_port': self.server.getsockname()[1]}
+
+    def open(self):
+        self.server.settimeout(5.0)
+        self.connection, _ = self.server.accept()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def send(self, data):
+        self.connection.sendall(data)
+        return True
+
+    def close(self):
+        for sock in (self.connection, self.server):
+            if sock:
+                sock.close()
+
+
+class UdpLink:
+    """One datagram per packet to the port DataReader binds."""
+
+    def __init__(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.bind(('127.0.0.1', 0))
+            self.port = probe.getsockname()[1]
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def reader_settings(self):
+        return {'mode': 'udp', 'udp_host': '127.0.0.1', 'udp_port': self.port}
+
+    def open(self):
+        pass
+
+    def send(self, data):
+        try:
+            self.sock.sendto(data, ('127.0.0.1', self.port))
+            return True
+        except OSError:
+            # Send buffer full (ENOBUFS); the packet is lost like it would be on the wire
+            return False
+
+    def close(self):
+        self.sock.close()
+
+
+class PtyLink:
+    """Pseudo-terminal pair standing in for a serial cable; DataReader opens the slave side."""
+
+    def __init__(self):
+        import tty
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+
+    def reader_settings(self):
+        return {'mode': 'serial', 'serial_port': os.ttyname(self.slave), 'baudrate': 115200}
+
+    def open(self):
+        pass
+
+    def send(self, data):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.master, view):]
+        return True
+
+    def close(self):
+        for fd in (self.master, self.slave):
+            os.close(fd)
+
+
+LINKS = {'tcp': TcpLink, 'udp': UdpLink, 'serial': PtyLink}
+
+
+class _MemoryReader(DataReader):
+    """DataReader fed from a list of encoded packets, to time parsing without any transport."""
+
+    def __init__(self, packets, **settings):
+        super().__init__(mode='serial', serial_port=None, **settings)
+        self._packets = iter(packets)
+
+    def _read_bytes(self):
+        return next(self._packets, None)
+
+    def _read_exact(self, size):
+        return next(self._packets, None)
+
+
+def measure_parse(data_format, channels, count=PARSE_PACKETS):
+    """
+    @brief Time DataReader.read_line() on packets already in memory.
+    @return Nanoseconds per parsed sample.
+    """
+    encoder = PacketEncoder(data_format, channels)
+    packets = [encoder.encode(sequence) for sequence in range(count)]
+    reader = _MemoryReader(packets, **encoder.reader_settings())
+    start = time.perf_counter_ns()
+    samples = 0
+    for _ in range(count):
+        packet = reader.read_line()
+        samples += len(packet) if isinstance(packet, list) else 0
+    return (time.perf_counter_ns() - start) / max(1, samples)
+
+
+def _send_paced(link, encoder, send_times, rate, lost):
+    start = time.perf_counter()
+    for sequence in range(len(send_times)):
+        delay = start + sequence / rate - time.perf_counter()
+        if delay > 0.001:
+            time.sleep(delay)
+        data = encoder.encode(sequence)
+        send_times[sequence] = time.perf_counter()
+        if not link.send(data):
+            lost[0] += 1
+
+
+def run_case(transport, data_format, rate, duration, channels):
+    """
+    @brief Stream rate * duration packets through one transport and format.
+    @return Case dictionary of settings and metrics.
+    """
+    encoder = PacketEncoder(data_format, channels)
+    total = max(1, int(rate * duration))
+    send_times = np.full(total, np.nan)
+    receive_times = np.full(total, np.nan)
+    lost = [0]
+    parse_errors = 0
+
+    link = LINKS[transport]()
+    reader = None
+    try:
+        reader = DataReader(timeout=READ_TIMEOUT, **link.reader_settings(), **encoder.reader_settings())
+        link.open()
+        sender = threading.Thread(target=_send_paced, args=(link, encoder, send_times, rate, lost),
+                                  daemon=True)
+        sender.start()
+        received = 0
+        last = time.perf_counter()
+        while True:
+            packet = reader.read_line()
+            now = time.perf_counter()
+            if isinstance(packet, list) and packet:
+                sequence = int(packet[0])
+                if 0 <= sequence < total and np.isnan(receive_times[sequence]):
+                    receive_times[sequence] = now
+                    received += 1
+                last = now
+            elif packet is not None:
+                parse_errors += 1
+            if not sender.is_alive() and (received == total or now - last > DRAIN_TIMEOUT):
+                break
+        sender.join()
+        rx_bytes = reader.rx_bytes
+    finally:
+        if reader:
+            reader.close()
+        link.close()
+
+    delivered = ~np.isnan(receive_times)
+    latency_us = (receive_times[delivered] - send_times[delivered]) * 1e6
+    latency = percentiles(latency_us)
+    span = np.nanmax(receive_times) - send_times[0] if received else 0.0
+    send_span = send_times[-1] - send_times[0]
+    return {
+        'case': f'{transport}/{data_format}/{rate:g}',
+        'transport': transport,
+        'format': data_format,
+        'target_rate': rate,
+        'channels': channels,
+        'sent': total - lost[0],
+        'received': received,
+        'dropped': total - received,
+        'drop_rate': (total - received) / total,
+        'parse_errors': parse_errors,
+        'send_rate': (total - 1) / send_span if send_span > 0 else None,
+        'packets_per_s': received / span if span > 0 else None,
+        'rx_bytes': rx_bytes,
+        'parse_ns_per_sample': measure_parse(data_format, channels),
+        **{f'latency_{key}_us': value for key, value in latency.items()},
+    }
+
+
+def run_suite(transports=TRANSPORTS, formats=FORMATS, rates=(1000, 10000), duration=2.0, channels=32,
+              log=print):
+    """
+    @brief Run every supported transport x format x rate combination.
+    @return List of case dictionaries.
+    """
+    results = []
+    for transport in transports:
+        if transport == 'serial' and not hasattr(os, 'openpty'):
+            log("serial: skipped, pseudo-terminals are not available on this platform")
+            continue
+        for data_format in formats:
+            if transport in STREAM_TRANSPORTS and data_format == 'raw_bytes':
+                continue
+            for rate in rates:
+                result = run_case(transport, data_format, rate, duration, channels)
+                results.append(result)
+                log(f"{result['case']:<28} {result['packets_per_s'] or 0:>10.0f} pkt/s  "
+                    f"parse {result['parse_ns_per_sample']:>7.0f} ns/sample  "
+                    f"p50 {result['latency_p50_us'] or 0:>8.0f} us  "
+                    f"p99 {result['latency_p99_us'] or 0:>8.0f} us  drop {result['drop_rate']:.2%}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="End-to-end throughput and latency benchmark for the ingest pipeline")
+    parser.add_argument('--transports', nargs='+', choices=TRANSPORTS, default=list(TRANSPORTS))
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--rates', nargs='+', type=float, default=[1000, 10000],
+                        help="Offered packet rates per second")
+    parser.add_argument('--duration', type=float, default=2.0, help="Seconds of sending per case")
+    parser.add_argument('--channels', type=int, default=32)
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+
+    settings = {key: getattr(args, key) for key in ('transports', 'formats', 'rates', 'duration', 'channels')}
+    results = run_suite(args.transports, args.formats, args.rates, args.duration, args.channels)
+    return finish('ingest', results, args, METRICS, settings)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        startup.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Cold start-up time benchmark.
+# @details     Starts the dashboard (or the headless recorder) in fresh interpreters and times each start-up
+#              phase: Qt application, module imports, window construction and first paint. Also lists
+#              the heavy optional modules that were loaded, so a module imported eagerly again shows
+#              up, and can list the modules that take longest to import (python -X importtime).
+#
+#              Usage: python -m benchmarks.startup [--targets gui headless] [--runs 5]
+#                     [--imports 15] [--output FILE] [--baseline FILE]
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Start-up time benchmark
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.common import add_output_arguments, finish
+
+####################################################################################################
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('reportlab', 'matplotlib', 'PIL', 'pyqtgraph', 'PySide6.QtWebEngineWidgets',
+                 'PySide6.QtWebEngineCore', 'serial.tools')
+METRICS = {'ready_ms_p50': 'lower', 'import_ms_p50': 'lower', 'window_ms_p50': 'lower'}
+
+# Run in a fresh interpreter per measurement; prints one JSON line of phase times (ms) when ready
+CHILD_CODE = r'''
+import json, sys, time
+start = time.perf_counter()
+target, heavy = sys.argv[1], sys.argv[2].split(",")
+phases = {}
+def mark(name):
+    global start
+    now = time.perf_counter()
+    phases[name] = (now - start) * 1000.0
+    start = now
+if target == "gui":
+    from PySide6.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    mark("qt_ms")
+    from app.ui.main_window import MainWindow
+    mark("import_ms")
+    window = MainWindow()
+    mark("window_ms")
+    window.show()
+    app.processEvents()
+    mark("show_ms")
+else:
+    from PySide6.QtCore import QCoreApplication
+    app = QCoreApplication(sys.argv[:1])
+    mark("qt_ms")
+    from app.headless import HeadlessRecorder
+    mark("import_ms")
+    recorder = HeadlessRecorder({"parameters": [], "connection_settings": {"mode": "dummy"}})
+    mark("window_ms")
+    phases["show_ms"] = 0.0
+phases["loaded"] = [name for name in heavy if name in sys.modules]
+print(json.dumps(phases), flush=True)
+if target == "gui":
+    window.simulator.stop()
+    window.simulator.wait()
+'''
+PHASES = ('qt_ms', 'import_ms', 'window_ms', 'show_ms')
+
+
+def _child_env():
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    env['PYTHONPATH'] = ROOT + (os.pathsep + env['PYTHONPATH'] if env.get('PYTHONPATH') else '')
+    return env
+
+
+def measure_once(target, python_flags=()):
+    """
+    @brief Start one fresh interpreter and time it until the target is ready.
+    @return (phase dictionary from the child, with 'ready_ms' added, and the child's stderr).
+    """
+    command = [sys.executable, *python_flags, '-c', CHILD_CODE, target, ','.join(HEAVY_MODULES)]
+    started = time.perf_counter()
+    child = subprocess.Popen(command, cwd=ROOT, env=_child_env(), stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE, text=True)
+    line = child.stdout.readline()
+    ready = (time.perf_counter() - started) * 1000.0
+    # The window prints connection messages to stdout; they come after the JSON line
+    _, errors = child.communicate(timeout=60)
+    if not line.startswith('{'):
+        raise RuntimeError(f"{target} start-up failed:\n{errors}")
+    phases = json.loads(line)
+    phases['ready_ms'] = ready
+    return phases, errors
+
+
+def slowest_imports(target, count=15):
+    """
+    @brief Modules with the largest own import time in one start-up (python -X importtime).
+    @details Own time excludes the modules a module imports in turn, so the cost shows up where it
+             is spent rather than at the top of the import chain.
+    @return List of (module, milliseconds), slowest first.
+    """
+    _, report = measure_once(target, ('-X', 'importtime'))
+    totals = []
+    for line in report.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        own, _, name = line[len('import time:'):].split('|')
+        if own.strip().isdigit():
+            totals.append((name.strip(), int(own) / 1000.0))
+    return sorted(totals, key=lambda entry: -entry[1])[:count]
+
+
+def run_case(target, runs):
+    """
+    @brief Median and spread of each start-up phase over `runs` fresh interpreters.
+    @return Case dictionary.
+    """
+    samples = [measure_once(target)[0] for _ in range(runs)]
+    result = {'case': target, 'runs': runs}
+    for phase in PHASES + ('ready_ms',):
+        values = np.array([sample[phase] for sample in samples])
+        result[f'{phase}_p50'] = float(np.median(values))
+        result[f'{phase}_max'] = float(values.max())
+    result['heavy_modules'] = sorted({name for sample in samples for name in sample['loaded']})
+    return result
+
+
+def run_suite(targets=('gui', 'headless'), runs=5, log=print):
+    results = []
+    for target in targets:
+        result = run_case(target, runs)
+        results.append(result)
+        log(f"{target:<9} ready {result['ready_ms_p50']:7.1f} ms  (Qt {result['qt_ms_p50']:.1f}, "
+            f"imports {result['import_ms_p50']:.1f}, window {result['window_ms_p50']:.1f}, "
+            f"first paint {result['show_ms_p50']:.1f})  heavy modules: {', '.join(result['heavy_modules']) or '-'}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold start-up time of the dashboard and the headless recorder")
+    parser.add_argument('--targets', nargs='+', choices=('gui', 'headless'), default=['gui', 'headless'])
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters started per target")
+    parser.add_argument('--imports', type=int, default=0, metavar='N',
+                        help="Also list the N modules with the largest own import time per target")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.targets, args.runs)
+    for target in args.targets if args.imports else ():
+        print(f"\nSlowest imports ({target}):")
+        for name, milliseconds in slowest_imports(target, args.imports):
+            print(f"  {milliseconds:8.1f} ms  {name}")
+    settings = {key: getattr(args, key) for key in ('targets', 'runs')}
+    return finish('startup', results, args, METRICS, settings)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
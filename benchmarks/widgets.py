@@ -0,0 +1,259 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        widgets.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Widget rendering benchmark on the offscreen Qt platform.
+# @details     Builds synthetic dashboards of one widget type at a time, feeds them synthetic history at
+#              a set sample rate, and times whole frames: the dashboard's per-widget update, the
+#              frame clock tick and the paint. Reports frame time per widget type, widget count and
+#              history length, and how many widgets fit a 60 fps frame.
+#
+#              Usage: python -m benchmarks.widgets [--types 'Time Graph' 'LED Indicator' ...]
+#                     [--counts 1 4 16] [--history 100 500 2000] [--rate 100] [--frames 120]
+#                     [--output FILE] [--baseline FILE]
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Widget rendering benchmark harness
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import argparse
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from PySide6.QtWidgets import QApplication, QGridLayout, QWidget
+
+from app.core.frame_clock import FrameClock
+from app.ui.main_window import MainWindow
+from app.widgets.general import GaugeWidget, HistogramWidget, LEDWidget, LogTable, TimeGraph, ValueCard
+from benchmarks.common import add_output_arguments, finish, percentiles
+
+####################################################################################################
+
+WIDGET_TYPES = {
+    'Time Graph': lambda params: TimeGraph(params),
+    'LED Indicator': lambda params: LEDWidget(params),
+    'Log Table': lambda params: LogTable(params),
+    'Instant Value': lambda params: ValueCard(params, 'Medium'),
+    'Gauge': lambda params: GaugeWidget(params[0]),
+    'Histogram': lambda params: HistogramWidget(params[0]),
+}
+FRAME_BUDGET_MS = 1000.0 / 60
+WARMUP_FRAMES = 10
+DASHBOARD_SIZE = (1920, 1080)
+METRICS = {'frame_ms_mean': 'lower', 'frame_ms_p95': 'lower'}
+
+
+class SyntheticDashboard:
+    """
+    @brief Grid of widgets fed like the main window's dashboard, without a data source.
+    @details History is kept in the main window's format (per-parameter lists of sample dicts plus
+             sequence counters) and widgets are updated by the main window's own per-type code.
+    """
+    render = MainWindow._render_widget
+
+    def __init__(self, widget_type, count, history_length, rate, fps=60):
+        self.history_length = history_length
+        self.samples_per_frame = rate / fps
+        self.frame_interval = 1.0 / fps
+        self._carry = 0.0
+        self._clock = 0.0
+        self.data_history = {}
+        self.history_seq = {}
+
+        self.window = QWidget()
+        self.window.resize(*DASHBOARD_SIZE)
+        layout = QGridLayout(self.window)
+        columns = math.ceil(math.sqrt(count))
+        self.entries = []
+        for index in range(count):
+            params = [{
+                'id': f'p{index}', 'name': f'P{index}', 'unit': 'V', 'array_index': index,
+                'color': '#0a84ff',
+                'threshold': {'low_crit': 5, 'low_warn': 15, 'high_warn': 85, 'high_crit': 95},
+            }]
+            widget = WIDGET_TYPES[widget_type](params)
+            layout.addWidget(widget, index // columns, index % columns)
+            self.entries.append((widget, {'displayType': widget_type, 'param_ids': [params[0]['id']]}))
+        self.window.show()
+        QApplication.processEvents()
+
+        # Start from a full history, as a dashboard that has been running for a while
+        self.feed(history_length)
+
+    def feed(self, samples):
+        """
+        @brief Append synthetic samples to every parameter's history.
+        """
+        for index, (_, config) in enumerate(self.entries):
+            pid = config['param_ids'][0]
+            history = self.data_history.setdefault(pid, [])
+            start = self.history_seq.get(pid, 0)
+            for sequence in range(start, start + samples):
+                value = 50.0 + 45.0 * math.sin(sequence * 0.05 + index)
+                history.append({'value': value, 'filtered_value': value,
+                                'timestamp': self._clock + sequence * self.frame_interval / max(1.0, self.samples_per_frame)})
+            if len(history) > self.history_length:
+                del history[:len(history) - self.history_length]
+            self.history_seq[pid] = start + samples
+
+    def frame(self):
+        """
+        @brief Run one dashboard frame.
+        @return (update seconds, paint seconds): history append plus per-widget updates, then the
+                frame clock tick and event processing that paints the changes.
+        """
+        self._carry += self.samples_per_frame
+        samples, self._carry = int(self._carry), self._carry - int(self._carry)
+        self._clock += self.frame_interval
+
+        start = time.perf_counter()
+        if samples:
+            self.feed(samples)
+            for widget, config in self.entries:
+                self.render(widget, config)
+        updated = time.perf_counter()
+        clock = FrameClock.shared()
+        clock.tick()
+        clock.timer.stop()   # Frames are driven here, not by the clock's own timer
+        QApplication.processEvents()
+        return updated - start, time.perf_counter() - updated
+
+    def close(self):
+        self.window.close()
+        self.window.deleteLater()
+        QApplication.processEvents()
+
+
+def run_case(widget_type, count, history_length, rate, frames):
+    """
+    @brief Time `frames` frames of a dashboard of `count` widgets of one type.
+    @return Case dictionary of settings and metrics.
+    """
+    dashboard = SyntheticDashboard(widget_type, count, history_length, rate)
+    try:
+        for _ in range(WARMUP_FRAMES):
+            dashboard.frame()
+        timings = np.array([dashboard.frame() for _ in range(frames)]) * 1000.0
+    finally:
+        dashboard.close()
+
+    totals = timings.sum(axis=1)
+    frame = percentiles(totals, (50, 95))
+    per_widget = totals.mean() / count
+    return {
+        'case': f'{widget_type}/{count}/{history_length}',
+        'widget_type': widget_type,
+        'count': count,
+        'history': history_length,
+        'rate': rate,
+        'frame_ms_mean': float(totals.mean()),
+        'frame_ms_p50': frame['p50'],
+        'frame_ms_p95': frame['p95'],
+        'frame_ms_max': frame['max'],
+        'update_ms_mean': float(timings[:, 0].mean()),
+        'paint_ms_mean': float(timings[:, 1].mean()),
+        'ms_per_widget': float(per_widget),
+        'widgets_at_60fps': int(FRAME_BUDGET_MS // per_widget) if per_widget > 0 else None,
+    }
+
+
+def scaling_report(results):
+    """
+    @brief Format results as a text table grouped by widget type.
+    """
+    lines = [f"{'widget':<14} {'count':>5} {'history':>7} {'mean ms':>8} {'p95 ms':>8} "
+             f"{'update':>7} {'paint':>7} {'ms/widget':>9} {'fit@60fps':>9}"]
+    for result in sorted(results, key=lambda r: (r['widget_type'], r['history'], r['count'])):
+        lines.append(
+            f"{result['widget_type']:<14} {result['count']:>5} {result['history']:>7} "
+            f"{result['frame_ms_mean']:>8.2f} {result['frame_ms_p95']:>8.2f} "
+            f"{result['update_ms_mean']:>7.2f} {result['paint_ms_mean']:>7.2f} "
+            f"{result['ms_per_widget']:>9.3f} {result['widgets_at_60fps'] or 0:>9}")
+    return "\n".join(lines)
+
+
+def run_suite(types=tuple(WIDGET_TYPES), counts=(1, 4, 16), histories=(100, 500, 2000), rate=100.0,
+              frames=120, log=print):
+    """
+    @brief Run every widget type x count x history length combination.
+    @return List of case dictionaries.
+    """
+    QApplication.instance() or QApplication(sys.argv[:1])
+    results = []
+    for widget_type in types:
+        for history_length in histories:
+            for count in counts:
+                result = run_case(widget_type, count, history_length, rate, frames)
+                results.append(result)
+                log(f"{result['case']:<28} {result['frame_ms_mean']:>7.2f} ms/frame")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Widget rendering benchmark on the offscreen Qt platform")
+    parser.add_argument('--types', nargs='+', choices=list(WIDGET_TYPES), default=list(WIDGET_TYPES))
+    parser.add_argument('--counts', nargs='+', type=int, default=[1, 4, 16], help="Widgets per dashboard")
+    parser.add_argument('--history', nargs='+', type=int, default=[100, 500, 2000],
+                        help="Samples kept per parameter")
+    parser.add_argument('--rate', type=float, default=100.0, help="Samples per second per parameter")
+    parser.add_argument('--frames', type=int, default=120, help="Measured frames per case")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.types, args.counts, args.history, args.rate, args.frames)
+    print()
+    print(scaling_report(results))
+    settings = {key: getattr(args, key) for key in ('types', 'counts', 'history', 'rate', 'frames')}
+    return finish('widgets', results, args, METRICS, settings)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -99,6 +99,10 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # 026  MOD      07-12-2025  NeilBaranwal9        feat: Fix unresponsive TimeGraph buttons using QGraphicsProxyWidget
 # 027  MOD      07-12-2025  NeilBaranwal9        feat: Removed invisible hover-close button from TimeGraph and from CustomTitleBar in remaining widgets
 # 028  MOD      07-12-2025  Shawn                fix: Windows specific icon fixes
+# 029  MOD      19-10-2026  MuhammadRamzy        feat: freeze_support for the report worker process
+# 030  MOD      19-10-2026  MuhammadRamzy        feat: --profile flag for the sampling profiler
+# 031  MOD      19-10-2026  MuhammadRamzy        feat: --headless ingest-and-log mode
+# 032  MOD      19-10-2026  MuhammadRamzy        fix: Pass --headless arguments, --help included, to the recorder
 ####################################################################################################
 
 ####################################################################################################
@@ -106,9 +110,8 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import sys
 import os
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
-from app.ui.main_window import MainWindow
+import argparse
+import multiprocessing
 
 ####################################################################################################
 
@@ -125,15 +128,44 @@ if __name__ == "__main__":
     @brief Main entry point of the application.
     @details Sets up the Qt application, loads the icon, creates the main window, and executes the event loop.
     """
+    # Report generation runs in worker processes; required for frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
+
+    # Headless mode owns the rest of the command line (its own --help included), so it is
+    # dispatched before the GUI parser can consume any of it
+    headless = next((i for i, arg in enumerate(sys.argv)
+                     if arg == "--headless" or arg.startswith("--headless=")), None)
+    if headless is not None:
+        # Imported here so the GUI modules are never loaded on display-less recorders
+        from app.headless import main as headless_main
+        headless_args = sys.argv[1:headless] + sys.argv[headless + 1:]
+        if "=" in sys.argv[headless]:
+            headless_args.insert(0, sys.argv[headless].split("=", 1)[1])
+        sys.exit(headless_main(headless_args))
+
+    # Our own flags; everything else is left for Qt (-platform, -style, ...)
+    parser = argparse.ArgumentParser(description="Glance Telemetry Dashboard")
+    parser.add_argument("--profile", type=float, metavar="SECONDS",
+                        help="record a sampling profile for SECONDS after start-up")
+    parser.add_argument("--headless", metavar="PROJECT",
+                        help="record PROJECT's data source without a GUI (see --headless PROJECT --help)")
+    args, qt_args = parser.parse_known_args()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QIcon
+    from app.ui.main_window import MainWindow
+
     # Fix for PyInstaller/Py2App to find resources
     base_path = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
     icon_path = os.path.join(base_path, "docs", "public", "Glance_nobg_jl.ico")
 
-    app = QApplication(sys.argv)
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setWindowIcon(QIcon(icon_path))
     
     window = MainWindow()
     window.setWindowIcon(QIcon(icon_path))
     window.show()
+    if args.profile:
+        window.start_profiling(args.profile)
     
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_alarms.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the alarm engine.
+# @details     Tests threshold compilation, block evaluation, hysteresis and debounce.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Vectorized alarm engine with hysteresis and debounce
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+import numpy as np
+from app.core.alarms import AlarmEngine, alarm_state, compile_thresholds
+
+THRESHOLD = {'low_crit': 0, 'low_warn': 10, 'high_warn': 90, 'high_crit': 100}
+
+@pytest.fixture
+def params():
+    return [
+        {'id': 'a', 'array_index': 0, 'threshold': dict(THRESHOLD)},
+        {'id': 'b', 'array_index': 2, 'threshold': dict(THRESHOLD, hysteresis=5)},
+        {'id': 'c', 'array_index': 1, 'threshold': {}},
+    ]
+
+def test_alarm_state():
+    assert alarm_state(50, THRESHOLD) == 'Nominal'
+    assert alarm_state(95, THRESHOLD) == 'Warning'
+    assert alarm_state(-1, THRESHOLD) == 'Critical'
+    assert alarm_state(None, THRESHOLD) == 'Nominal'
+    assert alarm_state(200, {'low_crit': 0}) == 'Nominal'
+    assert compile_thresholds(dict(THRESHOLD, high_crit=None)) is None
+    assert compile_thresholds({k: str(v) for k, v in THRESHOLD.items()}) == (0.0, 10.0, 90.0, 100.0)
+
+def test_parameters_without_thresholds_are_skipped(qapp, params):
+    engine = AlarmEngine(params)
+    assert engine.param_ids == ['a', 'b']
+    assert engine.state('c') == 'Nominal'
+
+def test_debounce(qapp, params):
+    engine = AlarmEngine(params, debounce=3)
+    published = []
+    engine.stateChanged.connect(lambda pid, state, value: published.append((pid, state, value)))
+
+    assert engine.evaluate([[95, 0, 50]] * 2) == []
+    # A single nominal sample resets the pending change
+    assert engine.evaluate([50, 0, 50]) == []
+    assert engine.evaluate([[95, 0, 50]] * 2) == []
+    assert engine.evaluate([95, None, 50]) == [('a', 'Nominal', 'Warning', 95.0)]
+    assert published == [('a', 'Warning', 95.0)]
+    assert engine.states() == {'a': 'Warning', 'b': 'Nominal'}
+
+def test_hysteresis(qapp, params):
+    engine = AlarmEngine(params, debounce=1)
+    engine.evaluate([95, 0, 95])
+    assert engine.states() == {'a': 'Warning', 'b': 'Warning'}
+
+    # Back inside high_warn but not past the band: stays in Warning (band is 0.8 for 'a', 5 for 'b')
+    assert engine.evaluate([89.5, 0, 87]) == []
+    assert engine.evaluate([89, 0, 84]) == [('a', 'Warning', 'Nominal', 89.0), ('b', 'Warning', 'Nominal', 84.0)]
+
+def test_block_transitions_in_sample_order(qapp, params):
+    engine = AlarmEngine(params, debounce=2)
+    block = np.full((10, 3), 50.0)
+    block[2:4, 2] = 120
+    block[6:8, 0] = -5
+    block[6:, 2] = np.nan
+    assert engine.evaluate(block) == [
+        ('b', 'Nominal', 'Critical', 120.0),
+        ('b', 'Critical', 'Nominal', 50.0),
+        ('a', 'Nominal', 'Critical', -5.0),
+        ('a', 'Critical', 'Nominal', 50.0),
+    ]
+
+def test_configure_keeps_states(qapp, params):
+    engine = AlarmEngine(params, debounce=1)
+    engine.evaluate([120, 0, 50])
+    engine.configure(params[:1])
+    assert engine.states() == {'a': 'Critical'}
+    engine.reset()
+    assert engine.state('a') == 'Nominal'
+
+def test_short_packet(qapp, params):
+    engine = AlarmEngine(params, debounce=1)
+    assert engine.evaluate([120]) == [('a', 'Nominal', 'Critical', 120.0)]
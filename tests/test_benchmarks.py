@@ -0,0 +1,104 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_benchmarks.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the benchmark suites.
+# @details     Tests result comparison, a short ingest run over a local socket and a short widget
+#              rendering run.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Benchmark suites for the ingest pipeline
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Widget rendering benchmark harness
+# 002  MOD      19-10-2026  MuhammadRamzy        feat: Start-up time benchmark
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+from benchmarks.common import compare_results, load_results, save_results
+from benchmarks import ingest, startup, widgets
+from benchmarks.ingest import METRICS, PacketEncoder, _MemoryReader, measure_parse
+
+def test_compare_results_flags_worse_metrics():
+    baseline = [{'case': 'a', 'packets_per_s': 1000.0, 'latency_p99_us': 100.0, 'drop_rate': 0.0},
+                {'case': 'b', 'packets_per_s': 1000.0}]
+    current = [{'case': 'a', 'packets_per_s': 950.0, 'latency_p99_us': 150.0, 'drop_rate': 0.2},
+               {'case': 'c', 'packets_per_s': 1.0}]
+    regressions = compare_results(current, baseline, METRICS, tolerance=0.1)
+    assert [(case, metric) for case, metric, _, _ in regressions] == [
+        ('a', 'latency_p99_us'), ('a', 'drop_rate')]
+
+def test_results_round_trip(tmp_path):
+    path = save_results('ingest', [{'case': 'a'}], str(tmp_path / "run.json"), {'duration': 1})
+    document = load_results(path)
+    assert document['suite'] == 'ingest' and document['results'] == [{'case': 'a'}]
+    assert document['settings'] == {'duration': 1} and 'python' in document['environment']
+
+@pytest.mark.parametrize("data_format", ['json_array', 'csv', 'raw_bytes', 'binary_struct'])
+def test_encoded_packets_parse_back(data_format):
+    encoder = PacketEncoder(data_format, 4)
+    reader = _MemoryReader([encoder.encode(7)], **encoder.reader_settings())
+    packet = reader.read_line()
+    assert len(packet) == 4 and packet[0] == 7.0
+    assert measure_parse(data_format, 4, count=100) > 0
+
+@pytest.mark.performance
+def test_tcp_case_delivers_every_packet():
+    result = ingest.run_case('tcp', 'json_array', rate=500, duration=0.2, channels=8)
+    assert result['case'] == 'tcp/json_array/500'
+    assert result['received'] == 100 and result['drop_rate'] == 0.0
+    assert result['latency_p50_us'] > 0
+
+@pytest.mark.performance
+def test_widget_case_reports_frame_times(qapp):
+    result = widgets.run_case('LED Indicator', count=2, history_length=50, rate=120, frames=5)
+    assert result['case'] == 'LED Indicator/2/50'
+    assert result['frame_ms_mean'] > 0 and result['widgets_at_60fps'] >= 1
+    report = widgets.scaling_report([result])
+    assert report.splitlines()[1].startswith('LED Indicator')
+
+def test_startup_loads_no_heavy_optional_modules():
+    result = startup.run_case('gui', runs=1)
+    assert result['ready_ms_p50'] > result['import_ms_p50'] > 0
+    assert result['heavy_modules'] == []
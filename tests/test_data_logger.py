@@ -47,6 +47,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # No#   |       when       who                  what
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Query logged sessions through DataLogger.open_reader
 ####################################################################################################
 
 ####################################################################################################
@@ -58,6 +59,7 @@ import shutil
 import time
 from unittest.mock import patch
 from datetime import datetime
+import numpy as np
 from app.core.data_logger import DataLogger
 
 class TestDataLogger:
@@ -154,3 +156,16 @@ class TestDataLogger:
         iso_ts = datetime.fromtimestamp(1234567890).isoformat()
         assert iso_ts in content
         assert '"p1": 20.0' in content
+
+    def test_open_reader(self, logger):
+        logger.configure(format_type='csv', file_path='test_logs/test_reader.csv', buffer_size=10,
+                         parameters=[{'id': 'p1', 'name': 'P1'}])
+        logger.start_logging()
+        for i in range(25):
+            logger.log_data(None, {'p1': [{'value': float(i)}]})
+
+        # Unflushed entries are written before the reader opens
+        reader = logger.open_reader()
+        assert os.path.exists('test_logs/test_reader.csv.idx')
+        assert reader.index.size == 3
+        assert np.array_equal(reader.read(parameters=['p1'])['p1'], np.arange(25, dtype=float))
@@ -0,0 +1,100 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_decimation.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for min/max decimation.
+# @details     Tests that decimated series stay bounded and keep every extreme.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Parallel per-parameter plot rendering in reports with decimated inputs
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Viewport decimation for live TimeGraph curves
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+import numpy as np
+from app.core.decimation import MinMaxEnvelope, decimate_minmax, decimate_viewport
+
+def test_decimate_minmax_keeps_extremes():
+    x = np.linspace(0, 100, 1000000)
+    y = np.sin(x)
+    y[123456] = 10.0
+    y[654321] = -10.0
+    dx, dy = decimate_minmax(x, y, 800)
+    assert dx.size <= 1600
+    assert np.all(np.diff(dx) >= 0)
+    assert dy.max() == 10.0 and dy.min() == -10.0
+
+def test_decimate_viewport_slices_visible_range():
+    x = np.arange(100000, dtype=float)
+    y = np.cos(x)
+    dx, dy = decimate_viewport(x, y, 5000, 6000, 100)
+    assert dx[0] == 4999 and dx[-1] == 6001
+    assert dx.size <= 202
+    assert dy.max() == pytest.approx(y[4999:6002].max())
+
+def test_decimate_minmax_passthrough_and_nan():
+    x = np.arange(10, dtype=float)
+    y = np.arange(10, dtype=float)
+    dx, dy = decimate_minmax(x, y, 800)
+    assert np.array_equal(dx, x) and np.array_equal(dy, y)
+
+    y = np.full(5000, np.nan)
+    y[::2] = 1.0
+    dx, dy = decimate_minmax(np.arange(5000, dtype=float), y, 100)
+    assert not np.isnan(dy).any()
+
+def test_envelope_is_bounded_and_keeps_extremes():
+    x = np.arange(100000, dtype=float)
+    y = np.sin(x / 500.0)
+    y[12345] = 50.0
+    y[67890] = -50.0
+    env = MinMaxEnvelope(capacity=256)
+    for start in range(0, x.size, 9999):
+        env.add(x[start:start + 9999], y[start:start + 9999])
+    px, py = env.points()
+    assert px.size <= 2 * 256 + env.stride
+    assert np.all(np.diff(px) >= 0)
+    assert py.max() == 50.0 and py.min() == -50.0
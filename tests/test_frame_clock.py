@@ -0,0 +1,117 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_frame_clock.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the shared frame clock.
+# @details     Tests callback ordering, visibility gating and load-adaptive frame rates.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Single shared frame clock for widget refreshes
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+from PySide6.QtWidgets import QLabel, QTabWidget
+from app.core import frame_clock
+from app.core.frame_clock import FrameClock
+
+@pytest.fixture
+def tabs(qapp):
+    widget = QTabWidget()
+    shown, hidden = QLabel("shown"), QLabel("hidden")
+    widget.addTab(shown, "A")
+    widget.addTab(hidden, "B")
+    widget.show()
+    qapp.processEvents()
+    yield widget, shown, hidden
+    widget.close()
+
+def test_tick_runs_on_screen_callbacks_in_priority_order(tabs):
+    window, shown, hidden = tabs
+    clock = FrameClock()
+    calls = []
+    clock.register(shown, lambda: calls.append('widget'))
+    clock.register(hidden, lambda: calls.append('hidden'))
+    clock.register(window, lambda: calls.append('data'), priority=0)
+
+    clock.tick()
+    assert calls == ['data', 'widget']
+
+    # Switching tabs moves the refresh to the newly visible widget
+    window.setCurrentIndex(1)
+    calls.clear()
+    clock.tick()
+    assert calls == ['data', 'hidden']
+
+def test_unregister_and_deleted_widgets(tabs, qapp):
+    window, shown, hidden = tabs
+    clock = FrameClock()
+    calls = []
+    clock.register(shown, lambda: calls.append('shown'))
+    assert clock.timer.isActive()
+
+    clock.unregister(shown)
+    clock.tick()
+    assert calls == []
+    assert not clock.timer.isActive()
+
+def test_rate_adapts_to_load(tabs, monkeypatch):
+    window, shown, hidden = tabs
+    monkeypatch.setattr(frame_clock, 'ADAPT_HOLD_SECONDS', 0.0)
+    clock = FrameClock(max_fps=60)
+    clock.register(shown, lambda: None)
+    assert clock.fps == 60
+
+    changes = []
+    clock.fpsChanged.connect(changes.append)
+    for _ in range(3):
+        clock.load = 1.0
+        clock._adapt(1e9)
+    assert changes == [30, 20, 15]
+    assert clock.timer.interval() == 67
+
+    clock.load = 0.0
+    clock._adapt(1e9)
+    assert clock.fps == 20
@@ -0,0 +1,113 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_headless.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the headless ingest-and-log mode.
+# @details     Records a dummy source to a log and checks that no GUI module is imported.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Headless ingest-and-log mode
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+from PySide6.QtCore import QCoreApplication
+from app.headless import HeadlessRecorder, main
+
+####################################################################################################
+
+def make_project(tmp_path, **logging_settings):
+    project = {
+        'parameters': [{'id': 'p1', 'name': 'Temp', 'array_index': 0},
+                       {'id': 'p2', 'name': 'Volt', 'array_index': 1}],
+        'connection_settings': {'mode': 'dummy'},
+        'logging_settings': dict({'format': 'csv', 'file_path': str(tmp_path / "log.csv"),
+                                  'selected_params': ['p1'], 'buffer_size': 2}, **logging_settings),
+    }
+    path = tmp_path / "project.json"
+    path.write_text(json.dumps(project))
+    return str(path)
+
+
+def test_recorder_logs_selected_parameters(qapp, tmp_path):
+    lines = []
+    recorder = HeadlessRecorder.from_file(make_project(tmp_path), duration=0.5, output=lines.append)
+    finished = []
+    recorder.finished.connect(lambda: finished.append(True))
+    recorder.start()
+    deadline = time.time() + 3.0
+    while not finished and time.time() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+
+    assert finished
+    with open(tmp_path / "log.csv") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['timestamp', 'elapsed_time', 'p1_Temp']
+    assert len(rows) - 1 == recorder.packets > 0
+    assert any("packets" in line for line in lines)
+
+
+def test_cli_overrides_log(qapp, tmp_path):
+    log_path = tmp_path / "override.json"
+    code = main([make_project(tmp_path), "--duration", "0.3", "--log-file", str(log_path),
+                 "--log-format", "json", "--status-interval", "0"])
+    assert code == 0
+    records = [json.loads(line) for line in log_path.read_text().splitlines() if line.startswith("{")]
+    assert records and set(records[0]['parameters']) == {'p1'}
+
+
+def test_no_gui_modules_imported():
+    script = ("import sys, app.headless; "
+              "print(sorted(m for m in sys.modules if m.startswith(('PySide6.QtWidgets', 'PySide6.QtGui', "
+              "'PySide6.QtWebEngine', 'pyqtgraph'))))")
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert output.strip() == "[]"
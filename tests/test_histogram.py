@@ -0,0 +1,143 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_histogram.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the streaming histogram.
+# @details     Tests fixed and adaptive binning, sliding windows and long-horizon accumulation.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Incremental histogram with fixed or adaptive bins
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Re-fit windowed adaptive bins, ignore non-finite values
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+import numpy as np
+from app.core.histogram import StreamingHistogram
+
+def feed(histogram, values, blocks):
+    changed = [histogram.add(block) for block in np.array_split(values, blocks)]
+    return any(changed)
+
+def test_fixed_edges_sliding_window():
+    rng = np.random.default_rng(1)
+    values = rng.uniform(-1, 11, 5000)
+    edges = np.linspace(0, 10, 11)
+    histogram = StreamingHistogram(edges=edges, window=500)
+    feed(histogram, values, 73)
+
+    expected, _ = np.histogram(values[-500:], bins=edges)
+    assert np.array_equal(histogram.counts, expected)
+    assert histogram.underflow == np.count_nonzero(values[-500:] < 0)
+    assert histogram.overflow == np.count_nonzero(values[-500:] > 10)
+    assert histogram.total == 500
+
+def test_adaptive_bins_grow_exactly():
+    rng = np.random.default_rng(2)
+    values = np.concatenate([rng.uniform(0, 1, 100), rng.uniform(-50, 3, 400), rng.uniform(0, 90, 200)])
+    histogram = StreamingHistogram(bins=7, window=300)
+    feed(histogram, values, 37)
+
+    edges = histogram.edges
+    assert len(edges) == 8 and edges[0] <= values[-300:].min() and edges[-1] >= values[-300:].max()
+    expected, _ = np.histogram(values[-300:], bins=edges)
+    assert np.array_equal(histogram.counts, expected)
+
+def test_accumulate_whole_session():
+    rng = np.random.default_rng(3)
+    values = rng.normal(size=20000)
+    histogram = StreamingHistogram(bins=20, window=None)
+    feed(histogram, values, 100)
+    assert histogram.total == histogram.counts.sum() == 20000
+    # Merged bins keep their counts; only values sitting on an edge may round to the neighbour
+    expected, _ = np.histogram(values, bins=histogram.edges)
+    assert np.abs(histogram.counts - expected).sum() <= 4
+
+def test_change_detection():
+    histogram = StreamingHistogram(edges=[0, 1, 2])
+    assert histogram.add([0.5])
+    assert not histogram.add([np.nan])
+    assert not histogram.add([5.0])     # Overflow only: no visible bin changed
+    assert histogram.counts.tolist() == [1, 0]
+
+def test_constant_values_and_bad_edges():
+    histogram = StreamingHistogram(bins=4)
+    histogram.add([3.0, 3.0])
+    assert histogram.counts.sum() == 2
+    with pytest.raises(ValueError):
+        StreamingHistogram(edges=[1, 1])
+
+def test_window_recovers_from_outlier():
+    rng = np.random.default_rng(4)
+    histogram = StreamingHistogram(bins=20, window=500)
+    histogram.add(rng.normal(0, 1, 400))
+    histogram.add([1e6])
+    assert histogram.edges[-1] >= 1e6
+    recent = rng.normal(0, 1, 600)
+    for block in np.array_split(recent, 30):
+        histogram.add(block)
+
+    edges = histogram.edges
+    assert edges[0] <= recent[-500:].min() and edges[-1] < 10
+    expected, _ = np.histogram(recent[-500:], bins=edges)
+    assert np.array_equal(histogram.counts, expected)
+    assert np.count_nonzero(histogram.counts) > 10
+
+def test_crowded_bins_refit_before_turnover():
+    histogram = StreamingHistogram(bins=20, window=1000)
+    histogram.add([0.0, 1.0])
+    histogram.add([1000.0])    # Doubling overshoots to 1024; the samples sit in two bins
+    assert histogram.edges[0] == 0.0 and histogram.edges[-1] == pytest.approx(1000.0)
+    expected, _ = np.histogram([0.0, 1.0, 1000.0], bins=histogram.edges)
+    assert np.array_equal(histogram.counts, expected)
+
+def test_non_finite_values_ignored():
+    with np.errstate(all='raise'):
+        histogram = StreamingHistogram(bins=4)
+        assert histogram.add([1.0, 2.0, np.inf, -np.inf, np.nan])
+    assert np.all(np.isfinite(histogram.edges))
+    assert histogram.total == histogram.counts.sum() == 2
+    assert not histogram.add([np.inf])
+
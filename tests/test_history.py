@@ -47,6 +47,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # No#   |       when       who                  what
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Memory-capped history and diff-based parameter commands
 ####################################################################################################
 
 ####################################################################################################
@@ -54,6 +55,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 
 import pytest
 from app.core.history import CommandHistory, Command
+from app.core.commands import UpdateParametersCommand
 
 class MockCommand(Command):
     def __init__(self, value, target_list):
@@ -111,3 +113,73 @@ def test_redo_stack_clear():
     history.push(MockCommand(2, target_list))
     assert not history.can_redo()
     assert target_list == [2]
+
+class SizedCommand(MockCommand):
+    def __init__(self, value, target_list, nbytes):
+        super().__init__(value, target_list)
+        self.nbytes = nbytes
+
+    def size(self):
+        return self.nbytes
+
+def test_memory_limit():
+    target_list = []
+    history = CommandHistory(limit=10, max_bytes=1000)
+    for value in range(5):
+        history.push(SizedCommand(value, target_list, 300))
+    assert [command.value for command in history._history] == [2, 3, 4]
+    assert history.memory_usage() == 900
+
+    # The latest command is kept even if it alone is over budget
+    history.push(SizedCommand(5, target_list, 5000))
+    assert [command.value for command in history._history] == [5]
+
+class FakeMainWindow:
+    def __init__(self, parameters):
+        self.parameters = parameters
+        self.restarts = 0
+
+    def restart_simulator(self):
+        self.restarts += 1
+
+def make_params(count):
+    return [{'id': f'p{i}', 'name': f'P{i}', 'unit': 'V', 'threshold': {'high_warn': i}} for i in range(count)]
+
+def test_update_parameters_stores_changed_slice():
+    original = make_params(500)
+    window = FakeMainWindow(list(original))
+    history = CommandHistory()
+
+    edited = list(window.parameters)
+    edited[250] = dict(edited[250], name='Edited')
+    history.push(UpdateParametersCommand(window, window.parameters, edited))
+    moved = list(window.parameters)
+    moved[10], moved[11] = moved[11], moved[10]
+    history.push(UpdateParametersCommand(window, window.parameters, moved))
+    grown = list(window.parameters) + [{'id': 'new', 'name': 'New', 'unit': 'A'}]
+    history.push(UpdateParametersCommand(window, window.parameters, grown))
+    shrunk = [p for p in window.parameters if p['id'] != 'p0']
+    history.push(UpdateParametersCommand(window, window.parameters, shrunk))
+
+    assert [len(c.old_slice) + len(c.new_slice) for c in history._history] == [2, 4, 1, 1]
+    assert window.parameters == shrunk
+    assert history.memory_usage() < 10000
+
+    for _ in range(4):
+        history.undo()
+    assert window.parameters == original
+    for _ in range(4):
+        history.redo()
+    assert window.parameters == shrunk
+    assert window.restarts == 12
+
+def test_update_parameters_is_isolated_from_later_edits():
+    window = FakeMainWindow(make_params(3))
+    new_params = make_params(3)
+    new_params[1]['name'] = 'Renamed'
+    history = CommandHistory()
+    history.push(UpdateParametersCommand(window, window.parameters, new_params))
+    window.parameters[1]['threshold']['high_warn'] = 99
+    history.undo()
+    history.redo()
+    assert window.parameters[1]['threshold']['high_warn'] == 1
@@ -0,0 +1,162 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_instrumentation.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for pipeline instrumentation.
+# @details     Tests stage histograms, snapshots, export and the performance overlay.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Separate idle wait stage for the reader
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import json
+import time
+import pytest
+from app.core.backend import DataReader
+from app.core.instrumentation import PipelineMetrics, StageStats, BUCKET_EDGES
+from app.widgets.performance import PipelineOverlay, WARN_STYLE
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def test_stage_percentiles_use_bucket_upper_edges():
+    stats = StageStats()
+    for _ in range(99):
+        stats.add(10e-6)
+    stats.add(5e-3)
+    assert stats.count == 100 and stats.max == 5e-3
+    assert 10e-6 <= stats.percentile(50) < 10e-6 * 1.6
+    assert stats.percentile(100) == 5e-3
+    assert StageStats().percentile(99) == 0.0
+    # Out of range durations land in the end buckets
+    stats.add(0.0)
+    stats.add(1e6)
+    assert stats.counts[0] == 1 and stats.counts[len(BUCKET_EDGES)] == 1
+
+def test_metrics_snapshot_and_export(tmp_path):
+    clock = FakeClock()
+    metrics = PipelineMetrics(clock=clock)
+    for _ in range(50):
+        metrics.record('filter', 2e-3)
+    metrics.record('custom', 1e-6)
+    metrics.emitted, metrics.handled = 12, 10
+    clock.now += 1.0
+
+    snapshot = metrics.snapshot()
+    assert snapshot['backlog'] == 2
+    assert snapshot['stages']['filter']['rate'] == pytest.approx(50.0)
+    assert snapshot['stages']['filter']['busy'] == pytest.approx(0.1)
+    assert snapshot['stages']['custom']['count'] == 1
+    assert snapshot['stages']['read']['count'] == 0
+
+    path = metrics.export(str(tmp_path / "pipeline.json"))
+    with open(path) as f:
+        exported = json.load(f)
+    assert sum(exported['stages']['filter']['bucket_counts']) == 50
+
+    metrics.reset()
+    assert metrics.snapshot()['stages']['filter']['count'] == 0 and metrics.backlog == 0
+
+def test_reader_records_read_and_decode():
+    class MemoryReader(DataReader):
+        def _read_bytes(self):
+            return b'[1.0, 2.0]\n'
+
+    reader = MemoryReader(mode='serial', serial_port=None)
+    reader.metrics = PipelineMetrics()
+    assert reader.read_line() == [1.0, 2.0]
+    assert reader.metrics.stages['read'].count == 1
+    assert reader.metrics.stages['decode'].count == 1
+
+    reader.metrics.enabled = False
+    reader.read_line()
+    assert reader.metrics.stages['decode'].count == 1
+
+def test_reader_wait_is_not_read_load(qapp):
+    class SlowSocket:
+        def recvfrom(self, size):
+            time.sleep(0.05)     # A quiet link: the reader mostly waits
+            return b'[1.0]', None
+
+    reader = DataReader(mode='udp')
+    reader.sock = SlowSocket()
+    reader.metrics = PipelineMetrics()
+    for _ in range(3):
+        assert reader.read_line() == [1.0]
+    stages = reader.metrics.stages
+    assert stages['wait'].count == 3 and stages['wait'].total >= 0.15
+    assert stages['read'].total < 0.01
+
+    overlay = PipelineOverlay(reader.metrics)
+    overlay.refresh()
+    assert 'wait' not in overlay.rows
+    assert overlay.rows['read'][0].styleSheet() != WARN_STYLE
+
+def test_overlay_flags_busy_stage(qapp, tmp_path):
+    clock = FakeClock()
+    metrics = PipelineMetrics(clock=clock)
+    overlay = PipelineOverlay(metrics)
+    metrics.record('render', 0.8)
+    metrics.record('filter', 1e-5)
+    clock.now += 1.0
+    overlay.refresh()
+    assert overlay.rows['render'][5].text() == "80.0%"
+    assert overlay.rows['render'][0].styleSheet() == WARN_STYLE
+    assert overlay.rows['filter'][0].styleSheet() != WARN_STYLE
+    assert overlay.rows['read'][1].text() == "-"
+
+    # The next refresh only reflects what happened since this one
+    metrics.record('filter', 1e-5)
+    clock.now += 0.5
+    overlay.refresh()
+    assert overlay.rows['render'][5].text() == "0.0%"
+    assert overlay.rows['filter'][1].text() == "2"
+    assert overlay.export_snapshot(str(tmp_path / "snap.json")).endswith("snap.json")
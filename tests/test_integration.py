@@ -47,6 +47,12 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # No#   |       when       who                  what
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Dirty-tracked dashboard redraws
+# 002  MOD      19-10-2026  MuhammadRamzy        feat: Per-stage pipeline instrumentation and overlay
+# 003  MOD      19-10-2026  MuhammadRamzy        feat: On-demand phase pages
+# 004  MOD      19-10-2026  MuhammadRamzy        feat: Lazy tab restore on project load
+# 005  MOD      19-10-2026  MuhammadRamzy        refactor: Stable tab IDs
+# 006  MOD      19-10-2026  MuhammadRamzy        fix: Replay progress and pause button state
 ####################################################################################################
 
 ####################################################################################################
@@ -162,3 +168,144 @@ def test_undo_redo_integration(main_window, qtbot):
     # Redo
     main_window.context_aware_redo()
     assert len(main_window.parameters) == initial_params_count + 1
+
+def test_dashboard_redraws_only_changed_widgets(main_window, qtbot, monkeypatch):
+    """Test that a sample only redraws widgets subscribed to its parameter"""
+    main_window.simulator.stop()
+    main_window.simulator.wait()
+    main_window.parameters = [
+        {"id": "a", "name": "A", "unit": "V", "array_index": 0, "threshold": {}},
+        {"id": "b", "name": "B", "unit": "V", "array_index": 1, "threshold": {}},
+    ]
+    main_window.show()
+    main_window.show_phase("dashboard")
+    qtbot.wait(50)
+    rendered = []
+    monkeypatch.setattr(main_window, "_render_widget", lambda widget, config: rendered.append(config["param_ids"][0]))
+
+    tab_id = main_window._current_tab_id()
+    main_window.add_widget_to_dashboard({"displayType": "Instant Value", "param_ids": ["a"], "priority": "Medium"}, tab_id, "card_a")
+    main_window.add_widget_to_dashboard({"displayType": "Instant Value", "param_ids": ["b"], "priority": "Medium"}, tab_id, "card_b")
+
+    # First pass after a layout change draws everything once
+    main_window.update_dashboard_ui()
+    assert sorted(rendered) == ["a", "b"]
+
+    # Nothing changed: nothing redrawn
+    rendered.clear()
+    main_window.update_dashboard_ui()
+    assert rendered == []
+
+    # Only parameter A changed
+    main_window.update_data([1.0, None])
+    main_window.update_dashboard_ui()
+    assert rendered == ["a"]
+
+def test_update_data_records_pipeline_stages(main_window, qtbot):
+    """Test that processing a packet is timed per stage and counted"""
+    main_window.simulator.stop()
+    main_window.simulator.wait()
+    main_window.parameters = [{"id": "a", "name": "A", "unit": "V", "array_index": 0, "threshold": {}}]
+    metrics = main_window.pipeline_metrics
+    metrics.reset()
+
+    main_window.update_data([1.0])
+    main_window.update_data([2.0])
+    assert metrics.stages['filter'].count == 2
+    assert metrics.stages['history'].count == 2
+    assert metrics.handled == 2
+
+    main_window.performance_overlay_action.setChecked(True)
+    assert not main_window.performance_overlay.isHidden()
+    main_window.performance_overlay.close_overlay()
+    assert not main_window.performance_overlay_action.isChecked()
+
+def test_replay_signals_update_controls(main_window, qtbot):
+    """Test that replay progress reaches the status bar and the end of a replay pauses the button"""
+    main_window.simulator.stop()
+    main_window.simulator.wait()
+    main_window.simulator.replayProgress.emit(12.5, 60.0)
+    assert main_window.replay_label.text() == "Replay 12.5 / 60.0 s"
+
+    main_window.simulator.replayFinished.emit()
+    assert main_window.pause_button.isChecked()
+    assert main_window.pause_button.text() == "Resume Stream"
+
+def test_phase_pages_built_on_demand(main_window, qtbot):
+    assert not hasattr(main_window, 'setup_page')
+    main_window.configured_widgets.append({'id': 'w1', 'name': 'Loaded widget', 'config': {}})
+    main_window.show_phase("widgets")
+    assert main_window.stack.currentWidget() is main_window.widgets_page
+    assert main_window.widgets_list.item(0).text() == 'Loaded widget'
+    main_window.show_phase("setup")
+    assert main_window._get_current_phase() == "setup"
+
+def test_project_tabs_restored_on_first_show(main_window, qtbot, tmp_path):
+    main_window.simulator.stop()
+    main_window.simulator.wait()
+    main_window.parameters = [{"id": "a", "name": "A", "unit": "V", "array_index": 0, "threshold": {}},
+                              {"id": "b", "name": "B", "unit": "V", "array_index": 1, "threshold": {}}]
+    config = {'param_ids': ['a'], 'displayType': 'Instant Value', 'priority': 'Medium'}
+    first = main_window.add_new_tab(name="First")
+    main_window.add_widget_to_dashboard(config, first, "w1")
+    second = main_window.add_new_tab(name="Second")
+    main_window.add_widget_to_dashboard(dict(config, param_ids=['b']), second, "w2")
+    project_path = str(tmp_path / "project.json")
+    assert main_window.save_project(file_path=project_path)
+    assert not [name for name in os.listdir(tmp_path) if name != "project.json"]
+
+    new_window = MainWindow()
+    qtbot.addWidget(new_window)
+    new_window.simulator.stop()
+    new_window.simulator.wait()
+    assert new_window.load_project(file_path=project_path)
+    names = [new_window.tab_widget.tabText(i) for i in range(new_window.tab_widget.count())]
+    index = {name: i for i, name in enumerate(names)}
+    second = new_window.tab_data[new_window._tab_id_at(index["Second"])]
+    assert new_window.tab_widget.currentIndex() == 0
+    assert "pending" in second
+    assert second['widgets'] == {}
+
+    # Saving an unshown tab writes its loaded layout back unchanged
+    assert new_window.save_project(file_path=project_path)
+    with open(project_path) as f:
+        assert "w2" in json.load(f)['layout']['Second']['configs']
+
+    new_window.tab_widget.setCurrentIndex(index["Second"])
+    assert "pending" not in second
+    assert list(second['docks']) == ["w2"]
+    assert new_window.widget_tabs["w2"] == second['id']
+
+def test_tab_ids_survive_floating_and_reordering(main_window, qtbot, monkeypatch):
+    monkeypatch.setattr("app.ui.main_window.QMessageBox.information", lambda *args, **kwargs: None)
+    main_window.simulator.stop()
+    main_window.simulator.wait()
+    main_window.parameters = [{"id": "a", "name": "A", "unit": "V", "array_index": 0, "threshold": {}}]
+    config = {'param_ids': ['a'], 'displayType': 'Instant Value', 'priority': 'Medium'}
+    first = main_window.add_new_tab(name="First")
+    second = main_window.add_new_tab(name="Second")
+    main_window.add_widget_to_dashboard(config, second, "w1")
+    main_window.update_dashboard_ui()
+    assert [entry[0] for entry in main_window.param_subscribers["a"]] == ["w1"]
+
+    # Floating a tab shifts the positions of the others but not their IDs
+    main_window.toggle_float_tab(main_window._tab_position(first))
+    assert main_window.tab_data[first]['is_floating']
+    assert main_window._tab_id_at(main_window._tab_position(second)) == second
+    main_window._dock_tab(first)
+    assert main_window._tab_position(first) >= 0
+
+    main_window.tab_widget.tabBar().moveTab(main_window._tab_position(second), 0)
+    assert main_window._tab_id_at(0) == second
+
+    # Widget moves and removals keep the reverse indexes in step
+    main_window._transfer_widget_to_tab(second, first, "w1")
+    assert main_window.widget_tabs["w1"] == first
+    assert "w1" in main_window.tab_data[first]['docks']
+    assert "w1" not in main_window.tab_data[second]['docks']
+    main_window._remove_widget_internal("w1")
+    assert "w1" not in main_window.widget_tabs
+    assert main_window.param_subscribers["a"] == []
+
+    main_window.close_tab(main_window._tab_position(second))
+    assert second not in main_window.tab_data
@@ -0,0 +1,142 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_link_stats.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the reader link statistics.
+# @details     Sliding-window counters, rates, jitter and the DataReader hook.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Reader link statistics
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+from app.core.backend import DataReader
+from app.core.link_stats import WindowCounter, LinkStats, format_bytes
+
+####################################################################################################
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_window_counter_slides():
+    counter = WindowCounter(window=1.0, buckets=10)
+    for step in range(10):
+        counter.add(step * 0.1, 2)
+    assert counter.total(0.95) == 20
+    # Half of the buckets have left the window, the rest still count
+    assert counter.total(1.45) == 10
+    assert counter.total(5.0) == 0
+    counter.add(5.0)
+    assert counter.total(5.0) == 1
+
+
+def test_rates_and_totals():
+    clock = FakeClock()
+    stats = LinkStats(window=1.0, clock=clock)
+    for i in range(100):
+        clock.now = 100.005 + i * 0.01
+        stats.record([1.0, 2.0] if i < 90 else "Parse", 12 if i < 90 else 5)
+    stats.record(None, 0)
+    # The window holds the last nine full 0.1 s buckets plus the current one
+    clock.now = 101.005
+    snapshot = stats.snapshot()
+    assert snapshot['frames_per_s'] == pytest.approx(80 / 0.905)
+    assert snapshot['bytes_per_s'] == pytest.approx((80 * 12 + 10 * 5) / 0.905)
+    assert snapshot['error_rate'] == pytest.approx(10 / 90)
+    assert snapshot['total_frames'] == 90 and snapshot['parse_errors'] == 10
+
+    # Rates fall back to zero once the window has passed, totals remain
+    clock.now += 2.0
+    snapshot = stats.snapshot()
+    assert snapshot['frames_per_s'] == 0 and snapshot['bytes_per_s'] == 0
+    assert snapshot['total_bytes'] == 90 * 12 + 10 * 5
+
+    stats.reset()
+    assert stats.snapshot()['total_frames'] == 0
+
+
+def test_jitter():
+    clock = FakeClock()
+    stats = LinkStats(clock=clock)
+    for _ in range(50):
+        clock.now += 0.010
+        stats.add_frame()
+    assert stats.snapshot()['jitter_ms'] == pytest.approx(0.0, abs=1e-3)
+
+    stats.reset()
+    for gap in (0.005, 0.015) * 25:
+        clock.now += gap
+        stats.add_frame()
+    assert stats.snapshot()['jitter_ms'] == pytest.approx(5.0, rel=0.05)
+
+
+def test_reader_feeds_stats():
+    class MemoryReader(DataReader):
+        lines = [b'[1.0, 2.0]\n', b'[1.0, oops]\n']
+
+        def _read_bytes(self):
+            raw = self.lines.pop(0)
+            self.rx_bytes += len(raw)
+            return raw
+
+    reader = MemoryReader(mode='serial', serial_port=None)
+    reader.stats = LinkStats()
+    assert reader.read_line() == [1.0, 2.0]
+    assert reader.read_line() == "Parse"
+    assert reader.stats.total_frames == 1
+    assert reader.stats.parse_errors == 1
+    assert reader.stats.total_bytes == len(b'[1.0, 2.0]\n') + len(b'[1.0, oops]\n')
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KB"
+    assert format_bytes(3 * 1024 ** 3) == "3.0 GB"
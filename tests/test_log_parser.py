@@ -0,0 +1,151 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_log_parser.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the streaming log parser.
+# @details     Tests block parsing and one-pass statistics.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Streaming, vectorized log parser for summary reports
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: LogReader time-range and column queries
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import os
+import pytest
+import numpy as np
+from unittest.mock import patch
+from app.core.data_logger import DataLogger
+from app.core.log_parser import LogReader, RunningStats, log_index_path, summarize_log
+
+PARAMS = [{'id': 'p1', 'name': 'P1', 'unit': 'V'}, {'id': 'p2', 'name': 'P2', 'unit': 'A'}]
+
+def write_log(path, fmt, values):
+    logger = DataLogger()
+    logger.configure(format_type=fmt, file_path=str(path), parameters=PARAMS, buffer_size=50)
+    logger.start_logging()
+    for v in values:
+        history = {'p1': [{'value': v}]}
+        if v % 2 == 0:
+            history['p2'] = [{'value': -v}]
+        logger.log_data(None, history)
+    logger.stop_logging()
+
+def test_running_stats_matches_numpy():
+    data = np.random.default_rng(1).normal(10, 3, 5000)
+    stats = RunningStats(reservoir_size=10000)
+    for block in np.array_split(data, 7):
+        stats.update(block)
+    assert stats.count == 5000
+    assert stats.mean == pytest.approx(data.mean())
+    assert stats.std == pytest.approx(data.std())
+    assert stats.min == data.min() and stats.max == data.max()
+    assert stats.percentiles((50,))[50] == pytest.approx(np.percentile(data, 50))
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_summarize_log(tmp_path, fmt):
+    path = tmp_path / f"log.{fmt}"
+    write_log(path, fmt, list(range(1, 301)))
+
+    summary = summarize_log(str(path), fmt, PARAMS, block_bytes=512)
+    assert summary['total_samples'] == 300
+    assert summary['start_time'] and summary['end_time']
+
+    p1 = summary['parameters']['P1']
+    assert p1['count'] == 300
+    assert p1['min'] == 1 and p1['max'] == 300
+    assert p1['mean'] == pytest.approx(150.5)
+    assert p1['percentiles'][50] == pytest.approx(150.5)
+
+    # Missing samples are skipped rather than counted
+    p2 = summary['parameters']['P2']
+    assert p2['count'] == 150
+    assert p2['min'] == -300 and p2['max'] == -2
+
+def test_summarize_log_with_filter(tmp_path):
+    path = tmp_path / "log.csv"
+    write_log(path, "csv", [1.0] * 10)
+    filters = {'p1': {'type': 'moving_average', 'filter_id': 'f1', 'window_size': 3}}
+    summary = summarize_log(str(path), "csv", PARAMS, filters=filters)
+    p1 = summary['parameters']['P1']
+    assert p1['filter_name'] == 'MovingAverageFilter'
+    assert np.allclose(p1['filtered_values'], 1.0)
+
+def write_timed_log(path, fmt, count, period=0.1):
+    clock = [1000.0]
+    with patch('app.core.data_logger.time.time', side_effect=lambda: clock[0]):
+        logger = DataLogger()
+        logger.configure(format_type=fmt, file_path=str(path), parameters=PARAMS, buffer_size=20)
+        logger.start_logging()
+        for i in range(count):
+            clock[0] = 1000.0 + i * period
+            logger.log_data(None, {'p1': [{'value': float(i)}], 'p2': [{'value': -float(i)}]})
+        logger.stop_logging()
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+@pytest.mark.parametrize("indexed", [True, False])
+def test_log_reader_time_range(tmp_path, fmt, indexed):
+    path = tmp_path / f"log.{fmt}"
+    write_timed_log(path, fmt, 1000)
+    if not indexed:
+        os.remove(log_index_path(str(path)))
+
+    reader = LogReader(str(path), fmt, PARAMS)
+    result = reader.read(start=30.0, end=33.0, parameters=['p2'])
+    assert set(result) == {'elapsed', 'p2'}
+    assert result['elapsed'].size == 31
+    assert result['elapsed'][0] == pytest.approx(30.0)
+    assert np.array_equal(result['p2'], -np.arange(300, 331, dtype=float))
+
+    everything = reader.read()
+    assert everything['p1'].size == 1000
+    first, last = reader.time_range()
+    assert first == pytest.approx(0.0) and last == pytest.approx(99.9)
+
+def test_log_reader_unknown_parameter(tmp_path):
+    path = tmp_path / "log.csv"
+    write_timed_log(path, "csv", 10)
+    with pytest.raises(KeyError):
+        LogReader(str(path)).read(parameters=['missing'])
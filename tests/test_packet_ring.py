@@ -0,0 +1,91 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_packet_ring.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the packet ring.
+# @details     Tests bounded storage, widening and notes of PacketRing.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Bounded packet ring for the raw telemetry viewer
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+from app.core.packet_ring import PacketRing, NOTE_LENGTH
+
+def test_ring_keeps_latest_rows():
+    ring = PacketRing(capacity=4, width=2)
+    for i in range(10):
+        ring.append([i, None], float(i))
+    assert len(ring) == 4 and ring.first == 6 and ring.total == 10
+
+    sequence, values, lengths, timestamps, numbers = ring.rows(0, 100)
+    assert sequence.tolist() == [6, 7, 8, 9]
+    assert values[:, 0].tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert np.isnan(values[:, 1]).all()
+    assert lengths.tolist() == [2, 2, 2, 2]
+    assert numbers.tolist() == [7, 8, 9, 10]
+
+def test_ring_widens_for_longer_packets():
+    ring = PacketRing(capacity=3, width=2, max_width=5)
+    ring.append([1, 2], 0.0)
+    assert ring.append(list(range(8)), 1.0) == 5
+    _, values, lengths, _, _ = ring.rows(0, 2)
+    assert values.shape == (2, 5)
+    assert values[0, :2].tolist() == [1.0, 2.0] and np.isnan(values[0, 2:]).all()
+    assert lengths.tolist() == [2, 5]
+
+def test_notes_are_evicted_with_their_rows():
+    ring = PacketRing(capacity=2)
+    ring.append_note("[PAUSED]", 0.0)
+    ring.append([1.0], 1.0)
+    _, _, lengths, _, numbers = ring.rows(0, 2)
+    assert lengths[0] == NOTE_LENGTH and numbers.tolist() == [0, 1]
+    assert ring.notes == {0: "[PAUSED]"}
+
+    ring.append([2.0], 2.0)
+    assert ring.notes == {}
+    ring.clear()
+    assert len(ring) == 0 and ring.packets == 0
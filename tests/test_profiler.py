@@ -0,0 +1,113 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_profiler.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the sampling profiler.
+# @details     Samples a busy worker thread and checks the collapsed and speedscope output.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Sampling profiler with flamegraph export
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import json
+import os
+import threading
+import time
+from app.core.profiler import StackSampler
+
+####################################################################################################
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(200))
+
+
+def record(seconds=0.3):
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,), name="IngestWorker")
+    worker.start()
+    sampler = StackSampler(interval=0.002)
+    sampler.start(duration=seconds)
+    time.sleep(seconds + 0.1)
+    sampler.stop()
+    stop.set()
+    worker.join()
+    return sampler
+
+
+def test_samples_worker_thread():
+    sampler = record()
+    assert not sampler.running
+    lines = sampler.collapsed()
+    worker_lines = [line for line in lines if line.startswith("IngestWorker;")]
+    assert worker_lines
+    assert any("busy_loop" in line for line in worker_lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    # The sampler never records itself
+    assert not any(line.startswith("StackSampler;") for line in lines)
+
+
+def test_speedscope_profile():
+    sampler = record()
+    document = sampler.speedscope("test")
+    names = [frame["name"] for frame in document["shared"]["frames"]]
+    assert any(name.startswith("busy_loop") for name in names)
+    profiles = {profile["name"]: profile for profile in document["profiles"]}
+    assert "IngestWorker" in profiles
+    for profile in profiles.values():
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert all(index < len(names) for stack in profile["samples"] for index in stack)
+
+
+def test_write(tmp_path):
+    sampler = record(0.1)
+    collapsed_path, speedscope_path = sampler.write(str(tmp_path / "profiles"), prefix="run")
+    assert os.path.basename(collapsed_path) == "run.collapsed.txt"
+    with open(speedscope_path) as f:
+        assert json.load(f)["$schema"]
+    with open(collapsed_path) as f:
+        assert f.read().strip()
@@ -0,0 +1,115 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_project_io.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for project file I/O.
+# @details     Tests atomic compact saves and loading of indented files.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Atomic compact project save/load
+# 001  MOD      19-10-2026  MuhammadRamzy        fix: Keep the project file's permissions across saves
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import json
+import os
+
+import pytest
+
+from app.core import project_io
+from app.core.project_io import load_project_file, save_project_file
+
+####################################################################################################
+
+def test_save_is_compact_and_round_trips(tmp_path):
+    path = str(tmp_path / "project.json")
+    data = {'parameters': [{'id': 'p1', 'name': 'P1'}], 'layout': {'Main': {'configs': {}}}}
+    save_project_file(path, data)
+    with open(path) as f:
+        text = f.read()
+    assert ' ' not in text and '\n' not in text
+    assert load_project_file(path) == data
+    assert os.listdir(tmp_path) == ["project.json"]
+
+
+def test_loads_indented_projects(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text(json.dumps({'version': '1.0'}, indent=4))
+    assert load_project_file(str(path)) == {'version': '1.0'}
+
+
+def test_failed_save_keeps_previous_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "project.json")
+    save_project_file(path, {'version': '1.0'})
+
+    def fail(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(project_io.os, 'replace', fail)
+    with pytest.raises(OSError):
+        save_project_file(path, {'version': '2.0'})
+    assert load_project_file(path) == {'version': '1.0'}
+    assert os.listdir(tmp_path) == ["project.json"]
+
+
+def test_unserialisable_data_leaves_file_untouched(tmp_path):
+    path = str(tmp_path / "project.json")
+    save_project_file(path, {'version': '1.0'})
+    with pytest.raises(TypeError):
+        save_project_file(path, {'bad': object()})
+    assert load_project_file(path) == {'version': '1.0'}
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX permission bits")
+def test_save_keeps_file_mode(tmp_path):
+    path = str(tmp_path / "project.json")
+    umask = os.umask(0o022)
+    try:
+        save_project_file(path, {'version': '1.0'})
+        assert os.stat(path).st_mode & 0o777 == 0o644
+        os.chmod(path, 0o640)
+        save_project_file(path, {'version': '2.0'})
+        assert os.stat(path).st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)
@@ -0,0 +1,132 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_replay.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for session replay.
+# @details     Tests replay timing, speed, pause, seek and packet layout against a fake clock.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Session replay source at 0.1x-100x speed
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import pytest
+from unittest.mock import patch
+from app.core.data_logger import DataLogger
+from app.core.replay import LogReplay
+
+PARAMS = [{'id': 'p1', 'name': 'P1', 'array_index': 3}, {'id': 'p2', 'name': 'P2', 'array_index': 0}]
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def log_file(tmp_path):
+    # 60 s session at 10 Hz; p2 is only present on even rows
+    path = tmp_path / "session.csv"
+    clock = [1000.0]
+    with patch('app.core.data_logger.time.time', side_effect=lambda: clock[0]):
+        logger = DataLogger()
+        logger.configure(format_type='csv', file_path=str(path), parameters=PARAMS, buffer_size=25)
+        logger.start_logging()
+        for i in range(600):
+            clock[0] = 1000.0 + i * 0.1
+            history = {'p1': [{'value': float(i)}]}
+            if i % 2 == 0:
+                history['p2'] = [{'value': -float(i)}]
+            logger.log_data(None, history)
+        logger.stop_logging()
+    return str(path)
+
+def test_replay_packets_follow_the_clock(log_file):
+    clock = FakeClock()
+    replay = LogReplay(log_file, PARAMS, num_channels=4, clock=clock)
+    assert replay.duration == pytest.approx(59.9)
+
+    replay.play()
+    packets, _ = replay.poll()
+    assert packets == [[-0.0, None, None, 0.0]]
+
+    clock.now = 1.0
+    packets, wait = replay.poll()
+    assert [p[3] for p in packets] == [float(i) for i in range(1, 11)]
+    assert packets[0][0] is None and packets[1][0] == -2.0
+    assert 0 <= wait <= 0.1
+
+def test_replay_speed_pause_and_seek(log_file):
+    clock = FakeClock()
+    replay = LogReplay(log_file, PARAMS, clock=clock, speed=1000)
+    assert replay.speed == 100.0
+
+    replay.set_speed(10)
+    replay.play()
+    clock.now = 1.0
+    packets, _ = replay.poll()
+    assert len(packets) == 101   # 0.0 s through 10.0 s of log time
+
+    replay.pause()
+    clock.now = 5.0
+    assert replay.poll()[0] == []
+    assert replay.position == pytest.approx(10.0)
+
+    # Chunk boundaries (10 s) are crossed without losing or repeating rows
+    replay.seek(25.0)
+    replay.play()
+    clock.now = 6.0
+    packets, _ = replay.poll()
+    assert [p[3] for p in packets] == [float(i) for i in range(250, 351)]
+
+def test_replay_finishes(log_file):
+    clock = FakeClock()
+    replay = LogReplay(log_file, PARAMS, clock=clock, speed=100)
+    replay.play()
+    clock.now = 1.0
+    packets, _ = replay.poll()
+    assert len(packets) == 600
+    assert replay.finished
@@ -0,0 +1,119 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_report.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for summary report generation.
+# @details     Tests the PDF builder and the worker-process report job.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Run PDF summary report generation off the GUI thread
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Parallel per-parameter plot rendering in reports
+# 002  MOD      19-10-2026  MuhammadRamzy        fix: Cancelling stops the plot pool's workers
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import os
+import multiprocessing
+import pytest
+from app.core.data_logger import DataLogger
+from app.core.log_parser import summarize_log
+from app.core.report import ReportJob, ReportCancelled, build_summary_report, render_parameter_plots
+
+PARAMS = [{'id': 'p1', 'name': 'P1', 'unit': 'V'}]
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = DataLogger()
+    logger.configure(format_type='csv', file_path=path, parameters=PARAMS)
+    logger.start_logging()
+    for i in range(200):
+        logger.log_data(None, {'p1': [{'value': float(i % 17)}]})
+    logger.stop_logging()
+    return path
+
+def test_build_summary_report(tmp_path, log_file):
+    pdf_path = str(tmp_path / "report.pdf")
+    steps = []
+    build_summary_report(pdf_path, log_file, 'csv', PARAMS, progress=lambda pct, msg: steps.append(pct))
+    assert os.path.getsize(pdf_path) > 0
+    assert steps[-1] == 100
+    assert steps == sorted(steps)
+
+def test_build_summary_report_cancel(tmp_path, log_file):
+    def progress(pct, msg):
+        if pct >= 60:
+            raise ReportCancelled()
+    with pytest.raises(ReportCancelled):
+        build_summary_report(str(tmp_path / "report.pdf"), log_file, 'csv', PARAMS, progress=progress)
+
+@pytest.mark.slow
+def test_render_parameter_plots_in_pool(log_file):
+    params = [dict(PARAMS[0], name=f"P1 copy {i}") for i in range(4)]
+    summary = summarize_log(log_file, 'csv', params)
+    plots = render_parameter_plots(summary, max_workers=2)
+    assert set(plots) == set(summary['parameters'])
+    assert all(png.startswith(b'\x89PNG') for png, error in plots.values())
+
+@pytest.mark.slow
+def test_render_parameter_plots_cancel_stops_pool(log_file):
+    params = [dict(PARAMS[0], name=f"P1 copy {i}") for i in range(8)]
+    summary = summarize_log(log_file, 'csv', params)
+    def progress(pct, msg):
+        if pct > 60:
+            raise ReportCancelled()
+    with pytest.raises(ReportCancelled):
+        render_parameter_plots(summary, progress=progress, max_workers=2)
+    assert multiprocessing.active_children() == []
+
+@pytest.mark.slow
+def test_report_job_runs_in_worker_process(qtbot, tmp_path, log_file):
+    pdf_path = str(tmp_path / "report.pdf")
+    job = ReportJob(pdf_path, log_file, 'csv', PARAMS)
+    with qtbot.waitSignal(job.finished, timeout=60000) as blocker:
+        job.start()
+    assert blocker.args == [pdf_path]
+    assert os.path.getsize(pdf_path) > 0
+    assert not job.is_running()
@@ -0,0 +1,77 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_series_buffer.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for append-only plot buffers.
+# @details     Tests growth, trimming of old samples and the running min/max envelope.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Incremental TimeGraph curve updates
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+from app.core.series_buffer import SeriesBuffer
+
+def test_append_grows_and_keeps_order():
+    buffer = SeriesBuffer(initial_capacity=4)
+    for start in range(0, 100, 10):
+        buffer.append(np.arange(start, start + 10), np.arange(start, start + 10) * 2.0)
+    assert len(buffer) == 100
+    assert np.array_equal(buffer.x, np.arange(100))
+    assert np.array_equal(buffer.y, np.arange(100) * 2.0)
+
+def test_full_buffer_drops_oldest_samples():
+    buffer = SeriesBuffer(max_points=100, envelope_capacity=8, initial_capacity=4)
+    for start in range(0, 210, 7):
+        buffer.append(np.arange(start, start + 7), np.arange(start, start + 7, dtype=float))
+    assert len(buffer) <= 100
+    assert buffer.x[-1] == 209
+    assert np.all(np.diff(buffer.x) == 1)
+
+    # The envelope covers exactly what is buffered, extremes included
+    env_x, env_y = buffer.envelope.points()
+    assert env_x[0] == buffer.x[0] and env_x[-1] == buffer.x[-1]
+    assert env_y.min() == buffer.y.min() and env_y.max() == buffer.y.max()
@@ -47,6 +47,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # No#   |       when       who                  what
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Replay mode driven by a logged session
 ####################################################################################################
 
 ####################################################################################################
@@ -55,6 +56,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 import pytest
 import time
 from PySide6.QtCore import QCoreApplication
+from app.core.data_logger import DataLogger
 from app.core.simulator import DataSimulator
 
 class TestDataSimulator:
@@ -100,3 +102,34 @@ class TestDataSimulator:
         
         sim.stop()
         sim.wait()
+
+    def test_replay_mode(self, qapp, tmp_path):
+        params = [{'id': 'p1', 'name': 'P1', 'array_index': 0}]
+        log_path = str(tmp_path / "session.json")
+        logger = DataLogger()
+        logger.configure(format_type='json', file_path=log_path, parameters=params)
+        logger.start_logging()
+        for i in range(20):
+            logger.log_data(None, {'p1': [{'value': float(i)}]})
+        logger.stop_logging()
+
+        sim = DataSimulator(num_channels=2, parameters=params,
+                            connection_settings={'mode': 'replay', 'replay_file': log_path})
+        sim.mode = 'replay'
+        received_data = []
+        finished = []
+        sim.newData.connect(received_data.append)
+        sim.replayFinished.connect(lambda: finished.append(True))
+        sim.start()
+
+        start_time = time.time()
+        while not finished and time.time() - start_time < 2.0:
+            QCoreApplication.processEvents()
+            time.sleep(0.01)
+
+        sim.stop()
+        sim.wait()
+
+        assert finished
+        assert [packet[0] for packet in received_data] == [float(i) for i in range(20)]
+        assert sim._is_paused is True
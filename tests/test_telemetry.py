@@ -0,0 +1,136 @@
+"""
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+                                        ::                                                      
+    ..    ..........    :.      ::      ::     .........  ..    ..........    ...      .        
+    ::    ::            : .:.   ::     .::.       ::      ::    ::       :    :: :.    :        
+    ::    ::   ..:::    :   .:. ::    ::::::      ::      ::    ::       :    ::   ::  :        
+    ::    ::......::    :      :::    ::::::      ::      ::    ::.......:    ::     :::        
+                                      ::::::                                                    
+                                      :.::.:                                                    
+                         .::::          ::          ::::.                                      
+                       .::::::::.       ::       .:::::::::                                    
+                       ::::::::::::....::::.....:::::::::::                                    
+                        .:::::::::::::::::::::::::::::::::.        
+
+                    Copyright (c) 2025 Ignition Software Department
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, version 3, with the additional restriction
+that this software may not be used for commercial purposes without
+explicit written permission from the authors.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program. If not, see <https://www.gnu.org/licenses/>.
+
+"""
+####################################################################################################
+# File:        test_telemetry.py
+# Author:      MuhammadRamzy
+# Created On:  19-10-2026
+#
+# @brief       Unit tests for the raw telemetry widgets.
+# @details     Tests batched rendering and rate counting of the raw telemetry monitor, and packet
+#              formatting of the standalone viewer.
+####################################################################################################
+# HISTORY:
+#
+#       +----- (NEW | MOD | ADD | DEL)
+#       |
+# No#   |       when       who                  what
+# ######+*********+**********+********************+**************************************************
+# 000  NEW      19-10-2026  MuhammadRamzy        feat: Batched plain-text RawTelemetryMonitor
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Virtualized packet view for StandaloneTelemetryViewer
+####################################################################################################
+
+####################################################################################################
+# Imports
+
+import numpy as np
+import pytest
+from app.widgets.telemetry import (
+    RawTelemetryMonitor, RateCounter, StandaloneTelemetryViewer, format_packets
+)
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def test_rate_counter_window():
+    clock = FakeClock()
+    counter = RateCounter(window=5.0, buckets=50, clock=clock)
+    assert counter.rate() == 0.0
+    for _ in range(100):
+        counter.add()
+        clock.now += 0.01
+    assert counter.rate() == pytest.approx(100.0)
+
+    # Events older than the window fall out of the ring
+    clock.now += 10.0
+    counter.add(5)
+    assert counter.rate() == pytest.approx(1.0)
+
+def test_monitor_batches_lines_per_flush(qapp):
+    monitor = RawTelemetryMonitor()
+    for i in range(10):
+        monitor.append_packet([float(i), None])
+    assert monitor.text_display.document().isEmpty()
+
+    monitor.flush()
+    lines = monitor.text_display.toPlainText().splitlines()
+    assert len(lines) == 10
+    assert lines[-1].endswith("[PKT 000010] [9.00, NULL]")
+    assert monitor.packet_count_label.text() == "Packets: 10"
+
+def test_monitor_keeps_only_max_lines(qapp):
+    monitor = RawTelemetryMonitor()
+    for i in range(monitor.max_lines * 3):
+        monitor.append_packet([float(i)])
+    monitor.flush()
+    lines = monitor.text_display.toPlainText().splitlines()
+    assert len(lines) == monitor.max_lines
+    assert lines[-1].endswith(f"[{monitor.max_lines * 3 - 1}.00]")
+
+    monitor.clear_display()
+    assert monitor.text_display.document().isEmpty() and monitor.packet_count == 0
+
+def test_format_packets_modes():
+    values = np.array([[65.0, 66.7, np.nan, 300.0], [-3.0, 0.0, 10.0, np.nan]])
+    lengths = [4, 3]
+    assert format_packets(values, lengths, 'decimal') == ['[65, 66.7, NULL, 300]', '[-3, 0, 10]']
+    assert format_packets(values, lengths, 'hex') == ['41 42 XX 12C', '-3 00 0A']
+    assert format_packets(values, lengths, 'ascii') == ['AB..', '...']
+    assert format_packets(values[1:], [3], 'binary') == ['-00000011 00000000 00001010']
+    assert format_packets(values[1:], [3], 'mixed') == ['[-3, 0, 10] | -3 00 0A']
+
+def test_viewer_shows_bounded_ring(qapp):
+    viewer = StandaloneTelemetryViewer(ring_capacity=100)
+    viewer.show_timestamp.setChecked(False)
+    viewer.simulator = object()   # Accept packets without a running source
+    for i in range(250):
+        viewer.on_data_received([float(i), None])
+    viewer.on_data_received("garbage")
+    viewer.refresh_view()
+
+    model = viewer.packet_model
+    assert model.rowCount() == 100 and viewer.packet_count == 251
+    assert model.data(model.index(0)) == "[152] [151, NULL]"
+    assert model.data(model.index(99)) == "garbage"
+
+    viewer.set_display_mode('hex')
+    assert model.data(model.index(98)) == "[250] F9 XX"
+
+    viewer.clear_display()
+    assert model.rowCount() == 0 and list(model.lines()) == []
+    viewer.simulator = None
@@ -47,14 +47,23 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 # No#   |       when       who                  what
 # ######+*********+**********+********************+**************************************************
 # 000  NEW      29-11-2025  MuhammadRamzy        feat: Redesign AddWidgetDialog with side-by-side layout and QStackedWidget
+# 001  MOD      19-10-2026  MuhammadRamzy        feat: Viewport min/max decimation in TimeGraph
+# 002  MOD      19-10-2026  MuhammadRamzy        feat: Incremental TimeGraph curve updates
+# 003  MOD      19-10-2026  MuhammadRamzy        feat: Painted LEDs and value text with cached state
+# 004  MOD      19-10-2026  MuhammadRamzy        feat: Incremental histogram with fixed or adaptive bins
+# 005  MOD      19-10-2026  MuhammadRamzy        feat: Model/view LogTable over columnar sample storage
+# 006  MOD      19-10-2026  MuhammadRamzy        fix: TimeGraph follows the last 500 samples by default
 ####################################################################################################
 
 ####################################################################################################
 # Imports
 
 import pytest
+import numpy as np
 from PySide6.QtWidgets import QApplication
-from app.widgets.general import ValueCard, GaugeWidget, TimeGraph, HistogramWidget, LEDWidget, MapWidget, LogTable
+from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt
+from app.widgets.general import ValueCard, GaugeWidget, TimeGraph, HistogramWidget, LEDWidget, MapWidget, LogTable, LEDLamp, LogTableModel
 
 class TestWidgets:
     @pytest.fixture
@@ -85,11 +94,85 @@ class TestWidgets:
         assert widget is not None
         assert len(widget.param_configs) == 1
 
+    def test_time_graph_decimates_to_viewport(self, qapp, param_config):
+        widget = TimeGraph([param_config], {'accumulate': True})
+        widget.resize(800, 300)
+        x = np.linspace(0, 1000, 1000000)
+        y = np.sin(x)
+        y[500000] = 5.0
+        widget.buffers['test_param'].append(x, y)
+        widget._view_changed = True
+        widget._refresh_plot()
+
+        x_data, y_data = widget.curves['test_param'].getData()
+        assert len(x_data) < 5000
+        assert x_data[0] == 0 and x_data[-1] == 1000
+        assert y_data.max() == 5.0
+
+        # Zooming re-decimates only the visible range at full detail
+        widget.plot_widget.setXRange(100, 101, padding=0)
+        widget._refresh_plot()
+        x_data, y_data = widget.curves['test_param'].getData()
+        assert x_data[1] >= 100 and x_data[-2] <= 101
+        assert len(x_data) == np.count_nonzero((x >= 100) & (x <= 101)) + 2
+
+        # Nothing changed: no re-decimation
+        widget.curves['test_param'].setData(x=[], y=[])
+        widget._refresh_plot()
+        x_data, _ = widget.curves['test_param'].getData()
+        assert x_data is None or len(x_data) == 0
+
+    def test_time_graph_follows_recent_window(self, qapp, param_config):
+        widget = TimeGraph([param_config])
+        widget.resize(800, 300)
+        widget.buffers['test_param'].append(np.arange(5000, dtype=float), np.arange(5000, dtype=float))
+        assert len(widget.buffers['test_param']) <= 2 * widget.window
+
+        widget._view_changed = True
+        widget._refresh_plot()
+        x_data, _ = widget.curves['test_param'].getData()
+        assert x_data[0] == 5000 - widget.window and x_data[-1] == 4999
+
+    def test_time_graph_appends_only_new_samples(self, qapp, param_config):
+        widget = TimeGraph([param_config])
+        t0 = widget.start_time
+        history = {'test_param': [{'timestamp': t0 + i, 'filtered_value': float(i)} for i in range(10)]}
+        widget.update_data(history, {'test_param': 10}, 'filtered_value')
+        assert len(widget.buffers['test_param']) == 10
+
+        # Same sequence number: nothing new, nothing to redraw
+        widget._refresh_plot()
+        widget.update_data(history, {'test_param': 10}, 'filtered_value')
+        assert not widget._data_changed
+
+        # Capped history: only the samples past the cursor are appended
+        history['test_param'] = history['test_param'][3:] + [{'timestamp': t0 + 10 + i, 'filtered_value': 10.0 + i}
+                                                            for i in range(3)]
+        widget.update_data(history, {'test_param': 13}, 'filtered_value')
+        assert np.array_equal(widget.buffers['test_param'].y, np.arange(13, dtype=float))
+
     def test_histogram_widget_instantiation(self, qapp, param_config):
         widget = HistogramWidget(param_config)
         assert widget is not None
         assert widget.param == param_config
 
+    def test_histogram_widget_counts_new_samples(self, qapp, param_config, monkeypatch):
+        widget = HistogramWidget(param_config, {'bins': 10, 'range': [0, 100]})
+        redraws = []
+        monkeypatch.setattr(widget.bar_item, 'setOpts', lambda **opts: redraws.append(opts))
+        history = {'test_param': [{'filtered_value': float(i)} for i in range(50)]}
+        widget.update_data(history, {'test_param': 50}, 'filtered_value')
+        assert widget.histogram.counts.tolist() == [10] * 5 + [0] * 5
+        assert len(redraws) == 1
+
+        # No new samples: no redraw
+        widget.update_data(history, {'test_param': 50}, 'filtered_value')
+        assert len(redraws) == 1
+
+        history['test_param'].append({'filtered_value': 95.0})
+        widget.update_data(history, {'test_param': 51}, 'filtered_value')
+        assert widget.histogram.counts[-1] == 1 and len(redraws) == 2
+
     def test_led_widget_instantiation(self, qapp, param_config):
         # LEDWidget now expects a list of param_configs
         widget = LEDWidget([param_config])
@@ -101,11 +184,75 @@ class TestWidgets:
         assert widget is not None
         assert len(widget.param_configs) == 1
 
+    def test_log_table_rows_from_new_samples(self, qapp, param_config):
+        other = dict(param_config, id='other', name='Other')
+        widget = LogTable([param_config, other])
+        history = {'test_param': [{'timestamp': 100.0 + i, 'value': float(i)} for i in range(4)],
+                   'other': [{'timestamp': 101.0, 'value': 50.0}]}
+        widget.update_data(history, {'test_param': 4, 'other': 1})
+        model = widget.model
+        assert model.rowCount() == 4 and model.columnCount() == 3
+        # Newest first; 'other' shows its last known value, '---' before its first sample
+        assert [model.data(model.index(r, 1)) for r in range(4)] == ["3.000", "2.000", "1.000", "0.000"]
+        assert [model.data(model.index(r, 2)) for r in range(4)] == ["50.000", "50.000", "50.000", "---"]
+
+        history['other'].append({'timestamp': 104.0, 'value': 60.0})
+        widget.update_data(history, {'test_param': 4, 'other': 2})
+        assert model.rowCount() == 5
+        assert model.data(model.index(0, 1)) == "3.000" and model.data(model.index(0, 2)) == "60.000"
+
+    def test_log_table_model_trims_and_searches(self, qapp, param_config):
+        model = LogTableModel([param_config], max_rows=1000, initial_rows=16)
+        for block in range(5):
+            model.append(np.arange(400) + 400 * block, np.arange(400.0)[:, None] + 400 * block)
+        assert model.rowCount() <= 1000 and model.timestamps[-1] == 1999
+        assert np.array_equal(model.timestamps, np.arange(2000 - model.rowCount(), 2000))
+
+        sample = model.find_last(0, "<", 1500)
+        assert model.values[sample, 0] == 1499
+        assert model.find_last(0, "=", 5) is None
+        model.set_highlight(sample)
+        row = model.row_of(sample)
+        assert model.data(model.index(row, 1), Qt.ItemDataRole.BackgroundRole) is model.highlight_brush
+
     def test_value_card_update(self, qapp, param_config):
         widget = ValueCard([param_config])
         widget.update_values({'test_param': 123.45})
         assert widget.value_labels['test_param'].text() == "123.5"
 
+        # Same value again: nothing to repaint
+        assert not widget.value_labels['test_param'].set_state("123.5", ValueCard.VALUE_COLOR)
+        widget.update_values({'test_param': None})
+        assert widget.value_labels['test_param'].text() == "--"
+
+    def test_led_widget_thresholds(self, qapp, param_config):
+        options = {'led_configs': {'test_param': {'thresholds': [
+            {'value': 50.0, 'condition': '≥', 'color': '#ff0000'},
+            {'value': 10.0, 'condition': '≥', 'color': '#ffff00'},
+        ]}}}
+        widget = LEDWidget([param_config], options)
+        led = widget.leds['test_param']
+
+        widget.update_values({'test_param': 5.0})
+        assert led.text() == "5.0" and led.state() is LEDLamp.OFF_STATE
+
+        # Rules are sorted by value once; the first match wins
+        widget.update_values({'test_param': 60.0})
+        assert led.state()[0] == QColor('#ffff00') and led.state()[3]
+        lit = led.state()
+        widget.update_values({'test_param': 70.0})
+        assert led.state() is lit
+        assert not led.set_state("70.0", lit)
+
+        widget.update_values({})
+        assert led.text() == "--" and led.state() is LEDLamp.MISSING_STATE
+
+    def test_led_widget_legacy_threshold(self, qapp, param_config):
+        widget = LEDWidget([param_config], {'led_configs': {'test_param': {'threshold': 1, 'condition': '>'}}})
+        widget.update_values({'test_param': 2.0})
+        assert widget.leds['test_param'].state()[0] == QColor('#21b35a')
+        assert widget._get_led_color(0.5, {'threshold': 1, 'condition': '>'}) is None
+
     def test_gauge_widget_update(self, qapp, param_config):
         widget = GaugeWidget(param_config)
         widget.update_values({'test_param': 50.0})